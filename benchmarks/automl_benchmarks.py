@@ -0,0 +1,325 @@
+"""Benchmarks for the end-to-end throughput of AutoMLSearch.
+
+Runs AutoMLSearch on synthetic datasets of several scales and on the bundled demo datasets with each engine,
+and writes the time spent in each phase of the search, the number of pipelines evaluated per minute and the
+peak resident memory to a JSON file, so results can be compared between releases. Requires psutil, which is
+installed with the development requirements (`pip install -r dev-requirements.txt`).
+
+Example:
+    python benchmarks/automl_benchmarks.py --datasets fraud churn synthetic_10k_10 \
+        --engines sequential cf_threaded --max-batches 2 --output benchmark_results.json
+"""
+import argparse
+import json
+import platform
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import psutil
+
+import evalml
+from evalml.automl import AutoMLSearch, get_default_primary_search_objective
+from evalml.data_checks import DefaultDataChecks
+from evalml.demos import load_churn, load_fraud, load_weather
+from evalml.pipelines.component_profiler import ComponentProfiler
+from evalml.problem_types import ProblemTypes
+
+ENGINES = ["sequential", "cf_threaded", "cf_process", "dask_threaded", "dask_process"]
+
+# Name of each synthetic dataset mapped to its number of rows and columns
+SYNTHETIC_SCALES = {
+    "synthetic_10k_10": (10_000, 10),
+    "synthetic_100k_100": (100_000, 100),
+    "synthetic_1m_500": (1_000_000, 500),
+    "synthetic_10m_2000": (10_000_000, 2_000),
+}
+
+# Share of the synthetic columns of each logical type
+SYNTHETIC_LOGICAL_TYPES = {
+    "Double": 0.5,
+    "Integer": 0.2,
+    "Categorical": 0.2,
+    "Boolean": 0.05,
+    "Datetime": 0.05,
+}
+
+
+def load_weather_benchmark():
+    """Load the weather demo dataset with the problem configuration used for its benchmark."""
+    X, y = load_weather()
+    problem_configuration = {
+        "time_index": "Date",
+        "gap": 1,
+        "max_delay": 7,
+        "forecast_horizon": 1,
+    }
+    return X, y, ProblemTypes.TIME_SERIES_REGRESSION, problem_configuration
+
+
+DEMO_DATASETS = {
+    "fraud": lambda: (*load_fraud(verbose=False), ProblemTypes.BINARY, None),
+    "churn": lambda: (*load_churn(verbose=False), ProblemTypes.BINARY, None),
+    "weather": load_weather_benchmark,
+}
+
+
+def make_synthetic_dataset(n_rows, n_cols, random_seed=0):
+    """Generate a binary classification dataset with a mix of woodwork logical types.
+
+    Args:
+        n_rows (int): Number of rows.
+        n_cols (int): Number of feature columns.
+        random_seed (int): Seed for the random number generator. Defaults to 0.
+
+    Returns:
+        pd.DataFrame, pd.Series: The features and the target.
+    """
+    random_state = np.random.RandomState(random_seed)
+    n_cols_per_type = {
+        logical_type: max(1, int(share * n_cols))
+        for logical_type, share in SYNTHETIC_LOGICAL_TYPES.items()
+    }
+    n_cols_per_type["Double"] += n_cols - sum(n_cols_per_type.values())
+
+    columns = {}
+    logical_types = {}
+    for logical_type, n_type_cols in n_cols_per_type.items():
+        for i in range(n_type_cols):
+            name = f"{logical_type.lower()}_{i}"
+            if logical_type == "Double":
+                values = random_state.normal(size=n_rows)
+            elif logical_type == "Integer":
+                values = random_state.randint(0, 1_000, size=n_rows)
+            elif logical_type == "Categorical":
+                categories = np.array([f"category_{j}" for j in range(10)])
+                values = categories[random_state.randint(0, 10, size=n_rows)]
+            elif logical_type == "Boolean":
+                values = random_state.randint(0, 2, size=n_rows).astype(bool)
+            else:
+                start = pd.Timestamp("2020-01-01").value // 10 ** 9
+                seconds = random_state.randint(0, 3 * 365 * 24 * 3600, size=n_rows)
+                values = pd.to_datetime(start + seconds, unit="s")
+            columns[name] = values
+            logical_types[name] = logical_type
+    X = pd.DataFrame(columns)
+    X.ww.init(logical_types=logical_types)
+
+    # The target depends on a few of the numeric columns
+    signal = X["double_0"].to_numpy() + X["integer_0"].to_numpy() / 500
+    noise = random_state.normal(scale=0.5, size=n_rows)
+    y = pd.Series(signal + noise > np.median(signal), name="target")
+    return X, y
+
+
+def load_dataset(name, random_seed=0):
+    """Load a benchmark dataset by name.
+
+    Args:
+        name (str): Name of a synthetic scale or a demo dataset.
+        random_seed (int): Seed used to generate synthetic datasets. Defaults to 0.
+
+    Returns:
+        tuple: The features, the target, the problem type and the problem configuration.
+    """
+    if name in SYNTHETIC_SCALES:
+        X, y = make_synthetic_dataset(*SYNTHETIC_SCALES[name], random_seed=random_seed)
+        return X, y, ProblemTypes.BINARY, None
+    return DEMO_DATASETS[name]()
+
+
+class PeakMemorySampler:
+    """Samples the resident memory of this process and its children in a background thread to track the peak.
+
+    Args:
+        interval (float): Seconds between samples. Defaults to 0.05.
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        process = psutil.Process()
+        rss = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+@contextmanager
+def record_phase(phases, name):
+    """Record the wall time and the peak resident memory of a phase of the benchmark."""
+    start = time.perf_counter()
+    with PeakMemorySampler() as sampler:
+        yield
+    phases[name] = {
+        "seconds": time.perf_counter() - start,
+        "peak_rss_bytes": sampler.peak_rss,
+    }
+
+
+def run_benchmark(
+    dataset_name, engine, max_batches=2, random_seed=0, profile_components=False
+):
+    """Run AutoMLSearch on one dataset with one engine and record its timings.
+
+    Args:
+        dataset_name (str): Name of a synthetic scale or a demo dataset.
+        engine (str): Name of the engine used by AutoMLSearch.
+        max_batches (int): Number of batches to search. Defaults to 2.
+        random_seed (int): Seed for the dataset and the search. Defaults to 0.
+        profile_components (bool): Whether to record the time spent in each component. Defaults to False.
+
+    Returns:
+        dict: Timings and memory of each phase and throughput of the search.
+    """
+    phases = {}
+    with record_phase(phases, "load_data"):
+        X, y, problem_type, problem_configuration = load_dataset(
+            dataset_name, random_seed=random_seed
+        )
+    with record_phase(phases, "data_checks"):
+        DefaultDataChecks(
+            problem_type,
+            objective=get_default_primary_search_objective(problem_type),
+            problem_configuration=problem_configuration,
+        ).validate(X, y)
+    with record_phase(phases, "init"):
+        automl = AutoMLSearch(
+            X_train=X,
+            y_train=y,
+            problem_type=problem_type,
+            problem_configuration=problem_configuration,
+            max_batches=max_batches,
+            engine=engine,
+            random_seed=random_seed,
+            profile_components=profile_components,
+            verbose=False,
+        )
+    try:
+        with record_phase(phases, "search"):
+            automl.search(show_iteration_plot=False)
+    finally:
+        automl.close_engine()
+
+    pipeline_results = automl.results["pipeline_results"].values()
+    training_times = [result["training_time"] for result in pipeline_results]
+    search_seconds = phases["search"]["seconds"]
+    results = {
+        "dataset": dataset_name,
+        "engine": engine,
+        "n_rows": X.shape[0],
+        "n_columns": X.shape[1],
+        "problem_type": str(problem_type),
+        "max_batches": max_batches,
+        "n_pipelines": len(training_times),
+        "pipelines_per_minute": 60 * len(training_times) / search_seconds,
+        "phases": phases,
+        "pipeline_training_seconds": {
+            "total": float(np.sum(training_times)),
+            "mean": float(np.mean(training_times)),
+            "max": float(np.max(training_times)),
+        },
+    }
+    if profile_components:
+        component_profile = [
+            record
+            for result in pipeline_results
+            for fold in result["cv_data"]
+            for record in fold.get("component_profile", [])
+        ]
+        results["component_profile"] = ComponentProfiler.summarize(
+            component_profile
+        ).to_dict(orient="records")
+    return results
+
+
+def run_benchmarks(
+    datasets, engines, max_batches=2, random_seed=0, profile_components=False
+):
+    """Run every dataset with every engine.
+
+    Args:
+        datasets (list(str)): Names of the datasets to run.
+        engines (list(str)): Names of the engines to run.
+        max_batches (int): Number of batches to search. Defaults to 2.
+        random_seed (int): Seed for the datasets and the searches. Defaults to 0.
+        profile_components (bool): Whether to record the time spent in each component. Defaults to False.
+
+    Returns:
+        dict: Information about the environment and the results of each benchmark.
+    """
+    results = []
+    for dataset_name in datasets:
+        for engine in engines:
+            results.append(
+                run_benchmark(
+                    dataset_name,
+                    engine,
+                    max_batches=max_batches,
+                    random_seed=random_seed,
+                    profile_components=profile_components,
+                )
+            )
+    return {
+        "evalml_version": evalml.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": psutil.cpu_count(),
+        "total_memory_bytes": psutil.virtual_memory().total,
+        "benchmarks": results,
+    }
+
+
+def main():
+    """Parse the command line arguments, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        default=["synthetic_10k_10", "fraud", "churn", "weather"],
+        choices=list(SYNTHETIC_SCALES) + list(DEMO_DATASETS),
+    )
+    parser.add_argument("--engines", nargs="+", default=["sequential"], choices=ENGINES)
+    parser.add_argument("--max-batches", type=int, default=2)
+    parser.add_argument("--random-seed", type=int, default=0)
+    parser.add_argument("--profile-components", action="store_true")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        args.datasets,
+        args.engines,
+        max_batches=args.max_batches,
+        random_seed=args.random_seed,
+        profile_components=args.profile_components,
+    )
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 import click
 
+from evalml.utils.batch_scoring import score_file
 from evalml.utils.cli_utils import print_info
 
 
@@ -17,4 +18,41 @@ def info():
     print_info()
 
 
+@click.command()
+@click.argument("pipeline_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_path", type=click.Path(dir_okay=False))
+@click.option(
+    "--chunk-size",
+    default=100_000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of rows scored at a time.",
+)
+@click.option(
+    "--n-jobs",
+    default=-1,
+    show_default=True,
+    type=int,
+    help="Number of processes scoring chunks. -1 uses all processors.",
+)
+@click.option(
+    "--include-column",
+    "include_columns",
+    multiple=True,
+    help="Column of the input file copied to the output file, such as an ID column. Can be repeated.",
+)
+def score(pipeline_path, input_path, output_path, chunk_size, n_jobs, include_columns):
+    """CLI command with `score` argument. Writes the predictions of a saved pipeline on a CSV or parquet file to OUTPUT_PATH, scoring the file in chunks of rows across processes."""
+    score_file(
+        pipeline_path,
+        input_path,
+        output_path,
+        chunk_size=chunk_size,
+        n_jobs=n_jobs,
+        include_columns=list(include_columns),
+    )
+
+
 cli.add_command(info)
+cli.add_command(score)
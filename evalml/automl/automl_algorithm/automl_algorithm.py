@@ -90,6 +90,20 @@ class AutoMLAlgorithm(ABC):
             )
         self._tuners[pipeline.name].add(pipeline.parameters, score_to_minimize)
 
+    def add_pruned_result(self, score_to_minimize, pipeline):
+        """Register the score of a pipeline which was discarded after being evaluated on a subsample of the training data.
+
+        Only the tuner of the pipeline learns from the score, so that it proposes other parameters. The pipeline is not
+        considered as the best pipeline of its model family, since its score isn't comparable to the scores of pipelines
+        evaluated on all the training data.
+
+        Args:
+            score_to_minimize (float): The score obtained by this pipeline on the primary objective, converted so that lower values indicate better pipelines.
+            pipeline (PipelineBase): The pipeline which was evaluated.
+        """
+        if pipeline.name in self._tuners:
+            self._tuners[pipeline.name].add(pipeline.parameters, score_to_minimize)
+
     @property
     def pipeline_number(self):
         """Returns the number of pipelines which have been recommended so far."""
@@ -27,6 +27,8 @@ from evalml.automl.utils import (
     check_all_pipeline_names_unique,
     get_best_sampler_for_data,
     get_default_primary_search_objective,
+    get_subsample_row_order,
+    get_successive_halving_fidelities,
     make_data_splitter,
 )
 from evalml.data_checks import DataCheckMessageType, DefaultDataChecks
@@ -47,7 +49,12 @@ from evalml.pipelines import (
     MulticlassClassificationPipeline,
     RegressionPipeline,
 )
-from evalml.pipelines.utils import make_timeseries_baseline_pipeline
+from evalml.pipelines.component_cache import ComponentCache
+from evalml.pipelines.component_profiler import ComponentProfiler
+from evalml.pipelines.utils import (
+    _make_stacked_ensemble_metalearner_pipeline,
+    make_timeseries_baseline_pipeline,
+)
 from evalml.problem_types import (
     ProblemTypes,
     handle_problem_types,
@@ -396,6 +403,24 @@ class AutoMLSearch:
         allow_long_running_models (bool): Whether or not to allow longer-running models for large multiclass problems. If False and no pipelines, component graphs, or model families are provided,
             AutoMLSearch will not use Elastic Net or XGBoost when there are more than 75 multiclass targets and will not use CatBoost when there are more than 150 multiclass targets. Defaults to False.
 
+        component_cache_size (int): Memory budget, in bytes, of a cache of fitted transformers and their outputs which is shared between the pipelines evaluated during search.
+            Pipelines that share a preprocessing prefix reuse the fitted prefix on each cross-validation fold instead of refitting it.
+            The cache is shared between jobs run in the same process, so it has no effect with process-based engines. Defaults to None, which disables the cache.
+
+        profile_components (bool): Whether to record the time spent in each component of each pipeline on each cross-validation fold, along with the shape of its input
+            and output and the approximate memory it allocated, in bytes, as traced by tracemalloc. The records are stored under "component_profile" in the "cv_data"
+            of each pipeline in `results` and summarized by `describe_pipeline`. Defaults to False.
+
+        successive_halving (bool): Whether to evaluate the pipelines of each batch with successive halving. The pipelines are first evaluated on a small subsample
+            of the training rows, and only the best 1 / halving_factor of them are evaluated again on a subsample halving_factor times larger, until the remaining
+            pipelines are evaluated on all the training rows. Only pipelines evaluated on all the training rows are added to `rankings`, and the scores on the
+            subsamples are stored under "low_fidelity_results" in `results`. Not supported for time series problems. Defaults to False.
+
+        halving_factor (int): The factor by which the number of pipelines is reduced, and the number of training rows increased, after each round of
+            successive halving. Must be at least 2. Defaults to 3.
+
+        min_fidelity (float): The smallest fraction of the training rows pipelines are evaluated on with successive halving. Must be between 0 and 1. Defaults to 0.1.
+
         _ensembling_split_size (float): The amount of the training data we'll set aside for training ensemble metalearners. Only used when ensembling is True.
             Must be between 0 and 1, exclusive. Defaults to 0.2
 
@@ -444,6 +469,11 @@ class AutoMLSearch:
         sampler_method="auto",
         sampler_balanced_ratio=0.25,
         allow_long_running_models=False,
+        component_cache_size=None,
+        profile_components=False,
+        successive_halving=False,
+        halving_factor=3,
+        min_fidelity=0.1,
         _ensembling_split_size=0.2,
         _pipelines_per_batch=5,
         automl_algorithm="default",
@@ -579,6 +609,7 @@ class AutoMLSearch:
         self._results = {
             "pipeline_results": {},
             "search_order": [],
+            "low_fidelity_results": [],
         }
         self._pipelines_searched = dict()
         self.random_seed = random_seed
@@ -667,6 +698,44 @@ class AutoMLSearch:
                 "Invalid type provided for 'engine'.  Requires string, DaskEngine instance, or CFEngine instance."
             )
 
+        self.successive_halving = successive_halving
+        self.halving_factor = halving_factor
+        self._fidelities = [1.0]
+        self._subsample_row_order = None
+        if self.successive_halving:
+            if is_time_series(self.problem_type):
+                raise ValueError(
+                    "Successive halving is not supported for time series problems."
+                )
+            if not isinstance(halving_factor, int) or halving_factor < 2:
+                raise ValueError(
+                    f"Parameter halving_factor must be an integer of at least 2. Received {halving_factor}."
+                )
+            if not 0 < min_fidelity <= 1:
+                raise ValueError(
+                    f"Parameter min_fidelity must be greater than 0 and at most 1. Received {min_fidelity}."
+                )
+            self._fidelities = get_successive_halving_fidelities(
+                len(self.X_train), min_fidelity, halving_factor
+            )
+            self._subsample_row_order = get_subsample_row_order(
+                self.y_train,
+                self.problem_type,
+                self.data_splitter.get_n_splits(),
+                self.random_seed,
+            )
+
+        self._component_cache = None
+        if component_cache_size is not None:
+            self._component_cache = ComponentCache(max_size=component_cache_size)
+
+        # Stacked ensembles are evaluated by fitting their metalearner on the out-of-fold
+        # predictions recorded for their input pipelines.
+        self._oof_predictions = {}
+        record_oof_predictions = not is_time_series(self.problem_type) and (
+            self.ensembling or automl_algorithm == "default"
+        )
+
         self.automl_config = AutoMLConfig(
             self.data_splitter,
             self.problem_type,
@@ -678,6 +747,9 @@ class AutoMLSearch:
             self.random_seed,
             self.X_train.ww.schema,
             self.y_train.ww.schema,
+            self._component_cache,
+            record_oof_predictions,
+            profile_components,
         )
 
         text_in_ensembling = (
@@ -728,6 +800,11 @@ class AutoMLSearch:
         self.allowed_model_families = [p.model_family for p in self.allowed_pipelines]
         if automl_algorithm == "iterative":
             self.max_iterations = self.automl_algorithm.max_iterations
+            # The iterative algorithm turns ensembling off when the stopping criteria leave no room for it
+            if not self.automl_algorithm.ensembling:
+                self.automl_config = self.automl_config._replace(
+                    record_oof_predictions=False
+                )
 
         if not self.max_iterations and not self.max_time and not self.max_batches:
             self.max_batches = self.automl_algorithm.default_max_batches
@@ -917,35 +994,45 @@ class AutoMLSearch:
                         self.logger,
                         f"Evaluating Batch Number {self._get_batch_number()}",
                     )
-                    for pipeline in current_batch_pipelines:
-                        self._pre_evaluation_callback(pipeline)
-                        computation = self._engine.submit_evaluation_job(
-                            self.automl_config, pipeline, self.X_train, self.y_train
+                    pipelines_to_evaluate = current_batch_pipelines
+                    if self.successive_halving:
+                        pipelines_to_evaluate = self._successive_halving(
+                            current_batch_pipelines
                         )
+                    for pipeline in pipelines_to_evaluate:
+                        self._pre_evaluation_callback(pipeline)
+                        computation = self._submit_evaluation_job(pipeline)
                         computations.append((computation, False))
-                    current_computation_index = 0
                     computations_left_to_process = len(computations)
+                # Wait for at most the sleep time at once, so that the search stops promptly once it shouldn't continue
+                completed_computations = self._engine.as_completed(
+                    [computation for computation, _ in computations],
+                    poll_interval=self._sleep_time,
+                    timeout=self._sleep_time,
+                )
                 while self._should_continue() and computations_left_to_process > 0:
-                    computation, has_been_processed = computations[
-                        current_computation_index
-                    ]
-                    if computation.done() and not has_been_processed:
-                        evaluation = computation.get_result()
-                        data, pipeline, job_log = (
-                            evaluation.get("scores"),
-                            evaluation.get("pipeline"),
-                            evaluation.get("logger"),
-                        )
-                        pipeline_id = self._post_evaluation_callback(
-                            pipeline, data, job_log
+                    computation = next(completed_computations)
+                    if computation is None:
+                        continue
+                    evaluation = computation.get_result()
+                    data, pipeline, job_log = (
+                        evaluation.get("scores"),
+                        evaluation.get("pipeline"),
+                        evaluation.get("logger"),
+                    )
+                    if "ensemble_pipeline" in computation.meta_data:
+                        pipeline = self._get_evaluated_ensemble_pipeline(
+                            computation.meta_data["ensemble_pipeline"], pipeline
                         )
-                        new_pipeline_ids.append(pipeline_id)
-                        computations[current_computation_index] = (computation, True)
-                        computations_left_to_process -= 1
-                    current_computation_index = (current_computation_index + 1) % max(
-                        len(computations), 1
+                    pipeline_id = self._post_evaluation_callback(
+                        pipeline, data, job_log
                     )
-                    time.sleep(self._sleep_time)
+                    new_pipeline_ids.append(pipeline_id)
+                    computations = [
+                        (other, has_been_processed or other is computation)
+                        for other, has_been_processed in computations
+                    ]
+                    computations_left_to_process -= 1
                 loop_interrupted = False
             except KeyboardInterrupt:
                 loop_interrupted = True
@@ -1011,6 +1098,196 @@ class AutoMLSearch:
         """
         return len(self._results["pipeline_results"])
 
+    def _submit_evaluation_job(self, pipeline):
+        """Submits a pipeline for evaluation.
+
+        Stacked ensembles whose input pipelines all have recorded out-of-fold predictions are evaluated by fitting
+        only their metalearner on those predictions. The ensemble pipeline is stored in the meta data of the computation.
+        """
+        oof_features = None
+        if pipeline.model_family == ModelFamily.ENSEMBLE:
+            oof_features = self._get_ensemble_oof_features(pipeline)
+        if oof_features is None:
+            automl_config = self.automl_config._replace(
+                record_oof_predictions=self._should_record_oof_predictions(pipeline)
+            )
+            return self._engine.submit_evaluation_job(
+                automl_config, pipeline, self.X_train, self.y_train
+            )
+        metalearner = _make_stacked_ensemble_metalearner_pipeline(pipeline)
+        automl_config = self.automl_config._replace(
+            X_schema=oof_features.ww.schema, record_oof_predictions=False
+        )
+        computation = self._engine.submit_evaluation_job(
+            automl_config, metalearner, oof_features, self.y_train
+        )
+        computation.meta_data["ensemble_pipeline"] = pipeline
+        return computation
+
+    def _should_record_oof_predictions(self, pipeline):
+        """Returns whether to record the out-of-fold predictions of a pipeline being submitted for evaluation.
+
+        Recording costs an extra prediction on every validation split, so predictions are only recorded for pipelines
+        which can be the input of a stacked ensemble, and only while the stopping criteria leave room for a later batch
+        in which the ensemble can run.
+        """
+        if not self.automl_config.record_oof_predictions:
+            return False
+        if pipeline.model_family in (ModelFamily.BASELINE, ModelFamily.ENSEMBLE):
+            return False
+        if self.max_batches and self._get_batch_number() >= self.max_batches:
+            return False
+        # The baseline pipeline isn't counted by the algorithm
+        if (
+            self.max_iterations
+            and self.automl_algorithm.pipeline_number + 1 >= self.max_iterations
+        ):
+            return False
+        return True
+
+    def _score_to_minimize(self, score):
+        if pd.isnull(score):
+            return np.inf
+        return -score if self.objective.greater_is_better else score
+
+    def _successive_halving(self, pipelines):
+        """Evaluates pipelines on growing subsamples of the training rows, keeping the best 1 / halving_factor of them after each round.
+
+        Stacked ensembles are not evaluated on subsamples, since they are built from pipelines evaluated on all the training rows.
+
+        Returns:
+            list[PipelineBase]: The pipelines to evaluate on all the training rows.
+        """
+        candidates = [
+            pipeline
+            for pipeline in pipelines
+            if pipeline.model_family != ModelFamily.ENSEMBLE
+        ]
+        ensembles = [
+            pipeline
+            for pipeline in pipelines
+            if pipeline.model_family == ModelFamily.ENSEMBLE
+        ]
+        for fidelity in self._fidelities[:-1]:
+            if len(candidates) < self.halving_factor:
+                break
+            if not self._should_continue():
+                return []
+            scores = self._evaluate_on_subsample(candidates, fidelity)
+            if scores is None:
+                return []
+            n_promoted = int(np.ceil(len(candidates) / self.halving_factor))
+            ranks = np.argsort(
+                [self._score_to_minimize(score) for score in scores], kind="stable"
+            )
+            promoted = set(ranks[:n_promoted])
+            for i, (pipeline, score) in enumerate(zip(candidates, scores)):
+                self._results["low_fidelity_results"].append(
+                    {
+                        "pipeline_name": pipeline.name,
+                        "parameters": pipeline.parameters,
+                        "fidelity": fidelity,
+                        "validation_score": score,
+                        "promoted": i in promoted,
+                    }
+                )
+                if i not in promoted:
+                    self.automl_algorithm.add_pruned_result(
+                        self._score_to_minimize(score), pipeline
+                    )
+            candidates = [
+                pipeline for i, pipeline in enumerate(candidates) if i in promoted
+            ]
+        return candidates + ensembles
+
+    def _evaluate_on_subsample(self, pipelines, fidelity):
+        """Evaluates pipelines on a fraction of the training rows and returns their mean validation scores.
+
+        Returns None if the search should stop before all the evaluations are done, after cancelling the ones left.
+        """
+        n_rows = int(np.ceil(fidelity * len(self.X_train)))
+        rows = np.sort(self._subsample_row_order[:n_rows])
+        X = self.X_train.ww.iloc[rows]
+        y = self.y_train.ww.iloc[rows]
+        automl_config = self.automl_config._replace(record_oof_predictions=False)
+        self.logger.info(
+            f"Evaluating {len(pipelines)} pipelines on {n_rows} of {len(self.X_train)} training rows"
+        )
+        computations = [
+            self._engine.submit_evaluation_job(automl_config, pipeline, X, y)
+            for pipeline in pipelines
+        ]
+        scores = [None] * len(computations)
+        computations_left_to_process = len(computations)
+        try:
+            # Wait for at most the sleep time at once, so that the search stops promptly once it shouldn't continue
+            completed_computations = self._engine.as_completed(
+                computations, poll_interval=self._sleep_time, timeout=self._sleep_time
+            )
+            while computations_left_to_process > 0:
+                if not self._should_continue():
+                    for computation in computations:
+                        if not computation.done():
+                            computation.cancel()
+                    return None
+                computation = next(completed_computations)
+                if computation is None:
+                    continue
+                evaluation = computation.get_result()
+                evaluation.get("logger").write_to_logger(self.logger)
+                position = next(
+                    i for i, other in enumerate(computations) if other is computation
+                )
+                scores[position] = evaluation.get("scores")["cv_scores"].mean()
+                computations_left_to_process -= 1
+        except KeyboardInterrupt:
+            for computation in computations:
+                computation.cancel()
+            raise
+        return scores
+
+    def _get_ensemble_oof_features(self, ensemble_pipeline):
+        """Builds the metalearner features of a stacked ensemble from the out-of-fold predictions of its input pipelines.
+
+        Returns None if the predictions of any input pipeline are missing or incomplete, for example when the data splitter
+        does not predict on every row.
+        """
+        input_ids = [
+            pipeline_info["id"]
+            for pipeline_info in self.automl_algorithm._best_pipeline_info.values()
+        ]
+        input_names = ensemble_pipeline.component_graph.get_inputs(
+            ensemble_pipeline.estimator.name
+        )[:-1]
+        if not input_ids or len(input_ids) != len(input_names):
+            return None
+        oof_features = []
+        for pipeline_id, input_name in zip(input_ids, input_names):
+            predictions = self._oof_predictions.get(pipeline_id)
+            if predictions is None or predictions.isna().to_numpy().any():
+                return None
+            component_name = input_name[: -len(".x")]
+            oof_features.append(
+                predictions.rename(
+                    columns={
+                        col: f"Col {str(col)} {component_name}.x"
+                        for col in predictions.columns
+                    }
+                )
+            )
+        oof_features = pd.concat(oof_features, axis=1)
+        oof_features.ww.init(
+            logical_types={col: "Double" for col in oof_features.columns}
+        )
+        return oof_features
+
+    def _get_evaluated_ensemble_pipeline(self, ensemble_pipeline, metalearner):
+        """Returns the ensemble pipeline to record for a metalearner evaluated on out-of-fold predictions."""
+        ensemble_pipeline = ensemble_pipeline.clone()
+        if is_binary(self.problem_type):
+            ensemble_pipeline.threshold = metalearner.threshold
+        return ensemble_pipeline
+
     def _should_continue(self):
         """Given the original stopping criterion and current state, return whether or not the search should continue.
 
@@ -1117,7 +1394,10 @@ class AutoMLSearch:
         self._pre_evaluation_callback(baseline)
         self.logger.info(f"Evaluating Baseline Pipeline: {baseline.name}")
         computation = self._engine.submit_evaluation_job(
-            self.automl_config, baseline, self.X_train, self.y_train
+            self.automl_config._replace(record_oof_predictions=False),
+            baseline,
+            self.X_train,
+            self.y_train,
         )
         evaluation = computation.get_result()
         data, pipeline, job_log = (
@@ -1191,6 +1471,7 @@ class AutoMLSearch:
                 self.objective.name
             ],
             "validation_score": validation_score,
+            "fidelity": 1.0,
         }
         self._pipelines_searched.update({pipeline_id: pipeline.clone()})
 
@@ -1219,6 +1500,7 @@ class AutoMLSearch:
                 )
             except PipelineNotFoundError:
                 pass
+            self._store_oof_predictions(pipeline_id, evaluation_results)
 
         # True when running in a jupyter notebook, else the plot is an instance of plotly.Figure
         if isinstance(self.search_iteration_plot, SearchIterationPlot):
@@ -1230,6 +1512,21 @@ class AutoMLSearch:
             )
         return pipeline_id
 
+    def _store_oof_predictions(self, pipeline_id, evaluation_results):
+        """Stores the out-of-fold predictions of a pipeline while it may be used as an input to a stacked ensemble."""
+        best_pipeline_info = getattr(self.automl_algorithm, "_best_pipeline_info", {})
+        best_ids = {
+            pipeline_info["id"] for pipeline_info in best_pipeline_info.values()
+        }
+        oof_predictions = evaluation_results.get("oof_predictions")
+        if oof_predictions is not None and pipeline_id in best_ids:
+            self._oof_predictions[pipeline_id] = oof_predictions
+        self._oof_predictions = {
+            pipeline_id: predictions
+            for pipeline_id, predictions in self._oof_predictions.items()
+            if pipeline_id in best_ids
+        }
+
     def _check_for_high_variance(self, pipeline, cv_scores, threshold=0.5):
         """Checks cross-validation scores and logs a warning if variance is higher than specified threshhold."""
         pipeline_name = pipeline.name
@@ -1351,6 +1648,18 @@ class AutoMLSearch:
         ):
             logger.info(all_objective_scores)
 
+        component_profile = [
+            record
+            for fold in pipeline_results["cv_data"]
+            for record in fold.get("component_profile", [])
+        ]
+        if component_profile:
+            log_subtitle(logger, "Component Profile", underline="-")
+            with pd.option_context(
+                "display.float_format", "{:.3f}".format, "expand_frame_repr", False
+            ):
+                logger.info(ComponentProfiler.summarize(component_profile))
+
         if return_dict:
             return pipeline_results
 
@@ -1517,19 +1826,17 @@ class AutoMLSearch:
                 )
             )
 
-        while computations:
-            computation = computations.pop(0)
-            if computation.done():
-                try:
-                    fitted_pipeline = computation.get_result()
-                    fitted_pipelines[fitted_pipeline.name] = fitted_pipeline
-                except Exception as e:
-                    self.logger.error(f"Train error for {pipeline.name}: {str(e)}")
-                    tb = traceback.format_tb(sys.exc_info()[2])
-                    self.logger.error("Traceback:")
-                    self.logger.error("\n".join(tb))
-            else:
-                computations.append(computation)
+        for computation in self._engine.as_completed(
+            computations, poll_interval=self._sleep_time
+        ):
+            try:
+                fitted_pipeline = computation.get_result()
+                fitted_pipelines[fitted_pipeline.name] = fitted_pipeline
+            except Exception as e:
+                self.logger.error(f"Train error for {pipeline.name}: {str(e)}")
+                tb = traceback.format_tb(sys.exc_info()[2])
+                self.logger.error("Traceback:")
+                self.logger.error("\n".join(tb))
 
         return fitted_pipelines
 
@@ -1571,28 +1878,26 @@ class AutoMLSearch:
                 )
             )
 
-        while computations:
-            computation = computations.pop(0)
-            if computation.done():
-                pipeline_name = computation.meta_data["pipeline_name"]
-                try:
-                    scores[pipeline_name] = computation.get_result()
-                except Exception as e:
-                    self.logger.error(f"Score error for {pipeline_name}: {str(e)}")
-                    if isinstance(e, PipelineScoreError):
-                        nan_scores = {objective: np.nan for objective in e.exceptions}
-                        scores[pipeline_name] = {**nan_scores, **e.scored_successfully}
-                    else:
-                        # Traceback already included in the PipelineScoreError so we only
-                        # need to include it for all other errors
-                        tb = traceback.format_tb(sys.exc_info()[2])
-                        self.logger.error("Traceback:")
-                        self.logger.error("\n".join(tb))
-                        scores[pipeline_name] = {
-                            objective.name: np.nan for objective in objectives
-                        }
-            else:
-                computations.append(computation)
+        for computation in self._engine.as_completed(
+            computations, poll_interval=self._sleep_time
+        ):
+            pipeline_name = computation.meta_data["pipeline_name"]
+            try:
+                scores[pipeline_name] = computation.get_result()
+            except Exception as e:
+                self.logger.error(f"Score error for {pipeline_name}: {str(e)}")
+                if isinstance(e, PipelineScoreError):
+                    nan_scores = {objective: np.nan for objective in e.exceptions}
+                    scores[pipeline_name] = {**nan_scores, **e.scored_successfully}
+                else:
+                    # Traceback already included in the PipelineScoreError so we only
+                    # need to include it for all other errors
+                    tb = traceback.format_tb(sys.exc_info()[2])
+                    self.logger.error("Traceback:")
+                    self.logger.error("\n".join(tb))
+                    scores[pipeline_name] = {
+                        objective.name: np.nan for objective in objectives
+                    }
         return scores
 
     @property
@@ -1603,6 +1908,18 @@ class AutoMLSearch:
         except ImportError:
             return None
 
+    @property
+    def component_cache_info(self):
+        """Returns the hit, miss and eviction counters and the memory usage of the cache of fitted components shared between pipelines.
+
+        Returns:
+            dict, None: Dictionary with keys "hits", "misses", "evictions", "entries", "size" and "max_size",
+                or None if the cache is disabled.
+        """
+        if self._component_cache is None:
+            return None
+        return self._component_cache.info()
+
     @property
     def _sleep_time(self):
         return self._SLEEP_TIME
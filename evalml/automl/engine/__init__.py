@@ -1,10 +1,13 @@
 """EvalML Engine classes used to evaluate pipelines in AutoMLSearch."""
 from .engine_base import (
+    DataCache,
     EngineBase,
     EngineComputation,
+    FoldEvaluationComputation,
     train_pipeline,
     train_and_score_pipeline,
     evaluate_pipeline,
+    evaluate_pipeline_fold,
 )
 from .sequential_engine import SequentialEngine
 from .dask_engine import DaskEngine
@@ -1,13 +1,24 @@
 """Custom CFClient API to match Dask's CFClient and allow context management."""
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import shutil
+import tempfile
+import weakref
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 
 from evalml.automl.engine.engine_base import (
+    DataCache,
     EngineBase,
     EngineComputation,
+    _get_futures,
     evaluate_pipeline,
     score_pipeline,
     train_pipeline,
 )
+from evalml.automl.engine.shared_data import SharedData
 
 
 class CFClient:
@@ -93,9 +104,13 @@ class CFEngine(EngineBase):
 
     Args:
         client (None or CFClient): If None, creates a threaded pool for processing. Defaults to None.
+        parallel_folds (bool): If True, each cross-validation fold of a pipeline is evaluated as a separate job, so that
+            the folds of a slow pipeline run in parallel. Defaults to False.
+        share_data (bool): If True and the client uses a process pool, the data is written once to memory-mapped files
+            which the worker processes load without copying, instead of pickling the data into every job. Defaults to True.
     """
 
-    def __init__(self, client=None):
+    def __init__(self, client=None, parallel_folds=False, share_data=True):
         if client is not None and not isinstance(client, CFClient):
             raise TypeError(
                 f"Expected evalml.automl.engine.cf_engine.CFClient, received {type(client)}"
@@ -103,7 +118,58 @@ class CFEngine(EngineBase):
         elif client is None:
             client = CFClient(ThreadPoolExecutor())
         self.client = client
-        self._data_futures_cache = {}
+        self.parallel_folds = parallel_folds
+        self.share_data = share_data
+        self._data_cache = DataCache()
+        self._shared_data_dir = None
+        self._remove_shared_data_dir = None
+
+    @property
+    def _uses_shared_data(self):
+        return self.share_data and isinstance(self.client.pool, ProcessPoolExecutor)
+
+    def _share(self, data):
+        if data is None:
+            return None
+        if self._shared_data_dir is None:
+            self._shared_data_dir = tempfile.mkdtemp(prefix="evalml_cf_engine_")
+            self._remove_shared_data_dir = weakref.finalize(
+                self, shutil.rmtree, self._shared_data_dir, ignore_errors=True
+            )
+        return SharedData.write(data, self._shared_data_dir)
+
+    def send_data_to_pool(self, X, y):
+        """Send data to the worker processes of the pool.
+
+        With a process pool, the data is written once to memory-mapped files and the jobs only carry handles to them,
+        which the worker processes load without copying the data. The handles are cached by the identity of the data,
+        see DataCache. With a thread pool, or if share_data is False, the data is returned unchanged.
+
+        Args:
+            X (pd.DataFrame): Input data for modeling.
+            y (pd.Series): Target data for modeling.
+
+        Returns:
+            tuple: The modeling data, or SharedData handles to it.
+        """
+        if not self._uses_shared_data:
+            return X, y
+        shared_data = self._data_cache.get(X, y)
+        if shared_data is None:
+            shared_data = self._share(X), self._share(y)
+            self._data_cache.set(X, y, shared_data)
+        return shared_data
+
+    def _wait_for_any(self, computations, poll_interval, timeout=None):
+        """Blocks until at least one of the underlying futures of the computations is done, or until the timeout expires."""
+        futures = [
+            future
+            for computation in computations
+            for future in _get_futures(computation)
+            if not future.done()
+        ]
+        if futures:
+            wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
 
     def submit_evaluation_job(self, automl_config, pipeline, X, y):
         """Send evaluation job to cluster.
@@ -116,10 +182,23 @@ class CFEngine(EngineBase):
 
         Returns:
             CFComputation: An object wrapping a reference to a future-like computation
-                occurring in the resource pool
+                occurring in the resource pool. FoldEvaluationComputation if parallel_folds is True.
         """
+        if self.parallel_folds:
+            return self._submit_fold_evaluation_jobs(
+                lambda func, **kwargs: CFComputation(
+                    self.client.submit(_load_shared_data, func, **kwargs)
+                ),
+                automl_config,
+                pipeline,
+                X,
+                y,
+                data=self.send_data_to_pool(X, y),
+            )
         logger = self.setup_job_log()
+        X, y = self.send_data_to_pool(X, y)
         future = self.client.submit(
+            _load_shared_data,
             evaluate_pipeline,
             pipeline=pipeline,
             automl_config=automl_config,
@@ -142,8 +221,14 @@ class CFEngine(EngineBase):
             CFComputation: An object wrapping a reference to a future-like computation
                 occurring in the resource pool
         """
+        X, y = self.send_data_to_pool(X, y)
         future = self.client.submit(
-            train_pipeline, pipeline=pipeline, X=X, y=y, automl_config=automl_config
+            _load_shared_data,
+            train_pipeline,
+            pipeline=pipeline,
+            X=X,
+            y=y,
+            automl_config=automl_config,
         )
         return CFComputation(future)
 
@@ -168,7 +253,10 @@ class CFEngine(EngineBase):
         # Get the schema before we lose it
         X_schema = X.ww.schema
         y_schema = y.ww.schema
+        X, y = self.send_data_to_pool(X, y)
+        X_train, y_train = self.send_data_to_pool(X_train, y_train)
         future = self.client.submit(
+            _load_shared_data,
             score_pipeline,
             pipeline=pipeline,
             X=X,
@@ -186,8 +274,22 @@ class CFEngine(EngineBase):
     def close(self):
         """Function to properly shutdown the Engine's Client's resources."""
         self.client.close()
+        if self._remove_shared_data_dir is not None:
+            self._remove_shared_data_dir()
+        self._data_cache.clear()
+        self._shared_data_dir = None
+        self._remove_shared_data_dir = None
 
     @property
     def is_closed(self):
         """Property that determines whether the Engine's Client's resources are shutdown."""
         return self.client.is_closed
+
+
+def _load_shared_data(func, **kwargs):
+    """Loads the shared data passed to a job in the worker process, then runs the job."""
+    kwargs = {
+        name: value.load() if isinstance(value, SharedData) else value
+        for name, value in kwargs.items()
+    }
+    return func(**kwargs)
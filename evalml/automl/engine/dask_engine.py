@@ -1,10 +1,13 @@
 """A Future-like wrapper around jobs created by the DaskEngine."""
-import joblib
-from dask.distributed import Client, LocalCluster
+import asyncio
+
+from dask.distributed import Client, LocalCluster, wait
 
 from evalml.automl.engine.engine_base import (
+    DataCache,
     EngineBase,
     EngineComputation,
+    _get_futures,
     evaluate_pipeline,
     score_pipeline,
     train_pipeline,
@@ -53,9 +56,11 @@ class DaskEngine(EngineBase):
     Args:
         cluster (None or dd.Client): If None, creates a local, threaded Dask client for processing.
             Defaults to None.
+        parallel_folds (bool): If True, each cross-validation fold of a pipeline is evaluated as a separate job, so that
+            the folds of a slow pipeline run in parallel. Defaults to False.
     """
 
-    def __init__(self, cluster=None):
+    def __init__(self, cluster=None, parallel_folds=False):
         if cluster is not None and not isinstance(cluster, (LocalCluster)):
             raise TypeError(
                 f"Expected dask.distributed.Client, received {type(cluster)}"
@@ -64,7 +69,8 @@ class DaskEngine(EngineBase):
             cluster = LocalCluster(processes=False)
         self.cluster = cluster
         self.client = Client(self.cluster)
-        self._data_futures_cache = {}
+        self.parallel_folds = parallel_folds
+        self._data_cache = DataCache()
 
     def __enter__(self):
         """Enter runtime context."""
@@ -78,7 +84,7 @@ class DaskEngine(EngineBase):
         """Send data to the cluster.
 
         The implementation uses caching so the data is only sent once. This follows
-        dask best practices.
+        dask best practices. The cache is looked up by the identity of the data, see DataCache.
 
         Args:
             X (pd.DataFrame): Input data for modeling.
@@ -87,15 +93,28 @@ class DaskEngine(EngineBase):
         Returns:
             dask.Future: The modeling data.
         """
-        data_hash = joblib.hash(X), joblib.hash(y)
-        if data_hash in self._data_futures_cache:
-            X_future, y_future = self._data_futures_cache[data_hash]
+        data_futures = self._data_cache.get(X, y)
+        if data_futures is not None:
+            X_future, y_future = data_futures
             if not (X_future.cancelled() or y_future.cancelled()):
                 return X_future, y_future
-        self._data_futures_cache[data_hash] = self.client.scatter(
-            [X, y], broadcast=True
-        )
-        return self._data_futures_cache[data_hash]
+        data_futures = self.client.scatter([X, y], broadcast=True)
+        self._data_cache.set(X, y, data_futures)
+        return data_futures
+
+    def _wait_for_any(self, computations, poll_interval, timeout=None):
+        """Blocks until at least one of the underlying futures of the computations is done, or until the timeout expires."""
+        futures = [
+            future
+            for computation in computations
+            for future in _get_futures(computation)
+            if not future.done()
+        ]
+        if futures:
+            try:
+                wait(futures, timeout=timeout, return_when="FIRST_COMPLETED")
+            except asyncio.TimeoutError:
+                pass
 
     def submit_evaluation_job(self, automl_config, pipeline, X, y):
         """Send evaluation job to cluster.
@@ -108,8 +127,19 @@ class DaskEngine(EngineBase):
 
         Returns:
             DaskComputation: An object wrapping a reference to a future-like computation
-                occurring in the dask cluster.
+                occurring in the dask cluster. FoldEvaluationComputation if parallel_folds is True.
         """
+        if self.parallel_folds:
+            return self._submit_fold_evaluation_jobs(
+                lambda func, **kwargs: DaskComputation(
+                    self.client.submit(func, **kwargs)
+                ),
+                automl_config,
+                pipeline,
+                X,
+                y,
+                data=self.send_data_to_cluster(X, y),
+            )
         logger = self.setup_job_log()
         X, y = self.send_data_to_cluster(X, y)
         dask_future = self.client.submit(
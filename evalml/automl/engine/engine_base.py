@@ -4,13 +4,16 @@ import time
 import traceback
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from contextlib import nullcontext
 
+import joblib
 import numpy as np
 import pandas as pd
 import woodwork as ww
 
 from evalml.automl.utils import tune_binary_threshold
 from evalml.exceptions import PipelineScoreError
+from evalml.pipelines.component_profiler import ComponentProfiler
 from evalml.preprocessing import split_data
 from evalml.problem_types import (
     is_binary,
@@ -39,6 +42,78 @@ class EngineComputation(ABC):
         """Cancel the computation."""
 
 
+class FoldEvaluationComputation(EngineComputation):
+    """Wrapper around the computations evaluating each cross-validation fold of a pipeline as a separate job.
+
+    The fold results are gathered into the same structure returned by evaluate_pipeline once every fold is done.
+
+    Args:
+        fold_computations (list[EngineComputation]): The computations evaluating each fold, in fold order.
+        pipeline (PipelineBase): The pipeline being evaluated.
+        automl_config (AutoMLConfig): The AutoMLSearch config the pipeline is evaluated with.
+        index (pd.Index): Index of the training data.
+        logger (JobLogger): Logger of the whole evaluation. The logs of each fold are appended to it.
+    """
+
+    def __init__(self, fold_computations, pipeline, automl_config, index, logger):
+        self.fold_computations = fold_computations
+        self.pipeline = pipeline
+        self.automl_config = automl_config
+        self.index = index
+        self.logger = logger
+        self.meta_data = {}
+        self._result = None
+
+    def done(self):
+        """Returns whether every fold computation is done."""
+        return all(computation.done() for computation in self.fold_computations)
+
+    def get_result(self):
+        """Gets the gathered fold results. Will block until every fold computation is finished.
+
+        Raises:
+            Exception: If any fold computation fails.
+
+        Returns:
+            dict: The scores, the pipeline trained on the last fold and the job logger, as returned by evaluate_pipeline.
+        """
+        if self._result is not None:
+            return self._result
+        fold_results = [
+            computation.get_result() for computation in self.fold_computations
+        ]
+        for fold_result in fold_results:
+            self.logger.logs.extend(fold_result["logger"].logs)
+        training_time = sum(
+            fold_result["training_time"] for fold_result in fold_results
+        )
+        self._result = _gather_fold_results(
+            self.pipeline,
+            self.automl_config,
+            fold_results,
+            self.index,
+            training_time,
+            self.logger,
+        )
+        return self._result
+
+    def cancel(self):
+        """Cancel every fold computation."""
+        for computation in self.fold_computations:
+            computation.cancel()
+
+
+def _get_futures(computation):
+    """Returns the futures underlying a computation submitted to a CFEngine or DaskEngine."""
+    if isinstance(computation, FoldEvaluationComputation):
+        return [
+            future
+            for fold_computation in computation.fold_computations
+            for future in _get_futures(fold_computation)
+        ]
+    return [computation.work]
+
+
 class JobLogger:
     """Mimic the behavior of a python logging.Logger but stores all messages rather than actually logging them.
 
@@ -79,6 +154,79 @@ class JobLogger:
             method(message)
 
 
+class DataCache:
+    """Cache of the data sent to the workers of an engine, such as scattered futures or shared data handles.
+
+    Entries are looked up by the identity of the features and target, so a lookup does not read the data. To catch
+    data modified in place, each entry also keeps a cheap fingerprint of the data, made of its shape, column names,
+    dtypes and a hash of at most `n_sample_rows` rows sampled at even intervals, and an entry whose fingerprint has
+    changed is discarded. Modifications to rows which are not sampled are not detected, so call `clear` after
+    modifying cached data in place.
+
+    Args:
+        n_sample_rows (int): Maximum number of rows hashed for the fingerprint of the data. Defaults to 1000.
+    """
+
+    def __init__(self, n_sample_rows=1000):
+        self.n_sample_rows = n_sample_rows
+        self._entries = {}
+
+    def fingerprint(self, data):
+        """Computes the fingerprint of a dataframe or series.
+
+        Args:
+            data (pd.DataFrame, pd.Series): The data.
+
+        Returns:
+            tuple: The fingerprint of the data, or None if data is None.
+        """
+        if data is None:
+            return None
+        step = max(1, len(data) // self.n_sample_rows)
+        if isinstance(data, pd.DataFrame):
+            columns, dtypes = tuple(data.columns), tuple(map(str, data.dtypes))
+        else:
+            columns, dtypes = data.name, str(data.dtype)
+        return data.shape, columns, dtypes, joblib.hash(data.iloc[::step])
+
+    def get(self, X, y):
+        """Returns the value cached for the data, or None if the data is not cached or has changed.
+
+        Args:
+            X (pd.DataFrame): Input data for modeling.
+            y (pd.Series): Target data for modeling.
+
+        Returns:
+            The cached value, or None.
+        """
+        entry = self._entries.get((id(X), id(y)))
+        if entry is None:
+            return None
+        cached_X, cached_y, fingerprint, value = entry
+        if cached_X is X and cached_y is y and fingerprint == self._fingerprints(X, y):
+            return value
+        del self._entries[(id(X), id(y))]
+        return None
+
+    def set(self, X, y, value):
+        """Caches a value for the data.
+
+        Args:
+            X (pd.DataFrame): Input data for modeling.
+            y (pd.Series): Target data for modeling.
+            value: The value to cache, e.g. the data sent to the workers.
+        """
+        # Keep references to the data so its id is not reused while it is cached
+        self._entries[(id(X), id(y))] = X, y, self._fingerprints(X, y), value
+
+    def clear(self):
+        """Removes every entry of the cache."""
+        self._entries = {}
+
+    def _fingerprints(self, X, y):
+        return self.fingerprint(X), self.fingerprint(y)
+
+
 class EngineBase(ABC):
     """Base class for EvalML engines."""
 
@@ -101,6 +249,78 @@ class EngineBase(ABC):
     ):
         """Submit job for pipeline scoring."""
 
+    def as_completed(self, computations, poll_interval=0.01, timeout=None):
+        """Yields computations as soon as they are done, regardless of the order they were submitted in.
+
+        Args:
+            computations (list[EngineComputation]): The computations to wait on.
+            poll_interval (float): Seconds to wait between checks of the computations, for engines which cannot
+                block until one of their computations is done. Defaults to 0.01.
+            timeout (float): Maximum seconds to wait for the next computation to be done. If no computation is done by
+                then, None is yielded so that the caller can check whether to keep waiting. Defaults to None, which
+                waits until the next computation is done.
+
+        Yields:
+            EngineComputation: The next computation which is done, or None if the timeout expired first.
+        """
+        remaining = list(computations)
+        while remaining:
+            any_done = False
+            for computation in list(remaining):
+                if computation.done():
+                    any_done = True
+                    remaining.remove(computation)
+                    yield computation
+            if remaining and not any_done:
+                self._wait_for_any(remaining, poll_interval, timeout)
+                if timeout is not None and not any(
+                    computation.done() for computation in remaining
+                ):
+                    yield None
+
+    def _wait_for_any(self, computations, poll_interval, timeout=None):
+        """Blocks until at least one of the computations may be done, or until the timeout expires."""
+        time.sleep(poll_interval if timeout is None else min(poll_interval, timeout))
+
+    def _submit_fold_evaluation_jobs(
+        self, submit, automl_config, pipeline, X, y, data=None
+    ):
+        """Submits one job per cross-validation fold of a pipeline.
+
+        Args:
+            submit (callable): Submits a function and its keyword arguments as a job, returning an EngineComputation.
+            automl_config: Structure containing data passed from AutoMLSearch instance.
+            pipeline (pipeline.PipelineBase): Pipeline to evaluate.
+            X (pd.DataFrame): Input data for modeling.
+            y (pd.Series): Target data for modeling.
+            data (tuple): The data to submit with the jobs in place of X and y, e.g. data already sent to a cluster.
+                Defaults to None.
+
+        Returns:
+            FoldEvaluationComputation: Computation gathering the results of every fold.
+        """
+        X_job, y_job = data if data is not None else (X, y)
+        logger = self.setup_job_log()
+        logger.info(f"{pipeline.name}:")
+        logger.info("\tStarting cross validation")
+        fold_computations = [
+            submit(
+                evaluate_pipeline_fold,
+                pipeline=pipeline,
+                automl_config=automl_config,
+                X=X_job,
+                y=y_job,
+                fold=i,
+                train=train,
+                valid=valid,
+                logger=self.setup_job_log(),
+            )
+            for i, (train, valid) in enumerate(get_cv_splits(automl_config, X, y))
+        ]
+        return FoldEvaluationComputation(
+            fold_computations, pipeline, automl_config, X.index, logger
+        )
+
 
 def train_pipeline(pipeline, X, y, automl_config, schema=True):
     """Train a pipeline and tune the threshold if necessary.
@@ -176,53 +396,117 @@ def train_and_score_pipeline(
         Exception: If there are missing target values in the training set after data split.
 
     Returns:
-        tuple of three items: First - A dict containing cv_score_mean, cv_scores, training_time and a cv_data structure with details.
+        tuple of three items: First - A dict containing cv_score_mean, cv_scores, training_time and a cv_data structure with details,
+            plus the out-of-fold predictions of the pipeline if automl_config.record_oof_predictions is True.
             Second - The pipeline class we trained and scored. Third - the job logger instance with all the recorded messages.
     """
     start = time.time()
-    cv_data = []
     logger.info("\tStarting cross validation")
-    # Encode target for classification problems so that we can support float targets. This is okay because we only use split to get the indices to split on
-    if is_classification(automl_config.problem_type):
-        y_mapping = {
-            original_target: encoded_target
-            for (encoded_target, original_target) in enumerate(
-                full_y_train.value_counts().index
-            )
-        }
-        full_y_train = ww.init_series(full_y_train.map(y_mapping))
-    cv_pipeline = pipeline
+    full_y_train = _encode_target_for_cv(full_y_train, automl_config.problem_type)
+    fold_results = []
     for i, (train, valid) in enumerate(
         automl_config.data_splitter.split(full_X_train, full_y_train)
     ):
-        logger.debug(f"\t\tTraining and scoring on fold {i}")
-        X_train, X_valid = full_X_train.ww.iloc[train], full_X_train.ww.iloc[valid]
-        y_train, y_valid = full_y_train.ww.iloc[train], full_y_train.ww.iloc[valid]
-        if is_binary(automl_config.problem_type) or is_multiclass(
-            automl_config.problem_type
-        ):
-            diff_train = set(np.setdiff1d(full_y_train, y_train))
-            diff_valid = set(np.setdiff1d(full_y_train, y_valid))
-            diff_string = (
-                f"Missing target values in the training set after data split: {diff_train}. "
-                if diff_train
-                else ""
-            )
-            diff_string += (
-                f"Missing target values in the validation set after data split: {diff_valid}."
-                if diff_valid
-                else ""
+        fold_results.append(
+            _train_and_score_fold(
+                pipeline,
+                automl_config,
+                full_X_train,
+                full_y_train,
+                i,
+                train,
+                valid,
+                logger,
             )
-            if diff_string:
-                raise Exception(diff_string)
-        objectives_to_score = [
-            automl_config.objective
-        ] + automl_config.additional_objectives
-        try:
+        )
+    training_time = time.time() - start
+    return _gather_fold_results(
+        pipeline, automl_config, fold_results, full_X_train.index, training_time, logger
+    )
+
+
+def _encode_target_for_cv(y, problem_type):
+    """Encodes the target for classification problems so that we can support float targets.
+
+    This is okay because the encoded target is only used to split and to train and score the pipeline on each fold.
+    """
+    if not is_classification(problem_type):
+        return y
+    y_mapping = {
+        original_target: encoded_target
+        for (encoded_target, original_target) in enumerate(y.value_counts().index)
+    }
+    return ww.init_series(y.map(y_mapping))
+
+
+def get_cv_splits(automl_config, X, y):
+    """Computes the folds a pipeline is trained and scored on during AutoMLSearch.
+
+    Args:
+        automl_config (AutoMLConfig): The AutoMLSearch config, used to access the data splitter.
+        X (pd.DataFrame): Training features.
+        y (pd.Series): Training target.
+
+    Returns:
+        list[tuple(np.ndarray, np.ndarray)]: The training and validation indices of each fold.
+    """
+    y = _encode_target_for_cv(y, automl_config.problem_type)
+    return list(automl_config.data_splitter.split(X, y))
+
+
+def _train_and_score_fold(
+    pipeline, automl_config, full_X_train, full_y_train, fold, train, valid, logger
+):
+    """Trains and scores a pipeline on a single cross-validation fold.
+
+    Returns:
+        dict: The cv_data entry of the fold, the pipeline trained on the fold or None if training failed, the
+            out-of-fold predictions of the fold and the time spent on the fold.
+    """
+    i = fold
+    start = time.time()
+    logger.debug(f"\t\tTraining and scoring on fold {i}")
+    X_train, X_valid = full_X_train.ww.iloc[train], full_X_train.ww.iloc[valid]
+    y_train, y_valid = full_y_train.ww.iloc[train], full_y_train.ww.iloc[valid]
+    if is_binary(automl_config.problem_type) or is_multiclass(
+        automl_config.problem_type
+    ):
+        diff_train = set(np.setdiff1d(full_y_train, y_train))
+        diff_valid = set(np.setdiff1d(full_y_train, y_valid))
+        diff_string = (
+            f"Missing target values in the training set after data split: {diff_train}. "
+            if diff_train
+            else ""
+        )
+        diff_string += (
+            f"Missing target values in the validation set after data split: {diff_valid}."
+            if diff_valid
+            else ""
+        )
+        if diff_string:
+            raise Exception(diff_string)
+    objectives_to_score = [
+        automl_config.objective
+    ] + automl_config.additional_objectives
+    cv_pipeline = pipeline
+    oof_predictions = None
+    component_profiler = None
+    profiler_context = nullcontext()
+    if automl_config.profile_components:
+        component_profiler = ComponentProfiler()
+        profiler_context = component_profiler.activate(fold=i)
+    try:
+        with profiler_context:
             logger.debug(f"\t\t\tFold {i}: starting training")
-            cv_pipeline = train_pipeline(
-                pipeline, X_train, y_train, automl_config, schema=False
-            )
+            if automl_config.component_cache is not None:
+                with automl_config.component_cache.activate(fold=i):
+                    cv_pipeline = train_pipeline(
+                        pipeline, X_train, y_train, automl_config, schema=False
+                    )
+            else:
+                cv_pipeline = train_pipeline(
+                    pipeline, X_train, y_train, automl_config, schema=False
+                )
             logger.debug(f"\t\t\tFold {i}: finished training")
             if (
                 automl_config.optimize_thresholds
@@ -244,71 +528,141 @@ def train_and_score_pipeline(
                 f"\t\t\tFold {i}: {automl_config.objective.name} score: {scores[automl_config.objective.name]:.3f}"
             )
             score = scores[automl_config.objective.name]
-        except Exception as e:
-            if automl_config.error_callback is not None:
-                automl_config.error_callback(
-                    exception=e,
-                    traceback=traceback.format_tb(sys.exc_info()[2]),
-                    automl=automl_config,
-                    fold_num=i,
-                    pipeline=pipeline,
-                )
-            if isinstance(e, PipelineScoreError):
-                nan_scores = {objective: np.nan for objective in e.exceptions}
-                scores = {**nan_scores, **e.scored_successfully}
-                scores = OrderedDict(
-                    {
-                        o.name: scores[o.name]
-                        for o in [automl_config.objective]
-                        + automl_config.additional_objectives
-                    }
-                )
-                score = scores[automl_config.objective.name]
-            else:
-                score = np.nan
-                scores = OrderedDict(
-                    zip(
-                        [n.name for n in automl_config.additional_objectives],
-                        [np.nan] * len(automl_config.additional_objectives),
+            if automl_config.record_oof_predictions:
+                try:
+                    oof_predictions = _predict_for_ensembling(
+                        cv_pipeline, X_valid, automl_config.problem_type
                     )
+                except Exception as e:
+                    logger.debug(
+                        f"\t\t\tFold {i}: could not record out-of-fold predictions: {e}"
+                    )
+    except Exception as e:
+        if automl_config.error_callback is not None:
+            automl_config.error_callback(
+                exception=e,
+                traceback=traceback.format_tb(sys.exc_info()[2]),
+                automl=automl_config,
+                fold_num=i,
+                pipeline=pipeline,
+            )
+        if isinstance(e, PipelineScoreError):
+            nan_scores = {objective: np.nan for objective in e.exceptions}
+            scores = {**nan_scores, **e.scored_successfully}
+            scores = OrderedDict(
+                {
+                    o.name: scores[o.name]
+                    for o in [automl_config.objective]
+                    + automl_config.additional_objectives
+                }
+            )
+            score = scores[automl_config.objective.name]
+        else:
+            score = np.nan
+            scores = OrderedDict(
+                zip(
+                    [n.name for n in automl_config.additional_objectives],
+                    [np.nan] * len(automl_config.additional_objectives),
                 )
+            )
 
-        ordered_scores = OrderedDict()
-        ordered_scores.update({automl_config.objective.name: score})
-        ordered_scores.update(scores)
-        ordered_scores.update({"# Training": y_train.shape[0]})
-        ordered_scores.update({"# Validation": y_valid.shape[0]})
+    ordered_scores = OrderedDict()
+    ordered_scores.update({automl_config.objective.name: score})
+    ordered_scores.update(scores)
+    ordered_scores.update({"# Training": y_train.shape[0]})
+    ordered_scores.update({"# Validation": y_valid.shape[0]})
 
-        evaluation_entry = {
-            "all_objective_scores": ordered_scores,
-            "mean_cv_score": score,
-            "binary_classification_threshold": None,
-        }
-        if (
-            is_binary(automl_config.problem_type)
-            and cv_pipeline is not None
-            and cv_pipeline.threshold is not None
-        ):
-            evaluation_entry["binary_classification_threshold"] = cv_pipeline.threshold
-        cv_data.append(evaluation_entry)
-    training_time = time.time() - start
+    evaluation_entry = {
+        "all_objective_scores": ordered_scores,
+        "mean_cv_score": score,
+        "binary_classification_threshold": None,
+    }
+    if (
+        is_binary(automl_config.problem_type)
+        and cv_pipeline is not None
+        and cv_pipeline.threshold is not None
+    ):
+        evaluation_entry["binary_classification_threshold"] = cv_pipeline.threshold
+    if component_profiler is not None:
+        evaluation_entry["component_profile"] = component_profiler.records
+    return {
+        "cv_data": evaluation_entry,
+        "pipeline": cv_pipeline if cv_pipeline is not pipeline else None,
+        "oof_predictions": (valid, oof_predictions)
+        if oof_predictions is not None
+        else None,
+        "training_time": time.time() - start,
+    }
+
+
+def _gather_fold_results(
+    pipeline, automl_config, fold_results, index, training_time, logger
+):
+    """Combines the results of each cross-validation fold into the result of evaluating a pipeline."""
+    cv_data = [fold_result["cv_data"] for fold_result in fold_results]
+    # Return the pipeline trained on the last fold which trained successfully, or the untrained pipeline if no fold did
+    cv_pipeline = pipeline
+    for fold_result in fold_results:
+        if fold_result["pipeline"] is not None:
+            cv_pipeline = fold_result["pipeline"]
     cv_scores = pd.Series([fold["mean_cv_score"] for fold in cv_data])
     cv_score_mean = cv_scores.mean()
     logger.info(
         f"\tFinished cross validation - mean {automl_config.objective.name}: {cv_score_mean:.3f}"
     )
+    scores = {
+        "cv_data": cv_data,
+        "training_time": training_time,
+        "cv_scores": cv_scores,
+        "cv_score_mean": cv_score_mean,
+    }
+    if automl_config.record_oof_predictions:
+        oof_predictions = [
+            fold_result["oof_predictions"] for fold_result in fold_results
+        ]
+        # Only use the predictions if every fold recorded them
+        if any(predictions is None for predictions in oof_predictions):
+            oof_predictions = []
+        scores["oof_predictions"] = _assemble_oof_predictions(oof_predictions, index)
     return {
-        "scores": {
-            "cv_data": cv_data,
-            "training_time": training_time,
-            "cv_scores": cv_scores,
-            "cv_score_mean": cv_score_mean,
-        },
+        "scores": scores,
         "pipeline": cv_pipeline,
         "logger": logger,
     }
 
 
+def _predict_for_ensembling(pipeline, X, problem_type):
+    """Computes the predictions a stacked ensemble metalearner is trained on.
+
+    Raises:
+        ValueError: If the pipeline does not return one row of predictions per row of X.
+    """
+    if is_classification(problem_type):
+        predictions = pipeline.predict_proba(X)
+        if is_binary(problem_type):
+            predictions = predictions.iloc[:, 1:]
+    else:
+        predictions = pd.DataFrame(pipeline.predict(X))
+    if not isinstance(predictions, pd.DataFrame) or len(predictions) != len(X):
+        raise ValueError("Pipeline did not return one prediction per row.")
+    return predictions
+
+
+def _assemble_oof_predictions(fold_predictions, index):
+    """Assembles the validation predictions of each fold into a single dataframe aligned with the training data.
+
+    Rows which were not predicted on, or which belong to a fold which failed, are left as NaN. Returns None
+    if no fold recorded predictions.
+    """
+    if not fold_predictions:
+        return None
+    columns = fold_predictions[0][1].columns
+    values = np.full((len(index), len(columns)), np.nan)
+    for rows, predictions in fold_predictions:
+        values[rows] = predictions.to_numpy(dtype="float64")
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
 def evaluate_pipeline(pipeline, automl_config, X, y, logger):
     """Function submitted to the submit_evaluation_job engine method.
 
@@ -337,6 +691,34 @@ def evaluate_pipeline(pipeline, automl_config, X, y, logger):
     )
 
 
+def evaluate_pipeline_fold(pipeline, automl_config, X, y, fold, train, valid, logger):
+    """Function submitted by engines which evaluate each cross-validation fold of a pipeline as a separate job.
+
+    Args:
+        pipeline (PipelineBase): The pipeline to score.
+        automl_config (AutoMLConfig): The AutoMLSearch object, used to access config and the error callback.
+        X (pd.DataFrame): Training features.
+        y (pd.Series): Training target.
+        fold (int): Number of the fold.
+        train (np.ndarray): Indices of the training rows of the fold.
+        valid (np.ndarray): Indices of the validation rows of the fold.
+        logger: Logger object to write to.
+
+    Returns:
+        dict: The cv_data entry of the fold, the pipeline trained on the fold or None if training failed, the
+            out-of-fold predictions of the fold, the time spent on the fold and the job logger instance with all the
+            recorded messages.
+    """
+    X.ww.init(schema=automl_config.X_schema)
+    y.ww.init(schema=automl_config.y_schema)
+    y = _encode_target_for_cv(y, automl_config.problem_type)
+    fold_result = _train_and_score_fold(
+        pipeline, automl_config, X, y, fold, train, valid, logger
+    )
+    fold_result["logger"] = logger
+    return fold_result
+
+
 def score_pipeline(
     pipeline, X, y, objectives, X_train=None, y_train=None, X_schema=None, y_schema=None
 ):
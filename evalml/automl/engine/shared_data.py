@@ -0,0 +1,220 @@
+"""Memory-mapped data shared between the processes of a CFEngine process pool."""
+import os
+import pickle
+import uuid
+
+import numpy as np
+import pandas as pd
+
+# Kinds of numpy dtypes whose values are stored as raw arrays: booleans, integers, floats, complex and datetimes
+_ARRAY_KINDS = "biufcmM"
+# Kinds of numpy dtypes of dataframes which are stored as one 2D array, as they are laid out in memory
+_BLOCK_KINDS = "biufc"
+_ALIGNMENT = 64
+
+
+class SharedData:
+    """Handle to a dataframe or series written to a memory-mapped file, which processes load without copying it.
+
+    Numeric, boolean and datetime columns and the codes of categorical columns are stored as raw arrays, and loading
+    the data wraps views of the file, mapped copy-on-write, in pandas objects. Every process reading the data shares
+    the same pages of memory, and a process which modifies the data in place only copies the pages it writes to,
+    without changing the file or the data of other processes. Other columns are pickled into the file and unpickled by each process which loads them.
+    A dataframe whose columns all have the same numeric or boolean dtype is stored as one 2D array, in the order its
+    values are laid out in memory, and loaded as a single 2D array, since estimators can compute slightly different
+    results on data laid out differently. The columns of other dataframes are stored and loaded one by one.
+    The woodwork schema of the data is kept on the handle and reattached on load. The handle only holds the layout of
+    the file, so it is cheap to send to other processes.
+
+    Use `SharedData.write` to create a handle.
+
+    Args:
+        path (str): Path of the memory-mapped file.
+        columns (pd.Index): Column names of the dataframe, or a single name for a series.
+        block_layouts (list(tuple)): Positions of the columns stored together, along with their layout in the file.
+            Each column is stored on its own unless the dataframe is stored as one 2D array. A series is stored as a
+            single column.
+        index_layout (tuple): Layout of the index in the file, or the arguments of the RangeIndex.
+        index_name (str): Name of the index.
+        index_freq (pd.DateOffset): Frequency of a datetime index, or None.
+        is_series (bool): Whether the data is a series.
+        schema (ww.TableSchema, ww.ColumnSchema): Woodwork schema of the data, or None if woodwork is not initialized.
+    """
+
+    def __init__(
+        self,
+        path,
+        columns,
+        block_layouts,
+        index_layout,
+        index_name,
+        index_freq,
+        is_series,
+        schema,
+    ):
+        self.path = path
+        self.columns = columns
+        self.block_layouts = block_layouts
+        self.index_layout = index_layout
+        self.index_name = index_name
+        self.index_freq = index_freq
+        self.is_series = is_series
+        self.schema = schema
+
+    @classmethod
+    def write(cls, data, directory):
+        """Writes a dataframe or series to a new file in the given directory.
+
+        Args:
+            data (pd.DataFrame, pd.Series): Data to share.
+            directory (str): Directory to write the file to.
+
+        Returns:
+            SharedData: Handle to the written data.
+        """
+        is_series = isinstance(data, pd.Series)
+        frame = data.to_frame() if is_series else data
+        path = os.path.join(directory, f"{uuid.uuid4().hex}.bin")
+        with open(path, "wb") as f:
+            if is_series:
+                block_layouts = [([0], _write_values(f, data))]
+            else:
+                block_layouts = _write_blocks(f, frame)
+            if isinstance(frame.index, pd.RangeIndex):
+                index_layout = (
+                    "range",
+                    frame.index.start,
+                    frame.index.stop,
+                    frame.index.step,
+                )
+            else:
+                index_layout = _write_values(f, frame.index)
+            # Empty files can't be memory-mapped
+            f.write(b"\0")
+        return cls(
+            path,
+            columns=data.name if is_series else data.columns,
+            block_layouts=block_layouts,
+            index_layout=index_layout,
+            index_name=frame.index.name,
+            index_freq=getattr(frame.index, "freq", None),
+            is_series=is_series,
+            schema=data.ww.schema,
+        )
+
+    def load(self):
+        """Loads the data from the memory-mapped file.
+
+        The numeric, boolean, datetime and categorical columns of the loaded data are copy-on-write views of the file.
+
+        Returns:
+            pd.DataFrame, pd.Series: The shared data, with its woodwork schema.
+        """
+        buffer = np.memmap(self.path, dtype=np.uint8, mode="c")
+        if self.index_layout[0] == "range":
+            index = pd.RangeIndex(*self.index_layout[1:], name=self.index_name)
+        else:
+            index = pd.Index(
+                _read_values(buffer, self.index_layout),
+                name=self.index_name,
+                copy=False,
+            )
+            if self.index_freq is not None:
+                index = pd.DatetimeIndex(index, freq=self.index_freq)
+        if self.is_series:
+            _, layout = self.block_layouts[0]
+            data = pd.Series(
+                _read_values(buffer, layout),
+                index=index,
+                name=self.columns,
+                copy=False,
+            )
+        elif len(self.block_layouts) == 1 and self.block_layouts[0][1][0] == "block":
+            _, dtype, offset, shape, order = self.block_layouts[0][1]
+            values = np.frombuffer(
+                buffer, dtype=dtype, count=shape[0] * shape[1], offset=offset
+            ).reshape(shape, order=order)
+            data = pd.DataFrame(values, index=index, columns=self.columns, copy=False)
+        else:
+            # Without copying, pandas doesn't consolidate the columns into new 2D arrays
+            data = pd.DataFrame(
+                {
+                    position: _read_values(buffer, layout)
+                    for (position,), layout in self.block_layouts
+                },
+                index=index,
+                copy=False,
+            )
+            data.columns = self.columns
+        if self.schema is not None:
+            data.ww.init(schema=self.schema)
+        return data
+
+    def delete(self):
+        """Deletes the memory-mapped file. Data already loaded by other processes stays readable."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _write_blocks(f, frame):
+    """Writes the columns of a dataframe to a file and returns the positions of the columns written together and their layouts.
+
+    A dataframe whose columns all have the same numeric or boolean dtype is written as one 2D array, in the order of its
+    values in memory. The columns of other dataframes are written one by one.
+    """
+    dtypes = set(frame.dtypes)
+    if len(dtypes) == 1:
+        dtype = dtypes.pop()
+        if isinstance(dtype, np.dtype) and dtype.kind in _BLOCK_KINDS:
+            # The values of a dataframe created from a C-ordered 2D array are a Fortran-ordered view of it
+            values = frame.to_numpy()
+            order = "F" if values.flags.f_contiguous else "C"
+            offset, _ = _write_array(f, values.T if order == "F" else values)
+            positions = list(range(frame.shape[1]))
+            return [(positions, ("block", dtype, offset, values.shape, order))]
+    return [
+        ([position], _write_values(f, frame.iloc[:, position]))
+        for position in range(frame.shape[1])
+    ]
+
+
+def _write_values(f, values):
+    """Writes the values of a series or index to a file and returns their layout."""
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = values.array.codes
+        return ("categorical", codes.dtype, *_write_array(f, codes), dtype)
+    if isinstance(dtype, np.dtype) and dtype.kind in _ARRAY_KINDS:
+        return ("array", dtype, *_write_array(f, values.to_numpy()), None)
+    if isinstance(dtype, np.dtype):
+        values = values.to_numpy()
+    else:
+        values = values.array
+    pickled = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    offset = _align(f)
+    f.write(pickled)
+    return ("pickle", None, offset, len(pickled), None)
+
+
+def _write_array(f, array):
+    offset = _align(f)
+    np.ascontiguousarray(array).tofile(f)
+    return offset, len(array)
+
+
+def _align(f):
+    """Pads the file so the next array starts on an aligned offset, and returns that offset."""
+    padding = -f.tell() % _ALIGNMENT
+    f.write(b"\0" * padding)
+    return f.tell()
+
+
+def _read_values(buffer, layout):
+    """Reads the values of a series or index from a memory-mapped file, without copying arrays."""
+    kind, dtype, offset, length, categorical_dtype = layout
+    if kind == "pickle":
+        return pickle.loads(buffer[offset : offset + length])
+    values = np.frombuffer(buffer, dtype=dtype, count=length, offset=offset)
+    if kind == "categorical":
+        return pd.Categorical.from_codes(values, dtype=categorical_dtype)
+    return values
@@ -1,6 +1,7 @@
 """Utilities useful in AutoML."""
 from collections import namedtuple
 
+import numpy as np
 import pandas as pd
 
 from evalml.objectives import get_objective
@@ -22,13 +23,15 @@ from evalml.problem_types import (
     ProblemTypes,
     handle_problem_types,
     is_binary,
+    is_classification,
     is_time_series,
 )
-from evalml.utils import import_or_raise
+from evalml.utils import get_random_state, import_or_raise
 
 _LARGE_DATA_ROW_THRESHOLD = int(1e5)
 _SAMPLER_THRESHOLD = 20000
 _LARGE_DATA_PERCENT_VALIDATION = 0.75
+_SUCCESSIVE_HALVING_MIN_ROWS = 30
 
 
 def get_default_primary_search_objective(problem_type):
@@ -177,7 +180,11 @@ AutoMLConfig = namedtuple(
         "random_seed",
         "X_schema",
         "y_schema",
+        "component_cache",
+        "record_oof_predictions",
+        "profile_components",
     ],
+    defaults=(None, False, False),
 )
 
 
@@ -247,3 +254,49 @@ def get_pipelines_from_component_graphs(
             )
         )
     return created_pipelines
+
+
+def get_successive_halving_fidelities(n_rows, min_fidelity, halving_factor):
+    """Computes the fractions of the training rows pipelines are evaluated on during successive halving.
+
+    Args:
+        n_rows (int): The number of training rows.
+        min_fidelity (float): The smallest fraction of the training rows to evaluate pipelines on.
+        halving_factor (int): The factor between consecutive fractions.
+
+    Returns:
+        list[float]: The fractions in increasing order, ending with 1.0. Fractions smaller than min_fidelity or which
+            would leave fewer than 30 rows are not included.
+    """
+    fidelities = [1.0]
+    while True:
+        fidelity = fidelities[0] / halving_factor
+        if fidelity < min_fidelity or fidelity * n_rows < _SUCCESSIVE_HALVING_MIN_ROWS:
+            return fidelities
+        fidelities.insert(0, fidelity)
+
+
+def get_subsample_row_order(y, problem_type, min_rows_per_class, random_seed=0):
+    """Orders the training rows so that every prefix of the order is a random subsample of the rows.
+
+    Subsamples taken as prefixes of the same order are nested, so a pipeline evaluated on a larger subsample is also
+    trained on the rows of the smaller ones. For classification problems, the order starts with min_rows_per_class rows
+    of each class and then keeps the proportions of the classes, so that every subsample can be split with stratification.
+
+    Args:
+        y (pd.Series): The training target.
+        problem_type (ProblemType): The type of machine learning problem.
+        min_rows_per_class (int): The number of rows of each class placed at the start of the order, for classification problems.
+        random_seed (int): Seed for the random number generator. Defaults to 0.
+
+    Returns:
+        np.ndarray: The positions of the training rows.
+    """
+    order = get_random_state(random_seed).permutation(len(y))
+    if not is_classification(problem_type):
+        return order
+    classes = pd.Series(pd.factorize(y.to_numpy()[order])[0])
+    rank = classes.groupby(classes).cumcount()
+    position_in_class = (rank + 1) / classes.map(classes.value_counts())
+    position_in_class[rank < min_rows_per_class] = 0.0
+    return order[np.argsort(position_in_class.to_numpy(), kind="stable")]
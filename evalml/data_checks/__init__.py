@@ -8,6 +8,7 @@ from .data_check_action_option import (
     DCAOParameterAllowedValuesType,
 )
 from .data_check_action_code import DataCheckActionCode
+from .column_profile import ColumnProfile
 from .data_checks import DataChecks
 from .data_check_message import DataCheckMessage, DataCheckWarning, DataCheckError
 from .data_check_message_type import DataCheckMessageType
@@ -17,6 +18,7 @@ from .null_data_check import NullDataCheck
 from .id_columns_data_check import IDColumnsDataCheck
 from .target_leakage_data_check import TargetLeakageDataCheck
 from .outliers_data_check import OutliersDataCheck
+from .chunked_column_profile import ChunkedColumnProfile
 from .no_variance_data_check import NoVarianceDataCheck
 from .class_imbalance_data_check import ClassImbalanceDataCheck
 from .multicollinearity_data_check import MulticollinearityDataCheck
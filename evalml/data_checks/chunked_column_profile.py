@@ -0,0 +1,443 @@
+"""Column statistics accumulated over chunks of data with mergeable sketches, for data which doesn't fit in memory."""
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from evalml.data_checks.column_profile import ColumnProfile
+from evalml.data_checks.outliers_data_check import OutliersDataCheck
+from evalml.utils import infer_feature_types
+
+
+class ChunkedColumnProfile(ColumnProfile):
+    """Statistics of the columns of data read in chunks, accumulated with mergeable sketches.
+
+    The profile keeps, for each column, the number of null values, a distinct count sketch which is exact up to
+    `max_exact_distinct` values and a HyperLogLog estimate above, and, for numeric columns, a t-digest of the values
+    used for quantiles and box plots. It also keeps the number of occurrences of each value of the target. The memory
+    used by the profile only depends on the number of columns, so data of any size can be profiled chunk by chunk, and
+    profiles of separate parts of the data can be combined with `merge`.
+
+    The woodwork types of the columns are inferred from the first chunk, unless it is already initialized with
+    woodwork. `X` and `y` are empty dataframes with these types, which data checks read the schema from while taking
+    the statistics from the profile.
+
+    Args:
+        compression (int): Compression of the t-digests. Higher values give more accurate quantiles with more
+            memory. Defaults to 200.
+        hll_precision (int): Number of bits indexing the registers of the HyperLogLog sketches. The relative error of
+            distinct counts above `max_exact_distinct` is about 1.04 / sqrt(2 ** hll_precision). Defaults to 14.
+        max_exact_distinct (int): Distinct values are counted exactly up to this number of values. Defaults to 1024.
+        n_jobs (int): Number of threads used to update the sketches of the columns. -1 uses all processors.
+            Defaults to -1.
+    """
+
+    def __init__(
+        self, compression=200, hll_precision=14, max_exact_distinct=1024, n_jobs=-1
+    ):
+        super().__init__(None, None, n_jobs=n_jobs)
+        self.compression = compression
+        self.hll_precision = hll_precision
+        self.max_exact_distinct = max_exact_distinct
+        self._n_rows = 0
+        self._null_counts = {}
+        self._distinct_counts = {}
+        self._digests = {}
+        self._target_value_counts = None
+        self._target_null_count = 0
+
+    @classmethod
+    def from_chunks(cls, chunks, target=None, **kwargs):
+        """Profiles data read in chunks.
+
+        Args:
+            chunks (iterable, dd.DataFrame): Chunks of the data, such as the chunks of `pd.read_csv` with a
+                `chunksize`, dataframes read from parquet row groups or the partitions of a Dask dataframe. Each chunk
+                is either a dataframe or a tuple of the features and the target.
+            target (str): Name of the target column, for chunks which are dataframes. Defaults to None, which treats
+                every column as a feature.
+            **kwargs: Arguments of ChunkedColumnProfile.
+
+        Returns:
+            ChunkedColumnProfile: Profile of the data.
+        """
+        if hasattr(chunks, "to_delayed"):
+            chunks = (partition.compute() for partition in chunks.to_delayed())
+        profile = cls(**kwargs)
+        for chunk in chunks:
+            if isinstance(chunk, tuple):
+                profile.update(*chunk)
+            elif target is not None:
+                profile.update(chunk.drop(columns=[target]), chunk[target])
+            else:
+                profile.update(chunk)
+        return profile
+
+    def update(self, X, y=None):
+        """Adds a chunk of the data to the profile.
+
+        Args:
+            X (pd.DataFrame): Features of the chunk.
+            y (pd.Series): Target of the chunk. Defaults to None.
+        """
+        if self.X is None:
+            X = infer_feature_types(X)
+            X = X.ww.drop(list(X.ww.select("index", return_schema=True).columns))
+            self.X = _empty_like(X)
+            if y is not None:
+                self.y = _empty_like(infer_feature_types(y))
+            self._null_counts = {col: 0 for col in self.X.columns}
+            self._distinct_counts = {
+                col: _DistinctCountSketch(self.hll_precision, self.max_exact_distinct)
+                for col in self.X.columns
+            }
+            self._digests = {
+                col: _TDigest(self.compression)
+                for col in self.X.ww.select("numeric", return_schema=True).columns
+            }
+
+        columns = list(self.X.columns)
+        if self.n_jobs == 1 or len(columns) == 1:
+            null_counts = [self._update_column(col, X[col]) for col in columns]
+        else:
+            null_counts = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(self._update_column)(col, X[col]) for col in columns
+            )
+        for col, null_count in zip(columns, null_counts):
+            self._null_counts[col] += null_count
+        self._n_rows += len(X)
+
+        if y is not None:
+            y = pd.Series(y)
+            self._add_target_value_counts(y.value_counts())
+            self._target_null_count += int(y.isnull().sum())
+
+    def _update_column(self, col, values):
+        non_null = values.dropna()
+        schema = self.X.ww.schema.columns[col]
+        if schema.is_numeric:
+            non_null = pd.to_numeric(non_null, errors="coerce").astype("float64")
+        elif schema.is_datetime:
+            non_null = pd.to_datetime(non_null, errors="coerce")
+        else:
+            # Values are hashed as strings so their dtype may change between chunks
+            non_null = non_null.astype(str)
+        self._distinct_counts[col].update(non_null)
+        if col in self._digests:
+            self._digests[col].update(non_null.dropna().to_numpy())
+        return len(values) - len(non_null)
+
+    def _add_target_value_counts(self, value_counts):
+        if self._target_value_counts is None:
+            self._target_value_counts = value_counts
+        else:
+            self._target_value_counts = self._target_value_counts.add(
+                value_counts, fill_value=0
+            ).astype("int64")
+        self._target_value_counts = self._target_value_counts.sort_values(
+            ascending=False, kind="mergesort"
+        )
+
+    def merge(self, other):
+        """Adds the statistics of another profile of the same columns, such as a profile of another part of the data.
+
+        Args:
+            other (ChunkedColumnProfile): Profile to merge into this one.
+
+        Returns:
+            ChunkedColumnProfile: This profile.
+        """
+        if other.X is None:
+            return self
+        if self.X is None:
+            self.X, self.y = other.X, other.y
+            self._null_counts = {col: 0 for col in other.X.columns}
+            self._distinct_counts = {
+                col: _DistinctCountSketch(self.hll_precision, self.max_exact_distinct)
+                for col in other.X.columns
+            }
+            self._digests = {col: _TDigest(self.compression) for col in other._digests}
+        for col in self.X.columns:
+            self._null_counts[col] += other._null_counts[col]
+            self._distinct_counts[col].merge(other._distinct_counts[col])
+            if col in self._digests:
+                self._digests[col].merge(other._digests[col])
+        self._n_rows += other._n_rows
+        if other._target_value_counts is not None:
+            self._add_target_value_counts(other._target_value_counts)
+        self._target_null_count += other._target_null_count
+        return self
+
+    @property
+    def n_rows(self):
+        """Number of rows profiled."""
+        return self._n_rows
+
+    def _value_count_statistics(self):
+        columns = list(self.X.columns)
+        null_counts = pd.Series(
+            [self._null_counts[col] for col in columns], index=columns, dtype="int64"
+        )
+        n_unique = pd.Series(
+            [
+                self._distinct_counts[col].estimate(
+                    self._n_rows - self._null_counts[col]
+                )
+                for col in columns
+            ],
+            index=columns,
+            dtype="int64",
+        )
+        return pd.DataFrame(
+            {
+                "null_count": null_counts,
+                "n_unique": n_unique,
+                "n_unique_with_nulls": n_unique + (null_counts > 0),
+                "uniqueness_score": np.nan,
+            }
+        )
+
+    @property
+    def n_unique_relative_errors(self):
+        """pd.Series: Standard error of the distinct count of each column relative to the count, which is 0 for columns with at most `max_exact_distinct` distinct values."""
+        return pd.Series(
+            [
+                0.0
+                if self._distinct_counts[col].exact_hashes is not None
+                else self._distinct_counts[col].relative_error
+                for col in self.X.columns
+            ],
+            index=self.X.columns,
+            dtype="float64",
+        )
+
+    def column_statistics(self, name, func, columns=None):
+        """Raises an error, since statistics other than the ones the profile keeps sketches for need the rows of the data.
+
+        Args:
+            name (str): Name of the statistic.
+            func (callable): Function computing the statistic from the Woodwork series of a column.
+            columns (list): Columns to compute the statistic for. Defaults to all the columns.
+
+        Raises:
+            ValueError: Always, since the rows of the data are not kept.
+        """
+        raise ValueError(
+            f"The {name} statistic can't be computed from a ChunkedColumnProfile, which doesn't keep the rows of the "
+            "data. Only the null counts, distinct counts, quantiles, box plot data and target value counts are available."
+        )
+
+    def quantiles(self, col, q):
+        """Estimates quantiles of a numeric column.
+
+        Args:
+            col (str): Name of a numeric column.
+            q (float, list(float)): Quantiles to estimate, between 0 and 1.
+
+        Returns:
+            float, np.ndarray: The estimated quantiles.
+        """
+        return self._digests[col].quantile(q)
+
+    @property
+    def keeps_rows(self):
+        """bool: Whether the box plot data lists the values and row indices of the outliers, which it doesn't since the profile only keeps sketches of the data."""
+        return False
+
+    def boxplot_data(self, columns):
+        """Estimates the box plot data of numeric columns from their t-digests.
+
+        The quartiles, bounds and share of outliers are estimated. The values and indices of the outliers are not
+        known, so they are left empty.
+
+        Args:
+            columns (list): Numeric columns to estimate the box plot data of.
+
+        Returns:
+            dict: Box plot data of each column, in the format of OutliersDataCheck.get_boxplot_data.
+        """
+        return {col: self._boxplot_data(self._digests[col]) for col in columns}
+
+    @staticmethod
+    def _boxplot_data(digest):
+        values = {
+            "low_values": [],
+            "high_values": [],
+            "low_indices": [],
+            "high_indices": [],
+        }
+        if digest.count == 0:
+            values.update(
+                {
+                    "q1": np.nan,
+                    "median": np.nan,
+                    "q3": np.nan,
+                    "low_bound": np.nan,
+                    "high_bound": np.nan,
+                }
+            )
+            return {"score": np.nan, "pct_outliers": np.nan, "values": values}
+        q1, median, q3 = digest.quantile([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        low_bound = max(q1 - iqr * 1.5, digest.min)
+        high_bound = min(q3 + iqr * 1.5, digest.max)
+        n_low = digest.count * digest.cdf(low_bound) if low_bound > digest.min else 0
+        n_high = (
+            digest.count * (1 - digest.cdf(high_bound))
+            if high_bound < digest.max
+            else 0
+        )
+        pct_outliers = (n_low + n_high) / digest.count
+        values.update(
+            {
+                "q1": q1,
+                "median": median,
+                "q3": q3,
+                "low_bound": low_bound,
+                "high_bound": high_bound,
+            }
+        )
+        return {
+            "score": OutliersDataCheck._no_outlier_prob(digest.count, pct_outliers),
+            "pct_outliers": pct_outliers,
+            "values": values,
+        }
+
+    @property
+    def target_value_counts(self):
+        """pd.Series: Number of occurrences of each value of the target, sorted by decreasing count."""
+        if self._target_value_counts is None:
+            return pd.Series(dtype="int64")
+        return self._target_value_counts
+
+    @property
+    def target_null_count(self):
+        """int: Number of null values in the target."""
+        return self._target_null_count
+
+
+def _empty_like(data):
+    """Returns the first zero rows of data, with its woodwork schema."""
+    empty = data.iloc[:0]
+    empty.ww.init(schema=data.ww.schema)
+    return empty
+
+
+class _DistinctCountSketch:
+    """Counts distinct values exactly up to max_exact values, and estimates the count with HyperLogLog above."""
+
+    def __init__(self, precision, max_exact):
+        self.precision = precision
+        self.max_exact = max_exact
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+        self.exact_hashes = np.array([], dtype=np.uint64)
+
+    def update(self, values):
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        self._update_registers(hashes)
+        if self.exact_hashes is not None:
+            self._update_exact(np.unique(hashes))
+
+    def _update_registers(self, hashes):
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        remaining = hashes << np.uint64(self.precision)
+        # The rank is the position of the first set bit of the remaining bits
+        _, exponent = np.frexp(remaining.astype(np.float64))
+        rank = np.where(remaining == 0, 65 - self.precision, 65 - exponent)
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def _update_exact(self, unique_hashes):
+        if len(unique_hashes) > self.max_exact:
+            self.exact_hashes = None
+            return
+        self.exact_hashes = np.union1d(self.exact_hashes, unique_hashes)
+        if len(self.exact_hashes) > self.max_exact:
+            self.exact_hashes = None
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self.exact_hashes is not None:
+            if other.exact_hashes is None:
+                self.exact_hashes = None
+            else:
+                self._update_exact(other.exact_hashes)
+
+    @property
+    def relative_error(self):
+        """Standard error of the HyperLogLog estimate relative to the distinct count."""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def estimate(self, n_values):
+        """Estimates the distinct count of n_values non-null values, which is at most n_values."""
+        if self.exact_hashes is not None:
+            return len(self.exact_hashes)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        n_zero_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and n_zero_registers > 0:
+            estimate = m * np.log(m / n_zero_registers)
+        return min(int(round(estimate)), n_values)
+
+
+class _TDigest:
+    """Mergeable sketch of the distribution of numeric values, which estimates quantiles accurately in the tails.
+
+    Values are summarized by centroids, with a mean and a weight, which are merged so the quantile range of each
+    centroid is at most one unit of the k1 scale function k(q) = compression / (2 * pi) * arcsin(2q - 1). Centroids
+    near the median summarize many values, and centroids near the extremes only a few.
+    """
+
+    def __init__(self, compression):
+        self.compression = compression
+        self.means = np.array([], dtype=np.float64)
+        self.weights = np.array([], dtype=np.float64)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self):
+        """Number of values summarized by the digest."""
+        return int(self.weights.sum())
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._compress(values, np.ones(len(values)))
+
+    def merge(self, other):
+        if len(other.means) == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(other.means, other.weights)
+
+    def _compress(self, means, weights):
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        q = (cumulative - weights / 2) / cumulative[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+        # Consecutive centroids in the same unit of k are merged
+        _, groups = np.unique(np.floor(k), return_inverse=True)
+        self.weights = np.bincount(groups, weights=weights)
+        self.means = np.bincount(groups, weights=means * weights) / self.weights
+
+    def _centers(self):
+        """Cumulative weights at the extremes and at the center of each centroid."""
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate([[0], centers, [self.weights.sum()]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return positions, values
+
+    def quantile(self, q):
+        positions, values = self._centers()
+        return np.interp(np.asarray(q) * positions[-1], positions, values)
+
+    def cdf(self, x):
+        positions, values = self._centers()
+        return np.interp(x, values, positions) / positions[-1]
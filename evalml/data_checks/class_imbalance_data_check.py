@@ -3,6 +3,7 @@
 Use for classification problems.
 """
 from evalml.data_checks import (
+    ColumnProfile,
     DataCheck,
     DataCheckError,
     DataCheckMessageCode,
@@ -24,6 +25,8 @@ class ClassImbalanceDataCheck(DataCheck):
         num_cv_folds (int): The number of cross-validation folds. Must be positive. Choose 0 to ignore this warning. Defaults to 3.
     """
 
+    _supports_chunks = True
+
     def __init__(self, threshold=0.1, min_samples=100, num_cv_folds=3):
         if threshold <= 0 or threshold > 0.5:
             raise ValueError(
@@ -130,7 +133,7 @@ class ClassImbalanceDataCheck(DataCheck):
 
         y = infer_feature_types(y)
 
-        fold_counts = y.value_counts(normalize=False, sort=True)
+        fold_counts = ColumnProfile.for_data(X, y).target_value_counts
         if len(fold_counts) == 0:
             return messages
         # search for targets that occur less than twice the number of cv folds first
@@ -0,0 +1,176 @@
+"""Column statistics computed once and shared by the data checks of a DataChecks collection."""
+from contextvars import ContextVar
+
+import pandas as pd
+from joblib import Parallel, delayed
+
+from evalml.utils import _set_context_var
+
+_active_column_profile = ContextVar("active_column_profile", default=None)
+
+
+class ColumnProfile:
+    """Statistics of the columns of the features and of the target, computed once and shared by data checks.
+
+    Each family of statistics is computed the first time a data check requests it, for every column at once and in
+    parallel across columns, then reused by every other data check. The statistics derived from value counts, such as
+    null counts, unique counts and uniqueness scores, are computed with a single value count per column.
+
+    Args:
+        X (pd.DataFrame): The features, initialized with Woodwork.
+        y (pd.Series): The target, initialized with Woodwork. Defaults to None.
+        n_jobs (int): Number of threads used to compute the statistics of the columns. -1 uses all processors.
+            Defaults to -1.
+    """
+
+    def __init__(self, X, y=None, n_jobs=-1):
+        self.X = X
+        self.y = y
+        self.n_jobs = n_jobs
+        self._column_statistics = {}
+        self._target_value_counts = None
+
+    @property
+    def n_rows(self):
+        """Number of rows of the features."""
+        return len(self.X)
+
+    def column_statistics(self, name, func, columns=None):
+        """Computes a statistic for each column, or returns it if it was already computed.
+
+        Args:
+            name (str): Name the statistic is cached under.
+            func (callable): Function computing the statistic from the Woodwork series of a column.
+            columns (list): Columns to compute the statistic for. Defaults to all the columns.
+
+        Returns:
+            dict: The statistic of each column.
+        """
+        statistics = self._column_statistics.setdefault(name, {})
+        columns = list(self.X.columns) if columns is None else list(columns)
+        missing = [col for col in columns if col not in statistics]
+        if missing:
+            if self.n_jobs == 1 or len(missing) == 1:
+                results = [func(self.X.ww[col]) for col in missing]
+            else:
+                results = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                    delayed(func)(self.X.ww[col]) for col in missing
+                )
+            statistics.update(zip(missing, results))
+        return {col: statistics[col] for col in columns}
+
+    def _value_count_statistics(self):
+        return pd.DataFrame.from_dict(
+            self.column_statistics("value_counts", _value_count_statistics),
+            orient="index",
+            columns=[
+                "null_count",
+                "n_unique",
+                "n_unique_with_nulls",
+                "uniqueness_score",
+            ],
+        ).reindex(self.X.columns)
+
+    @property
+    def null_counts(self):
+        """pd.Series: Number of null values in each column."""
+        return self._value_count_statistics()["null_count"]
+
+    @property
+    def null_fractions(self):
+        """pd.Series: Fraction of null values in each column."""
+        return self.null_counts / self.n_rows
+
+    @property
+    def n_unique(self):
+        """pd.Series: Number of distinct values in each column, not counting nulls."""
+        return self._value_count_statistics()["n_unique"]
+
+    @property
+    def n_unique_relative_errors(self):
+        """pd.Series: Standard error of the distinct count of each column relative to the count, which is 0 since the counts are exact."""
+        return pd.Series(0.0, index=self.X.columns, dtype="float64")
+
+    @property
+    def n_unique_with_nulls(self):
+        """pd.Series: Number of distinct values in each column, counting nulls as a value."""
+        return self._value_count_statistics()["n_unique_with_nulls"]
+
+    @property
+    def uniqueness_scores(self):
+        """pd.Series: Uniqueness score of each column, not counting nulls. See UniquenessDataCheck.uniqueness_score."""
+        return self._value_count_statistics()["uniqueness_score"]
+
+    @property
+    def keeps_rows(self):
+        """bool: Whether the box plot data lists the values and row indices of the outliers, which it does since the profile keeps the data."""
+        return True
+
+    def boxplot_data(self, columns):
+        """Computes the box plot data of numeric columns, or returns it if it was already computed.
+
+        Args:
+            columns (list): Numeric columns to compute the box plot data of.
+
+        Returns:
+            dict: Box plot data of each column, as returned by OutliersDataCheck.get_boxplot_data.
+        """
+        from evalml.data_checks.outliers_data_check import OutliersDataCheck
+
+        return self.column_statistics(
+            "boxplot_data", OutliersDataCheck.get_boxplot_data, columns=columns
+        )
+
+    @property
+    def target_value_counts(self):
+        """pd.Series: Number of occurrences of each value of the target, sorted by decreasing count."""
+        if self._target_value_counts is None:
+            self._target_value_counts = self.y.value_counts()
+        return self._target_value_counts
+
+    @property
+    def target_null_count(self):
+        """int: Number of null values in the target."""
+        return len(self.y) - int(self.target_value_counts.sum())
+
+    @classmethod
+    def for_data(cls, X, y=None):
+        """Returns the active column profile if it was computed for the given data, or a new profile otherwise.
+
+        Args:
+            X (pd.DataFrame): The features, initialized with Woodwork.
+            y (pd.Series): The target, initialized with Woodwork. Defaults to None.
+
+        Returns:
+            ColumnProfile: Profile of the data.
+        """
+        profile = _active_column_profile.get()
+        if profile is not None and profile.X is X and (y is None or profile.y is y):
+            return profile
+        return cls(X, y)
+
+    def activate(self):
+        """Makes `for_data` return this profile for its data to the data checks validated in the current thread.
+
+        Returns:
+            Context manager which yields this profile.
+        """
+        return _set_context_var(_active_column_profile, self, self)
+
+
+def _value_count_statistics(col):
+    """Computes the statistics derived from the value counts of a column."""
+    counts = col.value_counts(dropna=False)
+    # Categorical columns also count the categories which don't occur
+    counts = counts[counts > 0]
+    is_null = counts.index.isna()
+    non_null_counts = counts[~is_null]
+    null_count = int(counts[is_null].sum())
+    n_unique = len(non_null_counts)
+    norm_counts = non_null_counts / non_null_counts.sum()
+    return (
+        null_count,
+        n_unique,
+        n_unique + int(null_count > 0),
+        1 - (norm_counts ** 2).sum(),
+    )
@@ -11,6 +11,10 @@ class DataCheck(ABC):
     problems with input data.
     """
 
+    # Whether the data check only reads the schema of the data and the statistics of the active column profile, so it
+    # can validate data read in chunks with DataChecks.validate_chunks
+    _supports_chunks = False
+
     @classproperty
     def name(cls):
         """Return a name describing the data check."""
@@ -1,9 +1,10 @@
 """A collection of data checks."""
 import inspect
+import warnings
 
-from evalml.data_checks import DataCheck
+from evalml.data_checks import ColumnProfile, DataCheck
 from evalml.exceptions import DataCheckInitError
-from evalml.utils import infer_feature_types
+from evalml.utils import _trusted_woodwork_schemas, infer_feature_types
 
 
 def _has_defaults_for_all_args(init):
@@ -100,7 +101,51 @@ class DataChecks:
         if y is not None:
             y = infer_feature_types(y)
 
-        for data_check in self.data_checks:
-            messages_new = data_check.validate(X, y)
-            messages.extend(messages_new)
+        # The data checks share the statistics of the columns, and the schemas inferred above
+        profile = ColumnProfile(X, y)
+        with profile.activate(), _trusted_woodwork_schemas():
+            for data_check in self.data_checks:
+                messages_new = data_check.validate(X, y)
+                messages.extend(messages_new)
+        return messages
+
+    def validate_chunks(self, chunks, target=None, **kwargs):
+        """Inspect and validate data read in chunks, such as data which doesn't fit in memory, against data checks.
+
+        The chunks are read once into a ChunkedColumnProfile, which keeps null counts, distinct count sketches,
+        t-digests of the numeric columns and the number of occurrences of each value of the target. Only the data
+        checks which can be computed from these statistics are run: NullDataCheck, IDColumnsDataCheck,
+        NoVarianceDataCheck, OutliersDataCheck and ClassImbalanceDataCheck. NullDataCheck doesn't check for highly
+        null rows, and OutliersDataCheck estimates the share of outliers of each column without listing their rows.
+        The other data checks are skipped with a warning.
+
+        Args:
+            chunks (iterable, dd.DataFrame): Chunks of the data, such as the chunks of `pd.read_csv` with a
+                `chunksize`, dataframes read from parquet row groups or the partitions of a Dask dataframe. Each chunk
+                is either a dataframe or a tuple of the features and the target.
+            target (str): Name of the target column, for chunks which are dataframes. Defaults to None.
+            **kwargs: Arguments of ChunkedColumnProfile.
+
+        Returns:
+            dict: Dictionary containing DataCheckMessage objects
+        """
+        from evalml.data_checks.chunked_column_profile import (
+            ChunkedColumnProfile,
+        )
+
+        profile = ChunkedColumnProfile.from_chunks(chunks, target=target, **kwargs)
+        skipped = [
+            data_check.name
+            for data_check in self.data_checks
+            if not data_check._supports_chunks
+        ]
+        if skipped:
+            warnings.warn(
+                f"The following data checks don't support data read in chunks and were skipped: {', '.join(skipped)}"
+            )
+        messages = []
+        with profile.activate(), _trusted_woodwork_schemas():
+            for data_check in self.data_checks:
+                if data_check._supports_chunks:
+                    messages.extend(data_check.validate(profile.X, profile.y))
         return messages
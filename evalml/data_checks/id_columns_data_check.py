@@ -1,5 +1,6 @@
 """Data check that checks if any of the features are likely to be ID columns."""
 from evalml.data_checks import (
+    ColumnProfile,
     DataCheck,
     DataCheckActionCode,
     DataCheckActionOption,
@@ -16,6 +17,8 @@ class IDColumnsDataCheck(DataCheck):
         id_threshold (float): The probability threshold to be considered an ID column. Defaults to 1.0.
     """
 
+    _supports_chunks = True
+
     def __init__(self, id_threshold=1.0):
         if id_threshold < 0 or id_threshold > 1:
             raise ValueError("id_threshold must be a float between 0 and 1, inclusive.")
@@ -131,9 +134,14 @@ class IDColumnsDataCheck(DataCheck):
         ]  # columns whose name is "id"
         id_cols = {col: 0.95 for col in cols_named_id}
 
+        profile = ColumnProfile.for_data(X)
         X = X.ww.select(include=["Integer", "Categorical"])
 
-        check_all_unique = X.nunique() == len(X)
+        # Estimated distinct counts within three standard errors of the number of rows can't be told apart from it
+        tolerance = 3 * profile.n_unique_relative_errors[X.columns]
+        check_all_unique = profile.n_unique[X.columns] >= profile.n_rows * (
+            1 - tolerance
+        )
         cols_with_all_unique = check_all_unique[
             check_all_unique
         ].index.tolist()  # columns whose values are all unique
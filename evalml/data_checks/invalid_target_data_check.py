@@ -2,6 +2,7 @@
 import woodwork as ww
 
 from evalml.data_checks import (
+    ColumnProfile,
     DataCheck,
     DataCheckActionCode,
     DataCheckActionOption,
@@ -208,7 +209,7 @@ class InvalidTargetDataCheck(DataCheck):
             return messages
         messages = self._check_target_is_unsupported_type(y, messages)
         messages = self._check_regression_target(y, messages)
-        messages = self._check_classification_target(y, messages)
+        messages = self._check_classification_target(X, y, messages)
         messages = self._check_for_non_positive_target(y, messages)
         messages = self._check_target_and_features_compatible(X, y, messages)
         return messages
@@ -363,8 +364,8 @@ class InvalidTargetDataCheck(DataCheck):
             )
         return messages
 
-    def _check_classification_target(self, y, messages):
-        value_counts = y.value_counts()
+    def _check_classification_target(self, X, y, messages):
+        value_counts = ColumnProfile.for_data(X, y).target_value_counts
         unique_values = value_counts.index.tolist()
 
         if is_binary(self.problem_type) and len(value_counts) != 2:
@@ -4,6 +4,7 @@ from evalml.data_checks import (
     DataCheckMessageCode,
     DataCheckWarning,
 )
+from evalml.data_checks.mutual_information import pairwise_mutual_information
 from evalml.utils import infer_feature_types
 
 
@@ -12,12 +13,14 @@ class MulticollinearityDataCheck(DataCheck):
 
     Args:
         threshold (float): The threshold to be considered. Defaults to 0.9.
+        error_bound (float): If set, mutual information is estimated on a sample of rows large enough for the bias of the estimate to be at most error_bound, in nats. Defaults to None, which uses all rows.
     """
 
-    def __init__(self, threshold=0.9):
+    def __init__(self, threshold=0.9, error_bound=None):
         if threshold < 0 or threshold > 1:
             raise ValueError("threshold must be a float between 0 and 1, inclusive.")
         self.threshold = threshold
+        self.error_bound = error_bound
 
     def validate(self, X, y=None):
         """Check if any set of features are likely to be multicollinear.
@@ -53,7 +56,7 @@ class MulticollinearityDataCheck(DataCheck):
         messages = []
 
         X = infer_feature_types(X)
-        mutual_info_df = X.ww.mutual_information()
+        mutual_info_df = pairwise_mutual_information(X, error_bound=self.error_bound)
         if mutual_info_df.empty:
             return messages
         above_threshold = mutual_info_df.loc[
@@ -0,0 +1,238 @@
+"""Vectorized mutual information between the columns of a dataframe and a target."""
+import numpy as np
+import pandas as pd
+from woodwork.logical_types import Double
+from woodwork.utils import get_valid_mi_types
+
+from evalml.data_checks.column_profile import ColumnProfile
+
+# Maximum number of values histogrammed at once, which bounds the memory used by a batch of columns
+_MAX_BATCH_VALUES = 2 ** 22
+_EPS = np.finfo("float64").eps
+
+
+def mutual_information_with_target(X, y, num_bins=10, error_bound=None, random_seed=0):
+    """Computes the normalized mutual information between each column of X and the target.
+
+    Gives the same values as Woodwork's `mutual_information` on a dataframe of each column with the target, without
+    rebinning the target for every column. The target is discretized once and the mutual information of batches of
+    columns is computed with one histogram of the joint values per batch.
+
+    Args:
+        X (pd.DataFrame): The features, initialized with Woodwork.
+        y (pd.Series): The target, initialized with Woodwork.
+        num_bins (int): Number of quantile bins numeric and datetime values are discretized into. Defaults to 10.
+        error_bound (float): If set, the mutual information is estimated on a sample of rows large enough for the
+            bias of the estimate to be at most error_bound, in nats. Defaults to None, which uses all rows.
+        random_seed (int): Seed for sampling rows. Defaults to 0.
+
+    Returns:
+        pd.Series: Normalized mutual information between 0 and 1 of each column of X which supports mutual
+            information and is not fully null, or an empty series if the target doesn't support mutual information.
+    """
+    columns = _valid_columns(X)
+    if not _is_valid(y.ww.schema):
+        return pd.Series(dtype="float64")
+    rows = None
+    if error_bound is not None and columns:
+        n_bins = _max_n_bins(X, columns, num_bins)
+        n_target_bins = _n_bins(y.ww.schema, y.nunique(), num_bins)
+        rows = _sample_rows(
+            len(X),
+            (n_bins.max() - 1) * (n_target_bins - 1),
+            error_bound,
+            random_seed,
+        )
+    target_values = _take(y, rows)
+    if target_values.isnull().all():
+        return pd.Series(dtype="float64")
+    target_codes = _discretize(target_values, y.ww.schema, num_bins)
+    codes = {}
+    for col in columns:
+        values = _take(X[col], rows)
+        if values.notnull().any():
+            codes[col] = _discretize(values, X.ww.schema.columns[col], num_bins)
+    return pd.Series(
+        _batched_mutual_information(list(codes.values()), target_codes),
+        index=list(codes.keys()),
+        dtype="float64",
+    )
+
+
+def pairwise_mutual_information(X, num_bins=10, error_bound=None, random_seed=0):
+    """Computes the normalized mutual information between all pairs of columns of X.
+
+    Gives the same values as Woodwork's `mutual_information`. Each column is discretized once, and the mutual
+    information of a column with all the columns after it is computed in batches of columns.
+
+    Args:
+        X (pd.DataFrame): The features, initialized with Woodwork.
+        num_bins (int): Number of quantile bins numeric and datetime values are discretized into. Defaults to 10.
+        error_bound (float): If set, the mutual information is estimated on a sample of rows large enough for the
+            bias of the estimate to be at most error_bound, in nats. Defaults to None, which uses all rows.
+        random_seed (int): Seed for sampling rows. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: Columns `column_1`, `column_2` and `mutual_info` for each pair of columns which support mutual
+            information and are not fully null, sorted in descending order of mutual information.
+    """
+    columns = _valid_columns(X)
+    rows = None
+    if error_bound is not None and len(columns) > 1:
+        n_bins = np.sort(_max_n_bins(X, columns, num_bins))
+        rows = _sample_rows(
+            len(X), (n_bins[-1] - 1) * (n_bins[-2] - 1), error_bound, random_seed
+        )
+    codes = {}
+    for col in columns:
+        values = _take(X[col], rows)
+        if values.notnull().any():
+            codes[col] = _discretize(values, X.ww.schema.columns[col], num_bins)
+    names = list(codes.keys())
+    codes = list(codes.values())
+    mutual_info = []
+    for i, col in enumerate(names[:-1]):
+        scores = _batched_mutual_information(codes[i + 1 :], codes[i])
+        mutual_info.extend(
+            {"column_1": col, "column_2": other, "mutual_info": score}
+            for other, score in zip(names[i + 1 :], scores)
+        )
+    mutual_info.sort(key=lambda mi: mi["mutual_info"], reverse=True)
+    return pd.DataFrame(mutual_info, columns=["column_1", "column_2", "mutual_info"])
+
+
+def _is_valid(schema):
+    return type(schema.logical_type) in get_valid_mi_types()
+
+
+def _valid_columns(X):
+    """Columns of X whose logical type supports mutual information, without the index."""
+    return [
+        col
+        for col, schema in X.ww.schema.columns.items()
+        if _is_valid(schema) and col != X.ww.index
+    ]
+
+
+def _n_bins(schema, n_unique, num_bins):
+    """Upper bound on the number of distinct values of a column after discretizing it."""
+    if schema.is_numeric or schema.is_datetime:
+        return np.minimum(n_unique, num_bins)
+    return n_unique
+
+
+def _max_n_bins(X, columns, num_bins):
+    n_unique = ColumnProfile.for_data(X).n_unique
+    return np.array(
+        [_n_bins(X.ww.schema.columns[col], n_unique[col], num_bins) for col in columns]
+    )
+
+
+def _sample_rows(n_rows, n_free_cells, error_bound, random_seed):
+    """Chooses the rows to estimate the mutual information from, or None to use all rows.
+
+    The bias of the plug-in estimate of the mutual information from n rows is about n_free_cells / (2 * n) nats,
+    where n_free_cells is (bins of the first variable - 1) * (bins of the second variable - 1).
+    """
+    n_sample = int(np.ceil(max(n_free_cells, 1) / (2 * error_bound)))
+    if n_sample >= n_rows:
+        return None
+    random_state = np.random.RandomState(random_seed)
+    return np.sort(random_state.choice(n_rows, n_sample, replace=False))
+
+
+def _take(values, rows):
+    return values if rows is None else values.iloc[rows]
+
+
+def _discretize(values, schema, num_bins):
+    """Fills null values and discretizes a column into integer codes, the same way as Woodwork's mutual information."""
+    if values.isnull().any():
+        if schema.is_numeric or schema.is_datetime:
+            mean = values.mean()
+            if (
+                isinstance(mean, float)
+                and not mean.is_integer()
+                and not isinstance(schema.logical_type, Double)
+            ):
+                values = values.astype("float")
+            values = values.fillna(mean)
+        elif schema.is_categorical or schema.is_boolean:
+            mode = values.mode()
+            values = values.fillna(mode[0] if len(mode) > 0 else None)
+    if schema.is_numeric:
+        values = pd.qcut(values, num_bins, duplicates="drop")
+    elif schema.is_datetime:
+        values = pd.qcut(values.view("int64"), num_bins, duplicates="drop")
+    if str(values.dtype) != "category":
+        values = values.astype("category")
+    # Shift the codes so values which are still null, coded as -1, are counted as their own value
+    return values.cat.codes.to_numpy().astype(np.int32) + 1
+
+
+def _entropy(counts, groups, n_groups, n_rows):
+    """Entropy of each group of counts, ignoring empty counts."""
+    nonzero = counts > 0
+    p = counts[nonzero] / n_rows
+    return np.bincount(groups[nonzero], weights=-p * np.log(p), minlength=n_groups)
+
+
+def _batched_mutual_information(codes, target_codes):
+    """Computes the normalized mutual information of each array of codes with the target codes.
+
+    Matches scikit-learn's `normalized_mutual_info_score` with the arithmetic mean of the entropies as normalizer.
+    """
+    n_rows = len(target_codes)
+    target_counts = np.bincount(target_codes)
+    n_target = len(target_counts)
+    target_entropy = _entropy(
+        target_counts, np.zeros(n_target, dtype=np.int64), 1, n_rows
+    )[0]
+    n_target_classes = np.count_nonzero(target_counts)
+    batch_size = max(1, _MAX_BATCH_VALUES // max(n_rows, 1))
+    scores = []
+    for start in range(0, len(codes), batch_size):
+        batch = np.column_stack(codes[start : start + batch_size]).astype(np.int64)
+        n_batch = batch.shape[1]
+        n_values = batch.max(axis=0) + 1
+        value_offsets = np.concatenate([[0], np.cumsum(n_values)[:-1]])
+        value_column = np.repeat(np.arange(n_batch), n_values)
+
+        # Histograms of the values of every column of the batch, and of their joint values with the target
+        counts = np.bincount(
+            (batch + value_offsets).ravel(), minlength=n_values.sum()
+        ).astype(np.float64)
+        joint_values = (batch + value_offsets) * n_target + target_codes[:, None]
+        n_cells = n_values.sum() * n_target
+        if n_cells <= _MAX_BATCH_VALUES:
+            joint_counts = np.bincount(joint_values.ravel(), minlength=n_cells)
+            cells = np.flatnonzero(joint_counts)
+            cell_counts = joint_counts[cells].astype(np.float64)
+        else:
+            # The dense histogram of high cardinality columns would be too large, so only the joint values which
+            # occur are counted
+            cells, cell_counts = np.unique(joint_values.ravel(), return_counts=True)
+            cell_counts = cell_counts.astype(np.float64)
+        cell_value = cells // n_target
+        cell_target = cells % n_target
+        cell_mi = (cell_counts / n_rows) * (
+            np.log(cell_counts)
+            + np.log(n_rows)
+            - np.log(counts[cell_value])
+            - np.log(target_counts[cell_target])
+        )
+        cell_mi[np.abs(cell_mi) < _EPS] = 0.0
+        mi = np.clip(
+            np.bincount(value_column[cell_value], weights=cell_mi, minlength=n_batch),
+            0.0,
+            None,
+        )
+
+        entropy = _entropy(counts, value_column, n_batch, n_rows)
+        normalizer = np.maximum((entropy + target_entropy) / 2, _EPS)
+        batch_scores = np.where(mi == 0, 0.0, mi / normalizer)
+        # Two constant columns are a perfect match
+        n_classes = np.bincount(value_column[counts > 0], minlength=n_batch)
+        batch_scores[(n_classes == 1) & (n_target_classes == 1)] = 1.0
+        scores.append(batch_scores)
+    return np.concatenate(scores) if scores else np.array([], dtype=np.float64)
@@ -1,5 +1,6 @@
 """Data check that checks if the target or any of the features have no variance."""
 from evalml.data_checks import (
+    ColumnProfile,
     DataCheck,
     DataCheckActionCode,
     DataCheckActionOption,
@@ -20,6 +21,8 @@ class NoVarianceDataCheck(DataCheck):
             Defaults to False.
     """
 
+    _supports_chunks = True
+
     def __init__(self, count_nan_as_value=False):
         self._dropnan = not count_nan_as_value
 
@@ -155,8 +158,12 @@ class NoVarianceDataCheck(DataCheck):
         X = infer_feature_types(X)
         y = infer_feature_types(y)
 
-        unique_counts = X.nunique(dropna=self._dropnan).to_dict()
-        any_nulls = (X.isnull().any()).to_dict()
+        profile = ColumnProfile.for_data(X, y)
+        if self._dropnan:
+            unique_counts = profile.n_unique.to_dict()
+        else:
+            unique_counts = profile.n_unique_with_nulls.to_dict()
+        any_nulls = (profile.null_counts > 0).to_dict()
         one_unique = []
         one_unique_with_null = []
         zero_unique = []
@@ -235,8 +242,10 @@ class NoVarianceDataCheck(DataCheck):
         if not y_name:
             y_name = "Y"
 
-        y_unique_count = y.nunique(dropna=self._dropnan)
-        y_any_null = y.isnull().any()
+        y_any_null = profile.target_null_count > 0
+        y_unique_count = int((profile.target_value_counts > 0).sum())
+        if not self._dropnan and y_any_null:
+            y_unique_count += 1
 
         if y_unique_count == 0:
             messages.append(
@@ -1,5 +1,6 @@
 """Data check that checks if there are any highly-null columns and rows in the input."""
 from evalml.data_checks import (
+    ColumnProfile,
     DataCheck,
     DataCheckActionCode,
     DataCheckActionOption,
@@ -19,6 +20,8 @@ class NullDataCheck(DataCheck):
             that row will be considered highly-null. Defaults to 0.95.
     """
 
+    _supports_chunks = True
+
     def __init__(self, pct_null_col_threshold=0.95, pct_null_row_threshold=0.95):
         if pct_null_col_threshold < 0 or pct_null_col_threshold > 1:
             raise ValueError(
@@ -213,23 +216,27 @@ class NullDataCheck(DataCheck):
                 ).to_dict()
             )
 
-        highly_null_cols, _ = NullDataCheck.get_null_column_information(
-            X, pct_null_col_threshold=self.pct_null_col_threshold
-        )
+        percent_null_cols = ColumnProfile.for_data(X).null_fractions.to_dict()
+        highly_null_cols = {
+            key: value
+            for key, value in percent_null_cols.items()
+            if value >= self.pct_null_col_threshold and value != 0
+        }
 
-        X_to_check_for_any_null = X.ww.select(
+        cols_to_check_for_any_null = X.ww.select(
             [
                 "category",
                 "boolean",
                 "numeric",
                 "IntegerNullable",
                 "BooleanNullable",
-            ]
-        )
+            ],
+            return_schema=True,
+        ).columns
 
-        cols_with_any_nulls, _ = NullDataCheck.get_null_column_information(
-            X_to_check_for_any_null, pct_null_col_threshold=0.0
-        )
+        cols_with_any_nulls = [
+            col for col in cols_to_check_for_any_null if percent_null_cols[col] > 0
+        ]
 
         below_highly_null_cols = [
             col for col in cols_with_any_nulls if col not in highly_null_cols
@@ -325,7 +332,8 @@ class NullDataCheck(DataCheck):
         Returns:
             tuple: Tuple containing: dictionary mapping column name to its null percentage and dictionary mapping column name to null indices in that column.
         """
-        percent_null_cols = (X.isnull().mean()).to_dict()
+        X = infer_feature_types(X)
+        percent_null_cols = ColumnProfile.for_data(X).null_fractions.to_dict()
         highly_null_cols = {
             key: value
             for key, value in percent_null_cols.items()
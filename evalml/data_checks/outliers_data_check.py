@@ -3,6 +3,7 @@ import numpy as np
 from scipy.stats import gamma
 
 from evalml.data_checks import (
+    ColumnProfile,
     DataCheck,
     DataCheckActionCode,
     DataCheckActionOption,
@@ -18,6 +19,8 @@ class OutliersDataCheck(DataCheck):
     Columns with score anomalies are considered to contain outliers.
     """
 
+    _supports_chunks = True
+
     def validate(self, X, y=None):
         """Check if there are any outliers in a dataframe by using IQR to determine column anomalies. Column with anomalies are considered to contain outliers.
 
@@ -61,6 +64,7 @@ class OutliersDataCheck(DataCheck):
         messages = []
 
         X = infer_feature_types(X)
+        profile = ColumnProfile.for_data(X)
         X = X.ww.select("numeric")
 
         if len(X.columns) == 0:
@@ -68,13 +72,16 @@ class OutliersDataCheck(DataCheck):
 
         has_outliers = []
         outlier_row_indices = {}
+        pct_outliers_of_columns = {}
+        box_plot_data = profile.boxplot_data(X.columns)
         for col in X.columns:
-            box_plot_dict = OutliersDataCheck.get_boxplot_data(X.ww[col])
+            box_plot_dict = box_plot_data[col]
             box_plot_dict_values = box_plot_dict["values"]
 
             pct_outliers = box_plot_dict["pct_outliers"]
             if pct_outliers > 0 and box_plot_dict["score"] <= 0.9:
                 has_outliers.append(col)
+                pct_outliers_of_columns[col] = pct_outliers
                 outlier_row_indices[col] = (
                     box_plot_dict_values["low_indices"]
                     + box_plot_dict_values["high_indices"]
@@ -86,6 +93,21 @@ class OutliersDataCheck(DataCheck):
         warning_msg = "Column(s) {} are likely to have outlier data.".format(
             ", ".join([f"'{col}'" for col in has_outliers])
         )
+        if not profile.keeps_rows:
+            # Profiles of data read in chunks estimate the share of outliers without knowing which rows they are in
+            messages.append(
+                DataCheckWarning(
+                    message=f"{warning_msg} The share of outliers is estimated, so the rows with outliers are unknown.",
+                    data_check_name=self.name,
+                    message_code=DataCheckMessageCode.HAS_OUTLIERS,
+                    details={
+                        "columns": has_outliers,
+                        "pct_outliers": pct_outliers_of_columns,
+                    },
+                ).to_dict()
+            )
+            return messages
+
         all_rows_with_indices_set = set()
         for row_indices in outlier_row_indices.values():
             all_rows_with_indices_set.update(row_indices)
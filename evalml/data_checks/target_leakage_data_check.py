@@ -6,6 +6,9 @@ from evalml.data_checks import (
     DataCheckMessageCode,
     DataCheckWarning,
 )
+from evalml.data_checks.mutual_information import (
+    mutual_information_with_target,
+)
 from evalml.utils.woodwork_utils import (
     infer_feature_types,
     numeric_and_boolean_ww,
@@ -22,9 +25,10 @@ class TargetLeakageDataCheck(DataCheck):
     Args:
         pct_corr_threshold (float): The correlation threshold to be considered leakage. Defaults to 0.95.
         method (string): The method to determine correlation. Use 'mutual' for mutual information, otherwise 'pearson' for Pearson correlation. Defaults to 'mutual'.
+        error_bound (float): If set, mutual information is estimated on a sample of rows large enough for the bias of the estimate to be at most error_bound, in nats. Defaults to None, which uses all rows.
     """
 
-    def __init__(self, pct_corr_threshold=0.95, method="mutual"):
+    def __init__(self, pct_corr_threshold=0.95, method="mutual", error_bound=None):
         if pct_corr_threshold < 0 or pct_corr_threshold > 1:
             raise ValueError(
                 "pct_corr_threshold must be a float between 0 and 1, inclusive."
@@ -32,6 +36,7 @@ class TargetLeakageDataCheck(DataCheck):
         if method not in ["mutual", "pearson"]:
             raise ValueError(f"Method '{method}' not in ['mutual', 'pearson']")
         self.pct_corr_threshold = pct_corr_threshold
+        self.error_bound = error_bound
         self.method = method
 
     def _calculate_pearson(self, X, y):
@@ -50,17 +55,8 @@ class TargetLeakageDataCheck(DataCheck):
         return highly_corr_cols
 
     def _calculate_mutual_information(self, X, y):
-        highly_corr_cols = []
-        for col in X.columns:
-            cols_to_compare = X.ww[[col]]
-            cols_to_compare.ww[str(col) + "y"] = y
-            mutual_info = cols_to_compare.ww.mutual_information()
-            if (
-                len(mutual_info) > 0
-                and mutual_info["mutual_info"].iloc[0] > self.pct_corr_threshold
-            ):
-                highly_corr_cols.append(col)
-        return highly_corr_cols
+        mutual_info = mutual_information_with_target(X, y, error_bound=self.error_bound)
+        return list(mutual_info.index[mutual_info > self.pct_corr_threshold])
 
     def validate(self, X, y):
         """Check if any of the features are highly correlated with the target by using mutual information or Pearson correlation.
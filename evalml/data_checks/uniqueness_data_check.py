@@ -1,5 +1,6 @@
 """Data check that checks if there are any columns in the input that are either too unique for classification problems or not unique enough for regression problems."""
 from evalml.data_checks import (
+    ColumnProfile,
     DataCheck,
     DataCheckActionCode,
     DataCheckActionOption,
@@ -108,7 +109,7 @@ class UniquenessDataCheck(DataCheck):
 
         X = infer_feature_types(X)
 
-        res = X.apply(UniquenessDataCheck.uniqueness_score)
+        res = ColumnProfile.for_data(X).uniqueness_scores
 
         if is_regression(self.problem_type):
             not_unique_enough_cols = list(res.index[res < self.threshold])
@@ -20,7 +20,11 @@ from .graphs import (
     roc_curve,
     t_sne,
 )
-from .prediction_explanations import explain_predictions, explain_predictions_best_worst
+from .prediction_explanations import (
+    explain_predictions,
+    explain_predictions_best_worst,
+    PredictionExplainer,
+)
 from .permutation_importance import (
     calculate_permutation_importance,
     calculate_permutation_importance_one_column,
@@ -11,6 +11,8 @@ from scipy.stats.mstats import mquantiles
 
 from evalml.problem_types import is_regression
 
+_MAX_BATCH_MEMORY = 256 * 1024 ** 2
+
 
 def _range_for_dates(X_dt, percentiles, grid_resolution):
     """Compute the range of values used in partial dependence for datetime features.
@@ -121,14 +123,73 @@ def _cartesian(arrays):
     return out
 
 
-def _partial_dependence_calculation(pipeline, grid, features, X):
+def _grid_batch_size(X, n_grid_points, max_batch_memory):
+    """Number of grid points whose copies of X fit within `max_batch_memory` bytes."""
+    if X.ww.index is not None:
+        # Copies of X would repeat the values of the woodwork index
+        return 1
+    memory = X.memory_usage(deep=True).sum()
+    return int(np.clip(max_batch_memory // max(memory, 1), 1, max(n_grid_points, 1)))
+
+
+def _tile_grid_values(X, features, grid_points):
+    """Stack a copy of X for every point in the grid, with the features set to the values of that point.
+
+    Args:
+        X (pd.DataFrame): Input data.
+        features (list(str)): Column names of input data set to the values of the grid.
+        grid_points (pd.DataFrame): Points of the grid, with one column for each feature.
+
+    Returns:
+        pd.DataFrame: Copies of X for each point, in the order of the grid.
+    """
+    n_samples = X.shape[0]
+    if len(grid_points) == 1:
+        X_tiled = X.ww.copy()
+    else:
+        X_tiled = pd.concat([X] * len(grid_points), ignore_index=True)
+        X_tiled.ww.init(schema=X.ww.schema)
+    for i, variable in enumerate(features):
+        part_dep_column = pd.Series(
+            np.repeat(grid_points.iloc[:, i].to_numpy(), n_samples),
+            index=X_tiled.index,
+        )
+        X_tiled.ww[variable] = ww.init_series(
+            part_dep_column, logical_type=X.ww.logical_types[variable]
+        )
+    return X_tiled
+
+
+def _features_pass_through(pipeline, X, precomputed_features, features):
+    """Whether the features reach the estimator unchanged, so the output of the other components can be reused."""
+    provenance = pipeline._get_feature_provenance()
+    for feature in features:
+        if feature not in precomputed_features.columns or feature in provenance:
+            return False
+        if (
+            not X[feature]
+            .reset_index(drop=True)
+            .equals(precomputed_features[feature].reset_index(drop=True))
+        ):
+            return False
+    return True
+
+
+def _partial_dependence_calculation(
+    pipeline, grid, features, X, max_batch_memory=_MAX_BATCH_MEMORY
+):
     """Do the partial dependence calculation once the grid is computed.
 
+    Several points of the grid are evaluated with a single call to the pipeline by stacking a copy of X for each point,
+    as long as the stacked data fits within `max_batch_memory`. If the features are passed to the estimator without being
+    modified by any other component, the output of the other components is only computed once and reused for every point.
+
     Args:
         pipeline (PipelineBase): pipeline.
         grid (pd.DataFrame): Grid of features to compute the partial dependence on.
         features (list(str)): Column names of input data
         X (pd.DataFrame): Input data.
+        max_batch_memory (int): Maximum memory in bytes of the data passed to the pipeline in one call.
 
     Returns:
         Tuple (np.ndarray, np.ndarray): averaged and individual predictions for
@@ -137,28 +198,44 @@ def _partial_dependence_calculation(pipeline, grid, features, X):
     predictions = []
     averaged_predictions = []
 
+    X_eval = X
     if is_regression(pipeline.problem_type):
         prediction_method = pipeline.predict
     else:
         prediction_method = pipeline.predict_proba
 
-    X_eval = X.ww.copy()
-    for _, new_values in grid.iterrows():
-        for i, variable in enumerate(features):
-            part_dep_column = pd.Series(
-                [new_values[i]] * X_eval.shape[0], index=X_eval.index
-            )
-            X_eval.ww[variable] = ww.init_series(
-                part_dep_column, logical_type=X_eval.ww.logical_types[variable]
-            )
+    if pipeline._supports_fast_permutation_importance:
+        precomputed_features = pipeline.transform_all_but_final(X)
+        if _features_pass_through(pipeline, X, precomputed_features, features):
+            X_eval = precomputed_features
+            if is_regression(pipeline.problem_type):
 
-        pred = prediction_method(X_eval)
-
-        predictions.append(pred)
-        # average over samples
-        averaged_predictions.append(np.mean(pred, axis=0))
+                def predict_from_features(X_features):
+                    return pipeline.inverse_transform(
+                        pipeline.estimator.predict(X_features)
+                    )
 
-    n_samples = X.shape[0]
+                prediction_method = predict_from_features
+            else:
+                prediction_method = pipeline.estimator.predict_proba
+
+    n_samples = X_eval.shape[0]
+    batch_size = _grid_batch_size(X_eval, len(grid), max_batch_memory)
+    for start in range(0, len(grid), batch_size):
+        grid_batch = grid.iloc[start : start + batch_size]
+        pred = np.asarray(
+            prediction_method(_tile_grid_values(X_eval, features, grid_batch))
+        )
+        predictions.append(pred.reshape(len(grid_batch), n_samples, *pred.shape[1:]))
+        # average over samples, with the rows of each grid point stacked together
+        grid_point = np.repeat(np.arange(len(grid_batch)), n_samples)
+        averaged_pred = pd.DataFrame(pred).groupby(grid_point).mean().to_numpy()
+        averaged_predictions.append(
+            averaged_pred if pred.ndim > 1 else averaged_pred[:, 0]
+        )
+
+    predictions = np.concatenate(predictions)
+    averaged_predictions = np.concatenate(averaged_predictions)
 
     # reshape to (n_instances, n_points) for binary/regression
     # reshape to (n_classes, n_instances, n_points) for multiclass
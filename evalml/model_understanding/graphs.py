@@ -460,8 +460,17 @@ def binary_objective_vs_threshold(pipeline, X, y, objective, steps=100):
     if objective.score_needs_proba:
         raise ValueError("Objective `score_needs_proba` must be False")
 
-    pipeline_tmp = copy.copy(pipeline)
     thresholds = np.linspace(0, 1, steps + 1)
+    X = infer_feature_types(X)
+    y = infer_feature_types(y)
+    y_pred_proba = pipeline.predict_proba(X).iloc[:, 1]
+    costs = objective._score_thresholds(
+        y_pred_proba, pipeline._encode_targets(y), thresholds, X=X
+    )
+    if costs is not None:
+        return pd.DataFrame({"threshold": thresholds, "score": costs})
+
+    pipeline_tmp = copy.copy(pipeline)
     costs = []
     for threshold in thresholds:
         pipeline_tmp.threshold = threshold
@@ -8,9 +8,18 @@ from evalml.problem_types import is_classification
 from evalml.problem_types.utils import is_regression
 from evalml.utils import infer_feature_types
 
+_MAX_STACKED_ROWS = 1_000_000
+
 
 def calculate_permutation_importance(
-    pipeline, X, y, objective, n_repeats=5, n_jobs=None, random_seed=0
+    pipeline,
+    X,
+    y,
+    objective,
+    n_repeats=5,
+    n_jobs=None,
+    random_seed=0,
+    sample_size=None,
 ):
     """Calculates permutation importance for features.
 
@@ -23,6 +32,10 @@ def calculate_permutation_importance(
         n_jobs (int or None): Non-negative integer describing level of parallelism used for pipelines.
             None and 1 are equivalent. If set to -1, all CPUs are used. For n_jobs below -1, (n_cpus + 1 + n_jobs) are used. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        sample_size (int or None): Number of rows of X to sample to compute permutation importance on. If the pipeline supports
+            the fast calculation, each shuffle is scored on a different sample of rows. Otherwise, one sample is used for all shuffles.
+            If not None, the 95% confidence interval of the mean importance over the shuffles is returned in the "lower_bound" and
+            "upper_bound" columns. Defaults to None, which uses all rows.
 
     Returns:
         pd.DataFrame: Mean feature importance scores over a number of shuffles.
@@ -50,8 +63,15 @@ def calculate_permutation_importance(
             n_repeats=n_repeats,
             n_jobs=n_jobs,
             random_seed=random_seed,
+            sample_size=sample_size,
         )
     else:
+        if sample_size is not None and sample_size < X.shape[0]:
+            rows = np.random.RandomState(random_seed).choice(
+                X.shape[0], sample_size, replace=False
+            )
+            X = X.ww.iloc[np.sort(rows)]
+            y = y.ww.iloc[np.sort(rows)]
         perm_importance = _slow_permutation_importance(
             pipeline,
             X,
@@ -64,6 +84,23 @@ def calculate_permutation_importance(
 
     mean_perm_importance = perm_importance["importances_mean"]
     feature_names = list(X.columns)
+    if sample_size is not None:
+        margin = np.full(len(feature_names), np.nan)
+        if n_repeats > 1:
+            # Normal approximation of the confidence interval of the mean over the shuffles
+            importances = perm_importance["importances"]
+            margin = 1.96 * np.std(importances, axis=1, ddof=1) / np.sqrt(n_repeats)
+        perm_importance_df = pd.DataFrame(
+            {
+                "feature": feature_names,
+                "importance": mean_perm_importance,
+                "lower_bound": mean_perm_importance - margin,
+                "upper_bound": mean_perm_importance + margin,
+            }
+        )
+        return perm_importance_df.sort_values(
+            "importance", ascending=False, kind="mergesort"
+        ).reset_index(drop=True)
     mean_perm_importance = list(zip(feature_names, mean_perm_importance))
     mean_perm_importance.sort(key=lambda x: x[1], reverse=True)
     return pd.DataFrame(mean_perm_importance, columns=["feature", "importance"])
@@ -146,14 +183,24 @@ def _fast_permutation_importance(
     n_repeats=5,
     n_jobs=None,
     random_seed=None,
+    sample_size=None,
 ):
     """Calculate permutation importance faster by only computing the estimator features once.
 
-    Only used for pipelines that support this optimization.
+    Only used for pipelines that support this optimization. All permutations of a column are stacked and scored with one
+    call to the estimator. If `sample_size` is not None, each repeat is scored on a different random sample of rows.
     """
     if is_classification(pipeline.problem_type):
         y = pipeline._encode_targets(y)
-    baseline_score = _fast_scorer(pipeline, precomputed_features, X, y, objective)
+    row_indices = _sample_row_indices(
+        X.shape[0], n_repeats, sample_size, np.random.RandomState(random_seed)
+    )
+    if row_indices is None:
+        baseline_score = _fast_scorer(pipeline, precomputed_features, X, y, objective)
+    else:
+        baseline_score = _batched_fast_scores(
+            pipeline, precomputed_features, y, objective, [], row_indices, row_indices
+        )
     if col_name is None:
         scores = Parallel(n_jobs=n_jobs)(
             delayed(_calculate_permutation_scores_fast)(
@@ -164,13 +211,11 @@ def _fast_permutation_importance(
                 col_name,
                 random_seed,
                 n_repeats,
-                _fast_scorer,
                 baseline_score,
+                row_indices,
             )
             for col_name in X.columns
         )
-        importances = baseline_score - np.array(scores)
-        return {"importances_mean": np.mean(importances, axis=1)}
     else:
         scores = _calculate_permutation_scores_fast(
             pipeline,
@@ -180,14 +225,12 @@ def _fast_permutation_importance(
             col_name,
             random_seed,
             n_repeats,
-            _fast_scorer,
             baseline_score,
+            row_indices,
         )
     importances = baseline_score - np.array(scores)
-    importances_mean = (
-        np.mean(importances, axis=1) if col_name is None else np.mean(importances)
-    )
-    return {"importances_mean": importances_mean}
+    importances_mean = np.mean(importances, axis=-1)
+    return {"importances_mean": importances_mean, "importances": importances}
 
 
 def _calculate_permutation_scores_fast(
@@ -198,8 +241,8 @@ def _calculate_permutation_scores_fast(
     col_name,
     random_seed,
     n_repeats,
-    scorer,
     baseline_score,
+    row_indices=None,
 ):
     """Calculate the permutation score when `col_name` is permuted."""
     random_state = np.random.RandomState(random_seed)
@@ -213,23 +256,105 @@ def _calculate_permutation_scores_fast(
         return scores + baseline_score
 
     if col_name in precomputed_features.columns:
-        col_idx = precomputed_features.columns.get_loc(col_name)
+        col_idx = [precomputed_features.columns.get_loc(col_name)]
     else:
         col_idx = [
             precomputed_features.columns.get_loc(col)
             for col in pipeline._get_feature_provenance()[col_name]
         ]
 
-    return _shuffle_and_score_helper(
+    if row_indices is None:
+        n_rows = precomputed_features.shape[0]
+        row_indices = np.tile(np.arange(n_rows), (n_repeats, 1))
+        # Each round shuffles the permutation of the previous round, the same as _shuffle_and_score_helper
+        permuted_row_indices = np.zeros_like(row_indices)
+        shuffling_idx = np.arange(n_rows)
+        permutation = np.arange(n_rows)
+        for n_round in range(n_repeats):
+            random_state.shuffle(shuffling_idx)
+            permutation = permutation[shuffling_idx]
+            permuted_row_indices[n_round] = permutation
+    else:
+        permuted_row_indices = np.array(
+            [random_state.permutation(rows) for rows in row_indices]
+        )
+    return _batched_fast_scores(
         pipeline,
         precomputed_features,
         y,
         objective,
         col_idx,
-        n_repeats,
-        scorer,
-        random_state,
-        is_fast=True,
+        row_indices,
+        permuted_row_indices,
+    )
+
+
+def _batched_fast_scores(
+    pipeline,
+    precomputed_features,
+    y,
+    objective,
+    col_idx,
+    row_indices,
+    permuted_row_indices,
+):
+    """Score the estimator on several permutations of the columns at `col_idx`, stacked into a single call to the estimator.
+
+    Args:
+        pipeline (PipelineBase): Fitted pipeline.
+        precomputed_features (pd.DataFrame): Features computed by all components but the estimator.
+        y (pd.Series): The target data.
+        objective (ObjectiveBase): Objective to score on.
+        col_idx (list(int)): Positions of the columns to permute.
+        row_indices (np.ndarray): Positions of the rows scored in each repeat, of shape [n_repeats, n_rows].
+        permuted_row_indices (np.ndarray): Positions of the rows whose values are used for the permuted columns in each
+            repeat, of shape [n_repeats, n_rows].
+
+    Returns:
+        np.ndarray: The score of each repeat, negated if lower scores are better.
+    """
+    n_repeats, n_rows = row_indices.shape
+    repeats_per_batch = max(1, _MAX_STACKED_ROWS // max(n_rows, 1))
+    scores = np.zeros(n_repeats)
+    for start in range(0, n_repeats, repeats_per_batch):
+        rows = row_indices[start : start + repeats_per_batch]
+        permuted_rows = permuted_row_indices[start : start + repeats_per_batch]
+        stacked = precomputed_features.iloc[rows.ravel()].reset_index(drop=True)
+        for idx in col_idx:
+            stacked[stacked.columns[idx]] = precomputed_features.iloc[
+                permuted_rows.ravel(), idx
+            ].reset_index(drop=True)
+        stacked.ww.init(schema=precomputed_features.ww.schema)
+
+        if objective.score_needs_proba:
+            preds = pipeline.estimator.predict_proba(stacked)
+        else:
+            preds = pipeline.estimator.predict(stacked)
+            if is_regression(pipeline.problem_type):
+                preds = pipeline.inverse_transform(preds)
+
+        for n_round, repeat_rows in enumerate(rows):
+            repeat_preds = preds.iloc[n_round * n_rows : (n_round + 1) * n_rows].copy()
+            repeat_preds.index = precomputed_features.index[repeat_rows]
+            score = pipeline._score(
+                precomputed_features.iloc[repeat_rows],
+                y.iloc[repeat_rows],
+                repeat_preds,
+                objective,
+            )
+            scores[start + n_round] = score if objective.greater_is_better else -score
+    return scores
+
+
+def _sample_row_indices(n_rows, n_repeats, sample_size, random_state):
+    """Positions of the rows sampled for each repeat, or None if all rows are used."""
+    if sample_size is None or sample_size >= n_rows:
+        return None
+    return np.array(
+        [
+            np.sort(random_state.choice(n_rows, sample_size, replace=False))
+            for _ in range(n_repeats)
+        ]
     )
 
 
@@ -254,10 +379,8 @@ def _slow_permutation_importance(
             pipeline, X, y, col_name, objective, _slow_scorer, n_repeats, random_seed
         )
     importances = baseline_score - np.array(scores)
-    importances_mean = (
-        np.mean(importances, axis=1) if col_name is None else np.mean(importances)
-    )
-    return {"importances_mean": importances_mean}
+    importances_mean = np.mean(importances, axis=-1)
+    return {"importances_mean": importances_mean, "importances": importances}
 
 
 def _calculate_permutation_scores_slow(
@@ -277,7 +400,6 @@ def _calculate_permutation_scores_slow(
         n_repeats,
         scorer,
         random_state,
-        is_fast=False,
     )
 
 
@@ -290,7 +412,6 @@ def _shuffle_and_score_helper(
     n_repeats,
     scorer,
     random_state,
-    is_fast=True,
 ):
     scores = np.zeros(n_repeats)
 
@@ -303,10 +424,7 @@ def _shuffle_and_score_helper(
         col.index = X_permuted.index
         X_permuted.iloc[:, col_idx] = col
         X_permuted.ww.init(schema=X_features.ww.schema)
-        if is_fast:
-            feature_score = scorer(pipeline, X_permuted, X_features, y, objective)
-        else:
-            feature_score = scorer(pipeline, X_permuted, y, objective)
+        feature_score = scorer(pipeline, X_permuted, y, objective)
         scores[n_round] = feature_score
     return scores
 
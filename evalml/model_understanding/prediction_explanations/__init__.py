@@ -1,2 +1,3 @@
 """Prediction explanation tools."""
 from .explainers import explain_predictions_best_worst, explain_predictions
+from ._algorithms import PredictionExplainer
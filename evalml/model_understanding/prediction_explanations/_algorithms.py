@@ -9,7 +9,7 @@ from sklearn.utils import check_array
 
 from evalml.model_family.model_family import ModelFamily
 from evalml.problem_types import is_binary, is_multiclass, is_regression
-from evalml.utils import import_or_raise
+from evalml.utils import import_or_raise, infer_feature_types
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +35,16 @@ def _create_dictionary(explainer_values, feature_names):
     return mapping
 
 
-def _compute_lime_values(pipeline, features, index_to_explain):
-    """Computes LIME values for each feature.
+def _make_lime_explainer(pipeline, features):
+    """Builds the LIME explainer of a pipeline, which perturbs data with statistics of the given features.
 
     Args:
         pipeline (PipelineBase): Trained pipeline whose predictions we want to explain with LIME.
-        features (pd.DataFrame): Dataframe of features - needs to correspond to data the pipeline was fit on.
-        index_to_explain (int): Index in the pipeline_features/input_features to explain.
+        features (pd.DataFrame): Dataframe of features computed by the pipeline, used to compute the statistics of the
+            perturbed data.
 
     Returns:
-        dict or list(dict): For regression problems, a dictionary mapping a feature name to a list of LIME values.
-            For classification problems, returns a list of dictionaries. One for each class.
+        lime.lime_tabular.LimeTabularExplainer
     """
     error_msg = "lime is not installed. Please install using 'pip install lime'"
     lime = import_or_raise("lime.lime_tabular", error_msg=error_msg)
@@ -53,9 +52,33 @@ def _compute_lime_values(pipeline, features, index_to_explain):
         raise ValueError(
             "You passed in a baseline pipeline. These are simple enough that LIME values are not needed."
         )
-    mode = "classification"
-    if is_regression(pipeline.problem_type):
-        mode = "regression"
+    mode = "regression" if is_regression(pipeline.problem_type) else "classification"
+    feature_names = features.columns if isinstance(features, pd.DataFrame) else None
+    return lime.LimeTabularExplainer(
+        features,
+        feature_names=feature_names,
+        discretize_continuous=False,
+        mode=mode,
+    )
+
+
+def _compute_lime_values(pipeline, features, index_to_explain, explainer=None):
+    """Computes LIME values for each feature.
+
+    Args:
+        pipeline (PipelineBase): Trained pipeline whose predictions we want to explain with LIME.
+        features (pd.DataFrame): Dataframe of features - needs to correspond to data the pipeline was fit on.
+        index_to_explain (int): Index in the pipeline_features/input_features to explain.
+        explainer (lime.lime_tabular.LimeTabularExplainer): LIME explainer of the pipeline to use. Defaults to None,
+            which builds one from the features.
+
+    Returns:
+        dict or list(dict): For regression problems, a dictionary mapping a feature name to a list of LIME values.
+            For classification problems, returns a list of dictionaries. One for each class.
+    """
+    if explainer is None:
+        explainer = _make_lime_explainer(pipeline, features)
+    mode = explainer.mode
 
     def array_predict(row):
         row = pd.DataFrame(row, columns=feature_names)
@@ -76,12 +99,6 @@ def _compute_lime_values(pipeline, features, index_to_explain):
         feature_names = None
         instance = features[index_to_explain]
 
-    explainer = lime.LimeTabularExplainer(
-        features,
-        feature_names=feature_names,
-        discretize_continuous=False,
-        mode=mode,
-    )
     if mode == "regression":
         exp = explainer.explain_instance(
             instance,
@@ -105,7 +122,60 @@ def _compute_lime_values(pipeline, features, index_to_explain):
     return mappings
 
 
-def _compute_shap_values(pipeline, features, training_data=None):
+def _make_shap_explainer(pipeline, training_data=None):
+    """Builds the SHAP explainer of the estimator of a pipeline.
+
+    Args:
+        pipeline (PipelineBase): Trained pipeline whose predictions we want to explain with SHAP.
+        training_data (pd.DataFrame): Training data the pipeline was fit on.
+            For non-tree estimators, we need a sample of training data for the KernelSHAP algorithm.
+
+    Returns:
+        shap.TreeExplainer or shap.KernelExplainer
+    """
+    estimator = pipeline.estimator
+    if estimator.model_family == ModelFamily.BASELINE:
+        raise ValueError(
+            "You passed in a baseline pipeline. These are simple enough that SHAP values are not needed."
+        )
+
+    if estimator.model_family.is_tree_estimator():
+        # Use tree_path_dependent to avoid linear runtime with dataset size
+        with warnings.catch_warnings(record=True) as ws:
+            explainer = shap.TreeExplainer(
+                estimator._component_obj, feature_perturbation="tree_path_dependent"
+            )
+        if ws:
+            logger.debug(f"_compute_shap_values TreeExplainer: {ws[0].message}")
+        return explainer
+
+    if training_data is None:
+        raise ValueError(
+            "You must pass in a value for parameter 'training_data' when the pipeline "
+            "does not have a tree-based estimator. "
+            f"Current estimator model family is {estimator.model_family}."
+        )
+
+    # More than 100 datapoints can negatively impact runtime according to SHAP
+    # https://github.com/slundberg/shap/blob/master/shap/explainers/kernel.py#L114
+    sampled_training_data_features = shap.sample(training_data, 100)
+    sampled_training_data_features = check_array(sampled_training_data_features)
+    if is_regression(pipeline.problem_type):
+        decision_function = estimator._component_obj.predict
+    else:
+        decision_function = estimator._component_obj.predict_proba
+    with warnings.catch_warnings(record=True) as ws:
+        explainer = shap.KernelExplainer(
+            decision_function,
+            sampled_training_data_features,
+            link_function="identity",
+        )
+    if ws:
+        logger.debug(f"_compute_shap_values KernelExplainer: {ws[0].message}")
+    return explainer
+
+
+def _compute_shap_values(pipeline, features, training_data=None, explainer=None):
     """Computes SHAP values for each feature.
 
     Args:
@@ -113,6 +183,8 @@ def _compute_shap_values(pipeline, features, training_data=None):
         features (pd.DataFrame): Dataframe of features - needs to correspond to data the pipeline was fit on.
         training_data (pd.DataFrame): Training data the pipeline was fit on.
             For non-tree estimators, we need a sample of training data for the KernelSHAP algorithm.
+        explainer (shap.TreeExplainer or shap.KernelExplainer): SHAP explainer of the pipeline to use. Defaults to None,
+            which builds one, using the training data for non-tree estimators.
 
     Returns:
         dict or list(dict): For regression problems, a dictionary mapping a feature name to a list of SHAP values.
@@ -120,10 +192,8 @@ def _compute_shap_values(pipeline, features, training_data=None):
         float: the expected value if return_expected_value is True.
     """
     estimator = pipeline.estimator
-    if estimator.model_family == ModelFamily.BASELINE:
-        raise ValueError(
-            "You passed in a baseline pipeline. These are simple enough that SHAP values are not needed."
-        )
+    if explainer is None:
+        explainer = _make_shap_explainer(pipeline, training_data)
 
     feature_names = features.columns
 
@@ -134,13 +204,6 @@ def _compute_shap_values(pipeline, features, training_data=None):
         features = check_array(features.values)
 
     if estimator.model_family.is_tree_estimator():
-        # Use tree_path_dependent to avoid linear runtime with dataset size
-        with warnings.catch_warnings(record=True) as ws:
-            explainer = shap.TreeExplainer(
-                estimator._component_obj, feature_perturbation="tree_path_dependent"
-            )
-        if ws:
-            logger.debug(f"_compute_shap_values TreeExplainer: {ws[0].message}")
         shap_values = explainer.shap_values(features, check_additivity=False)
         # shap only outputs values for positive class for Catboost/Xgboost binary estimators.
         # this modifies the output to match the output format of other binary estimators.
@@ -156,27 +219,7 @@ def _compute_shap_values(pipeline, features, training_data=None):
         ):
             shap_values = [np.zeros(shap_values.shape), shap_values]
     else:
-        if training_data is None:
-            raise ValueError(
-                "You must pass in a value for parameter 'training_data' when the pipeline "
-                "does not have a tree-based estimator. "
-                f"Current estimator model family is {estimator.model_family}."
-            )
-
-        # More than 100 datapoints can negatively impact runtime according to SHAP
-        # https://github.com/slundberg/shap/blob/master/shap/explainers/kernel.py#L114
-        sampled_training_data_features = shap.sample(training_data, 100)
-        sampled_training_data_features = check_array(sampled_training_data_features)
-        if is_regression(pipeline.problem_type):
-            decision_function = estimator._component_obj.predict
-        else:
-            decision_function = estimator._component_obj.predict_proba
         with warnings.catch_warnings(record=True) as ws:
-            explainer = shap.KernelExplainer(
-                decision_function,
-                sampled_training_data_features,
-                link_function="identity",
-            )
             shap_values = explainer.shap_values(features)
         if ws:
             logger.debug(f"_compute_shap_values KernelExplainer: {ws[0].message}")
@@ -205,6 +248,114 @@ def _compute_shap_values(pipeline, features, training_data=None):
         raise ValueError(f"Unknown shap_values datatype {str(type(shap_values))}!")
 
 
+class PredictionExplainer:
+    """Explainer of the predictions of a fitted pipeline, built once and reused to explain any number of predictions.
+
+    Building an explainer samples the background data of KernelSHAP, or computes the statistics of the background data
+    LIME perturbs data with. Get the explainer of a pipeline with `PipelineBase.get_explainer`, which stores it with the
+    pipeline so that `explain_predictions` and `explain_predictions_best_worst` reuse it instead of building an
+    explainer from the data they explain, and so that it is saved along with the pipeline.
+
+    Args:
+        pipeline (PipelineBase): Fitted pipeline whose predictions we want to explain.
+        algorithm (str): Algorithm of the explainer, one of "shap" or "lime". Defaults to "shap".
+        background (pd.DataFrame): Input features, such as the training data of the pipeline, whose features computed by
+            the pipeline are the background data of the explainer. Required unless the algorithm is "shap" and the
+            estimator of the pipeline is tree-based. Defaults to None.
+        background_target (pd.Series): Targets of the background input features. Defaults to None.
+
+    Raises:
+        ValueError: If the algorithm is unknown or doesn't support the pipeline, or if background is required but not given.
+    """
+
+    def __init__(
+        self, pipeline, algorithm="shap", background=None, background_target=None
+    ):
+        if algorithm not in ["shap", "lime"]:
+            raise ValueError(
+                f"Unknown algorithm {algorithm}, should be one of ['shap', 'lime']"
+            )
+        if algorithm == "lime" and "CatBoost" in pipeline.estimator.name:
+            raise ValueError("CatBoost models are not supported by LIME at this time")
+        self.algorithm = algorithm
+
+        background_features = None
+        if background is not None:
+            background_features = pipeline.transform_all_but_final(
+                infer_feature_types(background), background_target
+            )
+        if algorithm == "shap":
+            if background_features is not None:
+                background_features = background_features.dropna(axis=0)
+            elif not pipeline.estimator.model_family.is_tree_estimator():
+                raise ValueError(
+                    "Parameter background is required to build a SHAP explainer when the pipeline does not have a tree-based estimator."
+                )
+            self.explainer = _make_shap_explainer(pipeline, background_features)
+        else:
+            if background_features is None:
+                raise ValueError(
+                    "Parameter background is required to build a LIME explainer."
+                )
+            self.explainer = _make_lime_explainer(pipeline, background_features)
+
+
+def _get_pipeline_explainer(pipeline, algorithm):
+    """Returns the SHAP or LIME explainer stored with a pipeline by `PipelineBase.get_explainer`, or None if there is none."""
+    explainers = getattr(pipeline, "_explainers", None)
+    if not isinstance(explainers, dict):
+        return None
+    explainer = explainers.get(algorithm)
+    return explainer.explainer if isinstance(explainer, PredictionExplainer) else None
+
+
+def _slice_explainer_values(values, position):
+    """Selects the explainer values of a single data point from explainer values computed for several data points.
+
+    Args:
+        values (dict or list(dict)): Dictionary mapping feature name to list of values,
+            or a list of dictionaries (each mapping a feature name to a list of values).
+        position (int): Position of the data point in the lists of values.
+
+    Returns:
+        dict or list(dict): The explainer values of the data point, in the same format as values.
+    """
+    if isinstance(values, dict):
+        return {
+            feature_name: [feature_values[position]]
+            for feature_name, feature_values in values.items()
+        }
+    return [_slice_explainer_values(class_values, position) for class_values in values]
+
+
+def _compute_shap_values_of_rows(pipeline, pipeline_features, indices):
+    """Computes the SHAP values of several data points with a single explainer and a single call to it.
+
+    Args:
+        pipeline (PipelineBase): Fitted pipeline whose predictions we want to explain with SHAP.
+        pipeline_features (pd.DataFrame): Dataframe of features computed by the pipeline.
+        indices (list[int]): Indices in the pipeline_features of the data points to explain.
+
+    Returns:
+        dict: Maps the index of each data point to its SHAP values, in the format returned by `_compute_shap_values`,
+            and the expected value.
+    """
+    indices = list(dict.fromkeys(indices))
+    if not indices:
+        return {}
+    explainer = _get_pipeline_explainer(pipeline, "shap")
+    explainer_values, expected_value = _compute_shap_values(
+        pipeline,
+        pipeline_features.iloc[indices],
+        training_data=(pipeline_features.dropna(axis=0) if explainer is None else None),
+        explainer=explainer,
+    )
+    return {
+        index: (_slice_explainer_values(explainer_values, position), expected_value)
+        for position, index in enumerate(indices)
+    }
+
+
 def _aggreggate_explainer_values_dict(values, provenance):
     """Aggregates explainer values across features created from a common feature.
 
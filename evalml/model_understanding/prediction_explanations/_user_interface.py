@@ -7,6 +7,8 @@ from evalml.model_understanding.prediction_explanations._algorithms import (
     _aggregate_explainer_values,
     _compute_lime_values,
     _compute_shap_values,
+    _compute_shap_values_of_rows,
+    _get_pipeline_explainer,
     _normalize_explainer_values,
 )
 from evalml.problem_types import ProblemTypes
@@ -513,6 +515,7 @@ def _make_single_prediction_explanation_table(
     include_expected_value=False,
     output_format="text",
     algorithm="shap",
+    shap_values=None,
 ):
     """Creates table summarizing the top_k_features positive and top_k_features negative contributing features to the prediction of a single datapoint.
 
@@ -529,6 +532,9 @@ def _make_single_prediction_explanation_table(
         include_expected_value (bool): Whether the expected value should be included in the table. Default is False.
         output_format (str): The desired format of the output.  Can be "text", "dict", or "dataframe".
         algorithm (str): Algorithm to use while generating top contributing features, one of "shap" or "lime". Defaults to "shap".
+        shap_values (tuple): SHAP values of the data point, in the format returned by `_compute_shap_values`, and the
+            expected value, when they were computed along with those of other data points. Defaults to None, which
+            computes them for this data point only.
 
     Returns:
         str: Table
@@ -540,14 +546,24 @@ def _make_single_prediction_explanation_table(
     input_features_row = input_features.iloc[[index_to_explain]]
 
     if algorithm == "shap":
-        explainer_values, expected_value = _compute_shap_values(
-            pipeline,
-            pipeline_features_row,
-            training_data=pipeline_features.dropna(axis=0),
-        )
+        if shap_values is not None:
+            explainer_values, expected_value = shap_values
+        else:
+            explainer = _get_pipeline_explainer(pipeline, "shap")
+            explainer_values, expected_value = _compute_shap_values(
+                pipeline,
+                pipeline_features_row,
+                training_data=(
+                    pipeline_features.dropna(axis=0) if explainer is None else None
+                ),
+                explainer=explainer,
+            )
     elif algorithm == "lime":
         explainer_values = _compute_lime_values(
-            pipeline, pipeline_features, index_to_explain
+            pipeline,
+            pipeline_features,
+            index_to_explain,
+            explainer=_get_pipeline_explainer(pipeline, "lime"),
         )
         expected_value = None
     else:
@@ -815,7 +831,9 @@ class _ExplanationTable(_SectionMaker):
         self.include_explainer_values = include_explainer_values
         self.algorithm = algorithm
 
-    def make_text(self, index, pipeline, pipeline_features, input_features):
+    def make_text(
+        self, index, pipeline, pipeline_features, input_features, shap_values=None
+    ):
         """Makes the explanation table section for reports formatted as text.
 
         The table is the same whether the user requests a best/worst report or they manually specified the
@@ -829,6 +847,8 @@ class _ExplanationTable(_SectionMaker):
             pipeline (PipelineBase): The pipeline to explain.
             pipeline_features (pd.DataFrame): The dataframe of features created by the pipeline.
             input_features (pd.Dataframe): The dataframe of features passed to the pipeline.
+            shap_values (tuple): SHAP values and expected value of the prediction, computed along with those of the other
+                predictions of the report. Defaults to None.
 
         Returns:
             The explanation table section for reports formatted as text.
@@ -842,12 +862,15 @@ class _ExplanationTable(_SectionMaker):
             include_explainer_values=self.include_explainer_values,
             output_format="text",
             algorithm=self.algorithm,
+            shap_values=shap_values,
         )
         table = table.splitlines()
         # Indent the rows of the table to match the indentation of the entire report.
         return ["\t\t" + line + "\n" for line in table] + ["\n\n"]
 
-    def make_dict(self, index, pipeline, pipeline_features, input_features):
+    def make_dict(
+        self, index, pipeline, pipeline_features, input_features, shap_values=None
+    ):
         """Makes the explanation table section formatted as a dictionary."""
         json_output = _make_single_prediction_explanation_table(
             pipeline,
@@ -858,10 +881,13 @@ class _ExplanationTable(_SectionMaker):
             include_explainer_values=self.include_explainer_values,
             output_format="dict",
             algorithm=self.algorithm,
+            shap_values=shap_values,
         )
         return json_output
 
-    def make_dataframe(self, index, pipeline, pipeline_features, input_features):
+    def make_dataframe(
+        self, index, pipeline, pipeline_features, input_features, shap_values=None
+    ):
         """Makes the explanation table section formatted as a dataframe."""
         return _make_single_prediction_explanation_table(
             pipeline,
@@ -872,6 +898,7 @@ class _ExplanationTable(_SectionMaker):
             include_explainer_values=self.include_explainer_values,
             output_format="dataframe",
             algorithm=self.algorithm,
+            shap_values=shap_values,
         )
 
 
@@ -896,6 +923,21 @@ class _ReportMaker:
         self.make_predicted_values_maker = predicted_values_maker
         self.table_maker = table_maker
 
+    def _compute_shap_values(self, data):
+        """Computes the SHAP values of all the predictions of the report at once, if the table explains them with SHAP.
+
+        Args:
+            data (_ReportData): Data passed in by the user.
+
+        Returns:
+            dict: Maps the index of each prediction to its SHAP values and expected value, or is empty for other algorithms.
+        """
+        if self.table_maker.algorithm != "shap":
+            return {}
+        return _compute_shap_values_of_rows(
+            data.pipeline, data.pipeline_features, data.index_list
+        )
+
     def make_text(self, data):
         """Make a prediction explanation report that is formatted as text.
 
@@ -906,6 +948,7 @@ class _ReportMaker:
              str
         """
         report = [data.pipeline.name + "\n\n", str(data.pipeline.parameters) + "\n\n"]
+        shap_values = self._compute_shap_values(data)
         for rank, index in enumerate(data.index_list):
             report.extend(self.heading_maker.make_text(rank))
             if self.make_predicted_values_maker:
@@ -922,7 +965,11 @@ class _ReportMaker:
                 report.extend([""])
             report.extend(
                 self.table_maker.make_text(
-                    index, data.pipeline, data.pipeline_features, data.input_features
+                    index,
+                    data.pipeline,
+                    data.pipeline_features,
+                    data.input_features,
+                    shap_values=shap_values.get(index),
                 )
             )
         return "".join(report)
@@ -937,6 +984,7 @@ class _ReportMaker:
              dict
         """
         report = []
+        shap_values = self._compute_shap_values(data)
         for rank, index in enumerate(data.index_list):
             section = {}
             # We want to omit heading and predicted values sections for "explain_predictions"-style reports
@@ -953,16 +1001,25 @@ class _ReportMaker:
                     pd.Series(data.pipeline_features.index),
                 )
             section["explanations"] = self.table_maker.make_dict(
-                index, data.pipeline, data.pipeline_features, data.input_features
+                index,
+                data.pipeline,
+                data.pipeline_features,
+                data.input_features,
+                shap_values=shap_values.get(index),
             )["explanations"]
             report.append(section)
         return {"explanations": report}
 
     def make_dataframe(self, data):
         report = []
+        shap_values = self._compute_shap_values(data)
         for rank, index in enumerate(data.index_list):
             explanation_table = self.table_maker.make_dataframe(
-                index, data.pipeline, data.pipeline_features, data.input_features
+                index,
+                data.pipeline,
+                data.pipeline_features,
+                data.input_features,
+                shap_values=shap_values.get(index),
             )
             if self.make_predicted_values_maker:
                 heading = self.make_predicted_values_maker.make_dataframe(
@@ -252,27 +252,20 @@ def explain_predictions_best_worst(
         raise ValueError("CatBoost models are not supported by LIME at this time")
 
     try:
+        # Transform the data once, and compute the predictions and the explanations from the same features
+        pipeline_features = pipeline.transform_all_but_final(
+            input_features, y_true, training_data, training_target
+        )
         if is_regression(pipeline.problem_type):
-            if is_time_series(pipeline.problem_type):
-                y_pred = pipeline.predict_in_sample(
-                    input_features, y_true, training_data, training_target
-                )
-            else:
-                y_pred = pipeline.predict(input_features)
+            y_pred = pipeline._predict_from_features(pipeline_features, y_true)
             y_pred_values = None
             y_true_no_nan, y_pred_no_nan = drop_rows_with_nans(y_true, y_pred)
             errors = metric(y_true_no_nan, y_pred_no_nan)
         else:
-            if is_time_series(pipeline.problem_type):
-                y_pred = pipeline.predict_proba_in_sample(
-                    input_features, y_true, training_data, training_target
-                )
-                y_pred_values = pipeline.predict_in_sample(
-                    input_features, y_true, training_data, training_target
-                )
-            else:
-                y_pred = pipeline.predict_proba(input_features)
-                y_pred_values = pipeline.predict(input_features)
+            y_pred = pipeline._predict_proba_from_features(pipeline_features, y_true)
+            y_pred_values = pipeline._predict_from_features(
+                pipeline_features, y_true, y_pred_proba=y_pred
+            )
             y_true_no_nan, y_pred_no_nan, y_pred_values_no_nan = drop_rows_with_nans(
                 y_true, y_pred, y_pred_values
             )
@@ -294,10 +287,6 @@ def explain_predictions_best_worst(
         start_time, timer(), ExplainPredictionsStage.COMPUTE_FEATURE_STAGE, callback
     )
 
-    pipeline_features = pipeline.transform_all_but_final(
-        input_features, y_true, training_data, training_target
-    )
-
     _update_progress(
         start_time,
         timer(),
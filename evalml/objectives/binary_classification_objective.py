@@ -48,6 +48,13 @@ class BinaryClassificationObjective(ObjectiveBase):
         if not self.can_optimize_threshold:
             raise RuntimeError("Trying to optimize objective that can't be optimized!")
 
+        thresholds = _candidate_thresholds(ypred_proba)
+        scores = self._score_thresholds(ypred_proba, y_true, thresholds, X=X)
+        if scores is not None and not np.isnan(scores).all():
+            if not self.greater_is_better:
+                scores = -scores
+            return thresholds[np.nanargmax(scores)]
+
         def cost(threshold):
             y_predicted = self.decision_function(
                 ypred_proba=ypred_proba, threshold=threshold[0], X=X
@@ -59,6 +66,89 @@ class BinaryClassificationObjective(ObjectiveBase):
 
         return optimal.x[0]
 
+    def _score_thresholds(self, ypred_proba, y_true, thresholds, X=None):
+        """Scores the objective at every threshold in a single sweep over the sorted predicted probabilities.
+
+        Only supported by objectives which implement `_score_confusion_counts` and use the default decision function.
+
+        Args:
+            ypred_proba (pd.Series, np.ndarray): The classifier's predicted probabilities.
+            y_true (pd.Series, np.ndarray): The ground truth for the predictions, encoded as 0 and 1.
+            thresholds (np.ndarray): Thresholds to score the objective at.
+            X (pd.DataFrame, optional): Any extra columns that are needed from training data.
+
+        Returns:
+            np.ndarray: The score at each threshold, or None if the objective does not support vectorized scoring.
+        """
+        if not self._supports_vectorized_thresholds():
+            return None
+        ypred_proba = self._standardize_input_type(ypred_proba).to_numpy(dtype=float)
+        y_true = self._standardize_input_type(y_true).to_numpy()
+        if (
+            len(ypred_proba) == 0
+            or len(ypred_proba) != len(y_true)
+            or not set(np.unique(y_true)).issubset({0, 1})
+        ):
+            return None
+        order = np.argsort(-ypred_proba, kind="stable")
+        is_positive = (y_true == 1)[order]
+        # Rows are predicted positive when their probability is above the threshold, which are the
+        # first rows in descending order of probability
+        n_predicted_positive = len(ypred_proba) - np.searchsorted(
+            np.sort(ypred_proba), np.asarray(thresholds, dtype=float), side="right"
+        )
+
+        def confusion_counts(weights=None):
+            weights = (
+                np.ones(len(order))
+                if weights is None
+                else np.asarray(weights, dtype=float)[order]
+            )
+            cumulative_positives = np.concatenate(
+                [[0], np.cumsum(weights * is_positive)]
+            )
+            cumulative_negatives = np.concatenate(
+                [[0], np.cumsum(weights * ~is_positive)]
+            )
+            tp = cumulative_positives[n_predicted_positive]
+            fp = cumulative_negatives[n_predicted_positive]
+            tn = cumulative_negatives[-1] - fp
+            fn = cumulative_positives[-1] - tp
+            return tp, fp, tn, fn
+
+        return self._score_confusion_counts(confusion_counts, X=X)
+
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        """Computes the objective from the confusion matrix counts at many thresholds at once.
+
+        Objectives which only depend on the confusion matrix can override this to optimize their threshold with an exact
+        sweep over every candidate threshold instead of differential evolution.
+
+        Args:
+            confusion_counts (callable): Returns the true positive, false positive, true negative and false negative
+                counts at each threshold as np.ndarrays. Takes optional per-row weights, which weight each row's count.
+            X (pd.DataFrame, optional): Any extra columns that are needed from training data.
+
+        Returns:
+            np.ndarray: The score at each threshold, or None if the objective does not support vectorized scoring.
+        """
+        return None
+
+    def _supports_vectorized_thresholds(self):
+        """Whether `_score_confusion_counts` is implemented by the same class as the objective function."""
+
+        def defining_class(attribute):
+            return next(
+                klass for klass in type(self).__mro__ if attribute in vars(klass)
+            )
+
+        hook_class = defining_class("_score_confusion_counts")
+        return (
+            hook_class is not BinaryClassificationObjective
+            and defining_class("objective_function") is hook_class
+            and defining_class("decision_function") is BinaryClassificationObjective
+        )
+
     def decision_function(self, ypred_proba, threshold=0.5, X=None):
         """Apply a learned threshold to predicted probabilities to get predicted classes.
 
@@ -80,3 +170,22 @@ class BinaryClassificationObjective(ObjectiveBase):
             raise ValueError("y_true contains more than two unique values")
         if len(np.unique(y_predicted)) > 2 and not self.score_needs_proba:
             raise ValueError("y_predicted contains more than two unique values")
+
+
+def _candidate_thresholds(ypred_proba):
+    """Returns one threshold for each distinct way of splitting the predicted probabilities, halfway between neighboring probabilities."""
+    values = np.unique(np.clip(np.asarray(ypred_proba, dtype=float), 0, 1))
+    edges = np.concatenate([[0.0], values, [1.0]])
+    return (edges[:-1] + edges[1:]) / 2
+
+
+def _safe_divide(numerator, denominator):
+    """Divides elementwise, returning 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator),
+        where=denominator != 0,
+    )
@@ -58,3 +58,22 @@ class CostBenefitMatrix(BinaryClassificationObjective):
 
         total_cost = np.multiply(conf_matrix.values, cost_matrix).sum()
         return total_cost
+
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        total_cost = (
+            self.true_positive * tp
+            + self.true_negative * tn
+            + self.false_positive * fp
+            + self.false_negative * fn
+        )
+        # When the true and predicted labels are all the same class, objective_function's confusion matrix only has
+        # that class, which is multiplied with every cost of the cost matrix
+        single_class = (fp + tn + fn == 0) | (tp + fn + fp == 0)
+        all_costs = (
+            self.true_positive
+            + self.true_negative
+            + self.false_positive
+            + self.false_negative
+        )
+        return np.where(single_class, all_costs, total_cost / (tp + fp + tn + fn))
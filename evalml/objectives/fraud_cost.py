@@ -81,3 +81,21 @@ class FraudCost(BinaryClassificationObjective):
         loss_per_total_processed = loss / transaction_amount.sum()
 
         return loss_per_total_processed
+
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        if X is None:
+            return None
+        X = self._standardize_input_type(X)
+        if self.amount_col not in X.columns:
+            return None
+        transaction_amount = X[self.amount_col].to_numpy(dtype=float)
+        fraud_cost = transaction_amount * self.fraud_payout_percentage
+        interchange_cost = (
+            transaction_amount * (1 - self.retry_percentage) * self.interchange_fee
+        )
+        tp, fp, tn, fn = confusion_counts()
+        _, _, _, false_negatives = confusion_counts(fraud_cost)
+        _, false_positives, _, _ = confusion_counts(interchange_cost)
+        all_one_prediction = (tp + fp == 0) | (tn + fn == 0)
+        loss = false_negatives + false_positives + all_one_prediction * fraud_cost.sum()
+        return loss / transaction_amount.sum()
@@ -1,6 +1,8 @@
 """Lead scoring objective."""
 import math
 
+import numpy as np
+
 from .binary_classification_objective import BinaryClassificationObjective
 
 
@@ -49,3 +51,12 @@ class LeadScoring(BinaryClassificationObjective):
         same_class_penalty = (2 - len(set(y_predicted))) * abs(profit_per_lead)
 
         return profit_per_lead - same_class_penalty
+
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        n_rows = tp + fp + tn + fn
+        profit_per_lead = (
+            self.true_positives * tp + self.false_positives * fp
+        ) / n_rows
+        same_class = (tp + fp == 0) | (tp + fp == n_rows)
+        return profit_per_lead - same_class * np.abs(profit_per_lead)
@@ -7,7 +7,10 @@ from sklearn import metrics
 from sklearn.preprocessing import label_binarize
 
 from ..utils import classproperty
-from .binary_classification_objective import BinaryClassificationObjective
+from .binary_classification_objective import (
+    BinaryClassificationObjective,
+    _safe_divide,
+)
 from .multiclass_classification_objective import (
     MulticlassClassificationObjective,
 )
@@ -35,6 +38,10 @@ class AccuracyBinary(BinaryClassificationObjective):
         """Objective function for accuracy score for binary classification."""
         return metrics.accuracy_score(y_true, y_predicted, sample_weight=sample_weight)
 
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        return (tp + tn) / (tp + fp + tn + fn)
+
 
 class AccuracyMulticlass(MulticlassClassificationObjective):
     """Accuracy score for multiclass classification.
@@ -79,6 +86,17 @@ class BalancedAccuracyBinary(BinaryClassificationObjective):
             y_true, y_predicted, sample_weight=sample_weight
         )
 
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        true_positive_rate = _safe_divide(tp, tp + fn)
+        true_negative_rate = _safe_divide(tn, tn + fp)
+        # Classes missing from the ground truth are left out of the average
+        if (tp + fn)[0] == 0:
+            return true_negative_rate
+        if (tn + fp)[0] == 0:
+            return true_positive_rate
+        return (true_positive_rate + true_negative_rate) / 2
+
 
 class BalancedAccuracyMulticlass(MulticlassClassificationObjective):
     """Balanced accuracy score for multiclass classification.
@@ -125,6 +143,10 @@ class F1(BinaryClassificationObjective):
             y_true, y_predicted, zero_division=0.0, sample_weight=sample_weight
         )
 
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        return _safe_divide(2 * tp, 2 * tp + fp + fn)
+
 
 class F1Micro(MulticlassClassificationObjective):
     """F1 score for multiclass classification using micro averaging.
@@ -229,6 +251,10 @@ class Precision(BinaryClassificationObjective):
             y_true, y_predicted, zero_division=0.0, sample_weight=sample_weight
         )
 
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        return _safe_divide(tp, tp + fp)
+
 
 class PrecisionMicro(MulticlassClassificationObjective):
     """Precision score for multiclass classification using micro averaging.
@@ -333,6 +359,10 @@ class Recall(BinaryClassificationObjective):
             y_true, y_predicted, zero_division=0.0, sample_weight=sample_weight
         )
 
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        return _safe_divide(tp, tp + fn)
+
 
 class RecallMicro(MulticlassClassificationObjective):
     """Recall score for multiclass classification using micro averaging.
@@ -617,6 +647,12 @@ class MCCBinary(BinaryClassificationObjective):
                 y_true, y_predicted, sample_weight=sample_weight
             )
 
+    def _score_confusion_counts(self, confusion_counts, X=None):
+        tp, fp, tn, fn = confusion_counts()
+        return _safe_divide(
+            tp * tn - fp * fn, np.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn))
+        )
+
 
 class MCCMulticlass(MulticlassClassificationObjective):
     """Matthews correlation coefficient for multiclass classification.
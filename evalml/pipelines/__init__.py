@@ -43,6 +43,7 @@ from .components import (
 )
 
 from .component_graph import ComponentGraph
+from .compiled_pipeline import CompiledPipeline
 from .pipeline_base import PipelineBase
 from .classification_pipeline import ClassificationPipeline
 from .binary_classification_pipeline import BinaryClassificationPipeline
@@ -54,3 +55,4 @@ from .time_series_classification_pipelines import (
     TimeSeriesMulticlassClassificationPipeline,
 )
 from .time_series_regression_pipeline import TimeSeriesRegressionPipeline
+from .time_series_forecaster import TimeSeriesForecaster
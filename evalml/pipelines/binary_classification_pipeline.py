@@ -86,6 +86,25 @@ class BinaryClassificationPipeline(
         """
         return super().predict_proba(X)
 
+    def _predict_from_features(self, features, y=None, y_pred_proba=None):
+        """Computes the labels returned by predict from the output of transform_all_but_final, without transforming the data again.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from. Ignored. Only used for time series.
+            y_pred_proba (pd.DataFrame): Output of _predict_proba_from_features on the same features. If the pipeline has a
+                threshold, the labels are derived from it instead of computing the probabilities again. Defaults to None.
+
+        Returns:
+            pd.Series: Estimated labels.
+        """
+        if self.threshold is None:
+            return super()._predict_from_features(features, y)
+        if y_pred_proba is None:
+            y_pred_proba = self._predict_proba_from_features(features)
+        predictions = self._predict_with_objective(features, y_pred_proba, None)
+        return self._decode_predictions(infer_feature_types(predictions))
+
     @staticmethod
     def _score(X, y, predictions, objective):
         """Given data, model predictions or predicted probabilities computed on the data, and an objective, evaluate and return the objective score."""
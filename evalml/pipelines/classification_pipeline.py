@@ -114,11 +114,30 @@ class ClassificationPipeline(PipelineBase):
             pd.Series: Estimated labels.
         """
         _predictions = self._predict(X, objective=objective)
-        predictions = self.inverse_transform(_predictions.astype(int))
-        predictions = pd.Series(
-            predictions, name=self.input_target_name, index=_predictions.index
+        return self._decode_predictions(_predictions)
+
+    def _decode_predictions(self, predictions):
+        """Converts predictions of the estimator, encoded as integers, to the labels of the target the pipeline was fit on."""
+        decoded = self.inverse_transform(predictions.astype(int))
+        decoded = pd.Series(
+            decoded, name=self.input_target_name, index=predictions.index
         )
-        return infer_feature_types(predictions)
+        return infer_feature_types(decoded)
+
+    def _predict_from_features(self, features, y=None, y_pred_proba=None):
+        """Computes the labels returned by predict from the output of transform_all_but_final, without transforming the data again.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from. Ignored. Only used for time series.
+            y_pred_proba (pd.DataFrame): Output of _predict_proba_from_features on the same features. Binary pipelines
+                with a threshold derive the labels from it instead of computing the probabilities again. Defaults to None.
+
+        Returns:
+            pd.Series: Estimated labels.
+        """
+        predictions = self.component_graph._call_final_component("predict", features)
+        return self._decode_predictions(predictions)
 
     def predict_proba(self, X, X_train=None, y_train=None):
         """Make probability estimates for labels.
@@ -139,7 +158,19 @@ class ClassificationPipeline(PipelineBase):
                 "Cannot call predict_proba() on a component graph because the final component is not an Estimator."
             )
         X = self.transform_all_but_final(X, y=None)
-        proba = self.estimator.predict_proba(X)
+        return self._predict_proba_from_features(X)
+
+    def _predict_proba_from_features(self, features, y=None):
+        """Computes the probability estimates returned by predict_proba from the output of transform_all_but_final.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from. Ignored. Only used for time series.
+
+        Returns:
+            pd.DataFrame: Probability estimates.
+        """
+        proba = self.component_graph._call_final_component("predict_proba", features)
         proba = proba.ww.rename(
             columns={col: new_col for col, new_col in zip(proba.columns, self.classes_)}
         )
@@ -0,0 +1,559 @@
+"""Fitted pipelines compiled into a flat sequence of NumPy kernels, to make predictions on a few rows with little overhead."""
+import warnings
+
+import numpy as np
+import pandas as pd
+from woodwork.logical_types import NaturalLanguage
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines.components import (
+    DateTimeFeaturizer,
+    DropColumns,
+    DropNullColumns,
+    Estimator,
+    Imputer,
+    OneHotEncoder,
+    SelectColumns,
+    SimpleImputer,
+    StandardScaler,
+)
+from evalml.problem_types import is_binary, is_classification, is_time_series
+
+
+class CompiledPipeline:
+    """A fitted pipeline compiled into a flat sequence of NumPy kernels, to make predictions on a few rows with little overhead.
+
+    Each component of the pipeline is replaced by a kernel which applies its fitted transform to plain NumPy columns,
+    using column positions computed once when compiling, and the estimator's underlying model is called directly on the
+    resulting feature matrix. Unlike `PipelineBase.predict`, the compiled pipeline doesn't infer Woodwork types or check
+    the input against the types the pipeline was fit on, so the input must have the columns and types the pipeline was
+    fit on. Predictions match the pipeline's predictions, up to floating point rounding.
+
+    The supported components are the Imputer, Simple Imputer, One Hot Encoder, Standard Scaler, DateTime Featurizer,
+    Drop Columns Transformer, Select Columns Transformer and Drop Null Columns Transformer, the components which only
+    transform the target, such as the Label Encoder, and the components which are only used in training, such as the
+    samplers. The estimator must make its predictions with its underlying model, as the scikit-learn based estimators
+    do. Time series pipelines are not supported.
+
+    The compiled pipeline is a snapshot of the pipeline: changes made to the pipeline after compiling it, such as
+    refitting it or setting its threshold, aren't reflected in the compiled pipeline.
+
+    Args:
+        pipeline (PipelineBase): Fitted pipeline to compile.
+
+    Raises:
+        PipelineNotYetFittedError: If the pipeline is not fitted.
+        ValueError: If the pipeline is a time series pipeline or has components which can't be compiled.
+    """
+
+    def __init__(self, pipeline):
+        if not pipeline._is_fitted:
+            klass = type(pipeline).__name__
+            raise PipelineNotYetFittedError(
+                f"This {klass} is not fitted yet. You must fit {klass} before calling compile."
+            )
+        if is_time_series(pipeline.problem_type):
+            raise ValueError("Time series pipelines can't be compiled.")
+        self.problem_type = pipeline.problem_type
+        self.name = pipeline.name
+        component_graph = pipeline.component_graph
+        input_schema = component_graph._input_types
+        self.input_feature_names = list(input_schema.columns)
+        input_kinds = [_column_kind(schema) for schema in input_schema.columns.values()]
+        self._input_converters = [_INPUT_CONVERTERS.get(kind) for kind in input_kinds]
+
+        names = {"X": self.input_feature_names}
+        kinds = {"X": input_kinds}
+        self._steps = []
+        unsupported = []
+        for component_name in component_graph.compute_order:
+            component = component_graph.get_component(component_name)
+            parents = tuple(
+                parent
+                for parent in component_graph.get_inputs(component_name)
+                if parent == "X" or parent.endswith(".x")
+            )
+            is_estimator = component_name == component_graph.compute_order[-1]
+            if is_estimator:
+                supported = _predicts_with_underlying_model(component)
+            else:
+                supported = (
+                    component.training_only
+                    or not component.modifies_features
+                    or type(component) in _KERNEL_BUILDERS
+                )
+            if not supported:
+                unsupported.append(component_name)
+            # The components which take the output of a component which can't be compiled are only checked for support
+            if not supported or any(parent not in names for parent in parents):
+                continue
+            input_names = [name for parent in parents for name in names[parent]]
+            input_kinds = [kind for parent in parents for kind in kinds[parent]]
+            fit_input_names = component_graph.input_feature_names.get(component_name)
+            if fit_input_names is not None and input_names != list(fit_input_names):
+                raise ValueError(
+                    f"Can't compile the pipeline because the input of {component_name} doesn't have the columns it was fit on."
+                )
+            if is_estimator:
+                self._final_parents = parents
+                break
+            if component.training_only or not component.modifies_features:
+                kernel, output_names, output_kinds = None, input_names, input_kinds
+            else:
+                kernel, output_names, output_kinds = _KERNEL_BUILDERS[type(component)](
+                    component, input_names, input_kinds
+                )
+            self._steps.append((parents, kernel, f"{component_name}.x"))
+            names[f"{component_name}.x"] = output_names
+            kinds[f"{component_name}.x"] = output_kinds
+        if unsupported:
+            raise ValueError(
+                f"Can't compile the pipeline because these components aren't supported: {', '.join(unsupported)}"
+            )
+
+        self._model = pipeline.estimator._component_obj
+        self._threshold = getattr(pipeline, "threshold", None)
+        self._labels = None
+        self._inverse_transform = None
+        if is_classification(self.problem_type):
+            self.classes_ = pipeline.classes_
+            # The model's classes are the encoded classes if the pipeline has a Label Encoder, and the labels otherwise
+            self._model_classes = np.asarray(self._model.classes_)
+            self._labels = pipeline.inverse_transform(
+                pd.Series(self._model_classes)
+            ).to_numpy()
+        elif _has_target_inverse_transform(component_graph):
+            self._inverse_transform = pipeline.inverse_transform
+
+    def _compute_features(self, X):
+        """Computes the feature matrix passed to the estimator."""
+        outputs = {"X": self._input_columns(X)}
+        for parents, kernel, output in self._steps:
+            if len(parents) == 1:
+                columns = outputs[parents[0]]
+            else:
+                columns = [column for parent in parents for column in outputs[parent]]
+            outputs[output] = columns if kernel is None else kernel(columns)
+        if len(self._final_parents) == 1:
+            columns = outputs[self._final_parents[0]]
+        else:
+            columns = [
+                column for parent in self._final_parents for column in outputs[parent]
+            ]
+        return np.column_stack(columns).astype(np.float64, copy=False)
+
+    def _input_columns(self, X):
+        """Splits the input into one array per input column, converting numeric and datetime columns."""
+        try:
+            if isinstance(X, pd.DataFrame):
+                columns = [X[name].to_numpy() for name in self.input_feature_names]
+            elif isinstance(X, dict):
+                # Values are kept as objects, since NumPy would convert the missing values of a list of strings to "nan"
+                columns = [
+                    np.atleast_1d(np.asarray(X[name], dtype=object))
+                    for name in self.input_feature_names
+                ]
+            else:
+                X = np.asarray(X)
+                if X.ndim == 1:
+                    X = X.reshape(1, -1)
+                if X.shape[1] != len(self.input_feature_names):
+                    raise ValueError(
+                        f"Input X must have {len(self.input_feature_names)} columns, but has {X.shape[1]} columns."
+                    )
+                columns = [X[:, i] for i in range(X.shape[1])]
+        except KeyError as e:
+            raise ValueError(f"Input X doesn't have the column {e}.")
+        return [
+            column if converter is None else converter(column)
+            for column, converter in zip(columns, self._input_converters)
+        ]
+
+    def _call_model(self, method, features):
+        with warnings.catch_warnings():
+            # The model was fit on a dataframe, but is passed the feature matrix to skip converting it to a dataframe
+            warnings.filterwarnings(
+                "ignore", message="X does not have valid feature names"
+            )
+            return getattr(self._model, method)(features)
+
+    def predict(self, X):
+        """Make predictions, which match the predictions of the pipeline's predict method.
+
+        Args:
+            X (pd.DataFrame, dict or np.ndarray): Data with the columns the pipeline was fit on. A dictionary maps each
+                column name to the value of a single row or to the values of several rows. An array has the columns in
+                the order the pipeline was fit on, and a one-dimensional array is a single row.
+
+        Returns:
+            np.ndarray: Predicted values.
+        """
+        features = self._compute_features(X)
+        if self._labels is None:
+            predictions = self._call_model("predict", features)
+            if self._inverse_transform is not None:
+                predictions = self._inverse_transform(pd.Series(predictions)).to_numpy()
+            return predictions
+        if is_binary(self.problem_type) and self._threshold is not None:
+            proba = self._call_model("predict_proba", features)
+            positions = (proba[:, 1] > self._threshold).astype(int)
+        else:
+            # The classes of scikit-learn models are sorted
+            positions = np.searchsorted(
+                self._model_classes, self._call_model("predict", features)
+            )
+        return self._labels[positions]
+
+    def predict_proba(self, X):
+        """Make probability estimates for labels, which match the estimates of the pipeline's predict_proba method.
+
+        Args:
+            X (pd.DataFrame, dict or np.ndarray): Data with the columns the pipeline was fit on. A dictionary maps each
+                column name to the value of a single row or to the values of several rows. An array has the columns in
+                the order the pipeline was fit on, and a one-dimensional array is a single row.
+
+        Returns:
+            np.ndarray: Probability estimates of shape [n_samples, n_classes], with the classes in the order of `classes_`.
+
+        Raises:
+            ValueError: If the pipeline is not a classification pipeline.
+        """
+        if self._labels is None:
+            raise ValueError(
+                "predict_proba is only available for classification pipelines."
+            )
+        return self._call_model("predict_proba", self._compute_features(X))
+
+    def __repr__(self):
+        """String representation of the compiled pipeline."""
+        return f"CompiledPipeline({self.name}, {len(self._steps)} steps)"
+
+
+def _column_kind(schema):
+    """Kind of a column, which determines how the kernels handle it."""
+    if schema.is_numeric:
+        return "numeric"
+    if schema.is_datetime:
+        return "datetime"
+    if schema.is_boolean:
+        return "boolean"
+    if schema.is_categorical:
+        return "category"
+    if isinstance(schema.logical_type, NaturalLanguage):
+        return "natural_language"
+    return "other"
+
+
+def _to_float(values):
+    """Converts a column to floats, with NaN for missing values."""
+    if values.dtype.kind in "biuf":
+        return values.astype(np.float64, copy=False)
+    missing = pd.isnull(values)
+    converted = np.full(len(values), np.nan)
+    converted[~missing] = values[~missing].astype(np.float64)
+    return converted
+
+
+def _to_datetime64(values):
+    """Converts a column to naive datetimes, keeping the local time of timezone-aware datetimes."""
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[ns]", copy=False)
+    values = pd.DatetimeIndex(pd.to_datetime(values))
+    if values.tz is not None:
+        values = values.tz_localize(None)
+    return values.to_numpy()
+
+
+def _to_object(values):
+    """Converts a column of strings to objects, so that comparing it to a category of another type is done elementwise."""
+    if values.dtype.kind in "SU":
+        return values.astype(object)
+    return values
+
+
+_INPUT_CONVERTERS = {
+    "numeric": _to_float,
+    "datetime": _to_datetime64,
+    "category": _to_object,
+}
+
+
+def _fill_missing(values, fill_value):
+    missing = pd.isnull(values)
+    if not missing.any():
+        return values
+    return np.where(missing, fill_value, values)
+
+
+def _predicts_with_underlying_model(component):
+    """Whether the predictions of an estimator are the predictions of its underlying model on the features."""
+    return (
+        isinstance(component, Estimator)
+        and type(component).predict is Estimator.predict
+        and type(component).predict_proba is Estimator.predict_proba
+        and component._component_obj is not None
+    )
+
+
+def _has_target_inverse_transform(component_graph):
+    """Whether the predictions of the estimator are inverse transformed by a component which transforms the target."""
+    current_component = component_graph.compute_order[-1]
+    parent_y = component_graph._get_parent_y(current_component)
+    while parent_y:
+        if hasattr(component_graph.get_component(parent_y), "inverse_transform"):
+            return True
+        parent_y = component_graph._get_parent_y(parent_y)
+    return False
+
+
+def _select(input_names, input_kinds, output_names):
+    """Kernel which selects columns by name."""
+    positions = [input_names.index(name) for name in output_names]
+
+    def kernel(columns):
+        return [columns[i] for i in positions]
+
+    return kernel, list(output_names), [input_kinds[i] for i in positions]
+
+
+def _compile_drop_columns(component, input_names, input_kinds):
+    columns_to_drop = set(component.parameters.get("columns") or [])
+    return _select(
+        input_names,
+        input_kinds,
+        [name for name in input_names if name not in columns_to_drop],
+    )
+
+
+def _compile_select_columns(component, input_names, input_kinds):
+    columns = component.parameters.get("columns") or []
+    return _select(
+        input_names,
+        input_kinds,
+        [name for name in dict.fromkeys(columns) if name in input_names],
+    )
+
+
+def _compile_drop_null_columns(component, input_names, input_kinds):
+    columns_to_drop = set(component._cols_to_drop)
+    return _select(
+        input_names,
+        input_kinds,
+        [name for name in input_names if name not in columns_to_drop],
+    )
+
+
+def _impute(positions, fill_values, kernel_positions):
+    """Kernel which selects columns and fills the missing values of some of them."""
+    fills = list(zip(kernel_positions, fill_values))
+
+    def kernel(columns):
+        columns = [columns[i] for i in positions]
+        for i, fill_value in fills:
+            columns[i] = _fill_missing(columns[i], fill_value)
+        return columns
+
+    return kernel
+
+
+def _compile_imputer(component, input_names, input_kinds):
+    all_null_columns = set(component._all_null_cols)
+    positions = [
+        i for i, name in enumerate(input_names) if name not in all_null_columns
+    ]
+    output_names = [input_names[i] for i in positions]
+    imputed_positions = []
+    fill_values = []
+    for columns, imputer in [
+        (component._numeric_cols, component._numeric_imputer),
+        (component._categorical_cols, component._categorical_imputer),
+    ]:
+        if columns is not None and len(columns) > 0:
+            imputed_positions.extend(output_names.index(name) for name in columns)
+            fill_values.extend(imputer._component_obj.statistics_)
+    kernel = _impute(positions, fill_values, imputed_positions)
+    return kernel, output_names, [input_kinds[i] for i in positions]
+
+
+def _compile_simple_imputer(component, input_names, input_kinds):
+    all_null_columns = set(component._all_null_cols)
+    # The imputer is fit on the columns which aren't natural language, and the natural language columns are added back
+    # after the imputed columns
+    fit_columns = [
+        name
+        for name, kind in zip(input_names, input_kinds)
+        if kind != "natural_language"
+    ]
+    natural_language_columns = [
+        name
+        for name, kind in zip(input_names, input_kinds)
+        if kind == "natural_language"
+    ]
+    imputed = []
+    if fit_columns:
+        imputed = [
+            (name, fill_value)
+            for name, fill_value in zip(
+                fit_columns, component._component_obj.statistics_
+            )
+            if name not in all_null_columns
+        ]
+    output_names = [name for name, _ in imputed] + natural_language_columns
+    positions = [input_names.index(name) for name in output_names]
+    kernel = _impute(
+        positions, [fill_value for _, fill_value in imputed], range(len(imputed))
+    )
+    return kernel, output_names, [input_kinds[i] for i in positions]
+
+
+def _compile_one_hot_encoder(component, input_names, input_kinds):
+    encoder = component._encoder
+    features_to_encode = component.features_to_encode
+    encoded_columns = set(features_to_encode)
+    passthrough = [
+        i for i, name in enumerate(input_names) if name not in encoded_columns
+    ]
+    if len(features_to_encode) == 0:
+        return _select(input_names, input_kinds, [input_names[i] for i in passthrough])
+
+    # Same order as the names of the encoded columns, before the majority value of binary columns is dropped
+    encoded_values = []
+    for column_index, categories in enumerate(encoder.categories_):
+        drop_index = (
+            None if encoder.drop_idx_ is None else encoder.drop_idx_[column_index]
+        )
+        for category_index, category in enumerate(categories):
+            if drop_index is None or category_index != drop_index:
+                encoded_values.append((column_index, category))
+    encoded_names = component._get_feature_names()
+    dropped_names = set(component._features_to_drop)
+    encoded = [
+        (column_index, category)
+        for (column_index, category), name in zip(encoded_values, encoded_names)
+        if name not in dropped_names
+    ]
+    output_names = [input_names[i] for i in passthrough] + [
+        name for name in encoded_names if name not in dropped_names
+    ]
+    output_kinds = [input_kinds[i] for i in passthrough] + ["boolean"] * len(encoded)
+    positions = [input_names.index(name) for name in features_to_encode]
+    missing_as_category = component.parameters["handle_missing"] == "as_category"
+    known_values = [set(categories) for categories in encoder.categories_]
+    error_on_unknown = component.parameters["handle_unknown"] == "error"
+
+    def kernel(columns):
+        values = []
+        for position in positions:
+            column = columns[position]
+            missing = pd.isnull(column)
+            if missing.any():
+                if not missing_as_category:
+                    raise ValueError("Input contains NaN")
+                column = column.astype(object)
+                column[missing] = "nan"
+            values.append(column)
+        if error_on_unknown:
+            for column, known in zip(values, known_values):
+                unknown = set(column) - known
+                if unknown:
+                    raise ValueError(
+                        f"Found unknown categories {sorted(unknown, key=str)} during transform"
+                    )
+        return [columns[i] for i in passthrough] + [
+            values[column_index] == category for column_index, category in encoded
+        ]
+
+    return kernel, output_names, output_kinds
+
+
+def _compile_standard_scaler(component, input_names, input_kinds):
+    scaler = component._component_obj
+    # Datetime columns are dropped before scaling
+    positions = [i for i, kind in enumerate(input_kinds) if kind != "datetime"]
+    offsets = scaler.mean_ if scaler.with_mean else np.zeros(len(positions))
+    scales = scaler.scale_ if scaler.with_std else np.ones(len(positions))
+    if len(positions) != scaler.n_features_in_:
+        raise ValueError(
+            "Can't compile the pipeline because the input of the Standard Scaler doesn't have the columns it was fit on."
+        )
+    scaled = list(zip(positions, offsets, scales))
+
+    def kernel(columns):
+        return [(_to_float(columns[i]) - offset) / scale for i, offset, scale in scaled]
+
+    return kernel, [input_names[i] for i in positions], ["numeric"] * len(positions)
+
+
+def _extract_datetime_feature(values, feature):
+    """Extracts a feature from datetimes the same way as the DateTime Featurizer, with NaN for missing datetimes."""
+    if feature == "year":
+        extracted = values.astype("datetime64[Y]").astype(np.int64) + 1970
+    elif feature == "month":
+        extracted = values.astype("datetime64[M]").astype(np.int64) % 12
+    elif feature == "day_of_week":
+        # January 1st 1970 is a Thursday, which is day 4 when Sunday is day 0
+        extracted = (values.astype("datetime64[D]").astype(np.int64) + 4) % 7
+    else:
+        extracted = values.astype("datetime64[h]").astype(np.int64) % 24
+    missing = np.isnat(values)
+    if missing.any():
+        extracted = np.where(missing, np.nan, extracted)
+    return extracted
+
+
+def _compile_datetime_featurizer(component, input_names, input_kinds):
+    features_to_extract = component.parameters["features_to_extract"]
+    if len(features_to_extract) == 0:
+        return None, input_names, input_kinds
+    categorical_features = (
+        {"month", "day_of_week"} if component.encode_as_categories else set()
+    )
+    # Each output column is either an input column, or a feature extracted from a datetime input column
+    output_names = list(input_names)
+    sources = list(range(len(input_names)))
+    output_kinds = list(input_kinds)
+    for column in component._date_time_col_names:
+        for feature in features_to_extract:
+            name = f"{column}_{feature}"
+            source = (input_names.index(column), feature)
+            kind = "category" if feature in categorical_features else "numeric"
+            if name in output_names:
+                sources[output_names.index(name)] = source
+                output_kinds[output_names.index(name)] = kind
+            else:
+                output_names.append(name)
+                sources.append(source)
+                output_kinds.append(kind)
+    datetime_columns = set(component._date_time_col_names)
+    kept = [i for i, name in enumerate(output_names) if name not in datetime_columns]
+    sources = [sources[i] for i in kept]
+    datetime_positions = sorted(
+        {source[0] for source in sources if isinstance(source, tuple)}
+    )
+
+    def kernel(columns):
+        datetimes = {i: _to_datetime64(columns[i]) for i in datetime_positions}
+        return [
+            columns[source]
+            if isinstance(source, int)
+            else _extract_datetime_feature(datetimes[source[0]], source[1])
+            for source in sources
+        ]
+
+    return (
+        kernel,
+        [output_names[i] for i in kept],
+        [output_kinds[i] for i in kept],
+    )
+
+
+_KERNEL_BUILDERS = {
+    DateTimeFeaturizer: _compile_datetime_featurizer,
+    DropColumns: _compile_drop_columns,
+    DropNullColumns: _compile_drop_null_columns,
+    Imputer: _compile_imputer,
+    OneHotEncoder: _compile_one_hot_encoder,
+    SelectColumns: _compile_select_columns,
+    SimpleImputer: _compile_simple_imputer,
+    StandardScaler: _compile_standard_scaler,
+}
@@ -0,0 +1,231 @@
+"""Cache of fitted components and their transformed outputs, shared between pipelines."""
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+
+import cloudpickle
+import joblib
+import pandas as pd
+
+from evalml.utils import _set_context_var
+
+_active_component_cache = ContextVar("active_component_cache", default=(None, None))
+
+
+class ComponentCache:
+    """Least recently used cache of fitted transformers and their transformed outputs.
+
+    Entries are content-addressed: the key of a component is built from its class, parameters and random seed, plus the keys of
+    all of its inputs. The inputs to the graph are keyed by the fold index and a fingerprint of the data being fit on. Pipelines
+    which share a preprocessing prefix therefore share cache entries, and refitting the prefix on the same fold is skipped.
+    Fitted components are stored pickled, and both their pickled size and the size of their outputs count against the budget.
+
+    The cache is only shared between jobs which run in the same process, such as the ones run by the SequentialEngine or by a threaded
+    CFEngine or DaskEngine. Pickling a cache, which happens when it is sent to another process, produces an empty cache with the same budget.
+
+    Args:
+        max_size (int): Memory budget, in bytes, for the cached components and transformed outputs. Once the budget is exceeded,
+            least recently used entries are evicted.
+        n_sample_rows (int): Maximum number of rows hashed for the fingerprint of the data. Defaults to 1000.
+
+    Examples:
+        >>> cache = ComponentCache(max_size=1024 ** 3)
+        >>> assert cache.info() == {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "size": 0, "max_size": 1024 ** 3}
+    """
+
+    def __init__(self, max_size, n_sample_rows=1000):
+        if max_size is None or max_size < 0:
+            raise ValueError(
+                f"Parameter max_size must be a non-negative integer. Received {max_size}."
+            )
+        self.max_size = max_size
+        self.n_sample_rows = n_sample_rows
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        """Approximate memory, in bytes, used by the cached components and outputs."""
+        return self._size
+
+    def __len__(self):
+        """Number of entries in the cache."""
+        return len(self._entries)
+
+    def info(self):
+        """Returns the hit, miss and eviction counters along with the current size of the cache.
+
+        Returns:
+            dict: Dictionary with keys "hits", "misses", "evictions", "entries", "size" and "max_size".
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "size": self.size,
+            "max_size": self.max_size,
+        }
+
+    def clear(self):
+        """Removes all entries from the cache. The counters are left untouched."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def data_key(self, X, y, fold=None):
+        """Computes the key of the data a component graph is fit on.
+
+        The fingerprint is made of the shape, column names, dtypes and index of the data, plus a hash of the values of
+        at most `n_sample_rows` rows sampled at even intervals.
+
+        Args:
+            X (pd.DataFrame): Features the graph is fit on.
+            y (pd.Series): Target the graph is fit on.
+            fold (int): Index of the cross-validation fold. Defaults to None.
+
+        Returns:
+            str: Key of the data.
+        """
+        step = max(1, len(X) // self.n_sample_rows)
+        index_hash = int(pd.util.hash_pandas_object(X.index).sum())
+        return joblib.hash(
+            (
+                fold,
+                X.shape,
+                list(X.columns),
+                list(map(str, X.dtypes)),
+                index_hash,
+                X.iloc[::step],
+                None if y is None else (y.name, str(y.dtype), y.iloc[::step]),
+            )
+        )
+
+    @staticmethod
+    def component_key(component, input_keys):
+        """Computes the key of a component given the keys of its inputs.
+
+        Args:
+            component (ComponentBase): Component to compute the key for.
+            input_keys (list): Keys of the inputs of the component, in order.
+
+        Returns:
+            str, None: Key of the component, or None if the component cannot be cached.
+        """
+        if any(key is None for key in input_keys):
+            return None
+        component_class = component.__class__
+        try:
+            return joblib.hash(
+                (
+                    f"{component_class.__module__}.{component_class.__qualname__}",
+                    component.parameters,
+                    component.random_seed,
+                    tuple(input_keys),
+                )
+            )
+        except Exception:
+            return None
+
+    def get(self, key):
+        """Looks up a fitted component and its output.
+
+        Args:
+            key (str): Key of the component.
+
+        Returns:
+            tuple(ComponentBase, pd.DataFrame, pd.Series), None: Copies of the fitted component and its transformed
+                features and target, or None if the key is not in the cache.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        pickled_component, output_x, output_y, _ = entry
+        return cloudpickle.loads(pickled_component), _copy(output_x), _copy(output_y)
+
+    def put(self, key, component, output_x, output_y=None):
+        """Stores a fitted component and its output, evicting least recently used entries if the memory budget is exceeded.
+
+        Components which cannot be pickled are not stored.
+
+        Args:
+            key (str): Key of the component.
+            component (ComponentBase): Fitted component.
+            output_x (pd.DataFrame): Features returned by the component.
+            output_y (pd.Series): Target returned by the component. Defaults to None.
+        """
+        try:
+            pickled_component = cloudpickle.dumps(component)
+        except Exception:
+            return
+        entry_size = (
+            len(pickled_component) + _memory_usage(output_x) + _memory_usage(output_y)
+        )
+        if entry_size > self.max_size:
+            return
+        entry = (pickled_component, _copy(output_x), _copy(output_y), entry_size)
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[3]
+            self._entries[key] = entry
+            self._size += entry_size
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted[3]
+                self.evictions += 1
+
+    def activate(self, fold=None):
+        """Makes the component graphs fit in the current thread look up and store their fitted components in this cache.
+
+        Args:
+            fold (int): Index of the cross-validation fold being fit. Defaults to None.
+
+        Returns:
+            Context manager which yields this cache.
+        """
+        return _set_context_var(_active_component_cache, (self, fold), self)
+
+    def __getstate__(self):
+        """Drops the cached entries and the lock when pickling."""
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        state["_size"] = 0
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Restores an empty cache."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def get_active_component_cache():
+    """Returns the component cache activated for the current thread, along with the fold it was activated for.
+
+    Returns:
+        tuple(ComponentCache, int): The active cache and fold, or (None, None) if no cache is active.
+    """
+    return _active_component_cache.get()
+
+
+def _copy(data):
+    if data is None:
+        return None
+    if data.ww.schema is not None:
+        return data.ww.copy()
+    return data.copy()
+
+
+def _memory_usage(data):
+    if data is None:
+        return 0
+    usage = data.memory_usage(index=True, deep=False)
+    return int(usage.sum()) if isinstance(data, pd.DataFrame) else int(usage)
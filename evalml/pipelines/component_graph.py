@@ -13,10 +13,14 @@ from evalml.exceptions.exceptions import (
     MissingComponentError,
     ParameterNotUsedWarning,
 )
+from evalml.pipelines.component_cache import get_active_component_cache
+from evalml.pipelines.component_profiler import get_active_component_profiler
 from evalml.pipelines.components import ComponentBase, Estimator, Transformer
 from evalml.pipelines.components.utils import handle_component_class
 from evalml.utils import (
+    _densify_sparse_columns,
     _schema_is_equal,
+    _trusted_woodwork_schemas,
     get_logger,
     import_or_raise,
     infer_feature_types,
@@ -294,12 +298,14 @@ class ComponentGraph:
         self, component_outputs, component, X, y=None
     ):
         x_inputs = []
+        x_parents = []
         y_input = None
         for parent_input in self.get_inputs(component):
             if parent_input == "y":
                 y_input = y
             elif parent_input == "X":
                 x_inputs.append(X)
+                x_parents.append(parent_input)
             elif parent_input.endswith(".y"):
                 y_input = component_outputs[parent_input]
             elif parent_input.endswith(".x"):
@@ -307,9 +313,33 @@ class ComponentGraph:
                 if isinstance(parent_x, pd.Series):
                     parent_x = parent_x.rename(parent_input)
                 x_inputs.append(parent_x)
+                x_parents.append(parent_input)
+        if (
+            len(x_inputs) == 1
+            and isinstance(x_inputs[0], pd.DataFrame)
+            and x_inputs[0].ww.schema is not None
+            and self._has_single_consumer(x_parents[0])
+        ):
+            # The output of a component which only feeds this component is passed on without copying it
+            return x_inputs[0], y_input
         x_inputs = ww.concat_columns(x_inputs)
         return x_inputs, y_input
 
+    def _has_single_consumer(self, parent_input):
+        """Whether the features output by a component are the input of exactly one component of the graph.
+
+        The input of the graph itself is never considered to have a single consumer, so components never receive the
+        data passed by the caller, which they may modify in place.
+        """
+        if parent_input == "X":
+            return False
+        consumers = [
+            component_name
+            for component_name in self.compute_order
+            if parent_input in self.get_inputs(component_name)
+        ]
+        return len(consumers) == 1
+
     def transform(self, X, y=None):
         """Transform the input using the component graph.
 
@@ -373,6 +403,7 @@ class ComponentGraph:
         y=None,
         fit=False,
         evaluate_training_only_components=False,
+        component_outputs=None,
     ):
         """Transforms the data by applying the given components.
 
@@ -382,6 +413,8 @@ class ComponentGraph:
             y (pd.Series): The target training data of length [n_samples].
             fit (boolean): Whether to fit the estimators as well as transform it. Defaults to False.
             evaluate_training_only_components (boolean): Whether to evaluate training-only components (such as the samplers) during transform or predict. Defaults to False.
+            component_outputs (dict): Outputs of components which were already computed on the same data and which the
+                components in component_list read instead of computing them. Defaults to None.
 
         Returns:
             dict: Outputs from each component.
@@ -401,62 +434,183 @@ class ComponentGraph:
         if len(component_list) == 0:
             return X
 
-        output_cache = {}
-        for component_name in component_list:
-            component_instance = self.get_component(component_name)
-            if not isinstance(component_instance, ComponentBase):
-                raise ValueError(
-                    "All components must be instantiated before fitting or predicting"
+        component_cache, fold = get_active_component_cache()
+        cache_keys = {}
+        if fit and component_cache is not None:
+            data_key = component_cache.data_key(X, y, fold)
+            cache_keys = {"X": data_key, "y": data_key}
+
+        component_profiler, profiler_fold = get_active_component_profiler()
+        output_cache = dict(component_outputs or {})
+        with _trusted_woodwork_schemas():
+            for component_name in component_list:
+                component_instance = self.get_component(component_name)
+                if not isinstance(component_instance, ComponentBase):
+                    raise ValueError(
+                        "All components must be instantiated before fitting or predicting"
+                    )
+                x_inputs, y_input = self._consolidate_inputs_for_component(
+                    output_cache, component_name, X, y
                 )
-            x_inputs, y_input = self._consolidate_inputs_for_component(
-                output_cache, component_name, X, y
-            )
-            self.input_feature_names.update({component_name: list(x_inputs.columns)})
-            if isinstance(component_instance, Transformer):
-                if fit:
-                    output = component_instance.fit_transform(x_inputs, y_input)
-                elif (
-                    component_instance.training_only
-                    and evaluate_training_only_components is False
-                ):
-                    output = x_inputs, y_input
-                else:
-                    output = component_instance.transform(x_inputs, y_input)
-
-                if isinstance(output, tuple):
-                    output_x, output_y = output[0], output[1]
+                if not component_instance._supports_sparse_input:
+                    x_inputs = _densify_sparse_columns(x_inputs)
+                self.input_feature_names.update(
+                    {component_name: list(x_inputs.columns)}
+                )
+                if component_profiler is not None:
+                    started = component_profiler.start()
+                if isinstance(component_instance, Transformer):
+                    method = "transform"
+                    if fit and cache_keys:
+                        method = "fit_transform"
+                        output = self._fit_transform_with_cache(
+                            component_cache,
+                            cache_keys,
+                            component_name,
+                            x_inputs,
+                            y_input,
+                        )
+                    elif fit:
+                        method = "fit_transform"
+                        output = component_instance.fit_transform(x_inputs, y_input)
+                    elif (
+                        component_instance.training_only
+                        and evaluate_training_only_components is False
+                    ):
+                        method = None
+                        output = x_inputs, y_input
+                    else:
+                        output = component_instance.transform(x_inputs, y_input)
+
+                    if isinstance(output, tuple):
+                        output_x, output_y = output[0], output[1]
+                    else:
+                        output_x = output
+                        output_y = None
+                    output_cache[f"{component_name}.x"] = output_x
+                    output_cache[f"{component_name}.y"] = output_y
+                    if component_profiler is not None and method is not None:
+                        component_profiler.record(
+                            component_name,
+                            method,
+                            profiler_fold,
+                            started,
+                            x_inputs,
+                            output_x,
+                        )
                 else:
-                    output_x = output
-                    output_y = None
-                output_cache[f"{component_name}.x"] = output_x
-                output_cache[f"{component_name}.y"] = output_y
-            else:
-                if fit:
-                    component_instance.fit(x_inputs, y_input)
-
-                if fit and component_name == self.compute_order[-1]:
-                    # Don't call predict on the final component during fit
-                    output = None
-                elif component_name != self.compute_order[-1]:
-                    try:
-                        output = component_instance.predict_proba(x_inputs)
-                        if isinstance(output, pd.DataFrame):
-                            if len(output.columns) == 2:
-                                # If it is a binary problem, drop the first column since both columns are colinear
-                                output = output.ww.drop(output.columns[0])
-                            output = output.ww.rename(
-                                {
-                                    col: f"Col {str(col)} {component_name}.x"
-                                    for col in output.columns
-                                }
+                    if fit:
+                        component_instance.fit(x_inputs, y_input)
+                        if component_profiler is not None:
+                            component_profiler.record(
+                                component_name,
+                                "fit",
+                                profiler_fold,
+                                started,
+                                x_inputs,
+                                None,
                             )
-                    except MethodPropertyNotFoundError:
+                            started = component_profiler.start()
+
+                    method = "predict"
+                    if fit and component_name == self.compute_order[-1]:
+                        # Don't call predict on the final component during fit
+                        method = None
+                        output = None
+                    elif component_name != self.compute_order[-1]:
+                        try:
+                            method = "predict_proba"
+                            output = component_instance.predict_proba(x_inputs)
+                            if isinstance(output, pd.DataFrame):
+                                if len(output.columns) == 2:
+                                    # If it is a binary problem, drop the first column since both columns are colinear
+                                    output = output.ww.drop(output.columns[0])
+                                output = output.ww.rename(
+                                    {
+                                        col: f"Col {str(col)} {component_name}.x"
+                                        for col in output.columns
+                                    }
+                                )
+                        except MethodPropertyNotFoundError:
+                            method = "predict"
+                            output = component_instance.predict(x_inputs)
+                    else:
                         output = component_instance.predict(x_inputs)
-                else:
-                    output = component_instance.predict(x_inputs)
-                output_cache[f"{component_name}.x"] = output
+                    output_cache[f"{component_name}.x"] = output
+                    if component_profiler is not None and method is not None:
+                        component_profiler.record(
+                            component_name,
+                            method,
+                            profiler_fold,
+                            started,
+                            x_inputs,
+                            output,
+                        )
         return output_cache
 
+    def _call_final_component(self, method, X):
+        """Calls a prediction method of the final component, recording the call to the active component profiler.
+
+        Args:
+            method (str): Name of the method to call, such as "predict" or "predict_proba".
+            X (pd.DataFrame): Input features of the final component.
+
+        Returns:
+            pd.Series or pd.DataFrame: Output of the method.
+        """
+        final_component = self.compute_order[-1]
+        component_profiler, profiler_fold = get_active_component_profiler()
+        if component_profiler is None:
+            with _trusted_woodwork_schemas():
+                return getattr(self.get_component(final_component), method)(X)
+        started = component_profiler.start()
+        with _trusted_woodwork_schemas():
+            output = getattr(self.get_component(final_component), method)(X)
+        component_profiler.record(
+            final_component,
+            method,
+            profiler_fold,
+            started,
+            X,
+            output,
+        )
+        return output
+
+    def _fit_transform_with_cache(
+        self, component_cache, cache_keys, component_name, x_inputs, y_input
+    ):
+        """Fits and transforms a transformer, reusing the fitted component and its output from the component cache when possible.
+
+        Args:
+            component_cache (ComponentCache): The active component cache.
+            cache_keys (dict): Cache keys of the graph inputs and of the outputs computed so far. Updated in place.
+            component_name (str): Name of the transformer to fit.
+            x_inputs (pd.DataFrame): Input features of the transformer.
+            y_input (pd.Series): Input target of the transformer.
+
+        Returns:
+            pd.DataFrame or tuple(pd.DataFrame, pd.Series): Output of the transformer.
+        """
+        component_instance = self.get_component(component_name)
+        key = component_cache.component_key(
+            component_instance,
+            [cache_keys.get(parent) for parent in self.get_inputs(component_name)],
+        )
+        cache_keys[f"{component_name}.x"] = cache_keys[f"{component_name}.y"] = key
+        if key is None:
+            return component_instance.fit_transform(x_inputs, y_input)
+        cached = component_cache.get(key)
+        if cached is not None:
+            fitted_component, output_x, output_y = cached
+            self.component_instances[component_name] = fitted_component
+            return output_x if output_y is None else (output_x, output_y)
+        output = component_instance.fit_transform(x_inputs, y_input)
+        if isinstance(output, tuple):
+            component_cache.put(key, component_instance, output[0], output[1])
+        else:
+            component_cache.put(key, component_instance, output)
+        return output
+
     def _get_feature_provenance(self, input_feature_names):
         """Get the feature provenance for each feature in the input_feature_names.
 
@@ -0,0 +1,152 @@
+"""Per-component timing and memory instrumentation for component graphs."""
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pandas as pd
+
+from evalml.utils import _set_context_var
+
+_active_component_profiler = ContextVar(
+    "active_component_profiler", default=(None, None)
+)
+_tracing_lock = threading.Lock()
+_tracing_profilers = 0
+_started_tracing = False
+
+
+class ComponentProfiler:
+    """Records the time and memory spent in each component of the component graphs evaluated while it is active.
+
+    A record is kept for every call to a component's fit, fit_transform, transform, predict or predict_proba method,
+    with the wall time of the call, the shape of its input and output and its memory delta. The memory delta is the
+    change in the memory traced by `tracemalloc` over the call, that is the number of bytes allocated by the call and
+    still held once it returns, such as its output and fitted state. Memory is traced for the whole process while a
+    profiler is active, so the delta also counts allocations made by other threads and is only approximate when
+    several pipelines are evaluated concurrently. Tracing slows allocations down, which inflates the recorded times.
+
+    Component graphs only look up the active profiler once per call to fit, transform or predict, so profiling costs
+    nothing when no profiler is active.
+
+    Examples:
+        >>> profiler = ComponentProfiler()
+        >>> assert profiler.records == []
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def start():
+        """Measures the time and traced memory at the start of a call to a component.
+
+        Returns:
+            tuple(float, int): The value of `time.perf_counter` and the number of bytes traced by `tracemalloc`.
+        """
+        return time.perf_counter(), tracemalloc.get_traced_memory()[0]
+
+    def record(self, component_name, method, fold, started, X, output):
+        """Adds a record for a call to a component.
+
+        Args:
+            component_name (str): Name of the component in its component graph.
+            method (str): Name of the method which was called.
+            fold (int): Index of the cross-validation fold the profiler was activated for.
+            started (tuple(float, int)): The measurements returned by `start` before the call.
+            X (pd.DataFrame): Input features of the component.
+            output (pd.DataFrame, pd.Series): Output of the component, or None if it has no output.
+        """
+        start_time, start_memory = started
+        record = {
+            "component": component_name,
+            "method": method,
+            "fold": fold,
+            "seconds": time.perf_counter() - start_time,
+            "input_shape": X.shape,
+            "output_shape": None if output is None else output.shape,
+            "memory_delta": tracemalloc.get_traced_memory()[0] - start_memory,
+        }
+        with self._lock:
+            self.records.append(record)
+
+    @staticmethod
+    def summarize(records):
+        """Totals the time spent in each method of each component.
+
+        Args:
+            records (list(dict)): Records of a component profiler, possibly combined from several profilers.
+
+        Returns:
+            pd.DataFrame: Total seconds, number of calls and mean memory delta for each component and method, in the
+                order the components were first called.
+        """
+        columns = ["component", "method", "seconds", "calls", "memory_delta"]
+        if not records:
+            return pd.DataFrame(columns=columns)
+        records = pd.DataFrame(records)
+        return (
+            records.groupby(["component", "method"], sort=False)
+            .agg(
+                seconds=("seconds", "sum"),
+                calls=("seconds", "size"),
+                memory_delta=("memory_delta", "mean"),
+            )
+            .reset_index()[columns]
+        )
+
+    @contextmanager
+    def activate(self, fold=None):
+        """Makes the component graphs evaluated in the current thread record their calls to this profiler, and traces memory allocations meanwhile.
+
+        Args:
+            fold (int): Index of the cross-validation fold being evaluated. Defaults to None.
+
+        Yields:
+            ComponentProfiler: This profiler.
+        """
+        with _trace_memory(), _set_context_var(
+            _active_component_profiler, (self, fold)
+        ):
+            yield self
+
+    def __getstate__(self):
+        """Drops the lock when pickling."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Restores the lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def get_active_component_profiler():
+    """Returns the component profiler activated for the current thread, along with the fold it was activated for.
+
+    Returns:
+        tuple(ComponentProfiler, int): The active profiler and fold, or (None, None) if no profiler is active.
+    """
+    return _active_component_profiler.get()
+
+
+@contextmanager
+def _trace_memory():
+    """Traces memory allocations with tracemalloc while at least one profiler is active, leaving tracing started elsewhere running."""
+    global _tracing_profilers, _started_tracing
+    with _tracing_lock:
+        if _tracing_profilers == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_profilers += 1
+    try:
+        yield
+    finally:
+        with _tracing_lock:
+            _tracing_profilers -= 1
+            if _tracing_profilers == 0 and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
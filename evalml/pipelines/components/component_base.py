@@ -25,6 +25,9 @@ class ComponentBase(ABC, metaclass=ComponentBaseMeta):
     """
 
     _default_parameters = None
+    # Whether the component accepts features with sparse columns. Component graphs convert sparse columns to dense
+    # ones before passing them to components which do not.
+    _supports_sparse_input = False
 
     def __init__(self, parameters=None, component_obj=None, random_seed=0, **kwargs):
         """Base class for all components.
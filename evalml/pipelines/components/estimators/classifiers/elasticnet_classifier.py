@@ -57,6 +57,7 @@ class ElasticNetClassifier(Estimator):
         ProblemTypes.TIME_SERIES_BINARY,
         ProblemTypes.TIME_SERIES_MULTICLASS,
     ]"""
+    _supports_sparse_input = True
 
     def __init__(
         self,
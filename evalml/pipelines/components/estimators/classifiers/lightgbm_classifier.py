@@ -13,6 +13,8 @@ from evalml.pipelines.components.transformers import LabelEncoder
 from evalml.problem_types import ProblemTypes
 from evalml.utils import (
     SEED_BOUNDS,
+    _can_convert_to_sparse_matrix,
+    _densify_sparse_columns,
     _rename_column_names_to_numeric,
     import_or_raise,
     infer_feature_types,
@@ -83,6 +85,7 @@ class LightGBMClassifier(Estimator):
     SEED_MIN = 0
     SEED_MAX = SEED_BOUNDS.max_bound
     """SEED_BOUNDS.max_bound"""
+    _supports_sparse_input = True
 
     def __init__(
         self,
@@ -147,7 +150,10 @@ class LightGBMClassifier(Estimator):
         cat_cols = list(X.ww.select("category", return_schema=True).columns)
         if fit:
             self.input_feature_names = list(X.columns)
-        X_encoded = _rename_column_names_to_numeric(X)
+        if _can_convert_to_sparse_matrix(X):
+            # Sparse features are passed to LightGBM as a matrix without column names
+            return X
+        X_encoded = _rename_column_names_to_numeric(_densify_sparse_columns(X))
         rename_cols_dict = dict(zip(X.columns, X_encoded.columns))
         cat_cols = [rename_cols_dict[col] for col in cat_cols]
 
@@ -185,7 +191,7 @@ class LightGBMClassifier(Estimator):
         X = infer_feature_types(X)
         X_encoded = self._encode_categories(X, fit=True)
         y_encoded = self._encode_labels(y)
-        self._component_obj.fit(X_encoded, y_encoded)
+        self._component_obj.fit(self._convert_sparse_input(X_encoded), y_encoded)
         return self
 
     def predict(self, X):
@@ -56,6 +56,7 @@ class LogisticRegressionClassifier(Estimator):
         ProblemTypes.TIME_SERIES_BINARY,
         ProblemTypes.TIME_SERIES_MULTICLASS,
     ]"""
+    _supports_sparse_input = True
 
     def __init__(
         self,
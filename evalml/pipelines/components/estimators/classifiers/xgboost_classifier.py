@@ -8,7 +8,12 @@ from evalml.model_family import ModelFamily
 from evalml.pipelines.components.estimators import Estimator
 from evalml.pipelines.components.transformers import LabelEncoder
 from evalml.problem_types import ProblemTypes
-from evalml.utils import _rename_column_names_to_numeric, import_or_raise
+from evalml.utils import (
+    _can_convert_to_sparse_matrix,
+    _densify_sparse_columns,
+    _rename_column_names_to_numeric,
+    import_or_raise,
+)
 
 
 class XGBoostClassifier(Estimator):
@@ -55,6 +60,7 @@ class XGBoostClassifier(Estimator):
     # is within that range.
     SEED_MIN = -(2 ** 31)
     SEED_MAX = 2 ** 31 - 1
+    _supports_sparse_input = True
 
     def __init__(
         self,
@@ -96,6 +102,15 @@ class XGBoostClassifier(Estimator):
             col: "Integer" for col in X.ww.select("boolean", return_schema=True).columns
         }
 
+    def _rename_features(self, X):
+        """Renames the features to numeric column names, which XGBoost requires."""
+        if _can_convert_to_sparse_matrix(X):
+            # Sparse features are passed to XGBoost as a matrix without column names
+            return X
+        return _rename_column_names_to_numeric(
+            _densify_sparse_columns(X), flatten_tuples=False
+        )
+
     def _label_encode(self, y):
         if not is_integer_dtype(y):
             self._label_encoder = LabelEncoder()
@@ -115,9 +130,9 @@ class XGBoostClassifier(Estimator):
         X, y = super()._manage_woodwork(X, y)
         X.ww.set_types(self._convert_bool_to_int(X))
         self.input_feature_names = list(X.columns)
-        X = _rename_column_names_to_numeric(X, flatten_tuples=False)
+        X = self._rename_features(X)
         y = self._label_encode(y)
-        self._component_obj.fit(X, y)
+        self._component_obj.fit(self._convert_sparse_input(X), y)
         return self
 
     def predict(self, X):
@@ -131,7 +146,7 @@ class XGBoostClassifier(Estimator):
         """
         X, _ = super()._manage_woodwork(X)
         X.ww.set_types(self._convert_bool_to_int(X))
-        X = _rename_column_names_to_numeric(X, flatten_tuples=False)
+        X = self._rename_features(X)
         predictions = super().predict(X)
         if not self._label_encoder:
             return predictions
@@ -151,7 +166,7 @@ class XGBoostClassifier(Estimator):
         """
         X, _ = super()._manage_woodwork(X)
         X.ww.set_types(self._convert_bool_to_int(X))
-        X = _rename_column_names_to_numeric(X, flatten_tuples=False)
+        X = self._rename_features(X)
         return super().predict_proba(X)
 
     @property
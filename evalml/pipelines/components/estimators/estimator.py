@@ -7,7 +7,12 @@ from pandas.core.indexes import range
 from evalml.exceptions import MethodPropertyNotFoundError
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components import ComponentBase
-from evalml.utils import infer_feature_types
+from evalml.utils import (
+    _can_convert_to_sparse_matrix,
+    _densify_sparse_columns,
+    _to_sparse_matrix,
+    infer_feature_types,
+)
 
 
 class Estimator(ComponentBase):
@@ -63,6 +68,12 @@ class Estimator(ComponentBase):
             y = infer_feature_types(y)
         return X, y
 
+    def _convert_sparse_input(self, X):
+        """Converts features with sparse columns to a scipy sparse matrix if the estimator accepts sparse input, or to dense columns otherwise."""
+        if self._supports_sparse_input and _can_convert_to_sparse_matrix(X):
+            return _to_sparse_matrix(X)
+        return _densify_sparse_columns(X)
+
     def fit(self, X, y=None):
         """Fits estimator to data.
 
@@ -75,7 +86,7 @@ class Estimator(ComponentBase):
         """
         X, y = self._manage_woodwork(X, y)
         self.input_feature_names = list(X.columns)
-        self._component_obj.fit(X, y)
+        self._component_obj.fit(self._convert_sparse_input(X), y)
         return self
 
     def predict(self, X):
@@ -94,7 +105,7 @@ class Estimator(ComponentBase):
             X = infer_feature_types(X)
             if isinstance(X.columns, range.RangeIndex):
                 X.columns = [x for x in X.columns]
-            predictions = self._component_obj.predict(X)
+            predictions = self._component_obj.predict(self._convert_sparse_input(X))
         except AttributeError:
             raise MethodPropertyNotFoundError(
                 "Estimator requires a predict method or a component_obj that implements predict"
@@ -117,7 +128,9 @@ class Estimator(ComponentBase):
         """
         try:
             X = infer_feature_types(X)
-            pred_proba = self._component_obj.predict_proba(X)
+            pred_proba = self._component_obj.predict_proba(
+                self._convert_sparse_input(X)
+            )
         except AttributeError:
             raise MethodPropertyNotFoundError(
                 "Estimator requires a predict_proba method or a component_obj that implements predict_proba"
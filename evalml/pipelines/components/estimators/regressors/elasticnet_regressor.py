@@ -40,6 +40,7 @@ class ElasticNetRegressor(Estimator):
         ProblemTypes.REGRESSION,
         ProblemTypes.TIME_SERIES_REGRESSION,
     ]"""
+    _supports_sparse_input = True
 
     def __init__(
         self,
@@ -10,6 +10,8 @@ from evalml.pipelines.components.estimators import Estimator
 from evalml.problem_types import ProblemTypes
 from evalml.utils import (
     SEED_BOUNDS,
+    _can_convert_to_sparse_matrix,
+    _densify_sparse_columns,
     _rename_column_names_to_numeric,
     import_or_raise,
     infer_feature_types,
@@ -73,6 +75,7 @@ class LightGBMRegressor(Estimator):
     SEED_MIN = 0
     SEED_MAX = SEED_BOUNDS.max_bound
     """SEED_BOUNDS.max_bound"""
+    _supports_sparse_input = True
 
     def __init__(
         self,
@@ -134,7 +137,10 @@ class LightGBMRegressor(Estimator):
         cat_cols = list(X.ww.select("category", return_schema=True).columns)
         if fit:
             self.input_feature_names = list(X.columns)
-        X_encoded = _rename_column_names_to_numeric(X)
+        if _can_convert_to_sparse_matrix(X):
+            # Sparse features are passed to LightGBM as a matrix without column names
+            return X
+        X_encoded = _rename_column_names_to_numeric(_densify_sparse_columns(X))
         rename_cols_dict = dict(zip(X.columns, X_encoded.columns))
         cat_cols = [rename_cols_dict[col] for col in cat_cols]
 
@@ -162,7 +168,7 @@ class LightGBMRegressor(Estimator):
         X_encoded = self._encode_categories(X, fit=True)
         if y is not None:
             y = infer_feature_types(y)
-        self._component_obj.fit(X_encoded, y)
+        self._component_obj.fit(self._convert_sparse_input(X_encoded), y)
         return self
 
     def predict(self, X):
@@ -37,6 +37,7 @@ class LinearRegressor(Estimator):
         ProblemTypes.REGRESSION,
         ProblemTypes.TIME_SERIES_REGRESSION,
     ]"""
+    _supports_sparse_input = True
 
     def __init__(
         self, fit_intercept=True, normalize=False, n_jobs=-1, random_seed=0, **kwargs
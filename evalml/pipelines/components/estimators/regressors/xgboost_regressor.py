@@ -5,6 +5,7 @@ from skopt.space import Integer, Real
 from evalml.model_family import ModelFamily
 from evalml.pipelines.components.estimators import Estimator
 from evalml.problem_types import ProblemTypes
+from evalml.utils import _can_convert_to_sparse_matrix, _densify_sparse_columns
 from evalml.utils.gen_utils import (
     _rename_column_names_to_numeric,
     import_or_raise,
@@ -51,6 +52,7 @@ class XGBoostRegressor(Estimator):
     # is within that range.
     SEED_MIN = -(2 ** 31)
     SEED_MAX = 2 ** 31 - 1
+    _supports_sparse_input = True
 
     def __init__(
         self,
@@ -86,6 +88,15 @@ class XGBoostRegressor(Estimator):
             col: "Integer" for col in X.ww.select("boolean", return_schema=True).columns
         }
 
+    def _rename_features(self, X):
+        """Renames the features to numeric column names, which XGBoost requires."""
+        if _can_convert_to_sparse_matrix(X):
+            # Sparse features are passed to XGBoost as a matrix without column names
+            return X
+        return _rename_column_names_to_numeric(
+            _densify_sparse_columns(X), flatten_tuples=False
+        )
+
     def fit(self, X, y=None):
         """Fits XGBoost regressor component to data.
 
@@ -99,8 +110,8 @@ class XGBoostRegressor(Estimator):
         X, y = super()._manage_woodwork(X, y)
         X.ww.set_types(self._convert_bool_to_int(X))
         self.input_feature_names = list(X.columns)
-        X = _rename_column_names_to_numeric(X, flatten_tuples=False)
-        self._component_obj.fit(X, y)
+        X = self._rename_features(X)
+        self._component_obj.fit(self._convert_sparse_input(X), y)
         return self
 
     def predict(self, X):
@@ -114,7 +125,7 @@ class XGBoostRegressor(Estimator):
         """
         X, _ = super()._manage_woodwork(X)
         X.ww.set_types(self._convert_bool_to_int(X))
-        X = _rename_column_names_to_numeric(X, flatten_tuples=False)
+        X = self._rename_features(X)
         return super().predict(X)
 
     @property
@@ -1,12 +1,16 @@
 """A transformer that encodes categorical features in a one-hot numeric array."""
 import numpy as np
 import pandas as pd
-import woodwork as ww
 from sklearn.preprocessing import OneHotEncoder as SKOneHotEncoder
 
 from evalml.pipelines.components import ComponentBaseMeta
 from evalml.pipelines.components.transformers.transformer import Transformer
-from evalml.utils import infer_feature_types
+from evalml.utils import (
+    SparseBoolean,
+    _concat_columns_without_copy,
+    _register_sparse_boolean,
+    infer_feature_types,
+)
 
 
 class OneHotEncoderMeta(ComponentBaseMeta):
@@ -37,6 +41,11 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
             `fit` or `transform`. If this is set to "as_category" and NaN values are within the `n` most frequent,
             "nan" values will be encoded as their own column. If this is set to "error", any missing
             values encountered will raise an error. Defaults to "error".
+        sparse_output (bool): Whether to store the encoded columns as sparse boolean columns instead of dense ones, which
+            uses far less memory when encoding columns with many categories. Sparse columns are passed as a scipy sparse
+            matrix to estimators which accept sparse input, such as the LightGBM, XGBoost and linear model estimators,
+            and are converted to dense columns before any other component. Note that XGBoost treats the zeros which are
+            not stored in a sparse matrix as missing values. Defaults to False.
         random_seed (int): Seed for the random number generator. Defaults to 0.
     """
 
@@ -52,6 +61,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
         drop="if_binary",
         handle_unknown="ignore",
         handle_missing="error",
+        sparse_output=False,
         random_seed=0,
         **kwargs,
     ):
@@ -62,6 +72,7 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
             "drop": drop,
             "handle_unknown": handle_unknown,
             "handle_missing": handle_missing,
+            "sparse_output": sparse_output,
         }
         parameters.update(kwargs)
 
@@ -185,16 +196,22 @@ class OneHotEncoder(Transformer, metaclass=OneHotEncoderMeta):
 
         # Call sklearn's transform on the categorical columns
         if len(self.features_to_encode) > 0:
-            X_cat = pd.DataFrame(
-                self._encoder.transform(X_copy[self.features_to_encode]).toarray(),
-                index=X_copy.index,
-            )
+            encoded = self._encoder.transform(X_copy[self.features_to_encode])
+            if self.parameters["sparse_output"]:
+                X_cat = pd.DataFrame.sparse.from_spmatrix(
+                    encoded, index=X_copy.index
+                ).astype(pd.SparseDtype(bool))
+                _register_sparse_boolean()
+                logical_type = SparseBoolean
+            else:
+                X_cat = pd.DataFrame(encoded.astype(bool).toarray(), index=X_copy.index)
+                logical_type = "Boolean"
             X_cat.columns = self._get_feature_names()
             X_cat.drop(columns=self._features_to_drop, inplace=True)
-            X_cat.ww.init(logical_types={c: "Boolean" for c in X_cat.columns})
+            X_cat.ww.init(logical_types={c: logical_type for c in X_cat.columns})
             self._feature_names = X_cat.columns
 
-            X = ww.utils.concat_columns([X, X_cat])
+            X = _concat_columns_without_copy([X, X_cat])
 
         return X
 
@@ -1,10 +1,9 @@
 """Component that imputes missing data according to a specified imputation strategy."""
 import pandas as pd
-import woodwork
 from sklearn.impute import SimpleImputer as SkImputer
 
 from evalml.pipelines.components.transformers import Transformer
-from evalml.utils import infer_feature_types
+from evalml.utils import _concat_columns_without_copy, infer_feature_types
 
 
 class SimpleImputer(Transformer):
@@ -114,7 +113,7 @@ class SimpleImputer(Transformer):
 
         # Add back in natural language columns, unchanged
         if len(natural_language_cols) > 0:
-            X_t = woodwork.concat_columns([X_t, X[natural_language_cols]])
+            X_t = _concat_columns_without_copy([X_t, X.ww[natural_language_cols]])
 
         if not_all_null_or_natural_language_cols:
             X_t.index = original_index
@@ -11,7 +11,10 @@ from woodwork import logical_types
 
 from evalml.pipelines.components.transformers import LabelEncoder
 from evalml.pipelines.components.transformers.transformer import Transformer
-from evalml.utils import infer_feature_types
+from evalml.utils import _concat_columns_without_copy, infer_feature_types
+
+# Logical types of the delays of columns with nullable dtypes
+_NULLABLE_LOGICAL_TYPES = {"Int64": "IntegerNullable", "boolean": "BooleanNullable"}
 
 
 class TimeSeriesFeaturizer(Transformer):
@@ -151,9 +154,11 @@ class TimeSeriesFeaturizer(Transformer):
     def _find_significant_lags(y, conf_level, max_delay):
         all_lags = np.arange(max_delay + 1)
         if y is not None:
-            # Compute the acf and find its peaks
+            # Compute the acf and find its peaks. Only lags up to max_delay are kept, and the acf and its confidence
+            # intervals at a lag do not depend on higher lags, so the acf is computed up to the first lag after
+            # max_delay, which is needed to tell whether max_delay is a peak.
             acf_values, ci_intervals = acf(
-                y, nlags=len(y) - 1, fft=True, alpha=conf_level
+                y, nlags=min(max_delay + 1, len(y) - 1), fft=True, alpha=conf_level
             )
             peaks, _ = find_peaks(acf_values)
 
@@ -173,12 +178,14 @@ class TimeSeriesFeaturizer(Transformer):
             significant_lags = all_lags
         return significant_lags
 
-    def _compute_rolling_transforms(self, X, y, original_features):
+    def _compute_rolling_transforms(self, X, y, original_features, start=0):
         """Compute the rolling features from the original features.
 
         Args:
             X (pd.DataFrame or None): Data to transform.
             y (pd.Series, or None): Target.
+            original_features (list): Names of the features to compute the rolling means of, if they are numeric.
+            start (int): Position of the first row to return the features of. Earlier rows are only read. Defaults to 0.
 
         Returns:
             pd.DataFrame: Data with rolling features. All new features.
@@ -194,15 +201,18 @@ class TimeSeriesFeaturizer(Transformer):
             X.ww.select(["numeric"], return_schema=True).columns
         ).intersection(original_features)
         data = pd.DataFrame(
-            {f"{col}_rolling_mean": rolling_mean(X.index, X[col]) for col in numerics}
+            {
+                f"{col}_rolling_mean": rolling_mean(X.index, X[col])[start:]
+                for col in numerics
+            }
         )
         if y is not None and "numeric" in y.ww.semantic_tags:
-            data[f"target_rolling_mean"] = rolling_mean(y.index, y)
-        data.index = X.index
+            data[f"target_rolling_mean"] = rolling_mean(y.index, y)[start:]
+        data.index = X.index[start:]
         data.ww.init()
         return data
 
-    def _compute_delays(self, X_ww, y):
+    def _compute_delays(self, X_ww, y, start=0):
         """Computes the delayed features for numeric/categorical features in X and y.
 
         Use the autocorrelation to determine delays.
@@ -210,6 +220,7 @@ class TimeSeriesFeaturizer(Transformer):
         Args:
             X (pd.DataFrame): Data to transform.
             y (pd.Series, or None): Target.
+            start (int): Position of the first row to return the features of. Earlier rows are only read. Defaults to 0.
 
         Returns:
             pd.DataFrame: Data with original features and delays.
@@ -220,39 +231,81 @@ class TimeSeriesFeaturizer(Transformer):
             ).columns
         )
         categorical_columns = self._get_categorical_columns(X_ww)
-        cols_derived_from_categoricals = []
-        lagged_features = {}
+        lags = [self.start_delay + t for t in self.statistically_significant_lags]
+        lagged_features = pd.DataFrame(index=X_ww.index[start:])
+        double_features = []
+        nullable_features = {}
         if self.delay_features and len(X_ww) > 0:
             X_categorical = self._encode_X_while_preserving_index(
                 X_ww[categorical_columns]
             )
+            # Columns with numpy dtypes, including the encoded categorical columns, are delayed together as one
+            # block of doubles. Columns with nullable dtypes are shifted one at a time to keep their dtype.
+            block_columns = []
+            shifted_features = {}
             for col_name in cols_to_delay:
-
                 col = X_ww[col_name]
                 if col_name in categorical_columns:
                     col = X_categorical[col_name]
-                for t in self.statistically_significant_lags:
-                    feature_name = f"{col_name}_delay_{self.start_delay + t}"
-                    lagged_features[
-                        f"{col_name}_delay_{self.start_delay + t}"
-                    ] = col.shift(self.start_delay + t)
-                    if col_name in categorical_columns:
-                        cols_derived_from_categoricals.append(feature_name)
+                if isinstance(col.dtype, np.dtype) and col.dtype.kind in "biuf":
+                    block_columns.append(col)
+                else:
+                    for lag in lags:
+                        shifted_features[f"{col_name}_delay_{lag}"] = col.shift(
+                            lag
+                        ).iloc[start:]
+                        nullable_features[
+                            f"{col_name}_delay_{lag}"
+                        ] = _NULLABLE_LOGICAL_TYPES.get(str(col.dtype))
+            double_features = [
+                f"{col.name}_delay_{lag}" for col in block_columns for lag in lags
+            ]
+            if block_columns:
+                values = np.column_stack(
+                    [col.to_numpy(dtype="float64") for col in block_columns]
+                )
+                lagged_features = pd.DataFrame(
+                    _delay_columns(values, lags, start),
+                    columns=double_features,
+                    index=X_ww.index[start:],
+                )
+            if shifted_features:
+                # Restore the order of the delayed features
+                delayed_names = [
+                    f"{col_name}_delay_{lag}"
+                    for col_name in cols_to_delay
+                    for lag in lags
+                ]
+                lagged_features = pd.concat(
+                    [lagged_features, pd.DataFrame(shifted_features)], axis=1
+                )[delayed_names]
         # Handle cases where the target was passed in
         if self.delay_target and y is not None:
             if type(y.ww.logical_type) == logical_types.Categorical:
                 y = self._encode_y_while_preserving_index(y)
-            for t in self.statistically_significant_lags:
-                lagged_features[
-                    self.target_colname_prefix.format(t + self.start_delay)
-                ] = y.shift(self.start_delay + t)
+            for lag in lags:
+                lagged_features[self.target_colname_prefix.format(lag)] = y.shift(
+                    lag
+                ).values[start:]
+                nullable_features[
+                    self.target_colname_prefix.format(lag)
+                ] = _NULLABLE_LOGICAL_TYPES.get(str(y.dtype))
         # Features created from categorical columns should no longer be categorical
-        lagged_features = pd.DataFrame(lagged_features)
-        lagged_features.ww.init(
-            logical_types={col: "Double" for col in cols_derived_from_categoricals}
+        # and the other delayed block features are known to be doubles, so they do not need type inference.
+        # The first rows of delayed nullable columns are missing, so they keep their nullable type even when
+        # the returned rows have no missing values.
+        delayed_logical_types = {col: "Double" for col in double_features}
+        delayed_logical_types.update(
+            {
+                col: logical_type
+                for col, logical_type in nullable_features.items()
+                if logical_type is not None
+            }
         )
-        lagged_features.index = X_ww.index
-        return ww.concat_columns([X_ww, lagged_features])
+        lagged_features.ww.init(logical_types=delayed_logical_types)
+        if start:
+            X_ww = X_ww.ww.iloc[start:]
+        return _concat_columns_without_copy([X_ww, lagged_features])
 
     def transform(self, X, y=None):
         """Computes the delayed values and rolling means for X and y.
@@ -278,7 +331,43 @@ class TimeSeriesFeaturizer(Transformer):
         original_features = [col for col in X_ww.columns if col != self.time_index]
         delayed_features = self._compute_delays(X_ww, y)
         rolling_means = self._compute_rolling_transforms(X_ww, y, original_features)
-        features = ww.concat_columns([delayed_features, rolling_means])
+        # Dropping the original features copies the concatenated features, so they do not share data with X
+        features = _concat_columns_without_copy([delayed_features, rolling_means])
+        return features.ww.drop(original_features)
+
+    def _transform_following(self, X_preceding, y_preceding, X, y=None):
+        """Computes the delayed values and rolling means of rows which follow the given rows, without transforming the preceding rows.
+
+        The features are the same as the last rows of transform on the preceding rows followed by X, but the preceding
+        rows are only read to take the delayed values and rolling windows of the new rows from them. This lets callers
+        which forecast a few rows at a time keep the recent rows instead of transforming them again on every call.
+
+        Args:
+            X_preceding (pd.DataFrame): Data of the rows preceding X. All the features of X are computed when there are
+                at least max_delay + forecast_horizon + gap of them.
+            y_preceding (pd.Series, or None): Target of the rows preceding X.
+            X (pd.DataFrame): Data to transform.
+            y (pd.Series, or None): Target of X.
+
+        Returns:
+            pd.DataFrame: Transformed X. No original features are returned.
+        """
+        X_ww = infer_feature_types(X)
+        X_combined = pd.concat([X_preceding, X_ww], axis=0)
+        X_combined.ww.init(logical_types=X_ww.ww.logical_types)
+        y_combined = None
+        if y is not None:
+            y = infer_feature_types(y)
+            y_combined = ww.init_series(
+                pd.concat([y_preceding, y], axis=0), logical_type=y.ww.logical_type
+            )
+        start = len(X_preceding)
+        original_features = [col for col in X_ww.columns if col != self.time_index]
+        delayed_features = self._compute_delays(X_combined, y_combined, start)
+        rolling_means = self._compute_rolling_transforms(
+            X_combined, y_combined, original_features, start
+        )
+        features = _concat_columns_without_copy([delayed_features, rolling_means])
         return features.ww.drop(original_features)
 
     def fit_transform(self, X, y=None):
@@ -292,3 +381,26 @@ class TimeSeriesFeaturizer(Transformer):
             pd.DataFrame: Transformed X.
         """
         return self.fit(X, y).transform(X, y)
+
+
+def _delay_columns(values, lags, start=0):
+    """Delays each column of a 2-D array by each of the given lags.
+
+    Args:
+        values (np.ndarray): Array of shape [n_samples, n_columns] to delay.
+        lags (list[int]): Non-negative number of rows to delay each column by.
+        start (int): Position of the first row to return the delays of. Defaults to 0.
+
+    Returns:
+        np.ndarray: Array of shape [n_samples - start, n_columns * len(lags)], with the delays of the first column first.
+            Rows before the start of the data are NaN.
+    """
+    n_samples, n_columns = values.shape
+    n_rows = n_samples - start
+    max_lag = max(lags)
+    padded = np.full((n_samples + max_lag, n_columns), np.nan)
+    padded[max_lag:] = values
+    # windows[k] is the data from row k - max_lag onwards, as a view of shape [n_columns, n_rows]
+    windows = np.lib.stride_tricks.sliding_window_view(padded, n_rows, axis=0)
+    delayed = windows[[start + max_lag - lag for lag in lags]]
+    return delayed.transpose(2, 1, 0).reshape(n_rows, n_columns * len(lags))
@@ -22,9 +22,14 @@ from .components import (
 )
 from .components.utils import all_components, handle_component_class
 
-from evalml.exceptions import ObjectiveCreationError, PipelineScoreError
+from evalml.exceptions import (
+    ObjectiveCreationError,
+    PipelineNotYetFittedError,
+    PipelineScoreError,
+)
 from evalml.objectives import get_objective
 from evalml.pipelines import ComponentGraph
+from evalml.pipelines.compiled_pipeline import CompiledPipeline
 from evalml.pipelines.pipeline_meta import PipelineBaseMeta
 from evalml.problem_types import is_binary
 from evalml.utils import (
@@ -113,6 +118,7 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
 
         self._validate_estimator_problem_type()
         self._is_fitted = False
+        self._explainers = {}
 
         self._pipeline_params = None
         if parameters is not None:
@@ -271,6 +277,7 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         return self.component_graph.transform_all_but_final(X, y=y)
 
     def _fit(self, X, y):
+        self._explainers = {}
         self.input_target_name = y.name
         self.component_graph.fit(X, y)
         self.input_feature_names = self.component_graph.input_feature_names
@@ -593,6 +600,58 @@ class PipelineBase(ABC, metaclass=PipelineBaseMeta):
         fig = go.Figure(data=data, layout=layout)
         return fig
 
+    def get_explainer(self, algorithm="shap", background=None, background_target=None):
+        """Gets the explainer of the predictions of this pipeline, building it the first time it is requested.
+
+        The explainer is stored with the pipeline, so `explain_predictions` and `explain_predictions_best_worst` reuse
+        it instead of building an explainer from the data they explain, and it is saved along with the pipeline.
+        Passing background data rebuilds the explainer, and fitting the pipeline again discards it.
+
+        Args:
+            algorithm (str): Algorithm of the explainer, one of "shap" or "lime". Defaults to "shap".
+            background (pd.DataFrame): Input features, such as the training data of the pipeline, whose features computed
+                by the pipeline are the background data of the explainer. Required to build the explainer unless the
+                algorithm is "shap" and the estimator is tree-based. Defaults to None.
+            background_target (pd.Series): Targets of the background input features. Defaults to None.
+
+        Returns:
+            PredictionExplainer: The explainer of the pipeline.
+
+        Raises:
+            PipelineNotYetFittedError: If the pipeline is not fitted.
+        """
+        from evalml.model_understanding.prediction_explanations import (
+            PredictionExplainer,
+        )
+
+        if not self._is_fitted:
+            klass = type(self).__name__
+            raise PipelineNotYetFittedError(
+                f"This {klass} is not fitted yet. You must fit {klass} before calling get_explainer."
+            )
+        if not isinstance(getattr(self, "_explainers", None), dict):
+            # Pipelines saved before explainers were stored with them don't have any
+            self._explainers = {}
+        if background is not None or algorithm not in self._explainers:
+            self._explainers[algorithm] = PredictionExplainer(
+                self, algorithm, background, background_target
+            )
+        return self._explainers[algorithm]
+
+    def compile(self):
+        """Compiles the fitted pipeline into a flat sequence of NumPy kernels, to make predictions on a few rows with little overhead.
+
+        See `CompiledPipeline` for the supported components.
+
+        Returns:
+            CompiledPipeline: The compiled pipeline, whose predict and predict_proba methods match the pipeline's.
+
+        Raises:
+            PipelineNotYetFittedError: If the pipeline is not fitted.
+            ValueError: If the pipeline is a time series pipeline or has components which can't be compiled.
+        """
+        return CompiledPipeline(self)
+
     def save(self, file_path, pickle_protocol=cloudpickle.DEFAULT_PROTOCOL):
         """Saves pipeline at file path.
 
@@ -95,3 +95,18 @@ class RegressionPipeline(PipelineBase):
         predictions = self.inverse_transform(predictions)
         predictions.name = self.input_target_name
         return infer_feature_types(predictions)
+
+    def _predict_from_features(self, features, y=None):
+        """Computes the predictions returned by predict from the output of transform_all_but_final, without transforming the data again.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from. Ignored. Only used for time series.
+
+        Returns:
+            pd.Series: Estimated values.
+        """
+        predictions = self.component_graph._call_final_component("predict", features)
+        predictions = self.inverse_transform(predictions)
+        predictions.name = self.input_target_name
+        return infer_feature_types(predictions)
@@ -34,7 +34,7 @@ class TimeSeriesClassificationPipeline(TimeSeriesPipelineBase, ClassificationPip
 
         This helper passes y as an argument if needed by the estimator.
         """
-        return self.estimator.predict_proba(features)
+        return self.component_graph._call_final_component("predict_proba", features)
 
     def predict_proba_in_sample(self, X_holdout, y_holdout, X_train, y_train):
         """Predict on future data where the target is known, e.g. cross validation.
@@ -56,8 +56,20 @@ class TimeSeriesClassificationPipeline(TimeSeriesPipelineBase, ClassificationPip
                 "Cannot call predict_proba_in_sample() on a component graph because the final component is not an Estimator."
             )
         features = self.transform_all_but_final(X_holdout, y_holdout, X_train, y_train)
+        return self._predict_proba_from_features(features, y_holdout)
+
+    def _predict_proba_from_features(self, features, y=None):
+        """Computes the probability estimates returned by predict_proba_in_sample from the output of transform_all_but_final.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from, whose index is used for the estimates.
+
+        Returns:
+            pd.DataFrame: Probability estimates.
+        """
         proba = self._estimator_predict_proba(features)
-        proba.index = y_holdout.index
+        proba.index = y.index
         proba = proba.ww.rename(
             columns={col: new_col for col, new_col in zip(proba.columns, self.classes_)}
         )
@@ -88,6 +100,20 @@ class TimeSeriesClassificationPipeline(TimeSeriesPipelineBase, ClassificationPip
                 "Cannot call predict_in_sample() on a component graph because the final component is not an Estimator."
             )
         features = self.transform_all_but_final(X, y, X_train, y_train)
+        return self._predict_from_features(features, y)
+
+    def _predict_from_features(self, features, y=None, y_pred_proba=None):
+        """Computes the labels returned by predict_in_sample from the output of transform_all_but_final, without transforming the data again.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from, whose index is used for the labels.
+            y_pred_proba (pd.DataFrame): Output of _predict_proba_from_features on the same features. Binary pipelines
+                with a threshold derive the labels from it instead of computing the probabilities again. Defaults to None.
+
+        Returns:
+            pd.Series: Estimated labels.
+        """
         predictions = self._estimator_predict(features)
         predictions.index = y.index
         predictions = self.inverse_transform(predictions.astype(int))
@@ -257,6 +283,30 @@ class TimeSeriesBinaryClassificationPipeline(
 
         return infer_feature_types(predictions)
 
+    def _predict_from_features(self, features, y=None, y_pred_proba=None):
+        """Computes the labels returned by predict_in_sample from the output of transform_all_but_final, without transforming the data again.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from, whose index is used for the labels.
+            y_pred_proba (pd.DataFrame): Output of _predict_proba_from_features on the same features. If the pipeline has a
+                threshold, the labels are derived from it instead of computing the probabilities again. Defaults to None.
+
+        Returns:
+            pd.Series: Estimated labels.
+        """
+        if self.threshold is None:
+            return super()._predict_from_features(features, y)
+        if y_pred_proba is None:
+            y_pred_proba = self._predict_proba_from_features(features, y)
+        predictions = (y_pred_proba.iloc[:, 1] > self.threshold).astype(int)
+        predictions = pd.Series(
+            predictions,
+            name=self.input_target_name,
+            index=y.index,
+        )
+        return infer_feature_types(predictions)
+
     @staticmethod
     def _score(X, y, predictions, objective):
         """Given data, model predictions or predicted probabilities computed on the data, and an objective, evaluate and return the objective score."""
@@ -0,0 +1,289 @@
+"""Stateful forecaster which serves rolling forecasts from a fitted time series pipeline."""
+import pandas as pd
+import woodwork as ww
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.objectives import get_objective
+from evalml.pipelines.components import TimeSeriesFeaturizer
+from evalml.pipelines.time_series_pipeline_base import TimeSeriesPipelineBase
+from evalml.problem_types import is_classification
+from evalml.utils import infer_feature_types
+from evalml.utils.gen_utils import are_datasets_separated_by_gap_time_index
+
+# pandas needs at least three dates to infer the frequency of the time index
+_MIN_HISTORY_SIZE = 3
+
+
+class TimeSeriesForecaster:
+    """Stateful forecaster which serves rolling forecasts from a fitted time series pipeline.
+
+    Time series pipelines compute the delayed features of new data from the most recent observations, so their
+    predict methods need the training data on every call. The forecaster keeps only the last
+    `max_delay + gap + forecast_horizon` observations, which is all the pipeline reads from the history, and appends
+    new observations to it as they arrive, so callers don't need to keep the full training data around to forecast.
+
+    Along with the observations, the forecaster keeps the input of the pipeline's Time Series Featurizer for each of
+    them, which the components before the featurizer compute once when the observations are added. Forecasts then
+    only run the pipeline's components on the new rows: the featurizer takes their delayed values and rolling means
+    from the kept inputs instead of transforming the history again. Missing values are forward filled from the previous
+    observations, as the pipeline's predict method does, except that predict leaves the oldest training rows it reads
+    unfilled. Pipelines without exactly one Time Series
+    Featurizer, such as ARIMA pipelines, forecast by calling predict with the kept observations.
+
+    Args:
+        pipeline (TimeSeriesPipelineBase): Fitted time series pipeline to forecast with.
+        X_train (pd.DataFrame): Features the pipeline was trained on, or at least the most recent rows of them.
+        y_train (pd.Series): Targets the pipeline was trained on, or at least the most recent values of them.
+
+    Raises:
+        ValueError: If the pipeline is not a time series pipeline, or if X_train and y_train have different lengths.
+        PipelineNotYetFittedError: If the pipeline is not fitted.
+    """
+
+    def __init__(self, pipeline, X_train, y_train):
+        if not isinstance(pipeline, TimeSeriesPipelineBase):
+            raise ValueError(
+                "TimeSeriesForecaster requires a time series pipeline, received "
+                f"{type(pipeline).__name__}."
+            )
+        if not pipeline._is_fitted:
+            raise PipelineNotYetFittedError(
+                "The pipeline must be fitted before creating a TimeSeriesForecaster."
+            )
+        self.pipeline = pipeline
+        self.history_size = max(
+            pipeline.max_delay + pipeline.gap + pipeline.forecast_horizon,
+            _MIN_HISTORY_SIZE,
+        )
+        X_train, y_train = pipeline._convert_to_woodwork(X_train, y_train)
+        self._check_lengths(X_train, y_train)
+        self._logical_types = X_train.ww.logical_types
+        self._target_logical_type = y_train.ww.logical_type
+        self._X_history, self._y_history = self._truncate(
+            X_train, y_train, self._logical_types, self._target_logical_type
+        )
+        self._featurizer_name = self._get_featurizer_name(pipeline)
+        if self._featurizer_name is not None:
+            component_graph = pipeline.component_graph
+            ancestors = self._get_ancestors(component_graph, self._featurizer_name)
+            self._upstream_components = [
+                name for name in component_graph.compute_order if name in ancestors
+            ]
+            self._downstream_components = [
+                name
+                for name in component_graph.compute_order[:-1]
+                if name not in ancestors and name != self._featurizer_name
+            ]
+            (X_featurizer, y_featurizer), _ = self._featurizer_inputs(
+                self._X_history, self._y_history
+            )
+            self._X_featurizer, self._y_featurizer = self._truncate(
+                X_featurizer,
+                y_featurizer,
+                X_featurizer.ww.logical_types,
+                y_featurizer.ww.logical_type,
+            )
+
+    @staticmethod
+    def _check_lengths(X, y):
+        if len(X) != len(y):
+            raise ValueError(
+                f"Features and target must have the same length, received {len(X)} and {len(y)}."
+            )
+
+    @staticmethod
+    def _get_featurizer_name(pipeline):
+        """The name of the pipeline's Time Series Featurizer, or None if the pipeline doesn't have exactly one or doesn't end with an estimator."""
+        component_graph = pipeline.component_graph
+        featurizer_names = [
+            name
+            for name in component_graph.compute_order
+            if isinstance(component_graph.get_component(name), TimeSeriesFeaturizer)
+        ]
+        if len(featurizer_names) != 1 or pipeline.estimator is None:
+            return None
+        return featurizer_names[0]
+
+    @staticmethod
+    def _get_ancestors(component_graph, component_name):
+        """The names of the components whose outputs the given component reads, directly or not."""
+        ancestors = set()
+        parents = [component_name]
+        while parents:
+            for parent_input in component_graph.get_inputs(parents.pop()):
+                parent = parent_input.rsplit(".", 1)[0]
+                if parent_input not in ("X", "y") and parent not in ancestors:
+                    ancestors.add(parent)
+                    parents.append(parent)
+        return ancestors
+
+    def _truncate(self, X, y, logical_types, target_logical_type):
+        """Keeps the last history_size rows of the features and target, forward filling their missing values."""
+        X = X.iloc[-self.history_size :].fillna(method="ffill")
+        y = y.iloc[-self.history_size :].fillna(method="ffill")
+        X.ww.init(logical_types=logical_types)
+        y = ww.init_series(y, logical_type=target_logical_type)
+        return X, y
+
+    def _featurizer_inputs(self, X, y):
+        """Runs the components before the Time Series Featurizer on the rows, and returns the featurizer's input for them along with the outputs of those components."""
+        component_graph = self.pipeline.component_graph
+        component_outputs = {}
+        if self._upstream_components:
+            component_outputs = component_graph._transform_features(
+                self._upstream_components, X, y
+            )
+        return (
+            component_graph._consolidate_inputs_for_component(
+                component_outputs, self._featurizer_name, X, y
+            ),
+            component_outputs,
+        )
+
+    @property
+    def history(self):
+        """The observations kept to compute the delayed features of the next forecast, as a tuple of features and target."""
+        return self._X_history, self._y_history
+
+    def update(self, X_new, y_new):
+        """Adds new observations to the history, dropping the oldest ones which are no longer needed.
+
+        Args:
+            X_new (pd.DataFrame): Features of the new observations, in time order.
+            y_new (pd.Series): Targets of the new observations.
+
+        Raises:
+            ValueError: If X_new and y_new have different lengths.
+        """
+        X_new = infer_feature_types(X_new)
+        y_new = infer_feature_types(y_new)
+        self._check_lengths(X_new, y_new)
+        if len(X_new) == 0:
+            return
+        self._X_history, self._y_history = self._truncate(
+            pd.concat([self._X_history, X_new], axis=0),
+            pd.concat([self._y_history, y_new], axis=0),
+            self._logical_types,
+            self._target_logical_type,
+        )
+        if self._featurizer_name is not None:
+            # Only the new observations which are kept go through the components before the featurizer
+            n_added = min(len(X_new), self.history_size)
+            (X_added, y_added), _ = self._featurizer_inputs(
+                self._X_history.ww.iloc[-n_added:], self._y_history.iloc[-n_added:]
+            )
+            self._X_featurizer, self._y_featurizer = self._truncate(
+                pd.concat([self._X_featurizer, X_added], axis=0),
+                pd.concat([self._y_featurizer, y_added], axis=0),
+                self._X_featurizer.ww.logical_types,
+                self._y_featurizer.ww.logical_type,
+            )
+
+    def _prepare_rows(self, X):
+        """Indexes the rows to forecast after the history, forward fills them and creates their placeholder target, as the pipeline's predict method does."""
+        X = infer_feature_types(X)
+        index = self.pipeline._move_index_forward(
+            self._X_history.index[-X.shape[0] :], self.pipeline.gap + X.shape[0]
+        )
+        X = pd.concat([self._X_history.iloc[-1:], X], axis=0).fillna(method="ffill")
+        X = X.iloc[1:]
+        X.index = index
+        X.ww.init(logical_types=self._logical_types)
+        y = self.pipeline._create_empty_series(self._y_history, X.shape[0])
+        y.index = X.index
+        return X, y
+
+    def _preceding_featurizer_inputs(self, X):
+        """The featurizer inputs of the rows preceding the rows to forecast, including the gap rows when X follows the history after a gap."""
+        pipeline = self.pipeline
+        n_preceding = pipeline.forecast_horizon + pipeline.max_delay + pipeline.gap
+        X_preceding = self._X_featurizer.iloc[-n_preceding:]
+        y_preceding = self._y_featurizer.iloc[-n_preceding:]
+        if pipeline.gap and are_datasets_separated_by_gap_time_index(
+            self._X_history, X, pipeline.pipeline_params
+        ):
+            # The gap rows are not observed, so they repeat the last observation
+            X_preceding = self._X_featurizer.iloc[-(n_preceding - pipeline.gap) :]
+            y_preceding = self._y_featurizer.iloc[-(n_preceding - pipeline.gap) :]
+            X_gap = self._X_featurizer.iloc[[-1] * pipeline.gap]
+            X_gap.index = pipeline._move_index_forward(
+                self._X_featurizer.index[-pipeline.gap :], pipeline.gap
+            )
+            y_gap = self._y_featurizer.iloc[[-1] * pipeline.gap]
+            y_gap.index = X_gap.index
+            X_preceding = pd.concat([X_preceding, X_gap], axis=0)
+            y_preceding = pd.concat([y_preceding, y_gap], axis=0)
+        return X_preceding, y_preceding
+
+    def _transform_all_but_final(self, X, y):
+        """Computes the features the pipeline's estimator takes for the rows to forecast, without transforming the history."""
+        component_graph = self.pipeline.component_graph
+        (X_new, y_new), component_outputs = self._featurizer_inputs(X, y)
+        X_preceding, y_preceding = self._preceding_featurizer_inputs(X)
+        featurizer = component_graph.get_component(self._featurizer_name)
+        component_outputs[
+            f"{self._featurizer_name}.x"
+        ] = featurizer._transform_following(X_preceding, y_preceding, X_new, y_new)
+        component_outputs[f"{self._featurizer_name}.y"] = None
+        if self._downstream_components:
+            component_outputs = component_graph._transform_features(
+                self._downstream_components,
+                X,
+                y,
+                component_outputs=component_outputs,
+            )
+        features, _ = component_graph._consolidate_inputs_for_component(
+            component_outputs, component_graph.compute_order[-1], X, y
+        )
+        return features
+
+    def forecast(self, X, objective=None):
+        """Forecasts the target of the rows following the observations in the history.
+
+        Args:
+            X (pd.DataFrame): Features of the rows to forecast, of at most forecast_horizon rows.
+            objective (ObjectiveBase, str, None): Objective used to threshold predicted probabilities, optional.
+
+        Returns:
+            pd.Series: Forecasted values.
+        """
+        if self._featurizer_name is None:
+            X_history, y_history = self.history
+            return self.pipeline.predict(
+                X, objective=objective, X_train=X_history, y_train=y_history
+            )
+        X, y = self._prepare_rows(X)
+        features = self._transform_all_but_final(X, y)
+        threshold = getattr(self.pipeline, "threshold", None)
+        if objective is None or threshold is None:
+            return self.pipeline._predict_from_features(features, y)
+        objective = get_objective(objective, return_instance=True)
+        proba = self.pipeline._predict_proba_from_features(features, y).iloc[:, 1]
+        predictions = objective.decision_function(proba, threshold=threshold, X=X)
+        predictions = pd.Series(
+            predictions, name=self.pipeline.input_target_name, index=y.index
+        )
+        return infer_feature_types(predictions)
+
+    def forecast_proba(self, X):
+        """Forecasts the probability of each class for the rows following the observations in the history.
+
+        Args:
+            X (pd.DataFrame): Features of the rows to forecast, of at most forecast_horizon rows.
+
+        Returns:
+            pd.DataFrame: Forecasted probabilities.
+
+        Raises:
+            ValueError: If the pipeline is not a classification pipeline.
+        """
+        if not is_classification(self.pipeline.problem_type):
+            raise ValueError(
+                "forecast_proba is only available for time series classification pipelines."
+            )
+        if self._featurizer_name is None:
+            X_history, y_history = self.history
+            return self.pipeline.predict_proba(X, X_train=X_history, y_train=y_history)
+        X, y = self._prepare_rows(X)
+        features = self._transform_all_but_final(X, y)
+        return self.pipeline._predict_proba_from_features(features, y)
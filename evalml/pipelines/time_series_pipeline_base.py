@@ -161,6 +161,18 @@ class TimeSeriesPipelineBase(PipelineBase, metaclass=PipelineBaseMeta):
             )
         target = infer_feature_types(y)
         features = self.transform_all_but_final(X, target, X_train, y_train)
+        return self._predict_from_features(features, y)
+
+    def _predict_from_features(self, features, y=None):
+        """Computes the predictions returned by predict_in_sample from the output of transform_all_but_final, without transforming the data again.
+
+        Args:
+            features (pd.DataFrame): Output of transform_all_but_final.
+            y (pd.Series): Target of the data the features were computed from, whose index is used for the predictions.
+
+        Returns:
+            pd.Series: Estimated values.
+        """
         predictions = self._estimator_predict(features)
         predictions.index = y.index
         predictions = self.inverse_transform(predictions)
@@ -209,4 +221,4 @@ class TimeSeriesPipelineBase(PipelineBase, metaclass=PipelineBaseMeta):
 
         This helper passes y as an argument if needed by the estimator.
         """
-        return self.estimator.predict(features)
+        return self.component_graph._call_final_component("predict", features)
@@ -609,6 +609,39 @@ def _make_stacked_ensemble_pipeline(
     )
 
 
+def _make_stacked_ensemble_metalearner_pipeline(ensemble_pipeline):
+    """Creates a pipeline which only contains the stacked ensemble estimator of a stacked ensemble pipeline.
+
+    The returned pipeline expects the predictions of the input pipelines of the ensemble as features, and can be
+    used to evaluate an ensemble on out-of-fold predictions without refitting its input pipelines.
+
+    Args:
+        ensemble_pipeline (PipelineBase): Pipeline created by `_make_stacked_ensemble_pipeline`.
+
+    Returns:
+        Pipeline with the same stacked ensemble estimator and name as the ensemble pipeline.
+    """
+    estimator = ensemble_pipeline.estimator
+    problem_type = ensemble_pipeline.problem_type
+    if is_classification(problem_type):
+        component_graph = {
+            "Label Encoder": ["Label Encoder", "X", "y"],
+            estimator.name: [
+                estimator.__class__,
+                "Label Encoder.x",
+                "Label Encoder.y",
+            ],
+        }
+    else:
+        component_graph = {estimator.name: [estimator.__class__, "X", "y"]}
+    return ensemble_pipeline.__class__(
+        component_graph,
+        parameters={estimator.name: estimator.parameters},
+        custom_name=ensemble_pipeline.custom_name,
+        random_seed=ensemble_pipeline.random_seed,
+    )
+
+
 def _make_pipeline_from_multiple_graphs(
     input_pipelines,
     estimator,
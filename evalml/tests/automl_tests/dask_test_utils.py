@@ -1,5 +1,7 @@
 import time
 
+from sklearn.model_selection import StratifiedKFold
+
 from evalml.automl.utils import AutoMLConfig
 from evalml.exceptions import PipelineScoreError
 from evalml.objectives.utils import get_objective
@@ -32,6 +34,9 @@ automl_data = AutoMLConfig(
     X_schema=None,
     y_schema=None,
 )
+automl_data_three_folds = automl_data._replace(
+    data_splitter=StratifiedKFold(n_splits=3, shuffle=True, random_state=0)
+)
 
 
 def delayed(delay):
@@ -149,6 +154,36 @@ class DaskPipelineFast(BinaryClassificationPipeline):
         super().fit(X, y)
 
 
+class DaskPipelineWaitsForEvent(BinaryClassificationPipeline):
+    """Pipeline for testing whose fit() only completes once the event is set.
+    This exists to control the order in which computations finish."""
+
+    component_graph = ["Baseline Classifier"]
+    custom_name = "WaitsForEventPipeline"
+
+    def __init__(self, parameters, event=None, random_seed=0):
+        super().__init__(
+            self.component_graph,
+            parameters=parameters,
+            custom_name=self.custom_name,
+            random_seed=random_seed,
+        )
+        self.event = event
+
+    def new(self, parameters, random_seed=0):
+        return self.__class__(parameters, event=self.event, random_seed=random_seed)
+
+    def clone(self):
+        return self.__class__(
+            self.parameters, event=self.event, random_seed=self.random_seed
+        )
+
+    def fit(self, X, y):
+        if not self.event.wait(timeout=60):
+            raise TimeoutError("The event was never set.")
+        return super().fit(X, y)
+
+
 class DaskSchemaCheckPipeline(BinaryClassificationPipeline):
     def __init__(
         self,
@@ -1,24 +1,36 @@
+import os
+import pickle
+import threading
+import time
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import Manager
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 import woodwork as ww
 
+from evalml.automl import AutoMLSearch
 from evalml.automl.engine.cf_engine import CFClient, CFComputation, CFEngine
 from evalml.automl.engine.engine_base import (
+    FoldEvaluationComputation,
     JobLogger,
     evaluate_pipeline,
     train_pipeline,
 )
 from evalml.automl.engine.sequential_engine import SequentialEngine
+from evalml.automl.engine.shared_data import SharedData
 from evalml.automl.utils import AutoMLConfig
 from evalml.pipelines import BinaryClassificationPipeline
 from evalml.pipelines.pipeline_base import PipelineBase
 from evalml.tests.automl_tests.dask_test_utils import (
+    DaskPipelineFast,
     DaskPipelineSlow,
+    DaskPipelineWaitsForEvent,
     DaskSchemaCheckPipeline,
     automl_data,
+    automl_data_three_folds,
 )
 
 
@@ -187,6 +199,55 @@ def test_submit_evaluate_job_single(
         )
 
 
+@pytest.mark.parametrize("pool_type", ["threads", "processes"])
+def test_submit_evaluate_job_parallel_folds(
+    X_y_binary_cls, pool_type, thread_pool, process_pool
+):
+    """Test that evaluating each fold of a pipeline as a separate job produces the
+    same results as simply running the evaluate_pipeline function."""
+    X, y = X_y_binary_cls
+    X.ww.init()
+    y = ww.init_series(y)
+    pool = get_pool(pool_type, thread_pool, process_pool)
+
+    with CFClient(pool) as client:
+        pipeline = BinaryClassificationPipeline(
+            component_graph=["Logistic Regression Classifier"],
+            parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+        )
+        engine = CFEngine(client=client, parallel_folds=True)
+
+        pipeline_future = engine.submit_evaluation_job(
+            X=X, y=y, automl_config=automl_data_three_folds, pipeline=pipeline
+        )
+        assert isinstance(pipeline_future, FoldEvaluationComputation)
+        assert len(pipeline_future.fold_computations) == 3
+        assert all(
+            isinstance(computation, CFComputation)
+            for computation in pipeline_future.fold_computations
+        )
+        par_eval_results = pipeline_future.get_result()
+        assert pipeline_future.done()
+
+        original_eval_results = evaluate_pipeline(
+            pipeline,
+            automl_config=automl_data_three_folds,
+            X=X,
+            y=y,
+            logger=JobLogger(),
+        )
+        par_scores = par_eval_results.get("scores")
+        original_eval_scores = original_eval_results.get("scores")
+        assert par_scores["cv_data"] == original_eval_scores["cv_data"]
+        assert all(par_scores["cv_scores"] == original_eval_scores["cv_scores"])
+        assert par_scores["cv_score_mean"] == original_eval_scores["cv_score_mean"]
+        assert par_eval_results.get("pipeline") == original_eval_results.get("pipeline")
+        assert (
+            par_eval_results.get("logger").logs
+            == original_eval_results.get("logger").logs
+        )
+
+
 @pytest.mark.parametrize("pool_type", ["threads", "processes"])
 def test_submit_evaluate_jobs_multiple(
     X_y_binary_cls, pool_type, thread_pool, process_pool
@@ -361,6 +422,124 @@ def test_cancel_job(X_y_binary_cls, pool_type, thread_pool, process_pool):
         assert pipeline_future.is_cancelled
 
 
+@pytest.mark.parametrize("pool_type", ["threads", "processes"])
+def test_as_completed(X_y_binary_cls, pool_type):
+    """Test that computations are yielded in the order they finish rather than the order they were submitted."""
+    X, y = X_y_binary_cls
+    pool_class = ThreadPoolExecutor if pool_type == "threads" else ProcessPoolExecutor
+
+    with Manager() as manager, pool_class(max_workers=2) as pool:
+        event = manager.Event()
+        engine = CFEngine(client=CFClient(pool))
+        slow_future = engine.submit_training_job(
+            X=X,
+            y=y,
+            automl_config=automl_data,
+            pipeline=DaskPipelineWaitsForEvent({}, event=event),
+        )
+        fast_future = engine.submit_training_job(
+            X=X, y=y, automl_config=automl_data, pipeline=DaskPipelineFast({})
+        )
+        completed = engine.as_completed([slow_future, fast_future])
+        assert next(completed) is fast_future
+        event.set()
+        assert next(completed) is slow_future
+        assert slow_future.done()
+
+
+def test_as_completed_timeout(X_y_binary_cls, thread_pool):
+    X, y = X_y_binary_cls
+    event = threading.Event()
+    with CFClient(thread_pool) as client:
+        engine = CFEngine(client=client)
+        computation = engine.submit_training_job(
+            X=X,
+            y=y,
+            automl_config=automl_data,
+            pipeline=DaskPipelineWaitsForEvent({}, event=event),
+        )
+        completed = engine.as_completed([computation], timeout=0.01)
+        assert next(completed) is None
+        assert next(completed) is None
+        event.set()
+        assert next(c for c in completed if c is not None) is computation
+
+
+def test_automl_search_stops_at_max_time_while_waiting(X_y_binary_cls, thread_pool):
+    """Test that AutoMLSearch stops once max_time is reached, even if no computation finishes."""
+    X, y = X_y_binary_cls
+    event = threading.Event()
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        engine=CFEngine(CFClient(thread_pool)),
+        max_time=1,
+    )
+
+    def submit_waiting_job(pipeline):
+        return CFComputation(thread_pool.submit(event.wait, 60))
+
+    try:
+        with patch.object(
+            automl, "_submit_evaluation_job", side_effect=submit_waiting_job
+        ):
+            start = time.time()
+            automl.search()
+            assert time.time() - start < 10
+    finally:
+        event.set()
+
+
+def test_successive_halving_stops_at_max_time_while_waiting(
+    X_y_binary_cls, thread_pool
+):
+    """Test that successive halving cancels the evaluations on subsamples left once max_time is reached."""
+    X, y = X_y_binary_cls
+    event = threading.Event()
+    engine = CFEngine(CFClient(thread_pool))
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        engine=engine,
+        allowed_component_graphs={
+            "Logistic Regression": ["Imputer", "Logistic Regression Classifier"],
+            "Decision Tree": ["Imputer", "Decision Tree Classifier"],
+            "Random Forest": ["Imputer", "Random Forest Classifier"],
+            "Elastic Net": ["Imputer", "Elastic Net Classifier"],
+        },
+        automl_algorithm="iterative",
+        optimize_thresholds=False,
+        successive_halving=True,
+        min_fidelity=0.3,
+        max_time=1,
+    )
+    submit_evaluation_job = engine.submit_evaluation_job
+    subsample_computations = []
+
+    def submit_waiting_subsample_job(automl_config, pipeline, X, y):
+        if len(X) == len(automl.X_train):
+            return submit_evaluation_job(automl_config, pipeline, X, y)
+        computation = CFComputation(thread_pool.submit(event.wait, 60))
+        subsample_computations.append(computation)
+        return computation
+
+    try:
+        with patch.object(
+            engine, "submit_evaluation_job", side_effect=submit_waiting_subsample_job
+        ), patch.object(CFComputation, "cancel", autospec=True) as mock_cancel:
+            start = time.time()
+            automl.search()
+            assert time.time() - start < 10
+    finally:
+        event.set()
+    assert len(subsample_computations) == 4
+    assert [call[0][0] for call in mock_cancel.call_args_list] == subsample_computations
+    assert automl.results["low_fidelity_results"] == []
+    assert len(automl.results["pipeline_results"]) == 1
+
+
 @pytest.mark.parametrize("pool_type", ["threads", "processes"])
 def test_cfengine_sends_woodwork_schema(
     X_y_binary_cls, pool_type, thread_pool, process_pool
@@ -444,3 +623,116 @@ def test_automl_closes_engines(pool_class, X_y_binary_cls):
     cf_engine = CFEngine(CFClient(pool_instance))
     cf_engine.close()
     assert cf_engine.is_closed
+
+
+def is_memory_mapped(array):
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array is not None
+
+
+@pytest.mark.parametrize("index", ["range", "int", "datetime", "str"])
+def test_shared_data_round_trip(index, tmp_path):
+    n_rows = 6
+    X = pd.DataFrame(
+        {
+            "double": np.arange(n_rows, dtype="float64") / 2,
+            "integer": np.arange(n_rows),
+            "boolean": [True, False] * 3,
+            "datetime": pd.date_range("2021-01-01", periods=n_rows),
+            "categorical": pd.Series(["a", "b", "c"] * 2, dtype="category"),
+            "natural_language": [f"some text {i}" for i in range(n_rows)],
+            "nullable_integer": pd.Series([1, None, 3, 4, 5, 6], dtype="Int64"),
+        }
+    )
+    X.index = {
+        "range": pd.RangeIndex(10, 10 + 2 * n_rows, 2),
+        "int": pd.Index([5, 3, 1, 0, 2, 4]),
+        "datetime": pd.date_range("2020-01-01", periods=n_rows, name="time"),
+        "str": pd.Index(list("abcdef")),
+    }[index]
+    X.ww.init(logical_types={"natural_language": "NaturalLanguage"})
+    y = pd.Series(["yes", "no"] * 3, index=X.index, dtype="category", name="target")
+    y.ww.init()
+
+    shared_X = SharedData.write(X, str(tmp_path))
+    shared_y = SharedData.write(y, str(tmp_path))
+    shared_X, shared_y = pickle.loads(pickle.dumps((shared_X, shared_y)))
+    X_loaded = shared_X.load()
+    y_loaded = shared_y.load()
+
+    pd.testing.assert_frame_equal(X_loaded, X)
+    pd.testing.assert_series_equal(y_loaded, y)
+    assert X_loaded.ww.schema == X.ww.schema
+    assert y_loaded.ww.schema == y.ww.schema
+
+    # Numeric columns are views of the mapped file, and writes are not shared
+    for column in ["double", "integer", "boolean", "datetime"]:
+        assert is_memory_mapped(X_loaded[column].to_numpy())
+    assert is_memory_mapped(X_loaded["categorical"].cat.codes.to_numpy())
+    assert is_memory_mapped(y_loaded.cat.codes.to_numpy())
+    X_loaded["double"].to_numpy()[0] = 100
+    pd.testing.assert_frame_equal(shared_X.load(), X)
+
+    shared_X.delete()
+    assert not os.path.exists(shared_X.path)
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_shared_data_keeps_memory_layout(order, tmp_path):
+    values = np.asarray(np.random.RandomState(0).rand(10, 3), order=order)
+    X = pd.DataFrame(values, columns=["a", "b", "c"])
+    X.ww.init()
+
+    X_loaded = SharedData.write(X, str(tmp_path)).load()
+    pd.testing.assert_frame_equal(X_loaded, X)
+    assert is_memory_mapped(X_loaded.to_numpy())
+    for flag in ["C_CONTIGUOUS", "F_CONTIGUOUS"]:
+        assert X_loaded.to_numpy().flags[flag] == X.to_numpy().flags[flag]
+
+    X_empty = pd.DataFrame(index=pd.RangeIndex(5))
+    pd.testing.assert_frame_equal(
+        SharedData.write(X_empty, str(tmp_path)).load(), X_empty
+    )
+
+
+def test_cfengine_shares_data_with_process_pool(X_y_binary_cls, process_pool):
+    X, y = X_y_binary_cls
+    engine = CFEngine(CFClient(process_pool))
+    shared_X, shared_y = engine.send_data_to_pool(X, y)
+    assert isinstance(shared_X, SharedData)
+    assert isinstance(shared_y, SharedData)
+    assert engine.send_data_to_pool(X, y) == (shared_X, shared_y)
+    assert engine.send_data_to_pool(X.copy(), y)[0] is not shared_X
+    assert engine.send_data_to_pool(None, None) == (None, None)
+    shared_data_dir = engine._shared_data_dir
+    assert len(os.listdir(shared_data_dir)) == 4
+
+    pipeline = BinaryClassificationPipeline(
+        component_graph=["Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+    fitted_pipeline = engine.submit_training_job(
+        X=X, y=y, automl_config=automl_data, pipeline=pipeline
+    ).get_result()
+    pipeline.fit(X, y)
+    np.testing.assert_allclose(
+        fitted_pipeline.predict_proba(X), pipeline.predict_proba(X)
+    )
+    assert len(os.listdir(shared_data_dir)) == 4
+
+    engine._remove_shared_data_dir()
+    assert not os.path.exists(shared_data_dir)
+
+
+@pytest.mark.parametrize("pool_type", ["threads", "processes"])
+def test_cfengine_does_not_share_data(
+    pool_type, X_y_binary_cls, thread_pool, process_pool
+):
+    X, y = X_y_binary_cls
+    pool = get_pool(pool_type, thread_pool, process_pool)
+    engine = CFEngine(CFClient(pool), share_data=pool_type == "threads")
+    X_sent, y_sent = engine.send_data_to_pool(X, y)
+    assert X_sent is X
+    assert y_sent is y
+    assert engine._shared_data_dir is None
@@ -1,3 +1,6 @@
+from multiprocessing import Manager
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -6,6 +9,7 @@ from dask.distributed import Client, LocalCluster
 
 from evalml.automl.engine.dask_engine import DaskComputation, DaskEngine
 from evalml.automl.engine.engine_base import (
+    FoldEvaluationComputation,
     JobLogger,
     evaluate_pipeline,
     train_pipeline,
@@ -15,9 +19,12 @@ from evalml.automl.utils import AutoMLConfig
 from evalml.pipelines import BinaryClassificationPipeline
 from evalml.pipelines.pipeline_base import PipelineBase
 from evalml.tests.automl_tests.dask_test_utils import (
+    DaskPipelineFast,
     DaskPipelineSlow,
+    DaskPipelineWaitsForEvent,
     DaskSchemaCheckPipeline,
     automl_data,
+    automl_data_three_folds,
 )
 
 
@@ -139,6 +146,45 @@ def test_submit_evaluate_job_single(X_y_binary_cls):
         )
 
 
+def test_submit_evaluate_job_parallel_folds(X_y_binary_cls):
+    """Test that evaluating each fold of a pipeline as a separate job produces the
+    same results as simply running the evaluate_pipeline function."""
+    X, y = X_y_binary_cls
+    X.ww.init()
+    y = ww.init_series(y)
+
+    pipeline = BinaryClassificationPipeline(
+        component_graph=["Logistic Regression Classifier"],
+        parameters={"Logistic Regression Classifier": {"n_jobs": 1}},
+    )
+
+    with DaskEngine(parallel_folds=True) as engine:
+        pipeline_future = engine.submit_evaluation_job(
+            X=X, y=y, automl_config=automl_data_three_folds, pipeline=pipeline
+        )
+        assert isinstance(pipeline_future, FoldEvaluationComputation)
+        assert len(pipeline_future.fold_computations) == 3
+        par_eval_results = pipeline_future.get_result()
+
+        original_eval_results = evaluate_pipeline(
+            pipeline,
+            automl_config=automl_data_three_folds,
+            X=X,
+            y=y,
+            logger=JobLogger(),
+        )
+        par_scores = par_eval_results.get("scores")
+        original_eval_scores = original_eval_results.get("scores")
+        assert par_scores["cv_data"] == original_eval_scores["cv_data"]
+        assert all(par_scores["cv_scores"] == original_eval_scores["cv_scores"])
+        assert par_scores["cv_score_mean"] == original_eval_scores["cv_score_mean"]
+        assert par_eval_results.get("pipeline") == original_eval_results.get("pipeline")
+        assert (
+            par_eval_results.get("logger").logs
+            == original_eval_results.get("logger").logs
+        )
+
+
 def test_submit_evaluate_jobs_multiple(X_y_binary_cls):
     """Test that evaluating multiple pipelines using the parallel engine produces the
     same results as the sequential engine."""
@@ -365,3 +411,49 @@ def test_automl_closes_engines(process, X_y_binary_cls):
     dask_engine = DaskEngine(LocalCluster(process))
     dask_engine.close()
     assert dask_engine.is_closed
+
+
+def test_as_completed(X_y_binary_cls):
+    """Test that computations are yielded in the order they finish rather than the order they were submitted."""
+    X, y = X_y_binary_cls
+    cluster = LocalCluster(processes=False, n_workers=1, threads_per_worker=2)
+    with Manager() as manager, DaskEngine(cluster=cluster) as engine:
+        event = manager.Event()
+        slow_future = engine.submit_training_job(
+            X=X,
+            y=y,
+            automl_config=automl_data,
+            pipeline=DaskPipelineWaitsForEvent({}, event=event),
+        )
+        fast_future = engine.submit_training_job(
+            X=X, y=y, automl_config=automl_data, pipeline=DaskPipelineFast({})
+        )
+        completed = engine.as_completed([slow_future, fast_future])
+        assert next(completed) is fast_future
+        event.set()
+        assert next(completed) is slow_future
+
+        event.clear()
+        computation = engine.submit_training_job(
+            X=X,
+            y=y,
+            automl_config=automl_data,
+            pipeline=DaskPipelineWaitsForEvent({}, event=event),
+        )
+        completed = engine.as_completed([computation], timeout=0.01)
+        assert next(completed) is None
+        event.set()
+        assert next(c for c in completed if c is not None) is computation
+
+
+def test_dask_sends_data_once(X_y_binary_cls):
+    X, y = X_y_binary_cls
+    with DaskEngine() as engine:
+        with patch.object(
+            engine.client, "scatter", wraps=engine.client.scatter
+        ) as mock_scatter:
+            X_future, y_future = engine.send_data_to_cluster(X, y)
+            assert engine.send_data_to_cluster(X, y) == (X_future, y_future)
+            assert mock_scatter.call_count == 1
+            engine.send_data_to_cluster(X.copy(), y)
+            assert mock_scatter.call_count == 2
@@ -112,8 +112,13 @@ def test_search_results(X_y_regression, X_y_binary, X_y_multi, automl_type, obje
         n_jobs=1,
     )
     automl.search()
-    assert automl.results.keys() == {"pipeline_results", "search_order"}
+    assert automl.results.keys() == {
+        "pipeline_results",
+        "search_order",
+        "low_fidelity_results",
+    }
     assert automl.results["search_order"] == [0, 1]
+    assert automl.results["low_fidelity_results"] == []
     assert len(automl.results["pipeline_results"]) == 2
     for pipeline_id, results in automl.results["pipeline_results"].items():
         assert results.keys() == {
@@ -130,8 +135,10 @@ def test_search_results(X_y_regression, X_y_binary, X_y_multi, automl_type, obje
             "percent_better_than_baseline_all_objectives",
             "percent_better_than_baseline",
             "validation_score",
+            "fidelity",
         }
         assert results["id"] == pipeline_id
+        assert results["fidelity"] == 1.0
         assert isinstance(results["pipeline_name"], str)
         assert issubclass(results["pipeline_class"], expected_pipeline_class)
         assert isinstance(results["pipeline_summary"], str)
@@ -4485,3 +4492,225 @@ def test_cv_validation_scores_time_series(
     assert len(validation_vals) == 1
     assert validation_vals[0] == 0.5
     assert cv_vals[0] == validation_vals[0]
+
+
+def test_automl_component_cache(X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type="binary")
+    assert automl.component_cache_info is None
+    assert automl.automl_config.component_cache is None
+
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        allowed_component_graphs={
+            "Logistic Regression": [
+                "Imputer",
+                "Standard Scaler",
+                "Logistic Regression Classifier",
+            ],
+            "Decision Tree": [
+                "Imputer",
+                "Standard Scaler",
+                "Decision Tree Classifier",
+            ],
+        },
+        automl_algorithm="iterative",
+        max_iterations=3,
+        optimize_thresholds=False,
+        component_cache_size=10 ** 8,
+        n_jobs=1,
+    )
+    assert automl.automl_config.component_cache is automl._component_cache
+    automl.search()
+    n_splits = automl.data_splitter.get_n_splits()
+    cache_info = automl.component_cache_info
+    # The baseline label encoder and the first pipeline's imputer and scaler are fit on every fold,
+    # then the second pipeline reuses the imputer and scaler
+    assert cache_info["misses"] == 3 * n_splits
+    assert cache_info["hits"] == 2 * n_splits
+    assert cache_info["entries"] == 3 * n_splits
+    assert 0 < cache_info["size"] <= 10 ** 8
+
+
+def test_automl_profile_components(X_y_binary, caplog):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        allowed_component_graphs={
+            "Logistic Regression": [
+                "Imputer",
+                "Standard Scaler",
+                "Logistic Regression Classifier",
+            ],
+        },
+        automl_algorithm="iterative",
+        max_iterations=2,
+        optimize_thresholds=False,
+        profile_components=True,
+        n_jobs=1,
+    )
+    assert automl.automl_config.profile_components
+    automl.search()
+    pipeline_results = automl.results["pipeline_results"][1]
+    for fold, cv_data in enumerate(pipeline_results["cv_data"]):
+        profile = cv_data["component_profile"]
+        assert {record["fold"] for record in profile} == {fold}
+        assert [(r["component"], r["method"]) for r in profile[:3]] == [
+            ("Imputer", "fit_transform"),
+            ("Standard Scaler", "fit_transform"),
+            ("Logistic Regression Classifier", "fit"),
+        ]
+
+    caplog.clear()
+    automl.describe_pipeline(1)
+    assert "Component Profile" in caplog.text
+    assert "Standard Scaler" in caplog.text
+
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type="binary", max_iterations=1)
+    automl.search()
+    assert all(
+        "component_profile" not in cv_data
+        for cv_data in automl.results["pipeline_results"][0]["cv_data"]
+    )
+
+
+def test_automl_successive_halving(X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        allowed_component_graphs={
+            "Logistic Regression": ["Imputer", "Logistic Regression Classifier"],
+            "Decision Tree": ["Imputer", "Decision Tree Classifier"],
+            "Random Forest": ["Imputer", "Random Forest Classifier"],
+            "Elastic Net": ["Imputer", "Elastic Net Classifier"],
+        },
+        automl_algorithm="iterative",
+        max_batches=1,
+        optimize_thresholds=False,
+        successive_halving=True,
+        min_fidelity=0.3,
+        n_jobs=1,
+    )
+    assert automl._fidelities == [1 / 3, 1.0]
+    with patch.object(
+        automl.automl_algorithm,
+        "add_pruned_result",
+        wraps=automl.automl_algorithm.add_pruned_result,
+    ) as mock_add_pruned_result:
+        automl.search()
+
+    # The order of the first batch is up to the automl algorithm
+    low_fidelity_results = automl.results["low_fidelity_results"]
+    assert {result["pipeline_name"] for result in low_fidelity_results} == {
+        "Logistic Regression",
+        "Decision Tree",
+        "Random Forest",
+        "Elastic Net",
+    }
+    assert all(result["fidelity"] == 1 / 3 for result in low_fidelity_results)
+    promoted = [
+        result["pipeline_name"] for result in low_fidelity_results if result["promoted"]
+    ]
+    assert len(promoted) == 2
+    assert mock_add_pruned_result.call_count == 2
+
+    score_to_minimize = [
+        automl._score_to_minimize(result["validation_score"])
+        for result in low_fidelity_results
+    ]
+    best_two = np.argsort(score_to_minimize, kind="stable")[:2]
+    assert set(promoted) == {low_fidelity_results[i]["pipeline_name"] for i in best_two}
+    pipeline_results = automl.results["pipeline_results"]
+    assert len(pipeline_results) == 3
+    assert {pipeline_results[i]["pipeline_name"] for i in [1, 2]} == set(promoted)
+    assert all(result["fidelity"] == 1.0 for result in pipeline_results.values())
+    assert set(automl.rankings["pipeline_name"]) == set(promoted) | {
+        "Mode Baseline Binary Classification Pipeline"
+    }
+
+
+def test_automl_successive_halving_small_batches(X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        allowed_component_graphs={
+            "Logistic Regression": ["Imputer", "Logistic Regression Classifier"],
+            "Decision Tree": ["Imputer", "Decision Tree Classifier"],
+        },
+        automl_algorithm="iterative",
+        max_batches=1,
+        optimize_thresholds=False,
+        successive_halving=True,
+        min_fidelity=0.3,
+        n_jobs=1,
+    )
+    automl.search()
+    assert automl.results["low_fidelity_results"] == []
+    assert len(automl.results["pipeline_results"]) == 3
+
+
+def test_automl_successive_halving_errors(X_y_binary, ts_data_binary):
+    X, y = X_y_binary
+    with pytest.raises(ValueError, match="halving_factor must be an integer"):
+        AutoMLSearch(
+            X_train=X,
+            y_train=y,
+            problem_type="binary",
+            successive_halving=True,
+            halving_factor=1,
+        )
+    with pytest.raises(ValueError, match="min_fidelity must be greater than 0"):
+        AutoMLSearch(
+            X_train=X,
+            y_train=y,
+            problem_type="binary",
+            successive_halving=True,
+            min_fidelity=0,
+        )
+    X, y = ts_data_binary
+    with pytest.raises(ValueError, match="not supported for time series"):
+        AutoMLSearch(
+            X_train=X,
+            y_train=y,
+            problem_type="time series binary",
+            problem_configuration={
+                "time_index": "date",
+                "gap": 0,
+                "max_delay": 0,
+                "forecast_horizon": 1,
+            },
+            successive_halving=True,
+        )
+
+
+@pytest.mark.parametrize(
+    "automl_algorithm,max_batches,expect_recorded",
+    [("default", 1, False), ("default", 2, True), ("iterative", 2, False)],
+)
+def test_automl_records_oof_predictions_only_when_ensembling_can_run(
+    automl_algorithm, max_batches, expect_recorded, X_y_binary, AutoMLTestEnv
+):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        max_batches=max_batches,
+        ensembling=True,
+        optimize_thresholds=False,
+        automl_algorithm=automl_algorithm,
+    )
+    env = AutoMLTestEnv("binary")
+    with env.test_context(score_return_value={automl.objective.name: 1}):
+        automl.search()
+    env.mock_score.assert_called()
+    # Out-of-fold predictions are the only predictions made when scoring is mocked
+    assert env.mock_predict_proba.called == expect_recorded
@@ -19,11 +19,14 @@ from evalml.pipelines import (
     BinaryClassificationPipeline,
     ComponentGraph,
     Estimator,
+    StackedEnsembleClassifier,
+    StackedEnsembleRegressor,
 )
 from evalml.pipelines.components.utils import (
     allowed_model_families,
     get_estimators,
 )
+from evalml.pipelines.utils import _make_stacked_ensemble_metalearner_pipeline
 from evalml.problem_types import ProblemTypes
 from evalml.tuners import SKOptTuner
 
@@ -1134,3 +1137,70 @@ def test_get_ensembler_input_pipelines(X_y_binary, AutoMLTestEnv):
     error_text = "Pipeline ID 500 is not a valid ensemble pipeline"
     with pytest.raises(ValueError, match=error_text):
         automl.get_ensembler_input_pipelines(500)
+
+
+@pytest.mark.parametrize("problem_type", ["binary", "regression"])
+def test_ensemble_evaluated_on_oof_predictions(
+    problem_type, X_y_binary, X_y_regression
+):
+    if problem_type == "binary":
+        X, y = X_y_binary
+        allowed_component_graphs = {
+            "Logistic Regression": ["Imputer", "Logistic Regression Classifier"],
+            "Decision Tree": ["Imputer", "Decision Tree Classifier"],
+        }
+        metalearner_class = StackedEnsembleClassifier
+    else:
+        X, y = X_y_regression
+        allowed_component_graphs = {
+            "Linear Regression": ["Imputer", "Linear Regressor"],
+            "Decision Tree": ["Imputer", "Decision Tree Regressor"],
+        }
+        metalearner_class = StackedEnsembleRegressor
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type=problem_type,
+        allowed_component_graphs=allowed_component_graphs,
+        max_batches=4,
+        ensembling=True,
+        optimize_thresholds=False,
+        automl_algorithm="iterative",
+        _pipelines_per_batch=1,
+        n_jobs=1,
+    )
+    assert automl.automl_config.record_oof_predictions
+
+    with patch(
+        "evalml.automl.automl_search._make_stacked_ensemble_metalearner_pipeline",
+        wraps=_make_stacked_ensemble_metalearner_pipeline,
+    ) as mock_make_metalearner, patch.object(
+        metalearner_class,
+        "fit",
+        autospec=True,
+        side_effect=metalearner_class.fit,
+    ) as mock_metalearner_fit:
+        automl.search()
+
+    ensemble_ids = automl.rankings[
+        automl.rankings["pipeline_name"].str.contains("Ensemble")
+    ]["id"]
+    assert len(ensemble_ids) == 1
+    ensemble_id = ensemble_ids.iloc[0]
+    input_pipeline_ids = automl.results["pipeline_results"][ensemble_id][
+        "input_pipeline_ids"
+    ]
+    assert len(input_pipeline_ids) == 2
+    assert set(automl._oof_predictions) == set(input_pipeline_ids)
+
+    # Only the metalearner is fit, once per fold, on one prediction column per input pipeline
+    assert mock_make_metalearner.call_count == 1
+    assert mock_metalearner_fit.call_count == automl.data_splitter.get_n_splits()
+    for call in mock_metalearner_fit.call_args_list:
+        metalearner_X = call[0][1]
+        assert len(metalearner_X.columns) == 2
+        assert all(col.startswith("Col ") for col in metalearner_X.columns)
+
+    ensemble_pipeline = automl.get_pipeline(ensemble_id)
+    assert ensemble_pipeline.model_family == ModelFamily.ENSEMBLE
+    assert len(ensemble_pipeline.component_graph.compute_order) > 2
@@ -1,5 +1,6 @@
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from sklearn.model_selection import KFold, StratifiedKFold
@@ -10,6 +11,8 @@ from evalml.automl.utils import (
     get_best_sampler_for_data,
     get_default_primary_search_objective,
     get_pipelines_from_component_graphs,
+    get_subsample_row_order,
+    get_successive_halving_fidelities,
     make_data_splitter,
     tune_binary_threshold,
 )
@@ -365,3 +368,38 @@ def test_get_pipelines_from_component_graphs(problem_type, estimator):
             assert all(
                 isinstance(pipe_, RegressionPipeline) for pipe_ in returned_pipelines
             )
+
+
+@pytest.mark.parametrize(
+    "n_rows,min_fidelity,halving_factor,expected",
+    [
+        (1000, 0.1, 3, [1 / 9, 1 / 3, 1.0]),
+        (1000, 0.1, 2, [1 / 8, 1 / 4, 1 / 2, 1.0]),
+        (1000, 0.5, 3, [1.0]),
+        (100, 0.1, 3, [1 / 3, 1.0]),
+        (50, 0.1, 3, [1.0]),
+    ],
+)
+def test_get_successive_halving_fidelities(
+    n_rows, min_fidelity, halving_factor, expected
+):
+    fidelities = get_successive_halving_fidelities(n_rows, min_fidelity, halving_factor)
+    np.testing.assert_allclose(fidelities, expected)
+
+
+def test_get_subsample_row_order():
+    y = pd.Series(np.arange(100) * 3.5)
+    order = get_subsample_row_order(y, ProblemTypes.REGRESSION, 3, random_seed=0)
+    assert sorted(order) == list(range(100))
+    np.testing.assert_array_equal(
+        order, get_subsample_row_order(y, ProblemTypes.REGRESSION, 3, random_seed=0)
+    )
+
+    y = pd.Series(["a"] * 90 + ["b"] * 8 + ["c"] * 2)
+    order = get_subsample_row_order(y, ProblemTypes.MULTICLASS, 3, random_seed=0)
+    assert sorted(order) == list(range(100))
+    assert y.iloc[order[:8]].value_counts().to_dict() == {"a": 3, "b": 3, "c": 2}
+    counts = y.iloc[order[:50]].value_counts()
+    assert counts["a"] == pytest.approx(45, abs=3)
+    assert counts["b"] == pytest.approx(4, abs=1)
+    assert counts["c"] == 2
@@ -6,9 +6,14 @@ import pandas as pd
 
 from evalml.automl.automl_search import AutoMLSearch
 from evalml.automl.engine import evaluate_pipeline, train_pipeline
-from evalml.automl.engine.engine_base import JobLogger
+from evalml.automl.engine.engine_base import DataCache, JobLogger
+from evalml.automl.engine.sequential_engine import (
+    SequentialComputation,
+    SequentialEngine,
+)
 from evalml.automl.utils import AutoMLConfig
 from evalml.objectives import F1, LogLossBinary
+from evalml.pipelines import BinaryClassificationPipeline
 from evalml.preprocessing import split_data
 
 
@@ -162,3 +167,173 @@ def test_job_logger_warning_and_error_messages(caplog):
 
     assert "This is a warning!" in caplog.text
     assert "This is an error!" in caplog.text
+
+
+def test_train_and_score_pipeline_records_oof_predictions(X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        optimize_thresholds=False,
+    )
+    pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    automl_config = automl.automl_config._replace(record_oof_predictions=True)
+    scores = evaluate_pipeline(
+        pipeline, automl_config, automl.X_train, automl.y_train, logger=MagicMock()
+    ).get("scores")
+    oof_predictions = scores["oof_predictions"]
+    assert oof_predictions.shape == (len(automl.X_train), 1)
+    assert not oof_predictions.isna().any().any()
+    assert ((oof_predictions >= 0) & (oof_predictions <= 1)).all().all()
+
+    automl_config = automl.automl_config._replace(record_oof_predictions=False)
+    scores = evaluate_pipeline(
+        pipeline, automl_config, automl.X_train, automl.y_train, logger=MagicMock()
+    ).get("scores")
+    assert "oof_predictions" not in scores
+
+
+def test_train_and_score_pipeline_oof_predictions_not_recorded_on_error(
+    AutoMLTestEnv, dummy_binary_pipeline, X_y_binary
+):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        optimize_thresholds=False,
+    )
+    automl_config = automl.automl_config._replace(record_oof_predictions=True)
+    env = AutoMLTestEnv("binary")
+    with env.test_context(score_return_value={automl.objective.name: 0.42}):
+        scores = evaluate_pipeline(
+            dummy_binary_pipeline,
+            automl_config,
+            automl.X_train,
+            automl.y_train,
+            logger=MagicMock(),
+        ).get("scores")
+    assert scores["oof_predictions"] is None
+    assert scores["cv_score_mean"] == 0.42
+
+
+def test_train_and_score_pipeline_keeps_pipeline_of_last_trained_fold(X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        optimize_thresholds=False,
+    )
+    pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    trained_pipelines = []
+
+    def train_all_but_last_fold(pipeline, X, y, automl_config, schema=True):
+        if len(trained_pipelines) == 2:
+            raise ValueError("Training failed")
+        trained_pipelines.append(train_pipeline(pipeline, X, y, automl_config, schema))
+        return trained_pipelines[-1]
+
+    with patch(
+        "evalml.automl.engine.engine_base.train_pipeline",
+        side_effect=train_all_but_last_fold,
+    ):
+        evaluation = evaluate_pipeline(
+            pipeline,
+            automl.automl_config,
+            automl.X_train,
+            automl.y_train,
+            logger=MagicMock(),
+        )
+    assert evaluation["pipeline"] is trained_pipelines[-1]
+    assert evaluation["pipeline"]._is_fitted
+    assert np.isnan(evaluation["scores"]["cv_data"][2]["mean_cv_score"])
+
+
+def test_fold_evaluation_computation_get_result_twice(X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        optimize_thresholds=False,
+    )
+    pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    engine = SequentialEngine()
+    computation = engine._submit_fold_evaluation_jobs(
+        lambda func, **kwargs: SequentialComputation(work=func, **kwargs),
+        automl.automl_config,
+        pipeline,
+        automl.X_train,
+        automl.y_train,
+    )
+    result = computation.get_result()
+    assert computation.get_result() is result
+    assert len(result["scores"]["cv_data"]) == 3
+    assert result["pipeline"]._is_fitted
+
+
+def test_sequential_engine_as_completed(dummy_binary_pipeline, X_y_binary):
+    X, y = X_y_binary
+    automl = AutoMLSearch(X_train=X, y_train=y, problem_type="binary")
+    engine = SequentialEngine()
+    computations = [
+        engine.submit_training_job(
+            automl.automl_config, dummy_binary_pipeline, automl.X_train, automl.y_train
+        )
+        for _ in range(3)
+    ]
+    with patch(
+        "evalml.automl.engine.sequential_engine.SequentialComputation.done",
+        return_value=True,
+    ) as mock_done:
+        assert list(engine.as_completed(computations)) == computations
+    assert mock_done.call_count == 3
+
+
+def test_data_cache(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+    cache = DataCache()
+    assert cache.get(X, y) is None
+    cache.set(X, y, "data")
+    assert cache.get(X, y) == "data"
+    assert cache.get(X.copy(), y) is None
+    assert cache.get(X, None) is None
+
+    cache.set(X, None, "data without target")
+    assert cache.get(X, None) == "data without target"
+    assert cache.get(X, y) == "data"
+
+    cache.clear()
+    assert cache.get(X, y) is None
+
+
+def test_data_cache_detects_changes(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+    cache = DataCache(n_sample_rows=len(X))
+    cache.set(X, y, "data")
+    X.iloc[1, 0] = X.iloc[1, 0] + 1
+    assert cache.get(X, y) is None
+
+    cache.set(X, y, "data")
+    X["new column"] = 1
+    assert cache.get(X, y) is None
+
+    cache.set(X, y, "data")
+    y.name = "target"
+    assert cache.get(X, y) is None
+
+
+def test_data_cache_fingerprint_samples_rows():
+    X = pd.DataFrame({"a": range(100)})
+    cache = DataCache(n_sample_rows=10)
+    with patch("evalml.automl.engine.engine_base.joblib.hash") as mock_hash:
+        mock_hash.return_value = "hash"
+        assert cache.fingerprint(X) == ((100, 1), ("a",), ("int64",), "hash")
+    pd.testing.assert_frame_equal(mock_hash.call_args[0][0], X.iloc[::10])
+    assert cache.fingerprint(None) is None
@@ -209,6 +209,7 @@ def test_describe_component():
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
     }
     assert imputer.describe(return_dict=True) == {
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 import pytest
+import woodwork as ww
 from pandas.testing import assert_frame_equal
 from woodwork.exceptions import TypeConversionError
 from woodwork.logical_types import (
@@ -14,7 +15,7 @@ from woodwork.logical_types import (
 
 from evalml.exceptions import ComponentNotYetFittedError
 from evalml.pipelines.components import OneHotEncoder
-from evalml.utils import get_random_seed, infer_feature_types
+from evalml.utils import SparseBoolean, get_random_seed, infer_feature_types
 
 
 def set_first_three_columns_to_categorical(X):
@@ -36,6 +37,7 @@ def test_init():
         "drop": "if_binary",
         "handle_unknown": "ignore",
         "handle_missing": "error",
+        "sparse_output": False,
     }
     encoder = OneHotEncoder()
     assert encoder.parameters == parameters
@@ -50,6 +52,7 @@ def test_parameters():
         "drop": "if_binary",
         "handle_unknown": "ignore",
         "handle_missing": "error",
+        "sparse_output": False,
     }
     assert encoder.parameters == expected_parameters
 
@@ -818,3 +821,49 @@ def test_ohe_output_bools():
         else:
             assert str(types) == "Boolean"
     assert len(output.columns) == 5
+
+
+def test_ohe_sparse_output():
+    X = pd.DataFrame(
+        {
+            "col_1": [f"category_{i}" for i in range(50)] * 2,
+            "col_2": ["x", "y"] * 50,
+            "numeric": range(100),
+        }
+    )
+    X.ww.init(logical_types={"col_1": "categorical", "col_2": "categorical"})
+    dense = OneHotEncoder(top_n=None).fit_transform(X)
+    encoder = OneHotEncoder(top_n=None, sparse_output=True)
+    sparse = encoder.fit_transform(X)
+
+    assert list(sparse.columns) == list(dense.columns)
+    encoded_columns = [col for col in sparse.columns if col != "numeric"]
+    assert all(isinstance(sparse[col].dtype, pd.SparseDtype) for col in encoded_columns)
+    assert {
+        col: str(logical_type) for col, logical_type in sparse.ww.logical_types.items()
+    } == {
+        "numeric": "Integer",
+        **{col: "SparseBoolean" for col in encoded_columns},
+    }
+    assert_frame_equal(
+        sparse[encoded_columns].sparse.to_dense(), dense[encoded_columns]
+    )
+    assert (
+        sparse[encoded_columns].memory_usage().sum()
+        < dense[encoded_columns].memory_usage().sum()
+    )
+    # The schema of the sparse output is valid, so it can be passed to other components
+    assert_frame_equal(infer_feature_types(sparse), sparse)
+
+
+def test_ohe_sparse_output_registers_logical_type():
+    if SparseBoolean in ww.type_system.registered_types:
+        ww.type_system.remove_type(SparseBoolean)
+    X = pd.DataFrame({"col": ["a", "b", "c"] * 5})
+    X.ww.init(logical_types={"col": "categorical"})
+    OneHotEncoder().fit_transform(X)
+    assert SparseBoolean not in ww.type_system.registered_types
+
+    X_t = OneHotEncoder(sparse_output=True).fit_transform(X)
+    assert SparseBoolean in ww.type_system.registered_types
+    assert all(isinstance(lt, SparseBoolean) for lt in X_t.ww.logical_types.values())
@@ -4,7 +4,9 @@ import numpy as np
 import pandas as pd
 import pytest
 import woodwork as ww
-from pandas.testing import assert_frame_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
+from scipy.signal import find_peaks
+from statsmodels.tsa.stattools import acf
 from woodwork.logical_types import (
     Boolean,
     Categorical,
@@ -14,6 +16,9 @@ from woodwork.logical_types import (
 )
 
 from evalml.pipelines import TimeSeriesFeaturizer
+from evalml.pipelines.components.transformers.preprocessing.time_series_featurizer import (
+    _delay_columns,
+)
 
 ROLLING_TRANSFORM_METHOD_NAME = "_compute_rolling_transforms"
 DELAYED_FEATURES_METHOD_NAME = "_compute_delays"
@@ -859,3 +864,115 @@ def test_delay_feature_transformer_woodwork_custom_overrides_returned_by_compone
                 "target_delay_1": Double,
                 "target_delay_2": Double,
             }
+
+
+@pytest.mark.parametrize("max_delay", [1, 5, 30, 200])
+def test_find_significant_lags_bounded_acf(max_delay):
+    random_state = np.random.RandomState(0)
+    y = pd.Series(
+        np.sin(np.arange(500) * 2 * np.pi / 12) + random_state.normal(size=500)
+    )
+    with patch(
+        "evalml.pipelines.components.transformers.preprocessing.time_series_featurizer.acf",
+        wraps=acf,
+    ) as mock_acf:
+        significant_lags = TimeSeriesFeaturizer._find_significant_lags(
+            y, conf_level=0.05, max_delay=max_delay
+        )
+    assert mock_acf.call_args[1]["nlags"] == min(max_delay + 1, len(y) - 1)
+
+    # The lags match the ones found from the acf of every lag
+    acf_values, ci_intervals = acf(y, nlags=len(y) - 1, fft=True, alpha=0.05)
+    peaks, _ = find_peaks(acf_values)
+    index = np.arange(len(acf_values))
+    significant = np.logical_or(ci_intervals[:, 0] > 0, ci_intervals[:, 1] < 0)
+    expected = set(index[significant]).intersection(peaks)
+    expected = expected.union(index[:10][significant[:10]])
+    expected = sorted(expected.intersection(np.arange(max_delay + 1))) or [1]
+    assert significant_lags == expected
+
+
+def test_delay_columns():
+    values = np.arange(12, dtype="float64").reshape(6, 2)
+    lags = [0, 2, 7]
+    delayed = _delay_columns(values, lags)
+    expected = pd.DataFrame(
+        {
+            f"{col}_{lag}": pd.Series(values[:, col]).shift(lag)
+            for col in range(2)
+            for lag in lags
+        }
+    )
+    np.testing.assert_array_equal(delayed, expected.to_numpy())
+    np.testing.assert_array_equal(
+        _delay_columns(values, lags, start=4), expected.to_numpy()[4:]
+    )
+
+
+@patch(
+    f"evalml.pipelines.TimeSeriesFeaturizer.{ROLLING_TRANSFORM_METHOD_NAME}",
+    return_value=pd.DataFrame(),
+)
+def test_delay_feature_transformer_nullable_and_block_columns(mock_roll):
+    X = pd.DataFrame(
+        {
+            "date": pd.date_range("2021-01-01", periods=20),
+            "double": np.arange(20) / 2,
+            "int_nullable": pd.Series(list(range(19)) + [None], dtype="Int64"),
+            "category": pd.Series(["a", "b"] * 10, dtype="category"),
+        }
+    )
+    y = pd.Series(range(20))
+    output = TimeSeriesFeaturizer(
+        max_delay=1, conf_level=1.0, time_index="date", delay_target=False
+    ).fit_transform(X, y)
+    assert list(output.columns) == [
+        "date",
+        "double_delay_1",
+        "double_delay_2",
+        "int_nullable_delay_1",
+        "int_nullable_delay_2",
+        "category_delay_1",
+        "category_delay_2",
+    ]
+    assert_series_equal(
+        output["double_delay_2"], X["double"].shift(2), check_names=False
+    )
+    assert_series_equal(
+        output["int_nullable_delay_1"], X["int_nullable"].shift(1), check_names=False
+    )
+    assert str(output.ww.logical_types["int_nullable_delay_1"]) == "IntegerNullable"
+    assert str(output.ww.logical_types["category_delay_1"]) == "Double"
+    assert output["category_delay_1"].tolist()[1:] == [0.0, 1.0] * 9 + [0.0]
+
+
+@pytest.mark.parametrize("n_preceding", [1, 8, 15])
+def test_time_series_featurizer_transform_following_matches_transform(n_preceding):
+    X = pd.DataFrame(
+        {
+            "date": pd.date_range("2021-01-01", periods=18),
+            "double": np.arange(18) / 2,
+            "int_nullable": pd.Series(list(range(17)) + [None], dtype="Int64"),
+            "category": pd.Series(["a", "b", "c"] * 6, dtype="category"),
+        }
+    )
+    X.ww.init()
+    y = pd.Series(np.arange(18) % 5, dtype="float64")
+    featurizer = TimeSeriesFeaturizer(
+        max_delay=3,
+        forecast_horizon=2,
+        gap=1,
+        conf_level=1.0,
+        rolling_window_size=1.0,
+        time_index="date",
+    ).fit(X, y)
+    expected = featurizer.transform(X, y)
+    expected = expected.ww.iloc[n_preceding:]
+    output = featurizer._transform_following(
+        X.ww.iloc[:n_preceding],
+        y.iloc[:n_preceding],
+        X.ww.iloc[n_preceding:],
+        y.iloc[n_preceding:],
+    )
+    assert_frame_equal(output, expected)
+    assert output.ww.logical_types == expected.ww.logical_types
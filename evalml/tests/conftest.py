@@ -514,6 +514,19 @@ def X_y_categorical_classification():
     return X, y
 
 
+@pytest.fixture
+def X_y_categorical_with_nulls():
+    X = pd.DataFrame(
+        {
+            "num": [1.0, np.nan, 3.0, 4.0, 5.0, 6.0] * 5,
+            "cat": ["a", "b", "a", "c", "b", np.nan] * 5,
+        }
+    )
+    y = pd.Series([0, 1] * 15)
+    X.ww.init(logical_types={"cat": "categorical"})
+    return X, ww.init_series(y)
+
+
 @pytest.fixture
 def X_y_based_on_pipeline_or_problem_type(X_y_binary, X_y_multi, X_y_regression):
     def _X_y_based_on_pipeline_or_problem_type(pipeline_or_type):
@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.data_checks import (
+    ChunkedColumnProfile,
+    ClassImbalanceDataCheck,
+    ColumnProfile,
+    DataChecks,
+    IDColumnsDataCheck,
+    NoVarianceDataCheck,
+    NullDataCheck,
+    OutliersDataCheck,
+    TargetLeakageDataCheck,
+)
+from evalml.data_checks.chunked_column_profile import (
+    _DistinctCountSketch,
+    _TDigest,
+)
+from evalml.utils import infer_feature_types
+
+
+@pytest.fixture
+def chunked_data():
+    random_state = np.random.RandomState(0)
+    n_rows = 1000
+    X = pd.DataFrame(
+        {
+            "id": np.arange(n_rows),
+            "normal": random_state.normal(size=n_rows),
+            "with_nulls": np.where(np.arange(n_rows) % 4 == 0, np.nan, 1.0),
+            "category": random_state.choice(["a", "b", "c"], n_rows),
+            "constant": ["x"] * n_rows,
+        }
+    )
+    X.loc[::50, "normal"] = 100.0
+    y = pd.Series(np.where(np.arange(n_rows) % 10 == 0, 1, 0), name="target")
+    return X, y
+
+
+def split(data, n_chunks):
+    bounds = np.linspace(0, len(data), n_chunks + 1).astype(int)
+    return [data.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def test_chunked_column_profile_statistics(chunked_data):
+    X, y = chunked_data
+    profile = ChunkedColumnProfile.from_chunks(
+        zip(split(X, 4), split(y, 4)), max_exact_distinct=100, n_jobs=1
+    )
+    exact = ColumnProfile(infer_feature_types(X), infer_feature_types(y))
+
+    assert profile.n_rows == len(X)
+    assert list(profile.X.columns) == list(X.columns)
+    assert len(profile.X) == 0
+    assert profile.X.ww.logical_types == infer_feature_types(X).ww.logical_types
+    pd.testing.assert_series_equal(
+        profile.null_counts, exact.null_counts, check_names=False
+    )
+    # Columns with more than max_exact_distinct values have estimated distinct counts
+    relative_errors = profile.n_unique_relative_errors
+    assert relative_errors.to_dict() == {
+        "id": pytest.approx(1.04 / 128),
+        "normal": pytest.approx(1.04 / 128),
+        "with_nulls": 0,
+        "category": 0,
+        "constant": 0,
+    }
+    assert (exact.n_unique_relative_errors == 0).all()
+    assert (
+        (profile.n_unique - exact.n_unique).abs()
+        <= 3 * relative_errors * exact.n_unique
+    ).all()
+    assert profile.n_unique["normal"] < profile.n_rows
+    assert profile.n_unique["category"] == 3
+    pd.testing.assert_series_equal(
+        profile.target_value_counts, exact.target_value_counts
+    )
+    assert profile.target_null_count == 0
+    assert profile.quantiles("normal", 0.5) == pytest.approx(
+        X["normal"].median(), abs=0.05
+    )
+    box_plot_data = profile.boxplot_data(["normal"])["normal"]
+    assert box_plot_data["pct_outliers"] == pytest.approx(0.02, abs=0.01)
+    assert box_plot_data["values"]["low_indices"] == []
+    with pytest.raises(ValueError, match="The mode statistic can't be computed"):
+        profile.column_statistics("mode", lambda col: col.mode())
+
+
+def test_chunked_column_profile_target_column(chunked_data):
+    X, y = chunked_data
+    data = pd.concat([X, y], axis=1)
+    profile = ChunkedColumnProfile.from_chunks(split(data, 3), target="target")
+
+    assert list(profile.X.columns) == list(X.columns)
+    assert profile.y.name == "target"
+    assert profile.target_value_counts.to_dict() == {0: 900, 1: 100}
+
+
+def test_chunked_column_profile_merge(chunked_data):
+    X, y = chunked_data
+    chunks = list(zip(split(X, 4), split(y, 4)))
+    profile = ChunkedColumnProfile.from_chunks(chunks, n_jobs=1)
+    merged = ChunkedColumnProfile(n_jobs=1)
+    merged.merge(ChunkedColumnProfile.from_chunks(chunks[:2], n_jobs=1))
+    merged.merge(ChunkedColumnProfile.from_chunks(chunks[2:], n_jobs=1))
+
+    assert merged.n_rows == profile.n_rows
+    pd.testing.assert_series_equal(merged.null_counts, profile.null_counts)
+    pd.testing.assert_series_equal(merged.n_unique, profile.n_unique)
+    pd.testing.assert_series_equal(
+        merged.target_value_counts, profile.target_value_counts
+    )
+
+
+def test_distinct_count_sketch():
+    sketch = _DistinctCountSketch(precision=12, max_exact=100)
+    sketch.update(pd.Series(["a", "b", "a"]))
+    assert sketch.estimate(3) == 2
+
+    values = pd.Series(np.arange(50_000)).astype(str)
+    sketch.update(values)
+    assert sketch.exact_hashes is None
+    assert sketch.estimate(60_000) == pytest.approx(50_002, rel=0.05)
+    # The estimate isn't rounded to the number of values when it's close to it
+    assert sketch.estimate(50_002) == min(sketch.estimate(60_000), 50_002)
+    assert sketch.estimate(40_000) == 40_000
+
+    other = _DistinctCountSketch(precision=12, max_exact=100)
+    other.update(pd.Series(np.arange(50_000, 100_000)).astype(str))
+    sketch.merge(other)
+    assert sketch.estimate(200_000) == pytest.approx(100_002, rel=0.05)
+
+
+def test_t_digest():
+    random_state = np.random.RandomState(0)
+    values = random_state.exponential(size=100_000)
+    digest = _TDigest(compression=200)
+    for chunk in np.array_split(values, 10):
+        digest.update(chunk)
+
+    assert digest.count == len(values)
+    assert len(digest.means) <= 200
+    assert digest.min == values.min()
+    assert digest.max == values.max()
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        assert digest.quantile(q) == pytest.approx(
+            np.quantile(values, q), rel=0.02, abs=0.01
+        )
+        assert digest.cdf(np.quantile(values, q)) == pytest.approx(q, abs=0.005)
+
+
+def test_validate_chunks_matches_validate(chunked_data):
+    X, y = chunked_data
+    data_checks = DataChecks(
+        [
+            NullDataCheck,
+            IDColumnsDataCheck,
+            NoVarianceDataCheck,
+            ClassImbalanceDataCheck,
+        ],
+        {"ClassImbalanceDataCheck": {"threshold": 0.2}},
+    )
+    messages = data_checks.validate_chunks(zip(split(X, 5), split(y, 5)))
+    assert messages == data_checks.validate(X, y)
+    assert {message["data_check_name"] for message in messages} == {
+        "NullDataCheck",
+        "IDColumnsDataCheck",
+        "NoVarianceDataCheck",
+        "ClassImbalanceDataCheck",
+    }
+
+
+def test_validate_chunks_outliers(chunked_data):
+    X, y = chunked_data
+    messages = DataChecks([OutliersDataCheck]).validate_chunks(
+        zip(split(X, 5), split(y, 5))
+    )
+    expected = OutliersDataCheck().validate(X, y)
+    assert [message["details"]["columns"] for message in messages] == [
+        message["details"]["columns"] for message in expected
+    ]
+    for message, expected_message in zip(messages, expected):
+        assert message["message"] == (
+            f"{expected_message['message']} The share of outliers is estimated, so the rows with outliers are unknown."
+        )
+        assert message["details"]["rows"] is None
+        assert "column_indices" not in message["details"]
+        assert message["action_options"] == []
+        assert set(message["details"]["pct_outliers"]) == set(
+            message["details"]["columns"]
+        )
+        assert all(pct > 0 for pct in message["details"]["pct_outliers"].values())
+
+
+def test_validate_chunks_skips_unsupported_data_checks(chunked_data):
+    X, y = chunked_data
+    data_checks = DataChecks([NullDataCheck, TargetLeakageDataCheck])
+    with pytest.warns(UserWarning, match="were skipped: TargetLeakageDataCheck"):
+        messages = data_checks.validate_chunks(zip(split(X, 2), split(y, 2)))
+    assert all(message["data_check_name"] == "NullDataCheck" for message in messages)
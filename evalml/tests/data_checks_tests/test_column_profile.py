@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.data_checks import (
+    ColumnProfile,
+    DataChecks,
+    IDColumnsDataCheck,
+    NoVarianceDataCheck,
+    NullDataCheck,
+    OutliersDataCheck,
+    UniquenessDataCheck,
+)
+from evalml.utils import infer_feature_types
+
+
+@pytest.fixture
+def profile_data():
+    X = pd.DataFrame(
+        {
+            "ints": [0, 1, 2, 3, 4],
+            "floats": [0.5, np.nan, 0.5, np.nan, 1.5],
+            "categories": pd.Series(
+                ["a", "a", None, "b", "a"], dtype="category"
+            ).cat.add_categories(["unused"]),
+            "constant": [1, 1, 1, 1, 1],
+        }
+    )
+    X.ww.init(logical_types={"categories": "Categorical"})
+    y = infer_feature_types(pd.Series([0, 1, 1, 0, 1]))
+    return X, y
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_column_profile_value_count_statistics(n_jobs, profile_data):
+    X, y = profile_data
+    profile = ColumnProfile(X, y, n_jobs=n_jobs)
+
+    pd.testing.assert_series_equal(
+        profile.null_counts, X.isnull().sum(), check_names=False
+    )
+    pd.testing.assert_series_equal(
+        profile.null_fractions, X.isnull().mean(), check_names=False
+    )
+    pd.testing.assert_series_equal(profile.n_unique, X.nunique(), check_names=False)
+    pd.testing.assert_series_equal(
+        profile.n_unique_with_nulls, X.nunique(dropna=False), check_names=False
+    )
+    pd.testing.assert_series_equal(
+        profile.uniqueness_scores,
+        X.apply(UniquenessDataCheck.uniqueness_score),
+        check_names=False,
+    )
+    pd.testing.assert_series_equal(profile.target_value_counts, y.value_counts())
+
+
+def test_column_profile_computes_statistics_once(profile_data):
+    X, _ = profile_data
+    profile = ColumnProfile(X, n_jobs=1)
+    computed = []
+
+    def length(col):
+        computed.append(col.name)
+        return len(col)
+
+    assert profile.column_statistics("length", length, columns=["ints"]) == {"ints": 5}
+    assert profile.column_statistics("length", length) == {col: 5 for col in X.columns}
+    assert profile.column_statistics("length", length) == {col: 5 for col in X.columns}
+    assert computed == list(X.columns)
+
+
+def test_column_profile_for_data(profile_data):
+    X, y = profile_data
+    profile = ColumnProfile(X, y)
+    assert ColumnProfile.for_data(X, y) is not profile
+
+    with profile.activate():
+        assert ColumnProfile.for_data(X, y) is profile
+        assert ColumnProfile.for_data(X) is profile
+        assert ColumnProfile.for_data(X.ww.copy(), y) is not profile
+        assert ColumnProfile.for_data(X, y.copy()) is not profile
+    assert ColumnProfile.for_data(X, y) is not profile
+
+
+@patch("evalml.data_checks.column_profile._value_count_statistics")
+def test_data_checks_share_column_profile(mock_statistics, profile_data):
+    X, y = profile_data
+    mock_statistics.side_effect = lambda col: (
+        int(col.isnull().sum()),
+        col.nunique(),
+        col.nunique(dropna=False),
+        UniquenessDataCheck.uniqueness_score(col),
+    )
+    data_checks = DataChecks(
+        [
+            NullDataCheck,
+            NoVarianceDataCheck,
+            IDColumnsDataCheck,
+            UniquenessDataCheck,
+            OutliersDataCheck,
+        ],
+        {"UniquenessDataCheck": {"problem_type": "regression"}},
+    )
+    messages = data_checks.validate(X, y)
+    assert mock_statistics.call_count == len(X.columns)
+
+    expected_messages = []
+    for data_check in data_checks.data_checks:
+        expected_messages.extend(data_check.validate(X, y))
+    assert messages == expected_messages
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.data_checks import (
+    MulticollinearityDataCheck,
+    TargetLeakageDataCheck,
+)
+from evalml.data_checks.mutual_information import (
+    _sample_rows,
+    mutual_information_with_target,
+    pairwise_mutual_information,
+)
+from evalml.utils import infer_feature_types
+
+
+@pytest.fixture
+def mixed_data():
+    random_state = np.random.RandomState(0)
+    n_rows = 200
+    target = random_state.randint(0, 3, size=n_rows)
+    X = pd.DataFrame(
+        {
+            "leak": target * 2 + 1,
+            "noisy": target + random_state.normal(scale=2, size=n_rows),
+            "with_nulls": np.where(
+                random_state.rand(n_rows) < 0.2, np.nan, random_state.rand(n_rows)
+            ),
+            "category": pd.Series(random_state.choice(["a", "b", "c"], n_rows)),
+            "bool": random_state.rand(n_rows) < 0.5,
+            "date": pd.date_range("2021-01-01", periods=n_rows),
+            "all_null": [np.nan] * n_rows,
+            "unknown": [f"value_{i}" for i in range(n_rows)],
+        }
+    )
+    X.ww.init(
+        logical_types={
+            "category": "Categorical",
+            "all_null": "Double",
+            "unknown": "Unknown",
+        }
+    )
+    y = infer_feature_types(pd.Series(target))
+    return X, y
+
+
+def test_mutual_information_with_target_matches_woodwork(mixed_data):
+    X, y = mixed_data
+    mutual_info = mutual_information_with_target(X, y)
+
+    assert list(mutual_info.index) == [
+        "leak",
+        "noisy",
+        "with_nulls",
+        "category",
+        "bool",
+        "date",
+    ]
+    for col in mutual_info.index:
+        cols_to_compare = X.ww[[col]]
+        cols_to_compare.ww["target"] = y
+        expected = cols_to_compare.ww.mutual_information()["mutual_info"].iloc[0]
+        assert mutual_info[col] == pytest.approx(expected)
+    assert mutual_info["leak"] == pytest.approx(1.0)
+
+
+def test_mutual_information_with_invalid_target(mixed_data):
+    X, _ = mixed_data
+    y = infer_feature_types(pd.Series([f"value_{i}" for i in range(len(X))]), "Unknown")
+    assert mutual_information_with_target(X, y).empty
+
+    y = infer_feature_types(pd.Series([np.nan] * len(X)), "Double")
+    assert mutual_information_with_target(X, y).empty
+
+
+def test_pairwise_mutual_information_matches_woodwork(mixed_data):
+    X, _ = mixed_data
+    mutual_info = pairwise_mutual_information(X)
+    expected = X.ww.mutual_information()
+
+    pd.testing.assert_frame_equal(
+        mutual_info[["column_1", "column_2"]], expected[["column_1", "column_2"]]
+    )
+    np.testing.assert_allclose(mutual_info["mutual_info"], expected["mutual_info"])
+
+
+def test_pairwise_mutual_information_high_cardinality():
+    # The dense joint histogram of these columns would have billions of cells
+    random_state = np.random.RandomState(0)
+    n_rows = 30_000
+    X = pd.DataFrame(
+        {
+            f"col_{i}": random_state.randint(0, 40_000, size=n_rows).astype(str)
+            for i in range(4)
+        }
+    )
+    X["copy"] = X["col_0"]
+    X.ww.init(logical_types={col: "Categorical" for col in X.columns})
+    mutual_info = pairwise_mutual_information(X)
+    expected = X.ww.mutual_information()
+
+    # The scores of the independent columns are too close for their order to be compared
+    pd.testing.assert_frame_equal(
+        mutual_info.set_index(["column_1", "column_2"]).sort_index(),
+        expected.set_index(["column_1", "column_2"]).sort_index(),
+    )
+    assert mutual_info["mutual_info"].iloc[0] == pytest.approx(1.0)
+
+
+def test_pairwise_mutual_information_empty():
+    X = infer_feature_types(pd.DataFrame({"a": [1, 2, 3]}))
+    mutual_info = pairwise_mutual_information(X)
+    assert mutual_info.empty
+    assert list(mutual_info.columns) == ["column_1", "column_2", "mutual_info"]
+
+
+def test_sample_rows():
+    assert _sample_rows(400, 81, 0.1, 0) is None
+    rows = _sample_rows(100_000, 81, 0.01, 0)
+    assert len(rows) == 4050
+    assert len(np.unique(rows)) == len(rows)
+    assert (np.diff(rows) > 0).all()
+    np.testing.assert_array_equal(rows, _sample_rows(100_000, 81, 0.01, 0))
+
+
+def test_mutual_information_error_bound():
+    random_state = np.random.RandomState(0)
+    n_rows = 50_000
+    target = pd.Series(random_state.rand(n_rows) < 0.5)
+    X = infer_feature_types(
+        pd.DataFrame(
+            {
+                "leak": target.map({True: "yes", False: "no"}),
+                "noise": random_state.normal(size=n_rows),
+            }
+        ),
+        {"leak": "Categorical"},
+    )
+    y = infer_feature_types(target)
+
+    mutual_info = mutual_information_with_target(X, y)
+    sampled = mutual_information_with_target(X, y, error_bound=0.01)
+    assert sampled["leak"] == pytest.approx(1.0)
+    assert sampled["noise"] == pytest.approx(mutual_info["noise"], abs=0.05)
+
+    pairwise = pairwise_mutual_information(X, error_bound=0.01)
+    assert pairwise["mutual_info"].iloc[0] < 0.05
+
+
+def test_data_checks_use_error_bound():
+    random_state = np.random.RandomState(0)
+    n_rows = 20_000
+    target = pd.Series(random_state.rand(n_rows) < 0.5)
+    X = pd.DataFrame(
+        {
+            "leak": target.map({True: "a", False: "b"}),
+            "copy": target.map({True: "c", False: "d"}),
+        }
+    )
+    X.ww.init(logical_types={"leak": "Categorical", "copy": "Categorical"})
+
+    messages = TargetLeakageDataCheck(error_bound=0.01).validate(X, target)
+    assert messages == TargetLeakageDataCheck().validate(X, target)
+    assert messages[0]["details"]["columns"] == ["leak", "copy"]
+
+    messages = MulticollinearityDataCheck(error_bound=0.01).validate(X)
+    assert messages == MulticollinearityDataCheck().validate(X)
+    assert messages[0]["details"]["columns"] == [("leak", "copy")]
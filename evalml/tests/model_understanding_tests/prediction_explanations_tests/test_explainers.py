@@ -1,4 +1,5 @@
 import json
+import os
 from itertools import product
 from unittest.mock import ANY, MagicMock, patch
 
@@ -7,7 +8,16 @@ import pandas as pd
 import pytest
 import woodwork as ww
 
-from evalml.exceptions import PipelineScoreError
+from evalml.exceptions import PipelineNotYetFittedError, PipelineScoreError
+from evalml.model_understanding import PredictionExplainer
+from evalml.model_understanding.prediction_explanations._algorithms import (
+    _compute_shap_values,
+    _make_lime_explainer,
+    _make_shap_explainer,
+)
+from evalml.model_understanding.prediction_explanations._user_interface import (
+    _make_single_prediction_explanation_table,
+)
 from evalml.model_understanding.prediction_explanations.explainers import (
     ExplainPredictionsStage,
     abs_error,
@@ -77,12 +87,12 @@ def test_explain_predictions_best_worst_value_errors(
 def test_explain_predictions_raises_pipeline_score_error():
     with pytest.raises(PipelineScoreError, match="Division by zero!"):
 
-        def raise_zero_division(input_features):
+        def raise_zero_division(pipeline_features, y_true):
             raise ZeroDivisionError("Division by zero!")
 
         pipeline = MagicMock()
         pipeline.problem_type = ProblemTypes.BINARY
-        pipeline.predict_proba.side_effect = raise_zero_division
+        pipeline._predict_proba_from_features.side_effect = raise_zero_division
         explain_predictions_best_worst(
             pipeline, pd.DataFrame({"a": range(15)}), pd.Series(range(15))
         )
@@ -521,6 +531,10 @@ regression_custom_indices = [[0, 1], [4, 10], ["foo", "bar"]]
         regression_problem_types, output_formats, regression_custom_indices, algorithms
     ),
 )
+@patch(
+    "evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_of_rows",
+    return_value={},
+)
 @patch("evalml.model_understanding.prediction_explanations.explainers.DEFAULT_METRICS")
 @patch(
     "evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_explanation_table"
@@ -528,6 +542,7 @@ regression_custom_indices = [[0, 1], [4, 10], ["foo", "bar"]]
 def test_explain_predictions_best_worst_and_explain_predictions_regression(
     mock_make_table,
     mock_default_metrics,
+    mock_shap_values,
     problem_type,
     output_format,
     custom_index,
@@ -560,8 +575,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_regression(
     input_features = pd.DataFrame({"a": [3, 4]}, index=custom_index)
     input_features.ww.init()
     pipeline = _prep_pipeline_mock(problem_type, input_features)
-    pipeline.predict.return_value = ww.init_series(pd.Series([2, 1]))
-    pipeline.predict_in_sample.return_value = ww.init_series(pd.Series([2, 1]))
+    pipeline._predict_from_features.return_value = ww.init_series(pd.Series([2, 1]))
     pipeline.transform_all_but_final.return_value = input_features
 
     abs_error_mock = MagicMock(__name__="abs_error")
@@ -595,6 +609,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_regression(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        shap_values=ANY,
     )
 
     best_worst_report = explain_predictions_best_worst(
@@ -617,7 +632,9 @@ def test_explain_predictions_best_worst_and_explain_predictions_regression(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        shap_values=ANY,
     )
+    assert mock_shap_values.called == (algorithm == "shap")
 
 
 binary_problem_types = [ProblemTypes.BINARY, ProblemTypes.TIME_SERIES_BINARY]
@@ -628,6 +645,10 @@ binary_custom_indices = [[0, 1], [7, 11], ["first", "second"]]
     "problem_type,output_format,custom_index,algorithm",
     product(binary_problem_types, output_formats, binary_custom_indices, algorithms),
 )
+@patch(
+    "evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_of_rows",
+    return_value={},
+)
 @patch("evalml.model_understanding.prediction_explanations.explainers.DEFAULT_METRICS")
 @patch(
     "evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_explanation_table"
@@ -635,6 +656,7 @@ binary_custom_indices = [[0, 1], [7, 11], ["first", "second"]]
 def test_explain_predictions_best_worst_and_explain_predictions_binary(
     mock_make_table,
     mock_default_metrics,
+    mock_shap_values,
     problem_type,
     output_format,
     custom_index,
@@ -674,10 +696,8 @@ def test_explain_predictions_best_worst_and_explain_predictions_binary(
     cross_entropy_mock.return_value = pd.Series([0.2, 0.78])
     proba = pd.DataFrame({"benign": [0.05, 0.1], "malignant": [0.95, 0.9]})
     proba.ww.init()
-    pipeline.predict_proba.return_value = proba
-    pipeline.predict_proba_in_sample.return_value = proba
-    pipeline.predict.return_value = ww.init_series(pd.Series(["malignant"] * 2))
-    pipeline.predict_in_sample.return_value = ww.init_series(
+    pipeline._predict_proba_from_features.return_value = proba
+    pipeline._predict_from_features.return_value = ww.init_series(
         pd.Series(["malignant"] * 2)
     )
     pipeline.transform_all_but_final.return_value = input_features
@@ -709,6 +729,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_binary(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        shap_values=ANY,
     )
 
     best_worst_report = explain_predictions_best_worst(
@@ -731,7 +752,9 @@ def test_explain_predictions_best_worst_and_explain_predictions_binary(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        shap_values=ANY,
     )
+    assert mock_shap_values.called == (algorithm == "shap")
 
 
 multiclass_problem_types = [
@@ -747,6 +770,10 @@ multiclass_custom_indices = [[0, 1], [17, 235], ["2020-15", "2020-15"]]
         multiclass_problem_types, output_formats, multiclass_custom_indices, algorithms
     ),
 )
+@patch(
+    "evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_of_rows",
+    return_value={},
+)
 @patch("evalml.model_understanding.prediction_explanations.explainers.DEFAULT_METRICS")
 @patch(
     "evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_explanation_table"
@@ -754,6 +781,7 @@ multiclass_custom_indices = [[0, 1], [17, 235], ["2020-15", "2020-15"]]
 def test_explain_predictions_best_worst_and_explain_predictions_multiclass(
     mock_make_table,
     mock_default_metrics,
+    mock_shap_values,
     problem_type,
     output_format,
     custom_index,
@@ -798,10 +826,8 @@ def test_explain_predictions_best_worst_and_explain_predictions_multiclass(
         {"setosa": [0.8, 0.2], "versicolor": [0.1, 0.75], "virginica": [0.1, 0.05]}
     )
     proba.ww.init()
-    pipeline.predict_proba.return_value = proba
-    pipeline.predict_proba_in_sample.return_value = proba
-    pipeline.predict.return_value = ww.init_series(pd.Series(["setosa", "versicolor"]))
-    pipeline.predict_in_sample.return_value = ww.init_series(
+    pipeline._predict_proba_from_features.return_value = proba
+    pipeline._predict_from_features.return_value = ww.init_series(
         pd.Series(["setosa", "versicolor"])
     )
     pipeline.transform_all_but_final.return_value = input_features
@@ -833,6 +859,7 @@ def test_explain_predictions_best_worst_and_explain_predictions_multiclass(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        shap_values=ANY,
     )
 
     best_worst_report = explain_predictions_best_worst(
@@ -855,7 +882,9 @@ def test_explain_predictions_best_worst_and_explain_predictions_multiclass(
         include_explainer_values=ANY,
         output_format=output_format,
         algorithm=algorithm,
+        shap_values=ANY,
     )
+    assert mock_shap_values.called == (algorithm == "shap")
 
 
 regression_custom_metric_answer = """Test Pipeline Name
@@ -921,11 +950,15 @@ regression_custom_metric_answer_dict = {
         ("dict", regression_custom_metric_answer_dict),
     ],
 )
+@patch(
+    "evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_of_rows",
+    return_value={},
+)
 @patch(
     "evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_explanation_table"
 )
 def test_explain_predictions_best_worst_custom_metric(
-    mock_make_table, output_format, answer
+    mock_make_table, mock_shap_values, output_format, answer
 ):
 
     mock_make_table.return_value = (
@@ -941,7 +974,7 @@ def test_explain_predictions_best_worst_custom_metric(
     input_features.ww.init()
     pipeline.transform_all_but_final.return_value = input_features
 
-    pipeline.predict.return_value = ww.init_series(pd.Series([2, 1]))
+    pipeline._predict_from_features.return_value = ww.init_series(pd.Series([2, 1]))
     y_true = pd.Series([3, 2])
 
     def sum(y_true, y_pred):
@@ -1837,10 +1870,14 @@ def test_explain_predictions_class_name_matches_class_name_in_y(
             )
 
 
+@patch(
+    "evalml.model_understanding.prediction_explanations._user_interface._compute_shap_values_of_rows",
+    return_value={},
+)
 @patch(
     "evalml.model_understanding.prediction_explanations._user_interface._make_single_prediction_explanation_table"
 )
-def test_explain_predictions_best_worst_callback(mock_make_table):
+def test_explain_predictions_best_worst_callback(mock_make_table, mock_shap_values):
     pipeline = MagicMock()
     pipeline.parameters = "Mock parameters"
     input_features = pd.DataFrame({"a": [5, 6]})
@@ -1848,7 +1885,7 @@ def test_explain_predictions_best_worst_callback(mock_make_table):
     pipeline.name = "Test Pipeline Name"
     input_features.ww.init()
     pipeline.transform_all_but_final.return_value = input_features
-    pipeline.predict.return_value = ww.init_series(pd.Series([2, 1]))
+    pipeline._predict_from_features.return_value = ww.init_series(pd.Series([2, 1]))
     y_true = pd.Series([3, 2])
 
     class MockCallback:
@@ -2227,3 +2264,201 @@ def test_explain_predictions_lime_catboost(X_y_binary):
 
     with pytest.raises(ValueError, match=error_msg):
         explain_predictions_best_worst(pl, X, y, algorithm="lime")
+
+
+@pytest.mark.parametrize(
+    "estimator", ["Random Forest Classifier", "Logistic Regression Classifier"]
+)
+def test_explain_predictions_best_worst_computes_shap_values_once(
+    estimator, X_y_binary
+):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Imputer", estimator])
+    pipeline.fit(X, y)
+
+    with patch(
+        "evalml.model_understanding.prediction_explanations._algorithms._compute_shap_values",
+        wraps=_compute_shap_values,
+    ) as mock_shap_values:
+        report = explain_predictions_best_worst(
+            pipeline,
+            X,
+            y,
+            num_to_explain=5,
+            include_explainer_values=True,
+            output_format="dict",
+        )
+    assert mock_shap_values.call_count == 1
+    assert len(mock_shap_values.call_args[0][1]) == 10
+    assert len(report["explanations"]) == 10
+
+    if estimator == "Random Forest Classifier":
+        # Tree SHAP values don't depend on the other rows explained
+        pipeline_features = pipeline.transform_all_but_final(X, y)
+        for section in report["explanations"]:
+            expected = _make_single_prediction_explanation_table(
+                pipeline,
+                pipeline_features,
+                X,
+                index_to_explain=section["predicted_values"]["index_id"],
+                include_explainer_values=True,
+                include_expected_value=True,
+                output_format="dict",
+            )
+            assert section["explanations"] == expected["explanations"]
+
+
+def test_explain_predictions_computes_shap_values_once(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Imputer", "Random Forest Classifier"])
+    pipeline.fit(X, y)
+
+    with patch(
+        "evalml.model_understanding.prediction_explanations._algorithms._compute_shap_values",
+        wraps=_compute_shap_values,
+    ) as mock_shap_values:
+        report = explain_predictions(
+            pipeline, X, y, indices_to_explain=[3, 0, 3], output_format="dict"
+        )
+    assert mock_shap_values.call_count == 1
+    assert len(mock_shap_values.call_args[0][1]) == 2
+    assert len(report["explanations"]) == 3
+    assert report["explanations"][0] == report["explanations"][2]
+
+
+@pytest.mark.parametrize(
+    "pipeline_class,estimator,threshold",
+    [
+        (BinaryClassificationPipeline, "Random Forest Classifier", None),
+        (BinaryClassificationPipeline, "Random Forest Classifier", 0.7),
+        (MulticlassClassificationPipeline, "Random Forest Classifier", None),
+        (RegressionPipeline, "Random Forest Regressor", None),
+    ],
+)
+def test_explain_predictions_best_worst_transforms_data_once(
+    pipeline_class, estimator, threshold, X_y_based_on_pipeline_or_problem_type
+):
+    X, y = X_y_based_on_pipeline_or_problem_type(pipeline_class)
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+    pipeline = pipeline_class(["Imputer", "One Hot Encoder", estimator])
+    pipeline.fit(X, y)
+    if threshold is not None:
+        pipeline.threshold = threshold
+
+    with patch.object(
+        pipeline.component_graph,
+        "transform_all_but_final",
+        wraps=pipeline.component_graph.transform_all_but_final,
+    ) as mock_transform:
+        report = explain_predictions_best_worst(
+            pipeline, X, y, num_to_explain=2, output_format="dict"
+        )
+    assert mock_transform.call_count == 1
+
+    y_pred = pipeline.predict(X)
+    for section in report["explanations"]:
+        predicted_values = section["predicted_values"]
+        index_id = predicted_values["index_id"]
+        assert predicted_values["predicted_value"] == pytest.approx(
+            y_pred[index_id], abs=1e-3
+        )
+        if predicted_values["probabilities"] is not None:
+            proba = pipeline.predict_proba(X).iloc[index_id]
+            assert predicted_values["probabilities"] == {
+                col: round(value, 3) for col, value in proba.items()
+            }
+
+
+def test_pipeline_get_explainer_is_reused(X_y_binary, tmpdir):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Imputer", "Random Forest Classifier"])
+    with pytest.raises(PipelineNotYetFittedError, match="before calling get_explainer"):
+        pipeline.get_explainer()
+    pipeline.fit(X, y)
+    report = explain_predictions(pipeline, X, y, [0, 1], output_format="dict")
+
+    explainer = pipeline.get_explainer()
+    assert isinstance(explainer, PredictionExplainer)
+    assert explainer.algorithm == "shap"
+    assert pipeline.get_explainer() is explainer
+
+    with patch(
+        "evalml.model_understanding.prediction_explanations._algorithms._make_shap_explainer",
+        wraps=_make_shap_explainer,
+    ) as mock_make_explainer:
+        assert (
+            explain_predictions(pipeline, X, y, [0, 1], output_format="dict") == report
+        )
+        explain_predictions_best_worst(pipeline, X, y, output_format="dict")
+
+        path = os.path.join(str(tmpdir), "pipeline.pkl")
+        pipeline.save(path)
+        loaded_pipeline = BinaryClassificationPipeline.load(path)
+        assert isinstance(loaded_pipeline.get_explainer(), PredictionExplainer)
+        assert (
+            explain_predictions(loaded_pipeline, X, y, [0, 1], output_format="dict")
+            == report
+        )
+    mock_make_explainer.assert_not_called()
+
+    pipeline.fit(X, y)
+    assert pipeline._explainers == {}
+    assert pipeline.clone()._explainers == {}
+
+
+def test_pipeline_get_explainer_background(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    y = pd.Series(y)
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "Logistic Regression Classifier"]
+    )
+    pipeline.fit(X, y)
+    with pytest.raises(ValueError, match="background is required"):
+        pipeline.get_explainer()
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        pipeline.get_explainer("fake", background=X)
+
+    explainer = pipeline.get_explainer(background=X)
+    assert explainer.explainer.data.data.shape == (100, X.shape[1])
+    assert pipeline.get_explainer() is explainer
+    assert pipeline.get_explainer(background=X.iloc[:50]) is not explainer
+
+    with patch(
+        "evalml.model_understanding.prediction_explanations._algorithms._make_shap_explainer"
+    ) as mock_make_explainer:
+        report = explain_predictions(
+            pipeline, X.iloc[:1], y.iloc[:1], [0], output_format="dataframe"
+        )
+    mock_make_explainer.assert_not_called()
+    assert not report.empty
+
+    del pipeline._explainers
+    assert pipeline.get_explainer(background=X) is pipeline._explainers["shap"]
+
+
+@pytest.mark.noncore_dependency
+def test_pipeline_get_explainer_lime(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = BinaryClassificationPipeline(["Imputer", "Random Forest Classifier"])
+    pipeline.fit(X, y)
+    with pytest.raises(ValueError, match="background is required"):
+        pipeline.get_explainer("lime")
+    explainer = pipeline.get_explainer("lime", background=X)
+    assert pipeline.get_explainer("lime") is explainer
+    assert pipeline.get_explainer("shap") is not explainer
+
+    with patch(
+        "evalml.model_understanding.prediction_explanations._algorithms._make_lime_explainer",
+        wraps=_make_lime_explainer,
+    ) as mock_make_explainer:
+        report = explain_predictions(
+            pipeline, X, y, [0, 1], output_format="dict", algorithm="lime"
+        )
+    mock_make_explainer.assert_not_called()
+    assert len(report["explanations"]) == 2
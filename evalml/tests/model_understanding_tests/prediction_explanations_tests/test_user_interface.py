@@ -709,3 +709,17 @@ def test_make_single_prediction_table_calls_correct_algorithm(
     )
     mock_shap.assert_not_called()
     mock_lime.assert_called()
+    mock_lime.reset_mock()
+
+    # SHAP values computed along with those of other rows are used as they are
+    _make_single_prediction_explanation_table(
+        pipeline,
+        binary_pipeline_features,
+        binary_pipeline_features,
+        0,
+        algorithm="shap",
+        shap_values=(binary, 0),
+    )
+    mock_shap.assert_not_called()
+    mock_lime.assert_not_called()
+    assert mock_make_text.call_args[0][0] == binary
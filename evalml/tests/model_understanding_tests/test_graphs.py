@@ -35,7 +35,11 @@ from evalml.model_understanding.graphs import (
     t_sne,
     visualize_decision_tree,
 )
-from evalml.objectives import CostBenefitMatrix
+from evalml.objectives import (
+    CostBenefitMatrix,
+    SensitivityLowAlert,
+    get_objective,
+)
 from evalml.pipelines import (
     DecisionTreeRegressor,
     ElasticNetRegressor,
@@ -755,17 +759,48 @@ def test_binary_objective_vs_threshold_steps(
     mock_score, X_y_binary, logistic_regression_binary_pipeline
 ):
     X, y = X_y_binary
-    cbm = CostBenefitMatrix(
-        true_positive=1, true_negative=-1, false_positive=-7, false_negative=-2
-    )
+    objective = SensitivityLowAlert()
     logistic_regression_binary_pipeline.fit(X, y)
-    mock_score.return_value = {"Cost Benefit Matrix": 0.2}
-    cost_benefit_df = binary_objective_vs_threshold(
-        logistic_regression_binary_pipeline, X, y, cbm, steps=234
+    mock_score.return_value = {objective.name: 0.2}
+    results_df = binary_objective_vs_threshold(
+        logistic_regression_binary_pipeline, X, y, objective, steps=234
     )
     mock_score.assert_called()
-    assert list(cost_benefit_df.columns) == ["threshold", "score"]
-    assert cost_benefit_df.shape == (235, 2)
+    assert list(results_df.columns) == ["threshold", "score"]
+    assert results_df.shape == (235, 2)
+
+
+@pytest.mark.parametrize(
+    "objective",
+    [
+        "F1",
+        "Precision",
+        "Balanced Accuracy Binary",
+        CostBenefitMatrix(
+            true_positive=1, true_negative=-1, false_positive=-7, false_negative=-2
+        ),
+    ],
+)
+@patch("evalml.pipelines.BinaryClassificationPipeline.score")
+def test_binary_objective_vs_threshold_vectorized(
+    mock_score, objective, X_y_binary, logistic_regression_binary_pipeline
+):
+    X, y = X_y_binary
+    objective = get_objective(objective, return_instance=True)
+    logistic_regression_binary_pipeline.fit(X, y)
+    results_df = binary_objective_vs_threshold(
+        logistic_regression_binary_pipeline, X, y, objective, steps=10
+    )
+    mock_score.assert_not_called()
+
+    y_pred_proba = logistic_regression_binary_pipeline.predict_proba(X).iloc[:, 1]
+    expected_scores = [
+        objective.score(
+            y, objective.decision_function(y_pred_proba, threshold=threshold)
+        )
+        for threshold in results_df["threshold"]
+    ]
+    np.testing.assert_allclose(results_df["score"], expected_scores)
 
 
 @pytest.mark.noncore_dependency
@@ -1,5 +1,5 @@
 import re
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import numpy as np
 import pandas as pd
@@ -15,6 +15,10 @@ from evalml.model_understanding import (
     graph_partial_dependence,
     partial_dependence,
 )
+from evalml.model_understanding._partial_dependence import (
+    _grid_from_X,
+    _partial_dependence_calculation,
+)
 from evalml.pipelines import (
     BinaryClassificationPipeline,
     ClassificationPipeline,
@@ -1817,3 +1821,106 @@ def test_partial_dependence_does_not_return_all_nan_grid():
     dep = partial_dependence(pipeline, X_holdout, "a", grid_resolution=4)
     assert not dep.feature_values.isna().any()
     assert not dep.partial_dependence.isna().any()
+
+
+@pytest.mark.parametrize(
+    "problem_type",
+    [ProblemTypes.BINARY, ProblemTypes.MULTICLASS, ProblemTypes.REGRESSION],
+)
+@pytest.mark.parametrize("features", [["country"], ["country", "amount"]])
+def test_partial_dependence_batched_grid(problem_type, features, fraud_100):
+    X, y = fraud_100
+    X = X.ww[["card_id", "store_id", "amount", "country"]]
+    if problem_type == ProblemTypes.BINARY:
+        pipeline = BinaryClassificationPipeline(
+            [
+                "Imputer",
+                "One Hot Encoder",
+                "Standard Scaler",
+                "Logistic Regression Classifier",
+            ]
+        )
+    elif problem_type == ProblemTypes.MULTICLASS:
+        y = pd.Series([0, 1, 2, 3] * 25)
+        pipeline = MulticlassClassificationPipeline(
+            [
+                "Imputer",
+                "One Hot Encoder",
+                "Standard Scaler",
+                "Logistic Regression Classifier",
+            ]
+        )
+    else:
+        y = X["amount"] * 2 + X["card_id"] % 7
+        pipeline = RegressionPipeline(
+            ["Imputer", "One Hot Encoder", "Standard Scaler", "Linear Regressor"]
+        )
+    pipeline.fit(X, y)
+    grid, _ = _grid_from_X(
+        X.loc[:, features],
+        (0.05, 0.95),
+        grid_resolution=5,
+        custom_range={"country": X["country"].dropna().unique()},
+    )
+
+    method = "predict" if problem_type == ProblemTypes.REGRESSION else "predict_proba"
+    with patch.object(
+        pipeline, method, wraps=getattr(pipeline, method)
+    ) as mock_predict:
+        unbatched = _partial_dependence_calculation(
+            pipeline, grid, features, X, max_batch_memory=1
+        )
+        assert mock_predict.call_count == len(grid)
+        mock_predict.reset_mock()
+        batched = _partial_dependence_calculation(pipeline, grid, features, X)
+        assert mock_predict.call_count == 1
+
+    np.testing.assert_allclose(batched[0], unbatched[0])
+    np.testing.assert_allclose(batched[1], unbatched[1])
+
+
+@pytest.mark.parametrize(
+    "problem_type",
+    [ProblemTypes.BINARY, ProblemTypes.REGRESSION],
+)
+def test_partial_dependence_reuses_precomputed_features(problem_type, fraud_100):
+    X, y = fraud_100
+    X = X.ww[["card_id", "store_id", "amount", "country"]]
+    if problem_type == ProblemTypes.BINARY:
+        pipeline = BinaryClassificationPipeline(
+            ["One Hot Encoder", "Random Forest Classifier"]
+        )
+        method = "predict_proba"
+    else:
+        y = X["amount"] * 2 + X["card_id"] % 7
+        pipeline = RegressionPipeline(["One Hot Encoder", "Random Forest Regressor"])
+        method = "predict"
+    pipeline.fit(X, y)
+    grid, _ = _grid_from_X(
+        X.loc[:, ["amount"]], (0.05, 0.95), grid_resolution=5, custom_range={}
+    )
+
+    with patch.object(pipeline, method, wraps=getattr(pipeline, method)) as mock:
+        fast = _partial_dependence_calculation(pipeline, grid, ["amount"], X)
+        mock.assert_not_called()
+    with patch.object(
+        type(pipeline),
+        "_supports_fast_permutation_importance",
+        new_callable=PropertyMock,
+        return_value=False,
+    ):
+        slow = _partial_dependence_calculation(pipeline, grid, ["amount"], X)
+
+    np.testing.assert_allclose(fast[0], slow[0])
+    np.testing.assert_allclose(fast[1], slow[1])
+
+    # The categorical feature is one hot encoded, so the pipeline is run for every point
+    grid, _ = _grid_from_X(
+        X.loc[:, ["country"]],
+        (0.05, 0.95),
+        grid_resolution=5,
+        custom_range={"country": X["country"].dropna().unique()},
+    )
+    with patch.object(pipeline, method, wraps=getattr(pipeline, method)) as mock:
+        _partial_dependence_calculation(pipeline, grid, ["country"], X)
+        mock.assert_called_once()
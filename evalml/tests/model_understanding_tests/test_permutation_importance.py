@@ -701,3 +701,73 @@ def test_permutation_importance_standard_scaler(fraud_100):
     pipeline = BinaryClassificationPipeline(component_graph)
     pipeline.fit(X, y)
     calculate_permutation_importance(pipeline, X, y, objective="log loss binary")
+
+
+def test_fast_permutation_importance_stacks_repeats(
+    X_y_binary, logistic_regression_binary_pipeline
+):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = logistic_regression_binary_pipeline
+    pipeline.fit(X, y)
+    estimator = pipeline.estimator
+    with patch.object(
+        estimator, "predict_proba", wraps=estimator.predict_proba
+    ) as mock_predict_proba:
+        calculate_permutation_importance(pipeline, X, y, "Log Loss Binary", n_repeats=5)
+    # One call for the baseline score and one call with all repeats for each column
+    assert mock_predict_proba.call_count == 1 + X.shape[1]
+    assert all(
+        call_args[0][0].shape[0] == 5 * X.shape[0]
+        for call_args in mock_predict_proba.call_args_list[1:]
+    )
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_permutation_importance_sample_size(
+    fast, X_y_binary, logistic_regression_binary_pipeline
+):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    pipeline = logistic_regression_binary_pipeline
+    pipeline.fit(X, y)
+
+    with patch(
+        "evalml.pipelines.PipelineBase._supports_fast_permutation_importance",
+        new_callable=PropertyMock,
+        return_value=fast,
+    ):
+        permutation_importance = calculate_permutation_importance(
+            pipeline, X, y, "Log Loss Binary", n_repeats=4, sample_size=50
+        )
+        assert list(permutation_importance.columns) == [
+            "feature",
+            "importance",
+            "lower_bound",
+            "upper_bound",
+        ]
+        assert permutation_importance["importance"].is_monotonic_decreasing and set(
+            permutation_importance["feature"]
+        ) == set(X.columns)
+        assert (
+            permutation_importance["lower_bound"]
+            <= permutation_importance["importance"]
+        ).all()
+        assert (
+            permutation_importance["importance"]
+            <= permutation_importance["upper_bound"]
+        ).all()
+
+        # Sampling at least as many rows as X uses all of them
+        all_rows = calculate_permutation_importance(
+            pipeline, X, y, "Log Loss Binary", n_repeats=4, sample_size=len(X)
+        )
+        expected = calculate_permutation_importance(
+            pipeline, X, y, "Log Loss Binary", n_repeats=4
+        )
+    pd.testing.assert_frame_equal(
+        all_rows[["feature", "importance"]]
+        .sort_values("feature")
+        .reset_index(drop=True),
+        expected.sort_values("feature").reset_index(drop=True),
+    )
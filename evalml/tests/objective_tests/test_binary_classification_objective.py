@@ -1,11 +1,26 @@
 from abc import ABCMeta, abstractmethod
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from evalml import AutoMLSearch
-from evalml.objectives.standard_metrics import AUC, F1
+from evalml.objectives import (
+    F1,
+    AccuracyBinary,
+    BalancedAccuracyBinary,
+    CostBenefitMatrix,
+    FraudCost,
+    LeadScoring,
+    MCCBinary,
+    Precision,
+    Recall,
+)
+from evalml.objectives.binary_classification_objective import (
+    _candidate_thresholds,
+)
+from evalml.objectives.standard_metrics import AUC
 
 
 def test_optimize_threshold():
@@ -30,6 +45,72 @@ def test_optimize_threshold_neg():
         obj.optimize_threshold(ypred_proba, y_true)
 
 
+@pytest.mark.parametrize(
+    "objective",
+    [
+        F1(),
+        Precision(),
+        Recall(),
+        AccuracyBinary(),
+        BalancedAccuracyBinary(),
+        MCCBinary(),
+        CostBenefitMatrix(
+            true_positive=1, true_negative=-1, false_positive=-7, false_negative=-2
+        ),
+        LeadScoring(true_positives=10, false_positives=-3),
+        FraudCost(amount_col="amount"),
+    ],
+)
+@pytest.mark.parametrize("all_one_class", [False, True])
+def test_score_thresholds_matches_objective_function(objective, all_one_class):
+    rs = np.random.RandomState(0)
+    ypred_proba = pd.Series(np.round(rs.random_sample(50), 2))
+    y_true = pd.Series(rs.randint(0, 2, 50))
+    if all_one_class:
+        y_true[:] = 1
+    X = pd.DataFrame({"amount": rs.randint(1, 1000, 50)})
+    thresholds = np.concatenate([[0.0, 1.0], _candidate_thresholds(ypred_proba)])
+
+    scores = objective._score_thresholds(ypred_proba, y_true, thresholds, X=X)
+    expected_scores = [
+        objective.objective_function(
+            y_true, objective.decision_function(ypred_proba, threshold, X=X), X=X
+        )
+        for threshold in thresholds
+    ]
+    np.testing.assert_allclose(scores, expected_scores)
+
+
+def test_optimize_threshold_vectorized():
+    ypred_proba = pd.Series([0.1, 0.3, 0.35, 0.6, 0.8])
+    y_true = pd.Series([0, 0, 1, 1, 1])
+    threshold = F1().optimize_threshold(ypred_proba, y_true)
+    assert 0.3 < threshold < 0.35
+
+
+@patch("evalml.objectives.binary_classification_objective.differential_evolution")
+def test_optimize_threshold_falls_back_for_custom_objective_function(
+    mock_differential_evolution,
+):
+    class PrecisionSquared(Precision):
+        def objective_function(self, y_true, y_predicted, X=None, sample_weight=None):
+            return super().objective_function(y_true, y_predicted) ** 2
+
+    ypred_proba = pd.Series([0.1, 0.3, 0.35, 0.6, 0.8])
+    y_true = pd.Series([0, 0, 1, 1, 1])
+    mock_differential_evolution.return_value.x = [0.5]
+    assert (
+        PrecisionSquared()._score_thresholds(ypred_proba, y_true, np.array([0.5]))
+        is None
+    )
+    assert PrecisionSquared().optimize_threshold(ypred_proba, y_true) == 0.5
+    mock_differential_evolution.assert_called_once()
+
+    mock_differential_evolution.reset_mock()
+    Precision().optimize_threshold(ypred_proba, y_true)
+    mock_differential_evolution.assert_not_called()
+
+
 def test_can_optimize_threshold():
     assert F1().can_optimize_threshold
     assert not AUC().can_optimize_threshold
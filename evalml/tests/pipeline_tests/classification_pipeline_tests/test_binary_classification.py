@@ -27,6 +27,7 @@ def test_binary_init():
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Random Forest Classifier": {"n_estimators": 100, "max_depth": 6, "n_jobs": -1},
     }
@@ -54,6 +55,7 @@ def test_binary_init():
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Random Forest Classifier": {"n_estimators": 100, "max_depth": 6, "n_jobs": -1},
     }
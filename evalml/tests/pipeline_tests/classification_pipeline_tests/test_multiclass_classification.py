@@ -19,6 +19,7 @@ def test_multiclass_init():
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Random Forest Classifier": {"n_estimators": 100, "max_depth": 6, "n_jobs": -1},
     }
@@ -46,6 +47,7 @@ def test_multiclass_init():
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Random Forest Classifier": {"n_estimators": 100, "max_depth": 6, "n_jobs": -1},
     }
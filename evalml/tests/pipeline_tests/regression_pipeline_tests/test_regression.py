@@ -24,6 +24,7 @@ def test_regression_init():
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Random Forest Regressor": {"n_estimators": 100, "max_depth": 6, "n_jobs": -1},
     }
@@ -51,6 +52,7 @@ def test_regression_init():
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Random Forest Regressor": {"n_estimators": 100, "max_depth": 6, "n_jobs": -1},
     }
@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    CompiledPipeline,
+    MulticlassClassificationPipeline,
+    RegressionPipeline,
+    TimeSeriesRegressionPipeline,
+)
+
+component_graph = [
+    "Imputer",
+    "DateTime Featurizer",
+    "One Hot Encoder",
+    "Standard Scaler",
+    "Logistic Regression Classifier",
+]
+# Pipelines fit on string labels need a Label Encoder, which can only be added in a dictionary
+label_encoded_component_graph = {
+    "Label Encoder": ["Label Encoder", "X", "y"],
+    "Imputer": ["Imputer", "X", "Label Encoder.y"],
+    "DateTime Featurizer": ["DateTime Featurizer", "Imputer.x", "Label Encoder.y"],
+    "One Hot Encoder": [
+        "One Hot Encoder",
+        "DateTime Featurizer.x",
+        "Label Encoder.y",
+    ],
+    "Standard Scaler": ["Standard Scaler", "One Hot Encoder.x", "Label Encoder.y"],
+    "Logistic Regression Classifier": [
+        "Logistic Regression Classifier",
+        "Standard Scaler.x",
+        "Label Encoder.y",
+    ],
+}
+
+
+@pytest.fixture
+def mixed_data():
+    random_state = np.random.RandomState(0)
+    n_rows = 100
+    X = pd.DataFrame(
+        {
+            "numeric": random_state.normal(size=n_rows),
+            "with_nulls": np.where(
+                random_state.rand(n_rows) < 0.2, np.nan, random_state.rand(n_rows)
+            ),
+            "category": random_state.choice(["a", "b", "c", None], n_rows),
+            "date": pd.date_range("2021-01-01", periods=n_rows, freq="7H"),
+        }
+    )
+    X.ww.init(logical_types={"category": "Categorical"})
+    return X
+
+
+def test_compiled_pipeline_binary(mixed_data):
+    X = mixed_data
+    y = pd.Series(np.where(X["numeric"] > 0, "yes", "no"))
+    pipeline = BinaryClassificationPipeline(label_encoded_component_graph)
+    pipeline.fit(X, y)
+    compiled = pipeline.compile()
+
+    assert isinstance(compiled, CompiledPipeline)
+    assert compiled.classes_ == pipeline.classes_
+    np.testing.assert_allclose(
+        compiled.predict_proba(X), pipeline.predict_proba(X).to_numpy()
+    )
+    np.testing.assert_array_equal(compiled.predict(X), pipeline.predict(X).to_numpy())
+
+    pipeline.threshold = 0.8
+    compiled = pipeline.compile()
+    np.testing.assert_array_equal(compiled.predict(X), pipeline.predict(X).to_numpy())
+
+
+def test_compiled_pipeline_multiclass(mixed_data):
+    X = mixed_data
+    y = pd.Series(np.digitize(X["numeric"], [-0.5, 0.5]))
+    pipeline = MulticlassClassificationPipeline(
+        component_graph[:-1] + ["Random Forest Classifier"]
+    )
+    pipeline.fit(X, y)
+    compiled = pipeline.compile()
+
+    np.testing.assert_allclose(
+        compiled.predict_proba(X), pipeline.predict_proba(X).to_numpy()
+    )
+    np.testing.assert_array_equal(compiled.predict(X), pipeline.predict(X).to_numpy())
+
+
+def test_compiled_pipeline_regression(mixed_data):
+    X = mixed_data
+    y = pd.Series(np.exp(X["numeric"]) + X["date"].dt.hour)
+    pipeline = RegressionPipeline(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "DateTime Featurizer": ["DateTime Featurizer", "Imputer.x", "y"],
+            "One Hot Encoder": ["One Hot Encoder", "DateTime Featurizer.x", "y"],
+            "Standard Scaler": ["Standard Scaler", "One Hot Encoder.x", "y"],
+            "Log Transformer": ["Log Transformer", "X", "y"],
+            "Linear Regressor": [
+                "Linear Regressor",
+                "Standard Scaler.x",
+                "Log Transformer.y",
+            ],
+        }
+    )
+    pipeline.fit(X, y)
+    compiled = pipeline.compile()
+
+    np.testing.assert_allclose(compiled.predict(X), pipeline.predict(X).to_numpy())
+    with pytest.raises(ValueError, match="only available for classification"):
+        compiled.predict_proba(X)
+
+
+def test_compiled_pipeline_input_formats(mixed_data):
+    X = mixed_data
+    y = pd.Series(np.where(X["numeric"] > 0, "yes", "no"))
+    pipeline = BinaryClassificationPipeline(label_encoded_component_graph)
+    pipeline.fit(X, y)
+    compiled = pipeline.compile()
+    expected = pipeline.predict_proba(X).to_numpy()
+
+    row = X.iloc[3].to_dict()
+    np.testing.assert_allclose(compiled.predict_proba(row), expected[[3]])
+    np.testing.assert_allclose(compiled.predict_proba(X.to_dict("list")), expected)
+    np.testing.assert_allclose(
+        compiled.predict_proba(X.to_numpy(dtype=object)), expected
+    )
+    np.testing.assert_allclose(
+        compiled.predict_proba(X.iloc[3].to_numpy(dtype=object)), expected[[3]]
+    )
+
+    with pytest.raises(ValueError, match="doesn't have the column 'date'"):
+        compiled.predict(X.drop(columns="date"))
+    with pytest.raises(ValueError, match="must have 4 columns"):
+        compiled.predict(X.to_numpy(dtype=object)[:, :2])
+
+
+def test_compile_errors(mixed_data):
+    X = mixed_data
+    y = pd.Series(np.where(X["numeric"] > 0, 1, 0))
+    pipeline = BinaryClassificationPipeline(component_graph)
+    with pytest.raises(PipelineNotYetFittedError, match="before calling compile"):
+        pipeline.compile()
+
+    pipeline = BinaryClassificationPipeline(
+        [
+            "Imputer",
+            "DateTime Featurizer",
+            "One Hot Encoder",
+            "Standard Scaler",
+            "PCA Transformer",
+            "Baseline Classifier",
+        ]
+    )
+    pipeline.fit(X, y)
+    with pytest.raises(
+        ValueError,
+        match="aren't supported: PCA Transformer, Baseline Classifier",
+    ):
+        pipeline.compile()
+
+    pipeline = TimeSeriesRegressionPipeline(
+        ["Random Forest Regressor"],
+        parameters={
+            "pipeline": {
+                "time_index": "date",
+                "gap": 0,
+                "max_delay": 0,
+                "forecast_horizon": 1,
+            }
+        },
+    )
+    pipeline._is_fitted = True
+    with pytest.raises(ValueError, match="Time series pipelines"):
+        pipeline.compile()
@@ -0,0 +1,195 @@
+import pickle
+from unittest.mock import patch
+
+import cloudpickle
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from evalml.pipelines import BinaryClassificationPipeline, ComponentGraph
+from evalml.pipelines.component_cache import (
+    ComponentCache,
+    get_active_component_cache,
+)
+from evalml.pipelines.components import Imputer, OneHotEncoder
+
+
+def test_component_cache_init():
+    with pytest.raises(ValueError, match="must be a non-negative integer"):
+        ComponentCache(max_size=-1)
+    cache = ComponentCache(max_size=100)
+    assert len(cache) == 0
+    assert cache.info() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "entries": 0,
+        "size": 0,
+        "max_size": 100,
+    }
+
+
+def test_component_cache_get_put(X_y_categorical_with_nulls):
+    X, y = X_y_categorical_with_nulls
+    imputer = Imputer().fit(X, y)
+    output = imputer.transform(X, y)
+    cache = ComponentCache(max_size=10 ** 6)
+    assert cache.get("key") is None
+    cache.put("key", imputer, output)
+    component, output_x, output_y = cache.get("key")
+    assert component == imputer
+    assert component is not imputer
+    assert output_y is None
+    assert_frame_equal(output_x, output)
+    assert output_x is not output
+    assert output_x.ww.schema == output.ww.schema
+    assert cache.info()["hits"] == 1
+    assert cache.info()["misses"] == 1
+    assert cache.size > 0
+
+
+def test_component_cache_lru_eviction():
+    data = pd.DataFrame({"a": np.arange(100, dtype="float64")})
+    data.ww.init()
+    imputer = Imputer()
+    entry_size = int(data.memory_usage(index=True, deep=False).sum()) + len(
+        cloudpickle.dumps(imputer)
+    )
+    cache = ComponentCache(max_size=2 * entry_size)
+    cache.put("first", imputer, data)
+    cache.put("second", imputer, data)
+    assert cache.get("first") is not None
+    cache.put("third", imputer, data)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+    assert cache.size == 2 * entry_size
+
+    cache.put("too big", imputer, pd.concat([data] * 3))
+    assert cache.get("too big") is None
+
+    # The fitted component counts against the budget too
+    cache = ComponentCache(max_size=entry_size)
+    cache.put("fitted", Imputer().fit(data), data)
+    assert cache.get("fitted") is None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_component_cache_component_key(X_y_categorical_with_nulls):
+    key = ComponentCache.component_key(Imputer(), ["data"])
+    assert key == ComponentCache.component_key(Imputer(), ["data"])
+    assert key != ComponentCache.component_key(Imputer(), ["other data"])
+    assert key != ComponentCache.component_key(Imputer(random_seed=1), ["data"])
+    assert key != ComponentCache.component_key(
+        Imputer(numeric_impute_strategy="median"), ["data"]
+    )
+    assert key != ComponentCache.component_key(OneHotEncoder(), ["data"])
+    assert ComponentCache.component_key(Imputer(), [None]) is None
+
+
+def test_component_cache_data_key(X_y_categorical_with_nulls):
+    X, y = X_y_categorical_with_nulls
+    cache = ComponentCache(max_size=100)
+    key = cache.data_key(X, y, fold=0)
+    assert key == cache.data_key(X, y, fold=0)
+    assert key == cache.data_key(X.copy(), y.copy(), fold=0)
+    assert key != cache.data_key(X, y, fold=1)
+    assert key != cache.data_key(X.iloc[1:], y.iloc[1:], fold=0)
+
+    # Data with the same index and shape but different values has a different key
+    other_X = X.copy()
+    other_X["num"] = other_X["num"] * 2
+    assert key != cache.data_key(other_X, y, fold=0)
+    assert key != cache.data_key(X, 1 - y, fold=0)
+
+
+def test_component_cache_activate():
+    cache = ComponentCache(max_size=100)
+    assert get_active_component_cache() == (None, None)
+    with cache.activate(fold=2) as active:
+        assert active is cache
+        assert get_active_component_cache() == (cache, 2)
+    assert get_active_component_cache() == (None, None)
+
+
+def test_component_cache_pickle(X_y_categorical_with_nulls):
+    X, y = X_y_categorical_with_nulls
+    cache = ComponentCache(max_size=10 ** 6)
+    cache.put("key", Imputer().fit(X, y), X)
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert len(unpickled) == 0
+    assert unpickled.max_size == cache.max_size
+    unpickled.put("key", Imputer(), X)
+    assert len(unpickled) == 1
+
+
+def test_component_graph_uses_active_cache(X_y_categorical_with_nulls):
+    X, y = X_y_categorical_with_nulls
+    component_dict = {
+        "Imputer": ["Imputer", "X", "y"],
+        "One Hot Encoder": ["One Hot Encoder", "Imputer.x", "y"],
+        "Logistic Regression": [
+            "Logistic Regression Classifier",
+            "One Hot Encoder.x",
+            "y",
+        ],
+    }
+    cache = ComponentCache(max_size=10 ** 7)
+    with cache.activate(fold=0):
+        first = ComponentGraph(component_dict).instantiate().fit(X, y)
+    assert cache.info()["misses"] == 2
+    assert len(cache) == 2
+
+    with patch.object(Imputer, "fit_transform") as mock_imputer_fit_transform:
+        with patch.object(OneHotEncoder, "fit_transform") as mock_ohe_fit_transform:
+            with cache.activate(fold=0):
+                second = ComponentGraph(component_dict).instantiate().fit(X, y)
+    mock_imputer_fit_transform.assert_not_called()
+    mock_ohe_fit_transform.assert_not_called()
+    assert cache.info()["hits"] == 2
+    assert second.get_component("Imputer") is not first.get_component("Imputer")
+    assert_frame_equal(
+        first.transform_all_but_final(X), second.transform_all_but_final(X)
+    )
+    np.testing.assert_allclose(
+        first.predict(X).to_numpy(dtype="int"), second.predict(X).to_numpy(dtype="int")
+    )
+
+    # Different upstream parameters invalidate the downstream entries too
+    with cache.activate(fold=0):
+        ComponentGraph(component_dict).instantiate(
+            {"Imputer": {"numeric_impute_strategy": "median"}}
+        ).fit(X, y)
+    assert cache.info()["misses"] == 4
+
+    # Other folds do not share entries
+    with cache.activate(fold=1):
+        ComponentGraph(component_dict).instantiate().fit(X, y)
+    assert cache.info()["misses"] == 6
+
+    # The cache is not used outside of an active context or when not fitting
+    ComponentGraph(component_dict).instantiate().fit(X, y)
+    with cache.activate(fold=1):
+        first.transform_all_but_final(X)
+    assert cache.info()["misses"] == 6
+    assert cache.info()["hits"] == 2
+
+
+def test_pipeline_fit_with_cache_matches_fit_without_cache(X_y_categorical_with_nulls):
+    X, y = X_y_categorical_with_nulls
+    component_graph = ["Imputer", "One Hot Encoder", "Random Forest Classifier"]
+    cache = ComponentCache(max_size=10 ** 8)
+    pipeline = BinaryClassificationPipeline(component_graph)
+    expected = pipeline.clone().fit(X, y).predict_proba(X)
+    with cache.activate(fold=0):
+        pipeline.clone().fit(X, y)
+    with cache.activate(fold=0):
+        cached_pipeline = pipeline.clone().fit(X, y)
+    assert cache.hits == 2
+    assert_frame_equal(expected, cached_pipeline.predict_proba(X))
@@ -6,6 +6,7 @@ from unittest.mock import patch
 import numpy as np
 import pandas as pd
 import pytest
+import woodwork as ww
 from pandas.testing import (
     assert_frame_equal,
     assert_index_equal,
@@ -36,7 +37,7 @@ from evalml.pipelines.components import (
     Undersampler,
 )
 from evalml.problem_types import is_classification
-from evalml.utils import infer_feature_types
+from evalml.utils import _to_sparse_matrix, infer_feature_types
 
 
 class DummyTransformer(Transformer):
@@ -1634,6 +1635,7 @@ def test_describe_component_graph(return_dict, example_graph, caplog):
                 "drop": "if_binary",
                 "handle_unknown": "ignore",
                 "handle_missing": "error",
+                "sparse_output": False,
             },
         },
         "Random Forest Classifier": {
@@ -2480,3 +2482,109 @@ def test_fit_transform_different_types(X_y_binary):
         ValueError, match="Input X data types are different from the input types"
     ):
         component_graph.transform(X2)
+
+
+@pytest.mark.parametrize(
+    "estimator,supports_sparse",
+    [
+        ("Logistic Regression Classifier", True),
+        ("LightGBM Classifier", True),
+        ("Random Forest Classifier", False),
+    ],
+)
+def test_component_graph_sparse_one_hot_encoding(
+    estimator, supports_sparse, X_y_categorical_classification
+):
+    X, y = X_y_categorical_classification
+    X = X[["Pclass", "Sex", "SibSp", "Parch", "Fare", "Embarked"]].fillna("S")
+    X.ww.init(logical_types={"Pclass": "categorical", "SibSp": "categorical"})
+    graphs = {}
+    for sparse_output in [False, True]:
+        graphs[sparse_output] = ComponentGraph(
+            {
+                "One Hot Encoder": ["One Hot Encoder", "X", "y"],
+                estimator: [estimator, "One Hot Encoder.x", "y"],
+            }
+        ).instantiate(
+            {"One Hot Encoder": {"top_n": None, "sparse_output": sparse_output}}
+        )
+
+    graphs[False].fit(X, y)
+    with patch(
+        "evalml.pipelines.components.estimators.estimator._to_sparse_matrix",
+        wraps=_to_sparse_matrix,
+    ) as mock_to_sparse_matrix:
+        graphs[True].fit(X, y)
+        assert mock_to_sparse_matrix.called == supports_sparse
+
+    X_t = graphs[True].transform_all_but_final(X, y)
+    assert "SparseBoolean" in set(map(str, X_t.ww.logical_types.values()))
+    assert_series_equal(
+        graphs[True].predict(X), graphs[False].predict(X), check_names=False
+    )
+
+
+def test_component_graph_trusts_component_schemas(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    X.ww.init()
+    component_graph = ComponentGraph(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "Standard Scaler": ["Standard Scaler", "Imputer.x", "y"],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "Standard Scaler.x",
+                "y",
+            ],
+        }
+    ).instantiate()
+    with patch(
+        "evalml.utils.woodwork_utils.ww.is_schema_valid",
+        wraps=ww.is_schema_valid,
+    ) as mock_is_schema_valid:
+        component_graph.fit(X, y)
+        # Only the input of the graph is validated, not the data passed between components
+        assert mock_is_schema_valid.call_count == 2
+        mock_is_schema_valid.reset_mock()
+        component_graph.predict(X)
+        assert mock_is_schema_valid.call_count == 1
+
+
+def test_component_graph_passes_single_consumer_outputs_without_copy(X_y_binary):
+    X, y = X_y_binary
+    X = pd.DataFrame(X)
+    X.ww.init()
+    component_graph = ComponentGraph(
+        {
+            "Imputer": ["Imputer", "X", "y"],
+            "Standard Scaler": ["Standard Scaler", "Imputer.x", "y"],
+            "Logistic Regression Classifier": [
+                "Logistic Regression Classifier",
+                "Standard Scaler.x",
+                "y",
+            ],
+            "Random Forest Classifier": [
+                "Random Forest Classifier",
+                "Standard Scaler.x",
+                "y",
+            ],
+            "Final Estimator": [
+                "Logistic Regression Classifier",
+                "Logistic Regression Classifier.x",
+                "Random Forest Classifier.x",
+                "y",
+            ],
+        }
+    ).instantiate()
+    with patch(
+        "evalml.pipelines.component_graph.ww.concat_columns",
+        wraps=ww.concat_columns,
+    ) as mock_concat_columns:
+        component_graph.fit(X, y)
+        # The input of the graph is copied for the imputer, the output of the scaler for both estimators,
+        # and the predictions of the estimators are concatenated for the final estimator
+        assert mock_concat_columns.call_count == 4
+    assert component_graph._has_single_consumer("Imputer.x")
+    assert not component_graph._has_single_consumer("Standard Scaler.x")
+    assert not component_graph._has_single_consumer("X")
@@ -0,0 +1,124 @@
+import pickle
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from evalml.pipelines import BinaryClassificationPipeline, ComponentGraph
+from evalml.pipelines.component_profiler import (
+    ComponentProfiler,
+    get_active_component_profiler,
+)
+
+
+def test_component_profiler_activate():
+    profiler = ComponentProfiler()
+    assert get_active_component_profiler() == (None, None)
+    assert not tracemalloc.is_tracing()
+    with profiler.activate(fold=2) as active:
+        assert active is profiler
+        assert get_active_component_profiler() == (profiler, 2)
+        assert tracemalloc.is_tracing()
+        with ComponentProfiler().activate(fold=3):
+            assert tracemalloc.is_tracing()
+        assert tracemalloc.is_tracing()
+    assert get_active_component_profiler() == (None, None)
+    assert not tracemalloc.is_tracing()
+
+    # Tracing started elsewhere is left running
+    tracemalloc.start()
+    try:
+        with profiler.activate():
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_component_profiler_records_components(X_y_categorical_with_nulls):
+    X, y = X_y_categorical_with_nulls
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Logistic Regression Classifier"]
+    )
+    profiler = ComponentProfiler()
+    with profiler.activate(fold=1):
+        pipeline.fit(X, y)
+        pipeline.predict_proba(X)
+
+    assert [(r["component"], r["method"]) for r in profiler.records] == [
+        ("Imputer", "fit_transform"),
+        ("One Hot Encoder", "fit_transform"),
+        ("Logistic Regression Classifier", "fit"),
+        ("Imputer", "transform"),
+        ("One Hot Encoder", "transform"),
+        ("Logistic Regression Classifier", "predict_proba"),
+    ]
+    assert all(record["fold"] == 1 for record in profiler.records)
+    assert all(record["seconds"] >= 0 for record in profiler.records)
+    assert all(isinstance(record["memory_delta"], int) for record in profiler.records)
+    ohe_record = profiler.records[1]
+    assert ohe_record["input_shape"] == (30, 2)
+    assert ohe_record["output_shape"] == (30, 4)
+    assert profiler.records[2]["output_shape"] is None
+    assert profiler.records[-1]["output_shape"] == (30, 2)
+
+    summary = ComponentProfiler.summarize(profiler.records)
+    assert list(summary.columns) == [
+        "component",
+        "method",
+        "seconds",
+        "calls",
+        "memory_delta",
+    ]
+    assert list(summary["component"]) == [
+        "Imputer",
+        "One Hot Encoder",
+        "Logistic Regression Classifier",
+        "Imputer",
+        "One Hot Encoder",
+        "Logistic Regression Classifier",
+    ]
+    assert (summary["calls"] == 1).all()
+
+    # Nothing is recorded once the profiler is no longer active
+    pipeline.predict(X)
+    assert len(profiler.records) == 6
+
+
+def test_component_profiler_summarize_empty():
+    summary = ComponentProfiler.summarize([])
+    assert summary.empty
+    assert list(summary.columns) == [
+        "component",
+        "method",
+        "seconds",
+        "calls",
+        "memory_delta",
+    ]
+
+
+def test_component_profiler_memory_delta():
+    random_state = np.random.RandomState(0)
+    X = pd.DataFrame({"cat": random_state.choice(list("abcdefghijklmnopqrst"), 20000)})
+    X.ww.init(logical_types={"cat": "categorical"})
+    y = pd.Series(random_state.randint(2, size=20000))
+    graph = ComponentGraph({"One Hot Encoder": ["One Hot Encoder", "X", "y"]})
+    graph.instantiate({"One Hot Encoder": {"top_n": None}})
+    profiler = ComponentProfiler()
+    with profiler.activate():
+        graph.fit(X, y)
+    X_encoded = graph.transform(X)
+    # The output of the encoder is allocated during the call and still held afterwards
+    output_size = int(X_encoded.memory_usage(index=False).sum())
+    assert profiler.records[0]["memory_delta"] >= output_size
+
+
+def test_component_profiler_pickle(X_y_categorical_with_nulls):
+    X, y = X_y_categorical_with_nulls
+    profiler = ComponentProfiler()
+    profiler.record("Imputer", "transform", 0, profiler.start(), X, X)
+    assert profiler.records[0]["memory_delta"] == 0
+    unpickled = pickle.loads(pickle.dumps(profiler))
+    assert unpickled.records == profiler.records
+    unpickled.record("Imputer", "transform", 0, unpickled.start(), X, X)
+    assert len(unpickled.records) == 2
@@ -313,6 +313,7 @@ def test_describe_pipeline(
                         "drop": "if_binary",
                         "handle_unknown": "ignore",
                         "handle_missing": "error",
+                        "sparse_output": False,
                     },
                 },
                 "Standard Scaler": {"name": "Standard Scaler", "parameters": {}},
@@ -354,6 +355,7 @@ def test_describe_pipeline(
                         "drop": "if_binary",
                         "handle_unknown": "ignore",
                         "handle_missing": "error",
+                        "sparse_output": False,
                     },
                 },
                 "Elastic Net Classifier": {
@@ -442,6 +444,7 @@ def test_parameters(logistic_regression_binary_pipeline):
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Logistic Regression Classifier": {
             "penalty": "l2",
@@ -480,6 +483,7 @@ def test_parameters_nonlinear(nonlinear_binary_pipeline):
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "OneHot_ElasticNet": {
             "top_n": 10,
@@ -488,6 +492,7 @@ def test_parameters_nonlinear(nonlinear_binary_pipeline):
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Random Forest": {"max_depth": 6, "n_estimators": 100, "n_jobs": -1},
         "Elastic Net": {
@@ -1246,6 +1251,7 @@ def test_get_default_parameters(logistic_regression_binary_pipeline):
             "drop": "if_binary",
             "handle_unknown": "ignore",
             "handle_missing": "error",
+            "sparse_output": False,
         },
         "Logistic Regression Classifier": {
             "penalty": "l2",
@@ -1861,8 +1867,8 @@ def test_nonlinear_pipeline_repr(pipeline_class):
     expected_repr = (
         f"pipeline = {pipeline_class.__name__}(component_graph={component_graph_str}, "
         "parameters={'Imputer':{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': None, 'numeric_fill_value': None}, "
-        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
-        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
+        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
+        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
         "'Estimator':{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}}, custom_name='Mock Pipeline', random_seed=0)"
     )
     assert repr(pipeline) == expected_repr
@@ -1875,8 +1881,8 @@ def test_nonlinear_pipeline_repr(pipeline_class):
     expected_repr = (
         f"pipeline = {pipeline_class.__name__}(component_graph={component_graph_str}, "
         "parameters={'Imputer':{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': None, 'numeric_fill_value': 42}, "
-        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
-        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
+        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
+        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
         "'Estimator':{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}}, custom_name='Mock Pipeline', random_seed=0)"
     )
     assert repr(pipeline_with_parameters) == expected_repr
@@ -1894,8 +1900,8 @@ def test_nonlinear_pipeline_repr(pipeline_class):
     expected_repr = (
         f"pipeline = {pipeline_class.__name__}(component_graph={component_graph_str}, "
         "parameters={'Imputer':{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': float('inf'), 'numeric_fill_value': float('inf')}, "
-        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
-        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
+        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
+        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
         "'Estimator':{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}}, custom_name='Mock Pipeline', random_seed=0)"
     )
     assert repr(pipeline_with_inf_parameters) == expected_repr
@@ -1913,8 +1919,8 @@ def test_nonlinear_pipeline_repr(pipeline_class):
     expected_repr = (
         f"pipeline = {pipeline_class.__name__}(component_graph={component_graph_str}, "
         "parameters={'Imputer':{'categorical_impute_strategy': 'most_frequent', 'numeric_impute_strategy': 'mean', 'categorical_fill_value': np.nan, 'numeric_fill_value': np.nan}, "
-        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
-        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error'}, "
+        "'OHE_1':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
+        "'OHE_2':{'top_n': 10, 'features_to_encode': None, 'categories': None, 'drop': 'if_binary', 'handle_unknown': 'ignore', 'handle_missing': 'error', 'sparse_output': False}, "
         "'Estimator':{'n_estimators': 100, 'max_depth': 6, 'n_jobs': -1}}, custom_name='Mock Pipeline', random_seed=0)"
     )
     assert repr(pipeline_with_nan_parameters) == expected_repr
@@ -2869,3 +2875,37 @@ def test_fit_predict_proba_types(problem_type, X_y_binary, X_y_multi):
         ValueError, match="Input X data types are different from the input types"
     ):
         pipeline.predict_proba(X2)
+
+
+@pytest.mark.parametrize("threshold", [None, 0.7])
+@pytest.mark.parametrize(
+    "problem_type",
+    [ProblemTypes.BINARY, ProblemTypes.MULTICLASS, ProblemTypes.REGRESSION],
+)
+def test_predict_from_features_matches_predict(
+    problem_type, threshold, X_y_based_on_pipeline_or_problem_type
+):
+    if threshold is not None and problem_type != ProblemTypes.BINARY:
+        pytest.skip("Only binary pipelines have a threshold")
+    X, y = X_y_based_on_pipeline_or_problem_type(problem_type)
+    X = infer_feature_types(X)
+    estimator = (
+        "Random Forest Regressor"
+        if problem_type == ProblemTypes.REGRESSION
+        else "Random Forest Classifier"
+    )
+    pipeline = _get_pipeline_base_class(problem_type)(["Imputer", estimator])
+    pipeline.fit(X, y)
+    if threshold is not None:
+        pipeline.threshold = threshold
+
+    features = pipeline.transform_all_but_final(X)
+    if is_classification(problem_type):
+        y_pred_proba = pipeline._predict_proba_from_features(features)
+        assert_frame_equal(y_pred_proba, pipeline.predict_proba(X))
+        predictions = pipeline._predict_from_features(
+            features, y_pred_proba=y_pred_proba
+        )
+    else:
+        predictions = pipeline._predict_from_features(features)
+    pd.testing.assert_series_equal(predictions, pipeline.predict(X))
@@ -0,0 +1,192 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    TimeSeriesBinaryClassificationPipeline,
+    TimeSeriesForecaster,
+    TimeSeriesRegressionPipeline,
+)
+from evalml.pipelines.components import Imputer, TimeSeriesFeaturizer
+
+
+def make_ts_pipeline(pipeline_class, estimator_name, gap):
+    component_graph = {
+        "Time Series Featurizer": ["Time Series Featurizer", "X", "y"],
+        "DateTime Featurizer": [
+            "DateTime Featurizer",
+            "Time Series Featurizer.x",
+            "y",
+        ],
+        "Drop NaN Rows Transformer": [
+            "Drop NaN Rows Transformer",
+            "DateTime Featurizer.x",
+            "y",
+        ],
+        estimator_name: [
+            estimator_name,
+            "Drop NaN Rows Transformer.x",
+            "Drop NaN Rows Transformer.y",
+        ],
+    }
+    pipeline_parameters = {
+        "time_index": "date",
+        "gap": gap,
+        "max_delay": 3,
+        "forecast_horizon": 2,
+    }
+    parameters = {
+        "pipeline": pipeline_parameters,
+        "Time Series Featurizer": {
+            **pipeline_parameters,
+            "conf_level": 1.0,
+            "rolling_window_size": 1.0,
+        },
+        estimator_name: {"n_jobs": 1},
+    }
+    return pipeline_class(component_graph=component_graph, parameters=parameters)
+
+
+@pytest.mark.parametrize("gap", [0, 1])
+def test_forecaster_matches_predict_with_training_data(gap, ts_data):
+    X, y = ts_data
+    X["date"] = X.index
+    pipeline = make_ts_pipeline(
+        TimeSeriesRegressionPipeline, "Random Forest Regressor", gap
+    )
+    pipeline.fit(X.iloc[:20], y.iloc[:20])
+
+    forecaster = TimeSeriesForecaster(pipeline, X.iloc[:20], y.iloc[:20])
+    X_history, y_history = forecaster.history
+    assert forecaster.history_size == 3 + gap + 2
+    assert_series_equal(y_history, y.iloc[20 - forecaster.history_size : 20])
+
+    for n_observed in [20, 22, 25]:
+        X_future = X.iloc[n_observed + gap : n_observed + gap + 2]
+        expected = pipeline.predict(
+            X_future.copy(), X_train=X.iloc[:n_observed], y_train=y.iloc[:n_observed]
+        )
+        assert_series_equal(forecaster.forecast(X_future.copy()), expected)
+        next_observed = {20: 22, 22: 25, 25: 25}[n_observed]
+        forecaster.update(
+            X.iloc[n_observed:next_observed], y.iloc[n_observed:next_observed]
+        )
+
+    X_history, y_history = forecaster.history
+    assert len(X_history) == forecaster.history_size
+    assert_series_equal(y_history, y.iloc[25 - forecaster.history_size : 25])
+    assert X_history.ww.schema is not None
+
+
+@pytest.mark.parametrize("gap", [0, 1])
+def test_forecaster_does_not_featurize_history(gap, ts_data):
+    X, y = ts_data
+    X["date"] = X.index
+    X["with_nulls"] = np.where(np.arange(len(X)) % 4 == 2, np.nan, np.arange(len(X)))
+    X["category"] = pd.Series(["a", "b", "c"] * 11).iloc[: len(X)].to_numpy()
+    X.ww.init(logical_types={"category": "Categorical"})
+    component_graph = {
+        "Imputer": ["Imputer", "X", "y"],
+        "Time Series Featurizer": ["Time Series Featurizer", "Imputer.x", "y"],
+        "DateTime Featurizer": [
+            "DateTime Featurizer",
+            "Time Series Featurizer.x",
+            "y",
+        ],
+        "One Hot Encoder": ["One Hot Encoder", "DateTime Featurizer.x", "y"],
+        "Drop NaN Rows Transformer": [
+            "Drop NaN Rows Transformer",
+            "One Hot Encoder.x",
+            "y",
+        ],
+        "Random Forest Regressor": [
+            "Random Forest Regressor",
+            "Drop NaN Rows Transformer.x",
+            "Drop NaN Rows Transformer.y",
+        ],
+    }
+    pipeline_parameters = {
+        "time_index": "date",
+        "gap": gap,
+        "max_delay": 3,
+        "forecast_horizon": 2,
+    }
+    pipeline = TimeSeriesRegressionPipeline(
+        component_graph,
+        parameters={
+            "pipeline": pipeline_parameters,
+            "Time Series Featurizer": {**pipeline_parameters, "conf_level": 1.0},
+            "Random Forest Regressor": {"n_jobs": 1},
+        },
+    )
+    pipeline.fit(X.ww.iloc[:20], y.iloc[:20])
+    forecaster = TimeSeriesForecaster(pipeline, X.ww.iloc[:20], y.iloc[:20])
+    forecaster.update(X.ww.iloc[20:22], y.iloc[20:22])
+    X_future = X.ww.iloc[22 + gap : 24 + gap]
+    expected = pipeline.predict(
+        X_future.ww.copy(), X_train=X.ww.iloc[:22], y_train=y.iloc[:22]
+    )
+
+    imputer_transform = Imputer.transform
+    transformed_lengths = []
+
+    def record_imputer_transform(self, X, y=None):
+        transformed_lengths.append(len(X))
+        return imputer_transform(self, X, y)
+
+    with patch.object(
+        Imputer, "transform", autospec=True, side_effect=record_imputer_transform
+    ), patch.object(TimeSeriesFeaturizer, "transform") as mock_featurizer_transform:
+        forecast = forecaster.forecast(X_future.ww.copy())
+    mock_featurizer_transform.assert_not_called()
+    assert transformed_lengths == [2]
+    assert_series_equal(forecast, expected)
+
+
+def test_forecaster_forecast_proba(ts_data_binary):
+    X, y = ts_data_binary
+    X["date"] = X.index
+    pipeline = make_ts_pipeline(
+        TimeSeriesBinaryClassificationPipeline, "Random Forest Classifier", 0
+    )
+    pipeline.fit(X.iloc[:20], y.iloc[:20])
+    forecaster = TimeSeriesForecaster(pipeline, X.iloc[:20], y.iloc[:20])
+    X_future = X.iloc[20:22]
+    assert_frame_equal(
+        forecaster.forecast_proba(X_future.copy()),
+        pipeline.predict_proba(
+            X_future.copy(), X_train=X.iloc[:20], y_train=y.iloc[:20]
+        ),
+    )
+
+
+def test_forecaster_raises_errors(ts_data, X_y_binary):
+    X, y = ts_data
+    X["date"] = X.index
+    pipeline = make_ts_pipeline(
+        TimeSeriesRegressionPipeline, "Random Forest Regressor", 0
+    )
+    with pytest.raises(PipelineNotYetFittedError, match="must be fitted"):
+        TimeSeriesForecaster(pipeline, X, y)
+
+    pipeline.fit(X, y)
+    with pytest.raises(ValueError, match="same length"):
+        TimeSeriesForecaster(pipeline, X, y.iloc[:-1])
+    forecaster = TimeSeriesForecaster(pipeline, X, y)
+    with pytest.raises(ValueError, match="same length"):
+        forecaster.update(X.iloc[:2], y.iloc[:1])
+    with pytest.raises(
+        ValueError, match="only available for time series classification"
+    ):
+        forecaster.forecast_proba(X.iloc[:1])
+
+    X_binary, y_binary = X_y_binary
+    binary_pipeline = BinaryClassificationPipeline(["Logistic Regression Classifier"])
+    binary_pipeline.fit(X_binary, y_binary)
+    with pytest.raises(ValueError, match="requires a time series pipeline"):
+        TimeSeriesForecaster(binary_pipeline, X_binary, y_binary)
@@ -1584,3 +1584,80 @@ def test_time_index_cannot_be_none(time_series_regression_pipeline_class):
                 }
             }
         )
+
+
+@pytest.mark.parametrize(
+    "pipeline_class,estimator_name,threshold",
+    [
+        (TimeSeriesRegressionPipeline, "Random Forest Regressor", None),
+        (TimeSeriesBinaryClassificationPipeline, "Random Forest Classifier", None),
+        (TimeSeriesBinaryClassificationPipeline, "Random Forest Classifier", 0.7),
+        (TimeSeriesMulticlassClassificationPipeline, "Random Forest Classifier", None),
+    ],
+)
+def test_predict_from_features_matches_predict_in_sample(
+    pipeline_class, estimator_name, threshold, ts_data
+):
+    X, y = ts_data
+    if pipeline_class == TimeSeriesBinaryClassificationPipeline:
+        y = y % 2
+    elif pipeline_class == TimeSeriesMulticlassClassificationPipeline:
+        y = y % 3
+    pipeline = pipeline_class(
+        component_graph={
+            "Time Series Featurizer": ["Time Series Featurizer", "X", "y"],
+            "DateTime Featurizer": [
+                "DateTime Featurizer",
+                "Time Series Featurizer.x",
+                "y",
+            ],
+            "Drop NaN Rows Transformer": [
+                "Drop NaN Rows Transformer",
+                "DateTime Featurizer.x",
+                "y",
+            ],
+            estimator_name: [
+                estimator_name,
+                "Drop NaN Rows Transformer.x",
+                "Drop NaN Rows Transformer.y",
+            ],
+        },
+        parameters={
+            "pipeline": {
+                "time_index": "date",
+                "gap": 1,
+                "max_delay": 2,
+                "forecast_horizon": 1,
+            },
+            "Time Series Featurizer": {
+                "time_index": "date",
+                "gap": 1,
+                "max_delay": 2,
+                "forecast_horizon": 1,
+            },
+            estimator_name: {"n_jobs": 1},
+        },
+    )
+    X_train, y_train = X.iloc[:20], y.iloc[:20]
+    X_holdout, y_holdout = X.iloc[20:], y.iloc[20:]
+    pipeline.fit(X_train, y_train)
+    if threshold is not None:
+        pipeline.threshold = threshold
+
+    features = pipeline.transform_all_but_final(X_holdout, y_holdout, X_train, y_train)
+    y_pred_proba = None
+    if is_classification(pipeline.problem_type):
+        y_pred_proba = pipeline._predict_proba_from_features(features, y_holdout)
+        assert_frame_equal(
+            y_pred_proba,
+            pipeline.predict_proba_in_sample(X_holdout, y_holdout, X_train, y_train),
+        )
+        predictions = pipeline._predict_from_features(
+            features, y_holdout, y_pred_proba=y_pred_proba
+        )
+    else:
+        predictions = pipeline._predict_from_features(features, y_holdout)
+    assert_series_equal(
+        predictions,
+        pipeline.predict_in_sample(X_holdout, y_holdout, X_train, y_train),
+    )
@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from evalml.__main__ import cli
+from evalml.exceptions import PipelineNotYetFittedError
+from evalml.pipelines import (
+    BinaryClassificationPipeline,
+    RegressionPipeline,
+    TimeSeriesRegressionPipeline,
+)
+from evalml.utils import read_chunks, score_file
+
+
+@pytest.fixture
+def scoring_data():
+    random_state = np.random.RandomState(0)
+    n_rows = 250
+    X = pd.DataFrame(
+        {
+            "id": np.arange(n_rows) + 1000,
+            "numeric": random_state.normal(size=n_rows),
+            "with_nulls": np.where(
+                random_state.rand(n_rows) < 0.2, np.nan, random_state.rand(n_rows)
+            ),
+            "category": random_state.choice(["a", "b", "c"], n_rows),
+        }
+    )
+    y = pd.Series(np.where(X["numeric"] > 0, "yes", "no"))
+    return X, y
+
+
+@pytest.fixture
+def saved_binary_pipeline(scoring_data, tmp_path):
+    X, y = scoring_data
+    X = X.drop(columns="id")
+    X.ww.init(logical_types={"category": "Categorical"})
+    pipeline = BinaryClassificationPipeline(
+        ["Imputer", "One Hot Encoder", "Random Forest Classifier"]
+    )
+    pipeline.fit(X, y)
+    pipeline.threshold = 0.6
+    pipeline_path = str(tmp_path / "pipeline.pkl")
+    pipeline.save(pipeline_path)
+    return pipeline, pipeline_path
+
+
+def test_read_chunks(scoring_data, tmp_path):
+    X, _ = scoring_data
+    input_path = str(tmp_path / "input.csv")
+    X.to_csv(input_path, index=False)
+
+    chunks = list(read_chunks(input_path, chunk_size=100))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    pd.testing.assert_frame_equal(pd.concat(chunks), X)
+
+    chunks = list(read_chunks(input_path, chunk_size=100, columns=["category", "id"]))
+    assert list(chunks[0].columns) == ["category", "id"]
+    assert list(chunks[2].index) == list(range(200, 250))
+
+    with pytest.raises(ValueError, match="doesn't have these columns: other"):
+        list(read_chunks(input_path, columns=["id", "other"]))
+    with pytest.raises(ValueError, match="Can't infer the format"):
+        list(read_chunks(str(tmp_path / "input.json")))
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_score_file_binary(n_jobs, scoring_data, saved_binary_pipeline, tmp_path):
+    X, _ = scoring_data
+    pipeline, pipeline_path = saved_binary_pipeline
+    input_path = str(tmp_path / "input.csv")
+    output_path = str(tmp_path / "predictions.csv")
+    X.to_csv(input_path, index=False)
+
+    n_rows = score_file(
+        pipeline_path,
+        input_path,
+        output_path,
+        chunk_size=60,
+        n_jobs=n_jobs,
+        include_columns=["id"],
+    )
+    assert n_rows == len(X)
+
+    output = pd.read_csv(output_path)
+    assert list(output.columns) == [
+        "id",
+        "prediction",
+        "probability_no",
+        "probability_yes",
+    ]
+    X_pipeline = X.drop(columns="id")
+    X_pipeline.ww.init(logical_types={"category": "Categorical"})
+    np.testing.assert_array_equal(output["id"], X["id"])
+    np.testing.assert_array_equal(
+        output["prediction"], pipeline.predict(X_pipeline).to_numpy()
+    )
+    np.testing.assert_allclose(
+        output[["probability_no", "probability_yes"]],
+        pipeline.predict_proba(X_pipeline),
+    )
+
+
+def test_score_file_regression(scoring_data, tmp_path):
+    X, _ = scoring_data
+    X = X.drop(columns="category")
+    y = X["numeric"] * 2 + 1
+    pipeline = RegressionPipeline(["Imputer", "Linear Regressor"])
+    pipeline.fit(X[["numeric", "with_nulls"]], y)
+    pipeline_path = str(tmp_path / "pipeline.pkl")
+    pipeline.save(pipeline_path)
+    input_path = str(tmp_path / "input.csv")
+    output_path = str(tmp_path / "predictions.csv")
+    X.to_csv(input_path, index=False)
+
+    score_file(pipeline_path, input_path, output_path, chunk_size=100, n_jobs=1)
+    output = pd.read_csv(output_path)
+    assert list(output.columns) == ["prediction"]
+    np.testing.assert_allclose(
+        output["prediction"], pipeline.predict(X[["numeric", "with_nulls"]])
+    )
+
+
+@pytest.mark.noncore_dependency
+def test_score_file_parquet(scoring_data, saved_binary_pipeline, tmp_path):
+    X, _ = scoring_data
+    pipeline, pipeline_path = saved_binary_pipeline
+    input_path = str(tmp_path / "input.parquet")
+    output_path = str(tmp_path / "predictions.parquet")
+    X.to_parquet(input_path, row_group_size=80)
+
+    score_file(pipeline_path, input_path, output_path, chunk_size=70, n_jobs=1)
+    output = pd.read_parquet(output_path)
+    X_pipeline = X.drop(columns="id")
+    X_pipeline.ww.init(logical_types={"category": "Categorical"})
+    np.testing.assert_array_equal(
+        output["prediction"], pipeline.predict(X_pipeline).to_numpy()
+    )
+    np.testing.assert_allclose(
+        output[["probability_no", "probability_yes"]],
+        pipeline.predict_proba(X_pipeline),
+    )
+
+
+def test_score_file_errors(scoring_data, tmp_path):
+    X, y = scoring_data
+    input_path = str(tmp_path / "input.csv")
+    output_path = str(tmp_path / "predictions.csv")
+    X.to_csv(input_path, index=False)
+    pipeline_path = str(tmp_path / "pipeline.pkl")
+
+    BinaryClassificationPipeline(["Random Forest Classifier"]).save(pipeline_path)
+    with pytest.raises(PipelineNotYetFittedError, match="before calling score_file"):
+        score_file(pipeline_path, input_path, output_path)
+
+    pipeline = BinaryClassificationPipeline(["Random Forest Classifier"])
+    pipeline.fit(X[["numeric"]].rename(columns={"numeric": "other"}), y)
+    pipeline.save(pipeline_path)
+    with pytest.raises(ValueError, match="doesn't have these columns: other"):
+        score_file(pipeline_path, input_path, output_path)
+
+    pipeline = TimeSeriesRegressionPipeline(
+        ["Random Forest Regressor"],
+        parameters={
+            "pipeline": {
+                "time_index": "date",
+                "gap": 0,
+                "max_delay": 0,
+                "forecast_horizon": 1,
+            }
+        },
+    )
+    pipeline._is_fitted = True
+    pipeline.save(pipeline_path)
+    with pytest.raises(ValueError, match="Time series pipelines"):
+        score_file(pipeline_path, input_path, output_path)
+
+
+def test_score_cli_cmd(scoring_data, saved_binary_pipeline, tmp_path, caplog):
+    X, _ = scoring_data
+    pipeline, pipeline_path = saved_binary_pipeline
+    input_path = str(tmp_path / "input.csv")
+    output_path = str(tmp_path / "predictions.csv")
+    X.to_csv(input_path, index=False)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "score",
+            pipeline_path,
+            input_path,
+            output_path,
+            "--chunk-size",
+            "100",
+            "--n-jobs",
+            "1",
+            "--include-column",
+            "id",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Scored 100 rows" in caplog.text
+    assert "rows per second" in caplog.text
+    assert f"Wrote the predictions of 250 rows to {output_path}" in caplog.text
+    output = pd.read_csv(output_path)
+    assert list(output.columns[:2]) == ["id", "prediction"]
+    assert len(output) == len(X)
@@ -1,6 +1,7 @@
 import inspect
 import os
 import warnings
+from contextvars import ContextVar
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -13,6 +14,7 @@ from evalml.pipelines.components import ComponentBase
 from evalml.utils.gen_utils import (
     SEED_BOUNDS,
     _rename_column_names_to_numeric,
+    _set_context_var,
     are_datasets_separated_by_gap_time_index,
     are_ts_parameters_valid_for_split,
     classproperty,
@@ -852,3 +854,20 @@ def test_year_start_separated_by_gap():
     assert are_datasets_separated_by_gap_time_index(
         train, test, {"time_index": "time_index", "gap": 2}
     )
+
+
+def test_set_context_var():
+    context_var = ContextVar("test_context_var", default=None)
+    with _set_context_var(context_var, 1) as result:
+        assert result is None
+        assert context_var.get() == 1
+        with _set_context_var(context_var, 2, result="result") as result:
+            assert result == "result"
+            assert context_var.get() == 2
+        assert context_var.get() == 1
+    assert context_var.get() is None
+
+    with pytest.raises(ValueError):
+        with _set_context_var(context_var, 1):
+            raise ValueError()
+    assert context_var.get() is None
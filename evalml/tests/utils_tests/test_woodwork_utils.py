@@ -7,8 +7,16 @@ import woodwork as ww
 from woodwork.logical_types import URL, Categorical, Double, Integer, Unknown
 
 from evalml.utils import (
+    SparseBoolean,
+    _can_convert_to_sparse_matrix,
+    _concat_columns_without_copy,
     _convert_numeric_dataset_pandas,
+    _densify_sparse_columns,
+    _get_sparse_columns,
+    _register_sparse_boolean,
     _schema_is_equal,
+    _to_sparse_matrix,
+    _trusted_woodwork_schemas,
     infer_feature_types,
 )
 
@@ -181,6 +189,21 @@ def test_infer_feature_types_raises_invalid_schema_error():
         infer_feature_types(df)
 
 
+def test_infer_feature_types_trusted_schemas():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    df.ww.init()
+    df.drop(columns=["b"], inplace=True)
+    with _trusted_woodwork_schemas():
+        assert infer_feature_types(df) is df
+    with pytest.raises(ValueError, match="Please initialize ww with df.ww.init()"):
+        infer_feature_types(df)
+
+    # Data without a schema is still inferred
+    with _trusted_woodwork_schemas():
+        df_inferred = infer_feature_types(pd.DataFrame({"a": [1.5, 2, 3]}))
+    assert isinstance(df_inferred.ww.logical_types["a"], Double)
+
+
 @pytest.mark.parametrize(
     "null_col,already_inited",
     product(
@@ -278,3 +301,80 @@ def test_schema_is_equal_fraud(fraud_100):
     X2 = X.copy()
     X2.ww.init()
     assert _schema_is_equal(X.ww.schema, X2.ww.schema)
+
+
+def test_sparse_column_conversions():
+    X = pd.DataFrame(
+        {
+            "sparse_1": pd.arrays.SparseArray([True, False, False, False]),
+            "dense": [1.5, np.nan, 0.0, 2.0],
+            "sparse_2": pd.arrays.SparseArray([False, False, True, False]),
+        }
+    )
+    _register_sparse_boolean()
+    X.ww.init(logical_types={"sparse_1": SparseBoolean, "sparse_2": SparseBoolean})
+    assert _get_sparse_columns(X) == ["sparse_1", "sparse_2"]
+    assert _can_convert_to_sparse_matrix(X)
+
+    matrix = _to_sparse_matrix(X)
+    assert matrix.format == "csr"
+    np.testing.assert_array_equal(
+        matrix.toarray(),
+        [[1.0, 1.5, 0.0], [0.0, np.nan, 0.0], [0.0, 0.0, 1.0], [0.0, 2.0, 0.0]],
+    )
+    # Every value of the dense column is stored, so the zero isn't read as missing by XGBoost
+    dense_column = matrix.tocsc()[:, 1]
+    assert dense_column.nnz == 4
+    np.testing.assert_array_equal(dense_column.indices, [0, 1, 2, 3])
+    assert matrix.nnz == 6
+    assert matrix.indices.dtype == np.int32
+
+    X_mixed = X.ww.copy()
+    X_mixed.ww["integer"] = pd.Series([0, 1, 0, 3])
+    X_mixed.ww["boolean"] = pd.Series([True, False, False, True])
+    X_mixed = X_mixed.ww[["integer", "sparse_1", "sparse_2", "dense", "boolean"]]
+    np.testing.assert_array_equal(
+        _to_sparse_matrix(X_mixed).toarray(),
+        X_mixed.astype("float64").to_numpy(),
+    )
+    assert _to_sparse_matrix(X_mixed).nnz == 14
+
+    X_dense = _densify_sparse_columns(X)
+    assert list(X_dense.columns) == ["sparse_1", "dense", "sparse_2"]
+    assert {col: str(lt) for col, lt in X_dense.ww.logical_types.items()} == {
+        "sparse_1": "Boolean",
+        "dense": "Double",
+        "sparse_2": "Boolean",
+    }
+    assert X_dense["sparse_1"].tolist() == [True, False, False, False]
+
+    X_dense.ww.init()
+    assert _get_sparse_columns(X_dense) == []
+    assert _densify_sparse_columns(X_dense) is X_dense
+    assert not _can_convert_to_sparse_matrix(X_dense)
+
+    X["category"] = pd.Series(["a", "b", "a", "b"], dtype="category")
+    X.ww.init(logical_types={"sparse_1": SparseBoolean, "sparse_2": SparseBoolean})
+    assert not _can_convert_to_sparse_matrix(X)
+
+
+def test_concat_columns_without_copy():
+    X = pd.DataFrame({"a": [1.5, 2.5, 3.5], "b": ["x", "y", "x"]})
+    X.ww.init(logical_types={"b": "Categorical"}, semantic_tags={"a": "custom_tag"})
+    y = pd.Series([1, 2, 3], name="c")
+    y.ww.init(logical_type="Integer", use_standard_tags=False)
+
+    X_t = _concat_columns_without_copy([X, y])
+    assert list(X_t.columns) == ["a", "b", "c"]
+    assert np.shares_memory(X_t["a"].to_numpy(), X["a"].to_numpy())
+    assert X_t.ww.logical_types == {"a": Double(), "b": Categorical(), "c": Integer()}
+    assert X_t.ww.semantic_tags == {
+        "a": {"numeric", "custom_tag"},
+        "b": {"category"},
+        "c": set(),
+    }
+    assert X_t.ww.schema == ww.concat_columns([X, y]).ww.schema
+
+    # Data without a woodwork schema is concatenated by woodwork
+    X_t = _concat_columns_without_copy([X, pd.Series([4, 5, 6], name="d")])
+    assert X_t.ww.logical_types["d"] == Integer()
@@ -17,6 +17,7 @@ from .gen_utils import (
     get_importable_subclasses,
     _rename_column_names_to_numeric,
     deprecate_arg,
+    _set_context_var,
 )
 from .cli_utils import (
     get_evalml_root,
@@ -26,8 +27,17 @@ from .cli_utils import (
     print_info,
     print_sys_info,
 )
+from .batch_scoring import read_chunks, score_file
 from .woodwork_utils import (
     infer_feature_types,
     _convert_numeric_dataset_pandas,
     _schema_is_equal,
+    _get_sparse_columns,
+    _densify_sparse_columns,
+    _concat_columns_without_copy,
+    _to_sparse_matrix,
+    _can_convert_to_sparse_matrix,
+    _trusted_woodwork_schemas,
+    SparseBoolean,
+    _register_sparse_boolean,
 )
@@ -0,0 +1,237 @@
+"""Utilities to make predictions on files which don't fit in memory, chunk by chunk."""
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from evalml.utils.gen_utils import import_or_raise
+from evalml.utils.logger import get_logger
+from evalml.utils.woodwork_utils import infer_feature_types
+
+_PARQUET_ERROR_MSG = "pyarrow is not installed. Please install using `pip install pyarrow` to read and write parquet files."
+
+# Pipeline loaded once by each worker process of score_file
+_worker_pipeline = None
+
+
+def _file_format(path):
+    """Format of a file, from its extension."""
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    if extension in (".csv", ".txt"):
+        return "csv"
+    raise ValueError(
+        f"Can't infer the format of {path}. Only CSV (.csv) and parquet (.parquet) files are supported."
+    )
+
+
+def read_chunks(input_path, chunk_size=100_000, columns=None):
+    """Reads a CSV or parquet file in chunks of rows, without loading the whole file in memory.
+
+    Args:
+        input_path (str): Path of the file. The format is inferred from the extension, .csv or .parquet.
+        chunk_size (int): Maximum number of rows of each chunk. Defaults to 100,000.
+        columns (list): Columns to read, in the order of the chunks' columns. Defaults to None, which reads every column.
+
+    Yields:
+        pd.DataFrame: The chunks of the file, indexed by the position of their rows in the file.
+
+    Raises:
+        ValueError: If the file doesn't have some of the columns or isn't a CSV or parquet file.
+    """
+    file_format = _file_format(input_path)
+    if file_format == "parquet":
+        pq = import_or_raise("pyarrow.parquet", error_msg=_PARQUET_ERROR_MSG)
+        parquet_file = pq.ParquetFile(input_path)
+        file_columns = parquet_file.schema_arrow.names
+    else:
+        file_columns = list(pd.read_csv(input_path, nrows=0).columns)
+    if columns is not None:
+        missing = [col for col in columns if col not in file_columns]
+        if missing:
+            raise ValueError(
+                f"{input_path} doesn't have these columns: {', '.join(map(str, missing))}"
+            )
+
+    if file_format == "parquet":
+        batches = (
+            batch.to_pandas()
+            for batch in parquet_file.iter_batches(
+                batch_size=chunk_size, columns=columns
+            )
+        )
+    else:
+        batches = pd.read_csv(input_path, chunksize=chunk_size, usecols=columns)
+    start = 0
+    for chunk in batches:
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk if columns is None else chunk[list(columns)]
+
+
+class _ChunkWriter:
+    """Appends chunks of predictions to a CSV or parquet file."""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.file_format = _file_format(output_path)
+        self._file = None
+        self._parquet_writer = None
+        self._schema = None
+
+    def write(self, chunk):
+        if self.file_format == "parquet":
+            pa = import_or_raise("pyarrow", error_msg=_PARQUET_ERROR_MSG)
+            pq = import_or_raise("pyarrow.parquet", error_msg=_PARQUET_ERROR_MSG)
+            table = pa.Table.from_pandas(
+                chunk, schema=self._schema, preserve_index=False
+            )
+            if self._parquet_writer is None:
+                self._schema = table.schema
+                self._parquet_writer = pq.ParquetWriter(self.output_path, self._schema)
+            self._parquet_writer.write_table(table)
+        else:
+            header = self._file is None
+            if header:
+                self._file = open(self.output_path, "w", newline="")
+            chunk.to_csv(self._file, header=header, index=False)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if self._file is not None:
+            self._file.close()
+
+
+def _predict_chunk(pipeline, chunk, include_columns):
+    """Predictions, and probabilities for classification pipelines, of a chunk of the input file."""
+    from evalml.problem_types import is_classification
+
+    input_types = pipeline.component_graph._input_types
+    X = infer_feature_types(chunk[list(input_types.columns)], input_types.logical_types)
+    predictions = pd.DataFrame(
+        {col: chunk[col].to_numpy() for col in include_columns}, index=chunk.index
+    )
+    # Transform the chunk once, and compute the predictions and the probabilities from the same features
+    features = pipeline.transform_all_but_final(X)
+    if is_classification(pipeline.problem_type):
+        proba = pipeline._predict_proba_from_features(features)
+        predictions["prediction"] = pipeline._predict_from_features(
+            features, y_pred_proba=proba
+        ).to_numpy()
+        for col in proba.columns:
+            predictions[f"probability_{col}"] = proba[col].to_numpy()
+    else:
+        predictions["prediction"] = pipeline._predict_from_features(features).to_numpy()
+    return predictions
+
+
+def _load_worker_pipeline(pipeline_path):
+    from evalml.pipelines import PipelineBase
+
+    global _worker_pipeline
+    _worker_pipeline = PipelineBase.load(pipeline_path)
+
+
+def _predict_chunk_in_worker(chunk, include_columns):
+    return _predict_chunk(_worker_pipeline, chunk, include_columns)
+
+
+def score_file(
+    pipeline_path,
+    input_path,
+    output_path,
+    chunk_size=100_000,
+    n_jobs=-1,
+    include_columns=None,
+):
+    """Makes predictions with a saved pipeline on a CSV or parquet file which doesn't need to fit in memory.
+
+    The input file is read in chunks of rows, which are scored across a pool of processes that each load the pipeline
+    once. The predictions are written to the output file in the order of the input rows as soon as the chunks are
+    scored, and at most two chunks per process are read ahead, so the memory used doesn't depend on the size of the file.
+    The output has a `prediction` column, and a `probability_<class>` column per class for classification pipelines.
+    Each chunk is given the Woodwork types the pipeline was fit on, instead of types inferred from the chunk.
+
+    Args:
+        pipeline_path (str): Path of a fitted pipeline saved with `PipelineBase.save`.
+        input_path (str): Path of the data to make predictions on, a .csv or .parquet file with the columns the
+            pipeline was fit on. Other columns are ignored.
+        output_path (str): Path of the .csv or .parquet file to write the predictions to.
+        chunk_size (int): Number of rows scored at a time. Defaults to 100,000.
+        n_jobs (int): Number of processes scoring chunks. -1 uses all processors, and 1 scores the chunks in the
+            current process. Defaults to -1.
+        include_columns (list): Columns of the input file copied to the output file before the predictions, such as
+            an ID column. Defaults to None.
+
+    Returns:
+        int: Number of rows scored.
+
+    Raises:
+        PipelineNotYetFittedError: If the pipeline is not fitted.
+        ValueError: If the pipeline is a time series pipeline, or the input file doesn't have the columns the pipeline
+            was fit on.
+    """
+    from evalml.exceptions import PipelineNotYetFittedError
+    from evalml.pipelines import PipelineBase
+    from evalml.problem_types import is_time_series
+
+    logger = get_logger(__name__)
+    pipeline = PipelineBase.load(pipeline_path)
+    if not pipeline._is_fitted:
+        klass = type(pipeline).__name__
+        raise PipelineNotYetFittedError(
+            f"This {klass} is not fitted yet. You must fit {klass} before calling score_file."
+        )
+    if is_time_series(pipeline.problem_type):
+        raise ValueError(
+            "Time series pipelines can't be scored in chunks because their predictions depend on the training data."
+        )
+    include_columns = list(include_columns or [])
+    columns = include_columns + [
+        col
+        for col in pipeline.component_graph._input_types.columns
+        if col not in include_columns
+    ]
+    chunks = read_chunks(input_path, chunk_size=chunk_size, columns=columns)
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+
+    writer = _ChunkWriter(output_path)
+    n_rows = 0
+    start_time = time.perf_counter()
+
+    def write(predictions):
+        nonlocal n_rows
+        writer.write(predictions)
+        n_rows += len(predictions)
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"Scored {n_rows} rows in {elapsed:.1f} seconds ({n_rows / elapsed:.0f} rows per second)"
+        )
+
+    try:
+        if n_jobs == 1:
+            for chunk in chunks:
+                write(_predict_chunk(pipeline, chunk, include_columns))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_load_worker_pipeline,
+                initargs=(pipeline_path,),
+            ) as pool:
+                futures = deque()
+                for chunk in chunks:
+                    futures.append(
+                        pool.submit(_predict_chunk_in_worker, chunk, include_columns)
+                    )
+                    if len(futures) >= 2 * n_jobs:
+                        write(futures.popleft().result())
+                while futures:
+                    write(futures.popleft().result())
+    finally:
+        writer.close()
+    logger.info(f"Wrote the predictions of {n_rows} rows to {output_path}")
+    return n_rows
@@ -4,6 +4,7 @@ import logging
 import os
 import warnings
 from collections import namedtuple
+from contextlib import contextmanager
 from functools import reduce
 
 import numpy as np
@@ -49,6 +50,28 @@ def import_or_raise(library, error_msg=None, warning=False):
             raise Exception(msg)
 
 
+@contextmanager
+def _set_context_var(context_var, value, result=None):
+    """Context manager which sets a context variable and restores its previous value on exit.
+
+    The value is only visible to code running in the current thread, so objects activated this way can be used by
+    concurrent jobs of a threaded engine without interfering with each other.
+
+    Args:
+        context_var (ContextVar): The context variable to set.
+        value: The value to set the context variable to.
+        result: The value to yield. Defaults to None.
+
+    Yields:
+        The given result.
+    """
+    token = context_var.set(value)
+    try:
+        yield result
+    finally:
+        context_var.reset(token)
+
+
 def convert_to_seconds(input_str):
     """Converts a string describing a length of time to its length in seconds.
 
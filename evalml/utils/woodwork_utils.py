@@ -1,9 +1,16 @@
 """Woodwork utility methods."""
+import threading
+from contextvars import ContextVar
+from itertools import groupby
+
 import numpy as np
 import pandas as pd
+import scipy.sparse
 import woodwork as ww
+from pandas.api.types import is_numeric_dtype
+from woodwork.logical_types import LogicalType
 
-from evalml.utils.gen_utils import is_all_numeric
+from evalml.utils.gen_utils import _set_context_var, is_all_numeric
 
 numeric_and_boolean_ww = [
     ww.logical_types.Integer.type_string,
@@ -15,6 +22,39 @@ numeric_and_boolean_ww = [
 ]
 
 
+class SparseBoolean(LogicalType):
+    """Represents boolean indicator columns stored as pandas sparse arrays, such as the output of the one-hot encoder with `sparse_output=True`.
+
+    Columns of this type are never inferred by Woodwork and only come from components which set them explicitly.
+    Woodwork only accepts registered logical types, so the first component to output sparse columns registers the type
+    in Woodwork's global type system, without an inference function. It doesn't change how Woodwork infers other columns.
+    """
+
+    primary_dtype = "Sparse[bool, False]"
+
+
+_sparse_boolean_lock = threading.Lock()
+
+
+def _register_sparse_boolean():
+    """Registers the SparseBoolean logical type in Woodwork's global type system, if it isn't registered yet."""
+    with _sparse_boolean_lock:
+        if SparseBoolean not in ww.type_system.registered_types:
+            ww.type_system.add_type(SparseBoolean)
+
+
+_trust_woodwork_schemas = ContextVar("trust_woodwork_schemas", default=False)
+
+
+def _trusted_woodwork_schemas():
+    """Context manager within which infer_feature_types returns data which already has a woodwork schema unchanged, without validating the schema.
+
+    Component graphs validate their input once and evaluate their components within this context, since the data
+    passed between components is produced by the components themselves.
+    """
+    return _set_context_var(_trust_woodwork_schemas, True)
+
+
 def _numpy_to_pandas(array):
     if len(array.shape) == 1:
         data = pd.Series(array)
@@ -48,6 +88,8 @@ def infer_feature_types(data, feature_types=None):
         data = _numpy_to_pandas(data)
 
     if data.ww.schema is not None:
+        if _trust_woodwork_schemas.get():
+            return data
         if isinstance(data, pd.DataFrame) and not ww.is_schema_valid(
             data, data.ww.schema
         ):
@@ -115,3 +157,141 @@ def _schema_is_equal(first, other):
     ]
     semantic = first.semantic_tags == other.semantic_tags
     return logical and semantic
+
+
+def _get_sparse_columns(X):
+    """Get the names of the columns of a Woodwork DataFrame which have the SparseBoolean logical type.
+
+    Args:
+        X (pd.DataFrame): The input data.
+
+    Returns:
+        list: The names of the sparse columns, in the order they appear in X.
+    """
+    if X.ww.schema is None:
+        return []
+    return [
+        col
+        for col, logical_type in X.ww.logical_types.items()
+        if isinstance(logical_type, SparseBoolean)
+    ]
+
+
+def _densify_sparse_columns(X):
+    """Convert the sparse columns of a Woodwork DataFrame to dense Boolean columns.
+
+    Args:
+        X (pd.DataFrame): The input data.
+
+    Returns:
+        pd.DataFrame: X with dense columns, in the same column order. X itself is returned if it has no sparse columns.
+    """
+    sparse_columns = _get_sparse_columns(X)
+    if not sparse_columns:
+        return X
+    X_dense = pd.DataFrame(
+        {col: X[col].sparse.to_dense() for col in sparse_columns}, index=X.index
+    )
+    X_dense.ww.init(logical_types={col: "Boolean" for col in sparse_columns})
+    X_t = _concat_columns_without_copy([X.ww.drop(sparse_columns), X_dense])
+    return X_t.ww[list(X.columns)]
+
+
+def _concat_columns_without_copy(objs):
+    """Concatenate the columns of Woodwork DataFrames and Series without copying their data.
+
+    Unlike ww.concat_columns, the result shares its data with the inputs, so it is meant for assembling the output of
+    a component from frames the component has just created. Falls back to ww.concat_columns if any input is not
+    initialized with Woodwork or has a Woodwork index or time index.
+
+    Args:
+        objs (list(pd.DataFrame, pd.Series)): Woodwork DataFrames and Series to concatenate, sharing the same index.
+
+    Returns:
+        pd.DataFrame: The concatenated data, with the logical types and semantic tags of the inputs.
+    """
+    schemas = [obj.ww.schema for obj in objs]
+    if any(
+        schema is None
+        or getattr(schema, "index", None) is not None
+        or getattr(schema, "time_index", None) is not None
+        for schema in schemas
+    ):
+        return ww.concat_columns(objs)
+    logical_types = {}
+    semantic_tags = {}
+    use_standard_tags = {}
+    for obj, schema in zip(objs, schemas):
+        if isinstance(obj, pd.Series):
+            column_schemas = {obj.name: schema}
+        else:
+            column_schemas = schema.columns
+        for col, column_schema in column_schemas.items():
+            logical_types[col] = column_schema.logical_type
+            tags = column_schema.semantic_tags
+            if column_schema.use_standard_tags:
+                tags = tags - column_schema.logical_type.standard_tags
+            semantic_tags[col] = tags
+            use_standard_tags[col] = column_schema.use_standard_tags
+    frames = [obj.to_frame() if isinstance(obj, pd.Series) else obj for obj in objs]
+    combined = pd.concat(frames, axis=1, copy=False)
+    combined.ww.init(
+        logical_types=logical_types,
+        semantic_tags=semantic_tags,
+        use_standard_tags=use_standard_tags,
+    )
+    return combined
+
+
+def _to_sparse_matrix(X):
+    """Convert a Woodwork DataFrame with sparse columns and numeric dense columns to a scipy CSR matrix.
+
+    Every value of the dense columns is stored in the matrix, zeros included, since estimators such as XGBoost treat
+    the entries which aren't stored as missing values rather than as zeros.
+
+    Args:
+        X (pd.DataFrame): The input data. All columns which are not sparse must be numeric or boolean.
+
+    Returns:
+        scipy.sparse.csr_matrix: The data as float64, with the columns in the same order as X.
+    """
+    sparse_columns = set(_get_sparse_columns(X))
+    blocks = []
+    # Consecutive columns of the same kind are converted together, so the blocks are already in the order of X
+    for is_sparse, columns in groupby(X.columns, key=lambda col: col in sparse_columns):
+        columns = list(columns)
+        if is_sparse:
+            blocks.append(X[columns].sparse.to_coo().astype("float64").tocsr())
+        else:
+            blocks.append(_dense_to_csr_matrix(X[columns]))
+    if len(blocks) == 1:
+        return blocks[0]
+    return scipy.sparse.hstack(blocks, format="csr")
+
+
+def _dense_to_csr_matrix(X):
+    """Converts dense numeric or boolean columns to a CSR matrix of float64 which stores all of their values.
+
+    The values are copied once, into a row-major array which becomes the data of the matrix. Only the column indices
+    are allocated besides, rather than the coordinates of every value, since each row of a full matrix stores the same columns.
+    """
+    n_rows, n_columns = X.shape
+    values = np.empty((n_rows, n_columns), dtype="float64")
+    for i in range(n_columns):
+        values[:, i] = X.iloc[:, i].to_numpy(dtype="float64", na_value=np.nan)
+    index_dtype = np.int32 if values.size <= np.iinfo(np.int32).max else np.int64
+    return scipy.sparse.csr_matrix(
+        (
+            values.ravel(),
+            np.tile(np.arange(n_columns, dtype=index_dtype), n_rows),
+            np.arange(0, values.size + 1, n_columns, dtype=index_dtype),
+        ),
+        shape=values.shape,
+    )
+
+
+def _can_convert_to_sparse_matrix(X):
+    """Whether X has sparse columns and all of its other columns are numeric or boolean."""
+    return bool(_get_sparse_columns(X)) and all(
+        is_numeric_dtype(dtype) for dtype in X.dtypes
+    )